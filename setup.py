@@ -36,6 +36,8 @@ if IS_WINDOWS:
     include_dirs = [
         np.get_include(),
         "sparse_numba/sparse_umfpack",
+        "sparse_numba/sparse_klu",
+        "sparse_numba/sparse_cholmod",
         "sparse_numba/sparse_superlu",
         "vendor/suitesparse/include",
         "vendor/superlu/include",
@@ -53,6 +55,11 @@ if IS_WINDOWS:
         "suitesparseconfig", "openblas"
     ]
     superlu_libraries = ["superlu", "openblas"]
+    klu_libraries = ["klu", "btf", "amd", "colamd", "suitesparseconfig"]
+    cholmod_libraries = [
+        "cholmod", "amd", "colamd", "camd", "ccolamd",
+        "suitesparseconfig", "openblas"
+    ]
     # Use MS_WIN64 to help pyconfig.h detect 64-bit correctly with MinGW.
     # Don't pass -DSIZEOF_VOID_P directly - it conflicts with pyconfig.h's own definition.
     import struct
@@ -83,6 +90,8 @@ elif IS_LINUX:
     include_dirs = [
         np.get_include(),
         "sparse_numba/sparse_umfpack",
+        "sparse_numba/sparse_klu",
+        "sparse_numba/sparse_cholmod",
         "sparse_numba/sparse_superlu",
         "/usr/include/suitesparse",  # Standard location on most Linux distros
         "/usr/local/include/suitesparse",  # Possible alternate location
@@ -122,11 +131,17 @@ elif IS_LINUX:
         "suitesparseconfig", "openblas"
     ]
     superlu_libraries = ["superlu", "openblas"]
+    klu_libraries = ["klu", "btf", "amd", "colamd", "suitesparseconfig"]
+    cholmod_libraries = [
+        "cholmod", "amd", "colamd", "camd", "ccolamd",
+        "suitesparseconfig", "openblas"
+    ]
 
     # Don't add "blas" library in CI builds as it sometimes causes issues
     if not CI_BUILD:
         umfpack_libraries.append("blas")
         superlu_libraries.append("blas")
+        cholmod_libraries.append("blas")
 
     extra_compile_args = ["-O3", "-fPIC"]
     extra_link_args = []
@@ -166,6 +181,8 @@ elif IS_MACOS:
     include_dirs = [
         np.get_include(),
         "sparse_numba/sparse_umfpack",
+        "sparse_numba/sparse_klu",
+        "sparse_numba/sparse_cholmod",
         "sparse_numba/sparse_superlu",
         f"{suitesparse_prefix}/include/suitesparse",
         f"{superlu_prefix}/include/superlu",
@@ -197,6 +214,11 @@ elif IS_MACOS:
         "suitesparseconfig", "openblas"
     ]
     superlu_libraries = ["superlu", "openblas"]
+    klu_libraries = ["klu", "btf", "amd", "colamd", "suitesparseconfig"]
+    cholmod_libraries = [
+        "cholmod", "amd", "colamd", "camd", "ccolamd",
+        "suitesparseconfig", "openblas"
+    ]
 
     # For macOS, ensure we're building for the right architecture
     extra_compile_args = ["-O3", "-fPIC"]
@@ -223,6 +245,8 @@ print(f"Include directories: {include_dirs}")
 print(f"Library directories: {library_dirs}")
 print(f"UMFPACK libraries: {umfpack_libraries}")
 print(f"SuperLU libraries: {superlu_libraries}")
+print(f"KLU libraries: {klu_libraries}")
+print(f"CHOLMOD libraries: {cholmod_libraries}")
 print(f"Extra compile args: {extra_compile_args}")
 print(f"Extra link args: {extra_link_args}")
 print(f"CI Build: {CI_BUILD}")
@@ -251,6 +275,46 @@ if not SKIP_UMFPACK:
 else:
     print("Skipping UMFPACK extension (SPARSE_NUMBA_SKIP_UMFPACK is set)")
 
+# KLU extension (requires SuiteSparse headers/libs to be installed)
+SKIP_KLU = os.environ.get('SPARSE_NUMBA_SKIP_KLU', '').lower() in ('1', 'true', 'yes')
+if not SKIP_KLU:
+    extensions.append(
+        Extension(
+            "sparse_numba.sparse_klu.cy_klu_wrapper",
+            sources=[
+                "sparse_numba/sparse_klu/cy_klu_wrapper.pyx",
+                "sparse_numba/sparse_klu/klu_wrapper.c"
+            ],
+            include_dirs=include_dirs,
+            libraries=klu_libraries,
+            library_dirs=library_dirs,
+            extra_compile_args=extra_compile_args,
+            extra_link_args=extra_link_args,
+        )
+    )
+else:
+    print("Skipping KLU extension (SPARSE_NUMBA_SKIP_KLU is set)")
+
+# CHOLMOD extension (requires SuiteSparse headers/libs to be installed)
+SKIP_CHOLMOD = os.environ.get('SPARSE_NUMBA_SKIP_CHOLMOD', '').lower() in ('1', 'true', 'yes')
+if not SKIP_CHOLMOD:
+    extensions.append(
+        Extension(
+            "sparse_numba.sparse_cholmod.cy_cholmod_wrapper",
+            sources=[
+                "sparse_numba/sparse_cholmod/cy_cholmod_wrapper.pyx",
+                "sparse_numba/sparse_cholmod/cholmod_wrapper.c"
+            ],
+            include_dirs=include_dirs,
+            libraries=cholmod_libraries,
+            library_dirs=library_dirs,
+            extra_compile_args=extra_compile_args,
+            extra_link_args=extra_link_args,
+        )
+    )
+else:
+    print("Skipping CHOLMOD extension (SPARSE_NUMBA_SKIP_CHOLMOD is set)")
+
 # SuperLU extension (always built - vendor libraries bundled)
 extensions.append(
     Extension(
@@ -338,11 +402,15 @@ class CustomBuildExt(build_ext):
         # Get extension paths for all platforms
         ext_path_umfpack = self.get_ext_fullpath("sparse_numba.sparse_umfpack.cy_umfpack_wrapper")
         ext_path_superlu = self.get_ext_fullpath("sparse_numba.sparse_superlu.cy_superlu_wrapper")
+        ext_path_klu = self.get_ext_fullpath("sparse_numba.sparse_klu.cy_klu_wrapper")
+        ext_path_cholmod = self.get_ext_fullpath("sparse_numba.sparse_cholmod.cy_cholmod_wrapper")
         package_dir = os.path.dirname(os.path.dirname(ext_path_umfpack))
 
         # Print for debugging
         print(f"Extension umfpack path: {ext_path_umfpack}")
         print(f"Extension superlu path: {ext_path_superlu}")
+        print(f"Extension klu path: {ext_path_klu}")
+        print(f"Extension cholmod path: {ext_path_cholmod}")
         print(f"Package directory: {package_dir}")
 
         # Handle Windows-specific tasks
@@ -410,6 +478,20 @@ class CustomBuildExt(build_ext):
                 else:
                     print(f"WARNING: UMFPACK extension not found at {ext_path_umfpack}")
 
+                # Set executable permissions for KLU extension
+                if os.path.exists(ext_path_klu):
+                    print(f"Setting executable permissions on KLU extension: {ext_path_klu}")
+                    os.chmod(ext_path_klu, os.stat(ext_path_klu).st_mode | stat.S_IEXEC)
+                else:
+                    print(f"WARNING: KLU extension not found at {ext_path_klu}")
+
+                # Set executable permissions for CHOLMOD extension
+                if os.path.exists(ext_path_cholmod):
+                    print(f"Setting executable permissions on CHOLMOD extension: {ext_path_cholmod}")
+                    os.chmod(ext_path_cholmod, os.stat(ext_path_cholmod).st_mode | stat.S_IEXEC)
+                else:
+                    print(f"WARNING: CHOLMOD extension not found at {ext_path_cholmod}")
+
                 # Verify the extensions exist in their directories
                 superlu_dir = os.path.dirname(ext_path_superlu)
                 umfpack_dir = os.path.dirname(ext_path_umfpack)
@@ -432,9 +514,39 @@ if IS_WINDOWS:
         'vendor/openblas/bin/*.dll',
         'sparse_superlu/*.pyd',
         'sparse_umfpack/*.pyd',
+        'sparse_klu/*.pyd',
+        'sparse_cholmod/*.pyd',
         'sparse_superlu/test/*.py',
         'sparse_umfpack/test/*.py',
-        'conversion/*.py'
+        'sparse_klu/test/*.py',
+        'sparse_cholmod/test/*.py',
+        'conversion/*.py',
+        'conversion/test/*.py',
+        'dense/*.py',
+        'dense/test/*.py',
+        'banded/*.py',
+        'banded/test/*.py',
+        'gplu/*.py',
+        'gplu/test/*.py',
+        'cholesky/*.py',
+        'cholesky/test/*.py',
+        'krylov/*.py',
+        'krylov/test/*.py',
+        'amg/*.py',
+        'amg/test/*.py',
+        'lowrank/*.py',
+        'lowrank/test/*.py',
+        'schur/*.py',
+        'schur/test/*.py',
+        'selinv/*.py',
+        'selinv/test/*.py',
+        'trisolve/*.py',
+        'trisolve/test/*.py',
+        'ordering/*.py',
+        'ordering/test/*.py',
+        'btf/*.py',
+        'btf/test/*.py',
+        'test/*.py'
     ]
 elif IS_LINUX:
     package_data['sparse_numba'] = [
@@ -442,9 +554,41 @@ elif IS_LINUX:
         'sparse_superlu/cy_superlu_wrapper*.so',  # More specific pattern
         'sparse_umfpack/*.so',
         'sparse_umfpack/cy_umfpack_wrapper*.so',  # More specific pattern
+        'sparse_klu/*.so',
+        'sparse_klu/cy_klu_wrapper*.so',  # More specific pattern
+        'sparse_cholmod/*.so',
+        'sparse_cholmod/cy_cholmod_wrapper*.so',  # More specific pattern
         'sparse_superlu/test/*.py',
         'sparse_umfpack/test/*.py',
-        'conversion/*.py'
+        'sparse_klu/test/*.py',
+        'sparse_cholmod/test/*.py',
+        'conversion/*.py',
+        'conversion/test/*.py',
+        'dense/*.py',
+        'dense/test/*.py',
+        'banded/*.py',
+        'banded/test/*.py',
+        'gplu/*.py',
+        'gplu/test/*.py',
+        'cholesky/*.py',
+        'cholesky/test/*.py',
+        'krylov/*.py',
+        'krylov/test/*.py',
+        'amg/*.py',
+        'amg/test/*.py',
+        'lowrank/*.py',
+        'lowrank/test/*.py',
+        'schur/*.py',
+        'schur/test/*.py',
+        'selinv/*.py',
+        'selinv/test/*.py',
+        'trisolve/*.py',
+        'trisolve/test/*.py',
+        'ordering/*.py',
+        'ordering/test/*.py',
+        'btf/*.py',
+        'btf/test/*.py',
+        'test/*.py'
     ]
 elif IS_MACOS:
     package_data['sparse_numba'] = [
@@ -452,19 +596,81 @@ elif IS_MACOS:
         'sparse_superlu/*.dylib',
         'sparse_umfpack/*.so',
         'sparse_umfpack/*.dylib',
+        'sparse_klu/*.so',
+        'sparse_klu/*.dylib',
+        'sparse_cholmod/*.so',
+        'sparse_cholmod/*.dylib',
         'sparse_superlu/test/*.py',
         'sparse_umfpack/test/*.py',
-        'conversion/*.py'
+        'sparse_klu/test/*.py',
+        'sparse_cholmod/test/*.py',
+        'conversion/*.py',
+        'conversion/test/*.py',
+        'dense/*.py',
+        'dense/test/*.py',
+        'banded/*.py',
+        'banded/test/*.py',
+        'gplu/*.py',
+        'gplu/test/*.py',
+        'cholesky/*.py',
+        'cholesky/test/*.py',
+        'krylov/*.py',
+        'krylov/test/*.py',
+        'amg/*.py',
+        'amg/test/*.py',
+        'lowrank/*.py',
+        'lowrank/test/*.py',
+        'schur/*.py',
+        'schur/test/*.py',
+        'selinv/*.py',
+        'selinv/test/*.py',
+        'trisolve/*.py',
+        'trisolve/test/*.py',
+        'ordering/*.py',
+        'ordering/test/*.py',
+        'btf/*.py',
+        'btf/test/*.py',
+        'test/*.py'
     ]
 
 # Setup configuration
 packages=[
         'sparse_numba',
         'sparse_numba.conversion',
+        'sparse_numba.conversion.test',
         'sparse_numba.sparse_superlu',
         'sparse_numba.sparse_superlu.test',
         'sparse_numba.sparse_umfpack',
         'sparse_numba.sparse_umfpack.test',
+        'sparse_numba.sparse_klu',
+        'sparse_numba.sparse_klu.test',
+        'sparse_numba.sparse_cholmod',
+        'sparse_numba.sparse_cholmod.test',
+        'sparse_numba.dense',
+        'sparse_numba.dense.test',
+        'sparse_numba.banded',
+        'sparse_numba.banded.test',
+        'sparse_numba.gplu',
+        'sparse_numba.gplu.test',
+        'sparse_numba.cholesky',
+        'sparse_numba.cholesky.test',
+        'sparse_numba.krylov',
+        'sparse_numba.krylov.test',
+        'sparse_numba.amg',
+        'sparse_numba.amg.test',
+        'sparse_numba.lowrank',
+        'sparse_numba.lowrank.test',
+        'sparse_numba.schur',
+        'sparse_numba.schur.test',
+        'sparse_numba.selinv',
+        'sparse_numba.selinv.test',
+        'sparse_numba.trisolve',
+        'sparse_numba.trisolve.test',
+        'sparse_numba.ordering',
+        'sparse_numba.ordering.test',
+        'sparse_numba.btf',
+        'sparse_numba.btf.test',
+        'sparse_numba.test',
     ]
 
 setup(
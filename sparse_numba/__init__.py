@@ -23,6 +23,10 @@ from .conversion import matrix_conversion_numba
 _HAS_SUPERLU = False
 # Track UMFPACK availability
 _HAS_UMFPACK = False
+# Track KLU availability
+_HAS_KLU = False
+# Track CHOLMOD availability
+_HAS_CHOLMOD = False
 
 # Determine platform
 PLATFORM = platform.system()
@@ -231,16 +235,48 @@ def initialize_umfpack():
         )
 
 
+def initialize_klu():
+    # KLU ships with SuiteSparse; its library paths are set up by initialize_umfpack
+    global _HAS_KLU
+    try:
+        from .sparse_klu import cy_klu_wrapper
+        _HAS_KLU = True
+        logger.info("KLU libraries found. Module should work correctly.")
+    except ImportError as e:
+        logger.debug(f"Error importing cy_klu_wrapper: {e}")
+        _HAS_KLU = False
+        logger.info("KLU extension is not available; the KLU backend is disabled.")
+
+
+def initialize_cholmod():
+    # CHOLMOD ships with SuiteSparse; its library paths are set up by initialize_umfpack
+    global _HAS_CHOLMOD
+    try:
+        from .sparse_cholmod import cy_cholmod_wrapper
+        _HAS_CHOLMOD = True
+        logger.info("CHOLMOD libraries found. Module should work correctly.")
+    except ImportError as e:
+        logger.debug(f"Error importing cy_cholmod_wrapper: {e}")
+        _HAS_CHOLMOD = False
+        logger.info("CHOLMOD extension is not available; the CHOLMOD backend is disabled.")
+
+
 # Initialize UMFPACK during module import
 initialize_umfpack()
 # Initialize SuperLU during module import
 initialize_superlu()
+# Initialize KLU during module import
+initialize_klu()
+# Initialize CHOLMOD during module import
+initialize_cholmod()
 
 
 __all__ = [
     'matrix_conversion_numba',
     'is_slu_available',
     'is_umf_available',
+    'is_klu_available',
+    'is_cholmod_available',
     # Pre-factorization API (SuperLU)
     'superlu_factorize_csc', 'superlu_factorize_coo', 'superlu_factorize_csr',
     'superlu_solve_factored', 'superlu_free_factors',
@@ -249,6 +285,8 @@ __all__ = [
     'umfpack_solve_factored', 'umfpack_free_factors',
     # Sparse utilities
     'convert_coo_to_csr', 'sparse_matvec_csr',
+    # Automatic solver choice
+    'solve', 'analyze_structure', 'select_route', 'ROUTE_NAMES',
 ]
 
 def is_slu_available():
@@ -259,6 +297,17 @@ def is_umf_available():
     """Check if umfpack is available"""
     return _HAS_UMFPACK
 
+def is_klu_available():
+    """Check if KLU is available"""
+    return _HAS_KLU
+
+def is_cholmod_available():
+    """Check if CHOLMOD is available"""
+    return _HAS_CHOLMOD
+
+# Imported after the library paths are set up; missing backends are skipped
+from .solver_dispatch import solve, analyze_structure, select_route, ROUTE_NAMES
+
 # Variables to track availability of solvers
 # has_umfpack = False
 # has_superlu = False
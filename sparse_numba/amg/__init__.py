@@ -0,0 +1,13 @@
+from .amg_numba import (
+    amg_setup, precond_amg, amg_solve, amg_free,
+    AMGHierarchy,
+    AMG_COARSE_AUTO, AMG_COARSE_GPLU, AMG_COARSE_SUPERLU, AMG_COARSE_UMFPACK,
+)
+
+__all__ = [
+    'amg_setup', 'precond_amg', 'amg_solve', 'amg_free',
+    'AMGHierarchy',
+    'AMG_COARSE_AUTO', 'AMG_COARSE_GPLU', 'AMG_COARSE_SUPERLU', 'AMG_COARSE_UMFPACK',
+]
+
+__author__ = 'Tianqi Hong'
@@ -0,0 +1,595 @@
+"""
+Smoothed-aggregation algebraic multigrid (AMG) in Numba, for use as a
+preconditioner of the Krylov solvers or as a standalone solver.
+    amg_setup
+    precond_amg
+    amg_solve
+    amg_free
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: amg_numba.py
+
+import numpy as np
+from numba import njit, prange, types, int32, int64, float64
+from numba.experimental import jitclass
+from numba.typed import List
+
+from sparse_numba.conversion.matrix_conversion_numba import (
+    ensure_float64, ensure_int32, convert_csr_to_csc,
+)
+from sparse_numba.conversion.sparse_products_numba import spmv_csr, spgemm_csr, spadd
+from sparse_numba.gplu.gplu_numba import GPLUFactors, gplu_factorize_csc, gplu_solve_factored
+from sparse_numba.krylov.precond_numba import precond_superlu, precond_umfpack
+
+try:
+    from sparse_numba.sparse_superlu.superlu_numba_interface import (
+        superlu_factorize_csc, superlu_free_factors,
+    )
+    _HAS_SUPERLU = True
+except ImportError:
+    _HAS_SUPERLU = False
+
+try:
+    from sparse_numba.sparse_umfpack.umfpack_numba_interface import (
+        umfpack_factorize_csc, umfpack_free_factors,
+    )
+    _HAS_UMFPACK = True
+except ImportError:
+    _HAS_UMFPACK = False
+
+# Solvers for the coarsest level (coarse_solver argument of amg_setup)
+AMG_COARSE_AUTO = -1          # SuperLU, else UMFPACK, else GP-LU
+AMG_COARSE_GPLU = 0           # pure-Numba Gilbert-Peierls LU
+AMG_COARSE_SUPERLU = 1        # superlu_factorize_csc
+AMG_COARSE_UMFPACK = 2        # umfpack_factorize_csc
+
+
+if _HAS_SUPERLU:
+    @njit(nogil=True)
+    def _superlu_factorize(data, indices, indptr):
+        return superlu_factorize_csc(data, indices, indptr)
+
+    @njit(nogil=True)
+    def _superlu_free(handle):
+        return superlu_free_factors(handle)
+else:
+    @njit(nogil=True)
+    def _superlu_factorize(data, indices, indptr):
+        print("Error: SuperLU is not available")
+        return np.int64(0), -5
+
+    @njit(nogil=True)
+    def _superlu_free(handle):
+        return -5
+
+
+if _HAS_UMFPACK:
+    @njit(nogil=True)
+    def _umfpack_factorize(data, indices, indptr):
+        return umfpack_factorize_csc(data, indices, indptr)
+
+    @njit(nogil=True)
+    def _umfpack_free(handle):
+        return umfpack_free_factors(handle)
+else:
+    @njit(nogil=True)
+    def _umfpack_factorize(data, indices, indptr):
+        print("Error: UMFPACK is not available")
+        return np.int64(0), -5
+
+    @njit(nogil=True)
+    def _umfpack_free(handle):
+        return -5
+
+
+_float_list = types.ListType(float64[::1])
+_int_list = types.ListType(int32[::1])
+
+
+@jitclass([
+    ('n_levels', int64),
+    ('A_data', _float_list),
+    ('A_indices', _int_list),
+    ('A_indptr', _int_list),
+    ('P_data', _float_list),
+    ('P_indices', _int_list),
+    ('P_indptr', _int_list),
+    ('R_data', _float_list),
+    ('R_indices', _int_list),
+    ('R_indptr', _int_list),
+    ('inv_diag', _float_list),
+    ('omega', float64[::1]),
+    ('x', _float_list),
+    ('b', _float_list),
+    ('r', _float_list),
+    ('n_sweeps', int64),
+    ('coarse_solver', int64),
+    ('coarse_handle', int64),
+    ('coarse_factors', GPLUFactors.class_type.instance_type),
+])
+class AMGHierarchy:
+    """
+    Multigrid hierarchy from amg_setup. Level 0 is the input matrix; A, P
+    (prolongation, n_l x n_{l+1}), R = P^T and the Jacobi data are CSR
+    arrays per level. The coarsest level is factorized with coarse_solver:
+    coarse_handle for SuperLU/UMFPACK, coarse_factors for GP-LU.
+
+    x, b and r are work vectors used by the V-cycle, so a hierarchy must
+    not be applied by several threads at once.
+    """
+
+    def __init__(self, n_levels, A_data, A_indices, A_indptr, P_data, P_indices, P_indptr,
+                 R_data, R_indices, R_indptr, inv_diag, omega, x, b, r, n_sweeps,
+                 coarse_solver, coarse_handle, coarse_factors):
+        self.n_levels = n_levels
+        self.A_data = A_data
+        self.A_indices = A_indices
+        self.A_indptr = A_indptr
+        self.P_data = P_data
+        self.P_indices = P_indices
+        self.P_indptr = P_indptr
+        self.R_data = R_data
+        self.R_indices = R_indices
+        self.R_indptr = R_indptr
+        self.inv_diag = inv_diag
+        self.omega = omega
+        self.x = x
+        self.b = b
+        self.r = r
+        self.n_sweeps = n_sweeps
+        self.coarse_solver = coarse_solver
+        self.coarse_handle = coarse_handle
+        self.coarse_factors = coarse_factors
+
+    @property
+    def level_sizes(self):
+        """Number of unknowns on each level."""
+        sizes = np.empty(self.n_levels, dtype=np.int64)
+        for lev in range(self.n_levels):
+            sizes[lev] = len(self.A_indptr[lev]) - 1
+        return sizes
+
+    @property
+    def operator_complexity(self):
+        """Total nnz of all level operators divided by nnz of A."""
+        total = 0
+        for lev in range(self.n_levels):
+            total += len(self.A_data[lev])
+        return total / max(len(self.A_data[0]), 1)
+
+
+# ================================================================
+# Setup kernels
+# ================================================================
+
+@njit(nogil=True)
+def _diagonal(data, indices, indptr):
+    n = len(indptr) - 1
+    diag = np.zeros(n, dtype=np.float64)
+    for i in range(n):
+        for p in range(indptr[i], indptr[i + 1]):
+            if indices[p] == i:
+                diag[i] += data[p]
+    return diag
+
+
+@njit(nogil=True)
+def _strength(data, indices, indptr, diag, theta):
+    """
+    Symmetric strength of connection: j is strongly connected to i if
+    |a_ij| >= theta * sqrt(|a_ii a_jj|). Returns the pattern as CSR.
+    """
+    n = len(indptr) - 1
+    s_indptr = np.zeros(n + 1, dtype=np.int32)
+    s_indices = np.empty(len(indices), dtype=np.int32)
+    q = 0
+    for i in range(n):
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            if j != i and abs(data[p]) >= theta * np.sqrt(abs(diag[i] * diag[j])):
+                s_indices[q] = j
+                q += 1
+        s_indptr[i + 1] = q
+    return s_indices[:q], s_indptr
+
+
+@njit(nogil=True)
+def _aggregate(s_indices, s_indptr):
+    """
+    Standard (greedy, three-pass) aggregation of the strength graph.
+    Returns the aggregate of each node (-1 for isolated nodes) and the
+    number of aggregates.
+    """
+    n = len(s_indptr) - 1
+    agg = np.full(n, -1, dtype=np.int32)
+    n_agg = 0
+
+    # Pass 1: seed aggregates at nodes whose neighbors are all free
+    for i in range(n):
+        if agg[i] >= 0 or s_indptr[i + 1] == s_indptr[i]:
+            continue
+        free = True
+        for p in range(s_indptr[i], s_indptr[i + 1]):
+            if agg[s_indices[p]] >= 0:
+                free = False
+                break
+        if free:
+            agg[i] = n_agg
+            for p in range(s_indptr[i], s_indptr[i + 1]):
+                agg[s_indices[p]] = n_agg
+            n_agg += 1
+
+    # Pass 2: attach remaining nodes to a neighboring aggregate
+    prev = agg.copy()
+    for i in range(n):
+        if agg[i] >= 0:
+            continue
+        for p in range(s_indptr[i], s_indptr[i + 1]):
+            a = prev[s_indices[p]]
+            if a >= 0:
+                agg[i] = a
+                break
+
+    # Pass 3: aggregate what is left with its free neighbors
+    for i in range(n):
+        if agg[i] >= 0 or s_indptr[i + 1] == s_indptr[i]:
+            continue
+        agg[i] = n_agg
+        for p in range(s_indptr[i], s_indptr[i + 1]):
+            j = s_indices[p]
+            if agg[j] < 0:
+                agg[j] = n_agg
+        n_agg += 1
+    return agg, n_agg
+
+
+@njit(nogil=True)
+def _tentative_prolongator(agg, n_agg):
+    """Piecewise-constant prolongator, columns normalized, as CSR."""
+    n = len(agg)
+    size = np.zeros(n_agg, dtype=np.float64)
+    for i in range(n):
+        if agg[i] >= 0:
+            size[agg[i]] += 1.0
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    for i in range(n):
+        indptr[i + 1] = indptr[i] + (1 if agg[i] >= 0 else 0)
+    indices = np.empty(indptr[n], dtype=np.int32)
+    data = np.empty(indptr[n], dtype=np.float64)
+    for i in range(n):
+        if agg[i] >= 0:
+            indices[indptr[i]] = agg[i]
+            data[indptr[i]] = 1.0 / np.sqrt(size[agg[i]])
+    return data, indices, indptr
+
+
+@njit(nogil=True)
+def _spectral_radius(data, indices, indptr, inv_diag, n_iter=15):
+    """Power-iteration estimate of rho(D^{-1} A)."""
+    n = len(indptr) - 1
+    v = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        v[i] = 1.0 + (i % 7) / 7.0
+    v /= np.sqrt(np.dot(v, v))
+    w = np.empty(n, dtype=np.float64)
+    rho = 0.0
+    for _ in range(n_iter):
+        spmv_csr(data, indices, indptr, v, w)
+        w *= inv_diag
+        rho = np.sqrt(np.dot(w, w))
+        if rho == 0.0:
+            break
+        v[:] = w / rho
+    return rho
+
+
+# ================================================================
+# Setup
+# ================================================================
+
+@njit(nogil=True)
+def amg_setup(csr_data, csr_indices, csr_indptr, theta=0.0, max_levels=10, max_coarse=500,
+              n_sweeps=1, coarse_solver=AMG_COARSE_AUTO):
+    """
+    Build a smoothed-aggregation AMG hierarchy: strength of connection,
+    standard aggregation, a piecewise-constant tentative prolongator
+    smoothed by one damped Jacobi step, and Galerkin coarse operators
+    R A P. Intended for symmetric positive definite matrices such as
+    diffusion problems.
+
+    Parameters:
+    -----------
+    csr_data : ndarray (float64)
+        Nonzero values in CSR format
+    csr_indices : ndarray (int32)
+        Column indices in CSR format
+    csr_indptr : ndarray (int32)
+        Row pointers in CSR format
+    theta : float
+        Strength threshold; a_ij is strong if |a_ij| >= theta sqrt(|a_ii a_jj|).
+        The default 0 treats every connection as strong, which suits the
+        dense-ish coarse operators of 3D problems; raise it (e.g. 0.08)
+        for anisotropic problems.
+    max_levels : int
+        Maximum number of levels
+    max_coarse : int
+        Stop coarsening once a level has at most this many unknowns
+    n_sweeps : int
+        Damped Jacobi pre- and post-smoothing sweeps per level
+    coarse_solver : int
+        AMG_COARSE_AUTO, AMG_COARSE_GPLU, AMG_COARSE_SUPERLU or
+        AMG_COARSE_UMFPACK
+
+    Returns:
+    --------
+    M : AMGHierarchy
+        The M argument of precond_amg and amg_solve
+    info : int
+        Status code (0 for success, -3 for a non-square matrix or a zero
+        diagonal entry, otherwise the status of the coarse factorization;
+        -5 if the chosen coarse solver is not available)
+    """
+    data = ensure_float64(csr_data)
+    indices = ensure_int32(csr_indices)
+    indptr = ensure_int32(csr_indptr)
+
+    A_data = List.empty_list(float64[::1])
+    A_indices = List.empty_list(int32[::1])
+    A_indptr = List.empty_list(int32[::1])
+    P_data = List.empty_list(float64[::1])
+    P_indices = List.empty_list(int32[::1])
+    P_indptr = List.empty_list(int32[::1])
+    R_data = List.empty_list(float64[::1])
+    R_indices = List.empty_list(int32[::1])
+    R_indptr = List.empty_list(int32[::1])
+    inv_diags = List.empty_list(float64[::1])
+    xs = List.empty_list(float64[::1])
+    bs = List.empty_list(float64[::1])
+    rs = List.empty_list(float64[::1])
+    omega = np.zeros(max(max_levels, 1), dtype=np.float64)
+
+    if coarse_solver == AMG_COARSE_AUTO:
+        if _HAS_SUPERLU:
+            coarse_solver = AMG_COARSE_SUPERLU
+        elif _HAS_UMFPACK:
+            coarse_solver = AMG_COARSE_UMFPACK
+        else:
+            coarse_solver = AMG_COARSE_GPLU
+
+    info = 0
+    n = len(indptr) - 1
+    if len(indices) > 0 and (indices.min() < 0 or indices.max() >= n):
+        print("Error: Matrix must be square")
+        info = -3
+
+    while info == 0:
+        n = len(indptr) - 1
+        diag = _diagonal(data, indices, indptr)
+        inv_diag = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            if diag[i] == 0.0:
+                print("Error: Zero diagonal entry in AMG setup")
+                info = -3
+                break
+            inv_diag[i] = 1.0 / diag[i]
+        if info != 0:
+            break
+        lev = len(A_data)
+        A_data.append(data)
+        A_indices.append(indices)
+        A_indptr.append(indptr)
+        inv_diags.append(inv_diag)
+        xs.append(np.zeros(n, dtype=np.float64))
+        bs.append(np.zeros(n, dtype=np.float64))
+        rs.append(np.zeros(n, dtype=np.float64))
+        rho = _spectral_radius(data, indices, indptr, inv_diag)
+        omega[lev] = 4.0 / (3.0 * rho) if rho > 0.0 else 0.0
+        if n <= max_coarse or lev + 1 >= max_levels:
+            break
+
+        s_indices, s_indptr = _strength(data, indices, indptr, diag, theta)
+        agg, n_agg = _aggregate(s_indices, s_indptr)
+        if n_agg == 0 or n_agg >= n:
+            break
+
+        # P = (I - omega D^{-1} A) T
+        t_data, t_indices, t_indptr = _tentative_prolongator(agg, n_agg)
+        at_data, at_indices, at_indptr = spgemm_csr(data, indices, indptr,
+                                                    t_data, t_indices, t_indptr, n_agg)
+        for i in range(n):
+            for p in range(at_indptr[i], at_indptr[i + 1]):
+                at_data[p] *= omega[lev] * inv_diag[i]
+        p_data, p_indices, p_indptr = spadd(t_data, t_indices, t_indptr,
+                                            at_data, at_indices, at_indptr, n_agg, -1.0)
+        # R = P^T: the CSC arrays of P are the CSR arrays of P^T
+        r_data, r_indices, r_indptr = convert_csr_to_csc(p_data, p_indices, p_indptr,
+                                                         (n, n_agg), False)
+        ap_data, ap_indices, ap_indptr = spgemm_csr(data, indices, indptr,
+                                                    p_data, p_indices, p_indptr, n_agg)
+        data, indices, indptr = spgemm_csr(r_data, r_indices, r_indptr,
+                                           ap_data, ap_indices, ap_indptr, n_agg)
+        P_data.append(p_data)
+        P_indices.append(p_indices)
+        P_indptr.append(p_indptr)
+        R_data.append(r_data)
+        R_indices.append(r_indices.astype(np.int32))
+        R_indptr.append(r_indptr.astype(np.int32))
+
+    # Coarsest level; nothing to factorize after an error
+    coarse_handle = np.int64(0)
+    coarse_factors, _ = gplu_factorize_csc(np.ones(1), np.zeros(1, dtype=np.int32),
+                                           np.array([0, 1], dtype=np.int32))
+    if info == 0:
+        c_data, c_indices, c_indptr = convert_csr_to_csc(data, indices, indptr,
+                                                         (len(indptr) - 1, len(indptr) - 1), False)
+        c_indices = c_indices.astype(np.int32)
+        c_indptr = c_indptr.astype(np.int32)
+        if coarse_solver == AMG_COARSE_SUPERLU:
+            coarse_handle, info = _superlu_factorize(c_data, c_indices, c_indptr)
+        elif coarse_solver == AMG_COARSE_UMFPACK:
+            coarse_handle, info = _umfpack_factorize(c_data, c_indices, c_indptr)
+        else:
+            coarse_solver = AMG_COARSE_GPLU
+            coarse_factors, info = gplu_factorize_csc(c_data, c_indices, c_indptr)
+
+    M = AMGHierarchy(len(A_data), A_data, A_indices, A_indptr, P_data, P_indices, P_indptr,
+                     R_data, R_indices, R_indptr, inv_diags, omega, xs, bs, rs, n_sweeps,
+                     coarse_solver, coarse_handle, coarse_factors)
+    return M, info
+
+
+# ================================================================
+# V-cycle
+# ================================================================
+
+@njit(nogil=True, parallel=True)
+def _jacobi_sweeps(data, indices, indptr, inv_diag, omega, b, x, r, n_sweeps, zero_guess):
+    """Damped Jacobi x += omega D^{-1} (b - A x), rows in parallel."""
+    n = len(b)
+    for sweep in range(n_sweeps):
+        if zero_guess and sweep == 0:
+            for i in prange(n):
+                x[i] = omega * inv_diag[i] * b[i]
+            continue
+        r[:] = b
+        spmv_csr(data, indices, indptr, x, r, -1.0, 1.0)
+        for i in prange(n):
+            x[i] += omega * inv_diag[i] * r[i]
+
+
+@njit(nogil=True)
+def _coarse_solve(M, b, x):
+    if M.coarse_solver == AMG_COARSE_SUPERLU:
+        return precond_superlu(M.coarse_handle, b, x)
+    if M.coarse_solver == AMG_COARSE_UMFPACK:
+        return precond_umfpack(M.coarse_handle, b, x)
+    y, info = gplu_solve_factored(M.coarse_factors, b)
+    x[:] = y
+    return info
+
+
+@njit(nogil=True)
+def precond_amg(M, r, z):
+    """
+    One symmetric V-cycle on A z = r with a zero initial guess, for the
+    Krylov solvers' precond argument (M from amg_setup). Smoothing and
+    grid transfers run in parallel; no memory is allocated on the fine
+    levels.
+
+    Returns:
+    --------
+    info : int
+        Status of the coarse solve (0 for success)
+    """
+    L = M.n_levels
+    M.b[0][:] = r
+    for lev in range(L - 1):
+        x = M.x[lev]
+        b = M.b[lev]
+        res = M.r[lev]
+        _jacobi_sweeps(M.A_data[lev], M.A_indices[lev], M.A_indptr[lev], M.inv_diag[lev],
+                       M.omega[lev], b, x, res, M.n_sweeps, True)
+        res[:] = b
+        spmv_csr(M.A_data[lev], M.A_indices[lev], M.A_indptr[lev], x, res, -1.0, 1.0)
+        spmv_csr(M.R_data[lev], M.R_indices[lev], M.R_indptr[lev], res, M.b[lev + 1])
+
+    info = _coarse_solve(M, M.b[L - 1], M.x[L - 1])
+
+    for lev in range(L - 2, -1, -1):
+        x = M.x[lev]
+        spmv_csr(M.P_data[lev], M.P_indices[lev], M.P_indptr[lev], M.x[lev + 1], x, 1.0, 1.0)
+        _jacobi_sweeps(M.A_data[lev], M.A_indices[lev], M.A_indptr[lev], M.inv_diag[lev],
+                       M.omega[lev], M.b[lev], x, M.r[lev], M.n_sweeps, False)
+    z[:] = M.x[0]
+    return info
+
+
+@njit(nogil=True)
+def amg_solve(M, b, x0=None, tol=1e-8, maxiter=100):
+    """
+    Solve A x = b by repeated V-cycles (stationary multigrid iteration).
+    For hard problems use precond_amg inside cg_csr instead.
+
+    Parameters:
+    -----------
+    M : AMGHierarchy
+        Hierarchy from amg_setup
+    b : ndarray (float64)
+        Right-hand side vector
+    x0 : ndarray (float64), optional
+        Initial guess (warm start); zero if not given
+    tol : float
+        Stop when ||b - A x|| <= tol * ||b||
+    maxiter : int
+        Maximum number of V-cycles
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    n_iter : int
+        Number of V-cycles performed
+    history : ndarray (float64)
+        Relative residual norms, k = 0..n_iter
+    info : int
+        Status code (0 for convergence, 1 if maxiter was reached, -3 for a
+        mismatched b, otherwise the status of the coarse solve)
+    """
+    data = M.A_data[0]
+    indices = M.A_indices[0]
+    indptr = M.A_indptr[0]
+    n = len(indptr) - 1
+    history = np.zeros(maxiter + 1, dtype=np.float64)
+    x = np.zeros(n, dtype=np.float64)
+    if len(b) != n:
+        print("Error: Length of b does not match the hierarchy")
+        return x, 0, history[:1], -3
+    if x0 is not None:
+        x[:] = x0
+    r = np.empty(n, dtype=np.float64)
+    e = np.empty(n, dtype=np.float64)
+    bnorm = np.sqrt(np.dot(b, b))
+    if bnorm == 0.0:
+        x[:] = 0.0
+        return x, 0, history[:1], 0
+
+    for it in range(maxiter + 1):
+        r[:] = b
+        spmv_csr(data, indices, indptr, x, r, -1.0, 1.0)
+        history[it] = np.sqrt(np.dot(r, r)) / bnorm
+        if history[it] <= tol:
+            return x, it, history[:it + 1], 0
+        if it == maxiter:
+            break
+        info = precond_amg(M, r, e)
+        if info != 0:
+            return x, it, history[:it + 1], info
+        x += e
+    return x, maxiter, history, 1
+
+
+@njit(nogil=True)
+def amg_free(M):
+    """
+    Free the coarse-level SuperLU/UMFPACK factors of a hierarchy. The rest
+    is released by Numba; for GP-LU coarse solves this does nothing.
+
+    Returns:
+    --------
+    info : int
+        Status code (0 for success)
+    """
+    handle = M.coarse_handle
+    M.coarse_handle = 0
+    if handle == 0:
+        return 0
+    if M.coarse_solver == AMG_COARSE_SUPERLU:
+        _superlu_free(handle)
+    elif M.coarse_solver == AMG_COARSE_UMFPACK:
+        _umfpack_free(handle)
+    return 0
@@ -0,0 +1,126 @@
+"""
+Tests for the smoothed-aggregation AMG preconditioner.
+The coarsest level uses the pure-Numba GP-LU, so the tests run without
+the SuperLU / UMFPACK libraries.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_amg.py
+
+import numpy as np
+import scipy.sparse as sp
+from sparse_numba.amg.amg_numba import (
+    amg_setup,
+    precond_amg,
+    amg_solve,
+    amg_free,
+    AMG_COARSE_GPLU,
+)
+from sparse_numba.krylov.krylov_numba import cg_csr
+
+
+def _laplacian_3d(m):
+    """7-point 3D Laplacian on an m x m x m grid, as CSR."""
+    T = sp.diags([-np.ones(m - 1), 2.0 * np.ones(m), -np.ones(m - 1)], [-1, 0, 1])
+    I = sp.eye(m)
+    A = sp.kron(sp.kron(T, I), I) + sp.kron(sp.kron(I, T), I) + sp.kron(sp.kron(I, I), T)
+    return A.tocsr()
+
+
+def test_hierarchy():
+    """Coarsening and Galerkin coarse operators."""
+    print("Test: amg_setup hierarchy")
+    A = _laplacian_3d(16)
+    M, info = amg_setup(A.data, A.indices, A.indptr, 0.0, 10, 50, 1, AMG_COARSE_GPLU)
+    assert info == 0
+    sizes = M.level_sizes
+    assert M.n_levels >= 3 and sizes[0] == A.shape[0] and sizes[-1] <= 50
+    assert np.all(np.diff(sizes) < 0)
+    assert M.operator_complexity < 3.0
+
+    n0, n1 = sizes[0], sizes[1]
+    P = sp.csr_matrix((M.P_data[0], M.P_indices[0], M.P_indptr[0]), shape=(n0, n1))
+    R = sp.csr_matrix((M.R_data[0], M.R_indices[0], M.R_indptr[0]), shape=(n1, n0))
+    A1 = sp.csr_matrix((M.A_data[1], M.A_indices[1], M.A_indptr[1]), shape=(n1, n1))
+    assert abs(R - P.T).max() < 1e-14
+    assert abs(A1 - P.T @ A @ P).max() < 1e-12
+    # The coarse operator of an SPD matrix stays symmetric
+    assert abs(A1 - A1.T).max() < 1e-12
+
+    # Small matrices are solved directly on one level
+    B = _laplacian_3d(4)
+    M, info = amg_setup(B.data, B.indices, B.indptr)
+    assert info == 0 and M.n_levels == 1
+    b = np.ones(64)
+    x, n_iter, _, info = amg_solve(M, b)
+    assert info == 0 and n_iter == 1 and np.allclose(B @ x, b)
+    print("  PASSED")
+
+
+def test_solve_and_precondition():
+    """V-cycle iteration and AMG-preconditioned CG."""
+    print("Test: amg_solve and precond_amg")
+    A = _laplacian_3d(20)
+    n = A.shape[0]
+    b = np.random.default_rng(0).standard_normal(n)
+    M, info = amg_setup(A.data, A.indices, A.indptr, 0.0, 10, 100)
+    assert info == 0
+
+    x, n_iter, hist, info = amg_solve(M, b, None, 1e-8, 100)
+    assert info == 0 and len(hist) == n_iter + 1
+    assert np.linalg.norm(A @ x - b) <= 1e-8 * np.linalg.norm(b)
+    # Roughly constant reduction per cycle, independent of the start
+    assert hist[-1] / hist[-2] < 0.7
+
+    _, it_cg, _, info = cg_csr(A.data, A.indices, A.indptr, b, None, 1e-8, 1000)
+    x, it_amg, _, info = cg_csr(A.data, A.indices, A.indptr, b, None, 1e-8, 1000, precond_amg, M)
+    assert info == 0 and it_amg < it_cg / 2
+    assert np.linalg.norm(A @ x - b) <= 1e-8 * np.linalg.norm(b) * 1.01
+
+    # Warm start from the solution
+    _, n_iter, _, info = amg_solve(M, b, x, 1e-6)
+    assert info == 0 and n_iter == 0
+    assert amg_free(M) == 0
+    print("  PASSED")
+
+
+def test_errors():
+    """Zero diagonals, non-square input and mismatched right-hand sides."""
+    print("Test: AMG error codes")
+    A = _laplacian_3d(5).tolil()
+    A[3, 3] = 0.0
+    A = A.tocsr()
+    A.eliminate_zeros()
+    _, info = amg_setup(A.data, A.indices, A.indptr)
+    assert info == -3
+
+    # Column index out of range: no level and no coarse factorization
+    M, info = amg_setup(np.ones(3), np.array([0, 1, 7], dtype=np.int32),
+                        np.array([0, 1, 2, 3], dtype=np.int32))
+    assert info == -3 and M.n_levels == 0
+
+    B = _laplacian_3d(5)
+    M, info = amg_setup(B.data, B.indices, B.indptr)
+    _, _, _, info = amg_solve(M, np.ones(10))
+    assert info == -3
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Smoothed-Aggregation AMG Tests")
+    print("=" * 60)
+    test_hierarchy()
+    test_solve_and_precondition()
+    test_errors()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
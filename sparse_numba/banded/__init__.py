@@ -0,0 +1,31 @@
+from .banded_numba import (
+    csc_bandwidth, csc_to_band,
+    csc_to_tridiagonal, csc_to_cyclic_tridiagonal, csc_to_block_tridiagonal,
+    banded_lu_factor, banded_lu_solve,
+    banded_solve, banded_solve_csc,
+    banded_factorize, banded_solve_factored,
+    tridiagonal_solve, tridiagonal_factorize, tridiagonal_solve_factored,
+    cyclic_tridiagonal_solve, cyclic_tridiagonal_factorize,
+    cyclic_tridiagonal_solve_factored,
+    block_tridiagonal_solve, block_tridiagonal_factorize,
+    block_tridiagonal_solve_factored,
+    BandedFactors, TridiagonalFactors, CyclicTridiagonalFactors,
+    BlockTridiagonalFactors,
+)
+
+__all__ = [
+    'csc_bandwidth', 'csc_to_band',
+    'csc_to_tridiagonal', 'csc_to_cyclic_tridiagonal', 'csc_to_block_tridiagonal',
+    'banded_lu_factor', 'banded_lu_solve',
+    'banded_solve', 'banded_solve_csc',
+    'banded_factorize', 'banded_solve_factored',
+    'tridiagonal_solve', 'tridiagonal_factorize', 'tridiagonal_solve_factored',
+    'cyclic_tridiagonal_solve', 'cyclic_tridiagonal_factorize',
+    'cyclic_tridiagonal_solve_factored',
+    'block_tridiagonal_solve', 'block_tridiagonal_factorize',
+    'block_tridiagonal_solve_factored',
+    'BandedFactors', 'TridiagonalFactors', 'CyclicTridiagonalFactors',
+    'BlockTridiagonalFactors',
+]
+
+__author__ = 'Tianqi Hong'
@@ -0,0 +1,877 @@
+"""
+Banded, tridiagonal and block-tridiagonal solvers.
+    csc_bandwidth
+    csc_to_band, csc_to_tridiagonal, csc_to_cyclic_tridiagonal,
+    csc_to_block_tridiagonal
+    banded_lu_factor, banded_lu_solve, banded_solve, banded_solve_csc
+    banded_factorize, banded_solve_factored
+    tridiagonal_solve, tridiagonal_factorize, tridiagonal_solve_factored
+    cyclic_tridiagonal_solve, cyclic_tridiagonal_factorize,
+    cyclic_tridiagonal_solve_factored
+    block_tridiagonal_solve, block_tridiagonal_factorize,
+    block_tridiagonal_solve_factored
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: banded_numba.py
+
+import numpy as np
+from numba import njit, int32, int64, float64
+from numba.experimental import jitclass
+
+from sparse_numba.dense.dense_lu_numba import _lu_factor_inplace, _lu_solve_factored_inplace
+
+
+@njit(nogil=True)
+def csc_bandwidth(indices, indptr):
+    """
+    Lower and upper bandwidth of a CSC matrix.
+
+    Parameters:
+    -----------
+    indices : ndarray
+        Row indices in CSC format
+    indptr : ndarray
+        Column pointers in CSC format
+
+    Returns:
+    --------
+    kl : int
+        Number of subdiagonals (max of i - j over the nonzeros)
+    ku : int
+        Number of superdiagonals (max of j - i over the nonzeros)
+    """
+    kl = 0
+    ku = 0
+    for j in range(len(indptr) - 1):
+        for k in range(indptr[j], indptr[j + 1]):
+            d = indices[k] - j
+            if d > kl:
+                kl = d
+            elif -d > ku:
+                ku = -d
+    return kl, ku
+
+
+@njit(nogil=True)
+def csc_to_band(data, indices, indptr, kl, ku):
+    """
+    Scatter a square CSC matrix into LAPACK gbsv band storage
+    (duplicates summed).
+
+    The result has 2*kl + ku + 1 rows: A[i, j] is stored at
+    ab[kl + ku + i - j, j], and the first kl rows are left as zero room
+    for the fill-in created by row interchanges. Entries outside the band
+    are ignored.
+
+    Parameters:
+    -----------
+    data : ndarray
+        Nonzero values in CSC format
+    indices : ndarray
+        Row indices in CSC format
+    indptr : ndarray
+        Column pointers in CSC format
+    kl : int
+        Number of subdiagonals, at least the true lower bandwidth
+    ku : int
+        Number of superdiagonals, at least the true upper bandwidth
+
+    Returns:
+    --------
+    ab : ndarray (float64)
+        Band storage, shape (2*kl + ku + 1, n)
+    """
+    n = len(indptr) - 1
+    kv = kl + ku
+    ab = np.zeros((2 * kl + ku + 1, n), dtype=np.float64)
+    for j in range(n):
+        for k in range(indptr[j], indptr[j + 1]):
+            d = indices[k] - j
+            if -ku <= d <= kl:
+                ab[kv + d, j] += data[k]
+    return ab
+
+
+@njit(nogil=True)
+def csc_to_tridiagonal(data, indices, indptr):
+    """
+    Extract the three diagonals of a square CSC matrix (duplicates summed,
+    entries outside the tridiagonal band ignored).
+
+    Parameters:
+    -----------
+    data : ndarray
+        Nonzero values in CSC format
+    indices : ndarray
+        Row indices in CSC format
+    indptr : ndarray
+        Column pointers in CSC format
+
+    Returns:
+    --------
+    dl : ndarray (float64)
+        Subdiagonal, dl[i] = A[i + 1, i], length n - 1
+    d : ndarray (float64)
+        Diagonal, length n
+    du : ndarray (float64)
+        Superdiagonal, du[i] = A[i, i + 1], length n - 1
+    """
+    n = len(indptr) - 1
+    dl = np.zeros(max(n - 1, 0), dtype=np.float64)
+    d = np.zeros(n, dtype=np.float64)
+    du = np.zeros(max(n - 1, 0), dtype=np.float64)
+    for j in range(n):
+        for k in range(indptr[j], indptr[j + 1]):
+            i = indices[k]
+            if i == j:
+                d[j] += data[k]
+            elif i == j + 1:
+                dl[j] += data[k]
+            elif i == j - 1:
+                du[i] += data[k]
+    return dl, d, du
+
+
+@njit(nogil=True)
+def csc_to_cyclic_tridiagonal(data, indices, indptr):
+    """
+    Extract the diagonals and the two corner entries of a square CSC
+    matrix with periodic tridiagonal structure (n >= 3).
+
+    Parameters:
+    -----------
+    data : ndarray
+        Nonzero values in CSC format
+    indices : ndarray
+        Row indices in CSC format
+    indptr : ndarray
+        Column pointers in CSC format
+
+    Returns:
+    --------
+    dl, d, du : ndarray (float64)
+        Diagonals as in csc_to_tridiagonal
+    lower_corner : float
+        A[n - 1, 0]
+    upper_corner : float
+        A[0, n - 1]
+    """
+    n = len(indptr) - 1
+    dl, d, du = csc_to_tridiagonal(data, indices, indptr)
+    lower_corner = 0.0
+    upper_corner = 0.0
+    for k in range(indptr[0], indptr[1]):
+        if indices[k] == n - 1 and n > 2:
+            lower_corner += data[k]
+    for k in range(indptr[n - 1], indptr[n]):
+        if indices[k] == 0 and n > 2:
+            upper_corner += data[k]
+    return dl, d, du, lower_corner, upper_corner
+
+
+@njit(nogil=True)
+def csc_to_block_tridiagonal(data, indices, indptr, block_size):
+    """
+    Scatter a square CSC matrix into block-tridiagonal storage (duplicates
+    summed, entries outside the block band ignored). n must be a multiple
+    of block_size.
+
+    Parameters:
+    -----------
+    data : ndarray
+        Nonzero values in CSC format
+    indices : ndarray
+        Row indices in CSC format
+    indptr : ndarray
+        Column pointers in CSC format
+    block_size : int
+        Size m of every block
+
+    Returns:
+    --------
+    lower : ndarray (float64)
+        Sub-diagonal blocks, shape (nb - 1, m, m), lower[k] = A_{k+1, k}
+    diag : ndarray (float64)
+        Diagonal blocks, shape (nb, m, m)
+    upper : ndarray (float64)
+        Super-diagonal blocks, shape (nb - 1, m, m), upper[k] = A_{k, k+1}
+    """
+    n = len(indptr) - 1
+    m = block_size
+    nb = n // m
+    lower = np.zeros((max(nb - 1, 0), m, m), dtype=np.float64)
+    diag = np.zeros((nb, m, m), dtype=np.float64)
+    upper = np.zeros((max(nb - 1, 0), m, m), dtype=np.float64)
+    for j in range(n):
+        bj = j // m
+        c = j - bj * m
+        for k in range(indptr[j], indptr[j + 1]):
+            i = indices[k]
+            bi = i // m
+            r = i - bi * m
+            if bi == bj:
+                diag[bi, r, c] += data[k]
+            elif bi == bj + 1:
+                lower[bj, r, c] += data[k]
+            elif bi == bj - 1:
+                upper[bi, r, c] += data[k]
+    return lower, diag, upper
+
+
+@njit(nogil=True)
+def banded_lu_factor(ab, kl, ku):
+    """
+    LU factorization with partial pivoting of a band matrix, in place
+    (the unblocked LAPACK gbtf2 algorithm).
+
+    Parameters:
+    -----------
+    ab : ndarray (float64)
+        Band storage from csc_to_band, shape (2*kl + ku + 1, n),
+        overwritten with the factors
+    kl : int
+        Number of subdiagonals
+    ku : int
+        Number of superdiagonals
+
+    Returns:
+    --------
+    ipiv : ndarray (int32)
+        Row interchanges: row j was swapped with row ipiv[j]
+    info : int
+        Status code (0 for success, j + 1 if U(j, j) is exactly zero)
+    """
+    n = ab.shape[1]
+    kv = kl + ku
+    ipiv = np.zeros(n, dtype=np.int32)
+    ju = 0  # Last column touched by the row interchanges so far
+    for j in range(n):
+        km = min(kl, n - 1 - j)
+
+        # Pivot search in column j
+        jp = 0
+        amax = abs(ab[kv, j])
+        for i in range(1, km + 1):
+            v = abs(ab[kv + i, j])
+            if v > amax:
+                amax = v
+                jp = i
+        ipiv[j] = j + jp
+        if amax == 0.0:
+            return ipiv, j + 1
+
+        ju = max(ju, min(j + ku + jp, n - 1))
+        if jp != 0:
+            for c in range(j, ju + 1):
+                r = kv + j - c
+                tmp = ab[r, c]
+                ab[r, c] = ab[r + jp, c]
+                ab[r + jp, c] = tmp
+
+        # Multipliers and rank-1 update of the trailing band
+        inv_pivot = 1.0 / ab[kv, j]
+        for i in range(1, km + 1):
+            ab[kv + i, j] *= inv_pivot
+        for c in range(j + 1, ju + 1):
+            r = kv + j - c
+            t = ab[r, c]
+            if t != 0.0:
+                for i in range(1, km + 1):
+                    ab[r + i, c] -= ab[kv + i, j] * t
+    return ipiv, 0
+
+
+@njit(nogil=True)
+def banded_lu_solve(ab, kl, ku, ipiv, b):
+    """
+    Solve A x = b with the factors from banded_lu_factor.
+
+    Parameters:
+    -----------
+    ab : ndarray (float64)
+        Factored band storage from banded_lu_factor
+    kl : int
+        Number of subdiagonals
+    ku : int
+        Number of superdiagonals
+    ipiv : ndarray (int32)
+        Row interchanges from banded_lu_factor
+    b : ndarray
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    """
+    n = ab.shape[1]
+    kv = kl + ku
+    x = b.astype(np.float64)
+
+    # Forward: row interchanges and unit lower triangle
+    for j in range(n - 1):
+        p = ipiv[j]
+        if p != j:
+            tmp = x[j]
+            x[j] = x[p]
+            x[p] = tmp
+        xj = x[j]
+        if xj != 0.0:
+            for i in range(1, min(kl, n - 1 - j) + 1):
+                x[j + i] -= ab[kv + i, j] * xj
+
+    # Backward: upper triangle with kl + ku superdiagonals
+    for j in range(n - 1, -1, -1):
+        xj = x[j] / ab[kv, j]
+        x[j] = xj
+        if xj != 0.0:
+            for i in range(max(0, j - kv), j):
+                x[i] -= ab[kv + i - j, j] * xj
+    return x
+
+
+@njit(nogil=True)
+def banded_solve(ab, kl, ku, b):
+    """
+    Solve A x = b for a band matrix (LAPACK gbsv equivalent).
+    ab is overwritten with the factors.
+
+    Parameters:
+    -----------
+    ab : ndarray (float64)
+        Band storage from csc_to_band, shape (2*kl + ku + 1, n)
+    kl : int
+        Number of subdiagonals
+    ku : int
+        Number of superdiagonals
+    b : ndarray
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success)
+    """
+    ipiv, info = banded_lu_factor(ab, kl, ku)
+    if info != 0:
+        return np.zeros(len(b), dtype=np.float64), info
+    return banded_lu_solve(ab, kl, ku, ipiv, b), 0
+
+
+@njit(nogil=True)
+def banded_solve_csc(csc_data, csc_indices, csc_indptr, b):
+    """
+    Solve Ax = b for a square CSC matrix with a narrow band.
+    The bandwidth is detected from the pattern.
+
+    Parameters:
+    -----------
+    csc_data : ndarray
+        Nonzero values in CSC format
+    csc_indices : ndarray
+        Row indices in CSC format
+    csc_indptr : ndarray
+        Column pointers in CSC format
+    b : ndarray
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray
+        Solution vector
+    info : int
+        Status code (0 for success)
+    """
+    kl, ku = csc_bandwidth(csc_indices, csc_indptr)
+    ab = csc_to_band(csc_data, csc_indices, csc_indptr, kl, ku)
+    return banded_solve(ab, kl, ku, b)
+
+
+# ================================================================
+# Factorize once, solve many times
+# ================================================================
+
+@jitclass([
+    ('ab', float64[:, ::1]),
+    ('kl', int64),
+    ('ku', int64),
+    ('ipiv', int32[::1]),
+])
+class BandedFactors:
+    """Band LU factors from banded_factorize."""
+
+    def __init__(self, ab, kl, ku, ipiv):
+        self.ab = ab
+        self.kl = kl
+        self.ku = ku
+        self.ipiv = ipiv
+
+
+@jitclass([
+    ('dl', float64[::1]),
+    ('inv_d', float64[::1]),
+    ('du', float64[::1]),
+])
+class TridiagonalFactors:
+    """Thomas algorithm factors from tridiagonal_factorize."""
+
+    def __init__(self, dl, inv_d, du):
+        self.dl = dl
+        self.inv_d = inv_d
+        self.du = du
+
+
+@jitclass([
+    ('tri', TridiagonalFactors.class_type.instance_type),
+    ('z', float64[::1]),
+    ('gamma', float64),
+    ('upper_corner', float64),
+    ('inv_denom', float64),
+])
+class CyclicTridiagonalFactors:
+    """Sherman-Morrison factors from cyclic_tridiagonal_factorize."""
+
+    def __init__(self, tri, z, gamma, upper_corner, inv_denom):
+        self.tri = tri
+        self.z = z
+        self.gamma = gamma
+        self.upper_corner = upper_corner
+        self.inv_denom = inv_denom
+
+
+@jitclass([
+    ('lower', float64[:, :, ::1]),
+    ('lu', float64[:, :, ::1]),
+    ('piv', int32[:, ::1]),
+    ('c', float64[:, :, ::1]),
+])
+class BlockTridiagonalFactors:
+    """Block LU factors from block_tridiagonal_factorize."""
+
+    def __init__(self, lower, lu, piv, c):
+        self.lower = lower
+        self.lu = lu
+        self.piv = piv
+        self.c = c
+
+
+@njit(nogil=True)
+def banded_factorize(ab, kl, ku):
+    """
+    Factorize a band matrix once for repeated solves. ab is not modified.
+
+    Parameters:
+    -----------
+    ab : ndarray (float64)
+        Band storage from csc_to_band, shape (2*kl + ku + 1, n)
+    kl : int
+        Number of subdiagonals
+    ku : int
+        Number of superdiagonals
+
+    Returns:
+    --------
+    factors : BandedFactors
+        Factors for banded_solve_factored
+    info : int
+        Status code (0 for success, j + 1 if U(j, j) is exactly zero)
+    """
+    lu = np.ascontiguousarray(ab).astype(np.float64)
+    ipiv, info = banded_lu_factor(lu, kl, ku)
+    return BandedFactors(lu, kl, ku, ipiv), info
+
+
+@njit(nogil=True)
+def banded_solve_factored(factors, b):
+    """
+    Solve A x = b with the factors from banded_factorize.
+
+    Parameters:
+    -----------
+    factors : BandedFactors
+        Factors from banded_factorize
+    b : ndarray
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success, -3 if the length of b does not match)
+    """
+    if len(b) != factors.ab.shape[1]:
+        print("Error: Length of b does not match the factors")
+        return np.zeros(len(b), dtype=np.float64), -3
+    return banded_lu_solve(factors.ab, factors.kl, factors.ku, factors.ipiv, b), 0
+
+
+@njit(nogil=True)
+def tridiagonal_factorize(dl, d, du):
+    """
+    Factorize a tridiagonal matrix with the Thomas algorithm (no pivoting).
+
+    Stable for diagonally dominant or symmetric positive definite
+    matrices; use banded_factorize with kl = ku = 1 otherwise.
+
+    Parameters:
+    -----------
+    dl : ndarray
+        Subdiagonal, dl[i] = A[i + 1, i], length n - 1
+    d : ndarray
+        Diagonal, length n
+    du : ndarray
+        Superdiagonal, du[i] = A[i, i + 1], length n - 1
+
+    Returns:
+    --------
+    factors : TridiagonalFactors
+        Factors for tridiagonal_solve_factored
+    info : int
+        Status code (0 for success, i + 1 if pivot i is exactly zero)
+    """
+    n = len(d)
+    inv_d = np.empty(n, dtype=np.float64)
+    c = np.empty(max(n - 1, 0), dtype=np.float64)
+    lower = np.ascontiguousarray(dl).astype(np.float64)
+    if n == 0:
+        return TridiagonalFactors(lower, inv_d, c), 0
+    info = 0
+    m = d[0]
+    for i in range(n):
+        if i > 0:
+            m = d[i] - lower[i - 1] * c[i - 1]
+        if m == 0.0:
+            info = i + 1
+            break
+        inv_d[i] = 1.0 / m
+        if i < n - 1:
+            c[i] = du[i] * inv_d[i]
+    return TridiagonalFactors(lower, inv_d, c), info
+
+
+@njit(nogil=True)
+def _tridiagonal_solve_factored(factors, b, x):
+    n = len(factors.inv_d)
+    dl = factors.dl
+    inv_d = factors.inv_d
+    c = factors.du
+    if n == 0:
+        return
+    x[0] = b[0] * inv_d[0]
+    for i in range(1, n):
+        x[i] = (b[i] - dl[i - 1] * x[i - 1]) * inv_d[i]
+    for i in range(n - 2, -1, -1):
+        x[i] -= c[i] * x[i + 1]
+
+
+@njit(nogil=True)
+def tridiagonal_solve_factored(factors, b):
+    """
+    Solve A x = b with the factors from tridiagonal_factorize.
+
+    Parameters:
+    -----------
+    factors : TridiagonalFactors
+        Factors from tridiagonal_factorize
+    b : ndarray
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success, -3 if the length of b does not match)
+    """
+    n = len(factors.inv_d)
+    x = np.zeros(len(b), dtype=np.float64)
+    if len(b) != n:
+        print("Error: Length of b does not match the factors")
+        return x, -3
+    _tridiagonal_solve_factored(factors, b, x)
+    return x, 0
+
+
+@njit(nogil=True)
+def tridiagonal_solve(dl, d, du, b):
+    """
+    Solve a tridiagonal system with the Thomas algorithm, O(n).
+
+    Parameters:
+    -----------
+    dl : ndarray
+        Subdiagonal, dl[i] = A[i + 1, i], length n - 1
+    d : ndarray
+        Diagonal, length n
+    du : ndarray
+        Superdiagonal, du[i] = A[i, i + 1], length n - 1
+    b : ndarray
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success)
+    """
+    factors, info = tridiagonal_factorize(dl, d, du)
+    if info != 0:
+        return np.zeros(len(b), dtype=np.float64), info
+    return tridiagonal_solve_factored(factors, b)
+
+
+@njit(nogil=True)
+def cyclic_tridiagonal_factorize(dl, d, du, lower_corner, upper_corner):
+    """
+    Factorize a periodic tridiagonal matrix (n >= 3), i.e. a tridiagonal
+    matrix plus the corner entries A[n - 1, 0] and A[0, n - 1], using the
+    Sherman-Morrison formula on top of the Thomas algorithm.
+
+    Parameters:
+    -----------
+    dl, d, du : ndarray
+        Diagonals as in tridiagonal_factorize
+    lower_corner : float
+        A[n - 1, 0]
+    upper_corner : float
+        A[0, n - 1]
+
+    Returns:
+    --------
+    factors : CyclicTridiagonalFactors
+        Factors for cyclic_tridiagonal_solve_factored
+    info : int
+        Status code (0 for success, -2 for n < 3, positive if the
+        modified tridiagonal matrix or the correction is singular)
+    """
+    n = len(d)
+    gamma = -d[0] if d[0] != 0.0 else -1.0
+    dd = np.ascontiguousarray(d).astype(np.float64)
+    if n < 3:
+        print("Error: Cyclic tridiagonal systems need n >= 3")
+        tri, _ = tridiagonal_factorize(dl, dd, du)
+        return CyclicTridiagonalFactors(tri, np.zeros(n, dtype=np.float64), gamma, 0.0, 0.0), -2
+
+    # A = T + u v^T with u = (gamma, 0, ..., 0, lower_corner) and
+    # v = (1, 0, ..., 0, upper_corner / gamma)
+    dd[0] -= gamma
+    dd[n - 1] -= lower_corner * upper_corner / gamma
+    tri, info = tridiagonal_factorize(dl, dd, du)
+    z = np.zeros(n, dtype=np.float64)
+    if info != 0:
+        return CyclicTridiagonalFactors(tri, z, gamma, upper_corner, 0.0), info
+
+    u = np.zeros(n, dtype=np.float64)
+    u[0] = gamma
+    u[n - 1] = lower_corner
+    _tridiagonal_solve_factored(tri, u, z)
+    denom = 1.0 + z[0] + upper_corner * z[n - 1] / gamma
+    if denom == 0.0:
+        return CyclicTridiagonalFactors(tri, z, gamma, upper_corner, 0.0), n + 1
+    return CyclicTridiagonalFactors(tri, z, gamma, upper_corner, 1.0 / denom), 0
+
+
+@njit(nogil=True)
+def cyclic_tridiagonal_solve_factored(factors, b):
+    """
+    Solve A x = b with the factors from cyclic_tridiagonal_factorize.
+
+    Parameters:
+    -----------
+    factors : CyclicTridiagonalFactors
+        Factors from cyclic_tridiagonal_factorize
+    b : ndarray
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success, -3 if the length of b does not match)
+    """
+    n = len(factors.z)
+    x = np.zeros(len(b), dtype=np.float64)
+    if len(b) != n:
+        print("Error: Length of b does not match the factors")
+        return x, -3
+    _tridiagonal_solve_factored(factors.tri, b, x)
+    z = factors.z
+    t = (x[0] + factors.upper_corner * x[n - 1] / factors.gamma) * factors.inv_denom
+    for i in range(n):
+        x[i] -= t * z[i]
+    return x, 0
+
+
+@njit(nogil=True)
+def cyclic_tridiagonal_solve(dl, d, du, lower_corner, upper_corner, b):
+    """
+    Solve a periodic tridiagonal system (n >= 3), O(n).
+
+    Parameters:
+    -----------
+    dl, d, du : ndarray
+        Diagonals as in tridiagonal_solve
+    lower_corner : float
+        A[n - 1, 0]
+    upper_corner : float
+        A[0, n - 1]
+    b : ndarray
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success)
+    """
+    factors, info = cyclic_tridiagonal_factorize(dl, d, du, lower_corner, upper_corner)
+    if info != 0:
+        return np.zeros(len(b), dtype=np.float64), info
+    return cyclic_tridiagonal_solve_factored(factors, b)
+
+
+@njit(nogil=True)
+def block_tridiagonal_factorize(lower, diag, upper):
+    """
+    Block LU factorization of a block-tridiagonal matrix (block Thomas
+    algorithm). Each diagonal Schur complement is factorized with partial
+    pivoting; there is no pivoting between blocks, so the matrix should be
+    block diagonally dominant (or symmetric positive definite).
+
+    Parameters:
+    -----------
+    lower : ndarray (float64)
+        Sub-diagonal blocks, shape (nb - 1, m, m), lower[k] = A_{k+1, k}
+    diag : ndarray (float64)
+        Diagonal blocks, shape (nb, m, m)
+    upper : ndarray (float64)
+        Super-diagonal blocks, shape (nb - 1, m, m), upper[k] = A_{k, k+1}
+
+    Returns:
+    --------
+    factors : BlockTridiagonalFactors
+        Factors for block_tridiagonal_solve_factored
+    info : int
+        Status code (0 for success, k * m + j + 1 if diagonal block k
+        has a zero pivot in column j)
+    """
+    nb = diag.shape[0]
+    m = diag.shape[1]
+    lu = np.ascontiguousarray(diag).astype(np.float64)
+    low = np.ascontiguousarray(lower).astype(np.float64)
+    piv = np.zeros((nb, m), dtype=np.int32)
+    c = np.zeros((max(nb - 1, 0), m, m), dtype=np.float64)
+    col = np.empty(m, dtype=np.float64)
+    for k in range(nb):
+        if k > 0:
+            # S_k = D_k - L_{k-1} C_{k-1}
+            for r in range(m):
+                for q in range(m):
+                    l_rq = low[k - 1, r, q]
+                    if l_rq != 0.0:
+                        for s in range(m):
+                            lu[k, r, s] -= l_rq * c[k - 1, q, s]
+        info = _lu_factor_inplace(lu[k], piv[k])
+        if info != 0:
+            return BlockTridiagonalFactors(low, lu, piv, c), k * m + info
+        if k < nb - 1:
+            # C_k = S_k^{-1} U_k, one column at a time
+            for s in range(m):
+                for r in range(m):
+                    col[r] = upper[k, r, s]
+                _lu_solve_factored_inplace(lu[k], piv[k], col)
+                for r in range(m):
+                    c[k, r, s] = col[r]
+    return BlockTridiagonalFactors(low, lu, piv, c), 0
+
+
+@njit(nogil=True)
+def block_tridiagonal_solve_factored(factors, b):
+    """
+    Solve A x = b with the factors from block_tridiagonal_factorize.
+
+    Parameters:
+    -----------
+    factors : BlockTridiagonalFactors
+        Factors from block_tridiagonal_factorize
+    b : ndarray
+        Right-hand side vector, length nb * m
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success, -3 if the length of b does not match)
+    """
+    nb = factors.lu.shape[0]
+    m = factors.lu.shape[1]
+    x = b.astype(np.float64)
+    if len(b) != nb * m:
+        print("Error: Length of b does not match the factors")
+        return np.zeros(len(b), dtype=np.float64), -3
+    low = factors.lower
+    c = factors.c
+
+    # Forward: y_k = S_k^{-1} (b_k - L_{k-1} y_{k-1})
+    for k in range(nb):
+        xk = x[k * m:(k + 1) * m]
+        if k > 0:
+            prev = x[(k - 1) * m:k * m]
+            for r in range(m):
+                s = 0.0
+                for q in range(m):
+                    s += low[k - 1, r, q] * prev[q]
+                xk[r] -= s
+        _lu_solve_factored_inplace(factors.lu[k], factors.piv[k], xk)
+
+    # Backward: x_k = y_k - C_k x_{k+1}
+    for k in range(nb - 2, -1, -1):
+        xk = x[k * m:(k + 1) * m]
+        nxt = x[(k + 1) * m:(k + 2) * m]
+        for r in range(m):
+            s = 0.0
+            for q in range(m):
+                s += c[k, r, q] * nxt[q]
+            xk[r] -= s
+    return x, 0
+
+
+@njit(nogil=True)
+def block_tridiagonal_solve(lower, diag, upper, b):
+    """
+    Solve a block-tridiagonal system, O(nb * m^3).
+
+    Parameters:
+    -----------
+    lower : ndarray (float64)
+        Sub-diagonal blocks, shape (nb - 1, m, m)
+    diag : ndarray (float64)
+        Diagonal blocks, shape (nb, m, m)
+    upper : ndarray (float64)
+        Super-diagonal blocks, shape (nb - 1, m, m)
+    b : ndarray
+        Right-hand side vector, length nb * m
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success)
+    """
+    factors, info = block_tridiagonal_factorize(lower, diag, upper)
+    if info != 0:
+        return np.zeros(len(b), dtype=np.float64), info
+    return block_tridiagonal_solve_factored(factors, b)
@@ -0,0 +1,165 @@
+"""
+Tests for the tridiagonal, cyclic tridiagonal and block-tridiagonal
+solvers and their factorize-once handles.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_tridiagonal.py
+
+import numpy as np
+import scipy.sparse as sp
+from numba import njit
+from sparse_numba.banded.banded_numba import (
+    csc_bandwidth, csc_to_band,
+    csc_to_tridiagonal, csc_to_cyclic_tridiagonal, csc_to_block_tridiagonal,
+    banded_factorize, banded_solve_factored,
+    tridiagonal_solve, tridiagonal_factorize, tridiagonal_solve_factored,
+    cyclic_tridiagonal_solve, cyclic_tridiagonal_factorize,
+    cyclic_tridiagonal_solve_factored,
+    block_tridiagonal_solve, block_tridiagonal_factorize,
+    block_tridiagonal_solve_factored,
+)
+
+
+def _make_test_matrix(n=100, seed=42, cyclic=False):
+    """Diagonally dominant (cyclic) tridiagonal matrix in CSC."""
+    rng = np.random.default_rng(seed)
+    dl = rng.standard_normal(n - 1)
+    du = rng.standard_normal(n - 1)
+    d = 5.0 + rng.random(n)
+    A = sp.diags([dl, d, du], [-1, 0, 1], format='lil')
+    if cyclic:
+        A[n - 1, 0] = 0.7
+        A[0, n - 1] = -1.3
+    A = A.tocsc()
+    A.indices = A.indices.astype(np.int32)
+    A.indptr = A.indptr.astype(np.int32)
+    return A
+
+
+def _make_block_matrix(nb=12, m=4, seed=42):
+    rng = np.random.default_rng(seed)
+    n = nb * m
+    dense = rng.standard_normal((n, n))
+    blocks = np.arange(n) // m
+    dense *= np.abs(blocks[:, None] - blocks[None, :]) <= 1
+    dense += np.eye(n) * 3.0 * m
+    A = sp.csc_matrix(dense)
+    A.indices = A.indices.astype(np.int32)
+    A.indptr = A.indptr.astype(np.int32)
+    return A
+
+
+def test_tridiagonal():
+    """Thomas algorithm, one-shot and with reused factors."""
+    print("Test: tridiagonal_solve / tridiagonal_factorize")
+    A = _make_test_matrix()
+    dl, d, du = csc_to_tridiagonal(A.data, A.indices, A.indptr)
+    assert np.array_equal(d, A.diagonal()) and np.array_equal(dl, A.diagonal(-1))
+    assert np.array_equal(du, A.diagonal(1))
+
+    b = np.linspace(-1.0, 1.0, 100)
+    x, info = tridiagonal_solve(dl, d, du, b)
+    assert info == 0 and np.abs(A @ x - b).max() < 1e-12
+
+    factors, info = tridiagonal_factorize(dl, d, du)
+    assert info == 0
+    for seed in range(3):
+        b = np.random.default_rng(seed).standard_normal(100)
+        x, info = tridiagonal_solve_factored(factors, b)
+        assert info == 0 and np.abs(A @ x - b).max() < 1e-12
+
+    _, info = tridiagonal_solve_factored(factors, np.ones(99))
+    assert info == -3
+    _, info = tridiagonal_factorize(np.zeros(2), np.array([1.0, 0.0, 1.0]), np.zeros(2))
+    assert info == 2
+    factors, info = tridiagonal_factorize(np.zeros(0), np.zeros(0), np.zeros(0))
+    assert info == 0
+    x, info = tridiagonal_solve_factored(factors, np.zeros(0))
+    assert info == 0 and len(x) == 0
+    print("  PASSED")
+
+
+def test_cyclic_tridiagonal():
+    """Periodic tridiagonal systems through Sherman-Morrison."""
+    print("Test: cyclic_tridiagonal_solve")
+    A = _make_test_matrix(cyclic=True)
+    dl, d, du, lower_corner, upper_corner = csc_to_cyclic_tridiagonal(A.data, A.indices, A.indptr)
+    assert (lower_corner, upper_corner) == (0.7, -1.3)
+
+    b = np.linspace(-1.0, 1.0, 100)
+    x, info = cyclic_tridiagonal_solve(dl, d, du, lower_corner, upper_corner, b)
+    assert info == 0 and np.abs(A @ x - b).max() < 1e-12
+
+    factors, info = cyclic_tridiagonal_factorize(dl, d, du, lower_corner, upper_corner)
+    assert info == 0
+    b = np.random.default_rng(3).standard_normal(100)
+    x, info = cyclic_tridiagonal_solve_factored(factors, b)
+    assert info == 0 and np.abs(A @ x - b).max() < 1e-12
+    print("  PASSED")
+
+
+def test_block_tridiagonal():
+    """Block Thomas algorithm against the band solver and the residual."""
+    print("Test: block_tridiagonal_solve")
+    A = _make_block_matrix()
+    lower, diag, upper = csc_to_block_tridiagonal(A.data, A.indices, A.indptr, 4)
+    assert diag.shape == (12, 4, 4) and lower.shape == (11, 4, 4)
+    assert np.array_equal(diag[2], A.toarray()[8:12, 8:12])
+    assert np.array_equal(lower[2], A.toarray()[12:16, 8:12])
+
+    b = np.linspace(-1.0, 1.0, 48)
+    x, info = block_tridiagonal_solve(lower, diag, upper, b)
+    assert info == 0 and np.abs(A @ x - b).max() < 1e-12
+
+    factors, info = block_tridiagonal_factorize(lower, diag, upper)
+    assert info == 0
+    x2, info = block_tridiagonal_solve_factored(factors, b)
+    assert info == 0 and np.allclose(x, x2)
+
+    kl, ku = csc_bandwidth(A.indices, A.indptr)
+    factors, info = banded_factorize(csc_to_band(A.data, A.indices, A.indptr, kl, ku), kl, ku)
+    x3, info = banded_solve_factored(factors, b)
+    assert info == 0 and np.allclose(x, x3)
+    print("  PASSED")
+
+
+@njit(nogil=True)
+def _time_steps(dl, d, du, b, n_steps):
+    factors, info = tridiagonal_factorize(dl, d, du)
+    x = b.copy()
+    for _ in range(n_steps):
+        x, info = tridiagonal_solve_factored(factors, x)
+    return x
+
+
+def test_factors_inside_numba():
+    """Factor handles can be created and reused inside jitted code."""
+    print("Test: factor handles inside Numba code")
+    A = _make_test_matrix(30)
+    dl, d, du = csc_to_tridiagonal(A.data, A.indices, A.indptr)
+    b = np.ones(30)
+    x = _time_steps(dl, d, du, b, 3)
+    assert np.abs(A @ (A @ (A @ x)) - b).max() < 1e-12
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Tridiagonal / Block-Tridiagonal Solver Tests")
+    print("=" * 60)
+    test_tridiagonal()
+    test_cyclic_tridiagonal()
+    test_block_tridiagonal()
+    test_factors_inside_numba()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
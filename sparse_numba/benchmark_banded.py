@@ -0,0 +1,187 @@
+"""
+Benchmark: Banded and Tridiagonal Solvers vs SuperLU
+====================================================
+
+For tridiagonal (kl = ku = 1) and narrowly banded (kl = ku = 4) systems
+of increasing size n, times:
+
+    superlu       superlu_solve_csc (natural ordering)
+    banded        csc_to_band + banded_solve (gbsv equivalent)
+    tridiagonal   csc_to_tridiagonal + tridiagonal_solve (kl = ku = 1 only)
+
+and the factorize-once / solve-many case with 100 right-hand sides.
+"""
+
+#  [sparse_numba] (C)2025 Tianqi Hong
+#
+#  BSD License
+
+import numpy as np
+import scipy.sparse as sp
+import time
+import platform
+import matplotlib.pyplot as plt
+from numba import njit
+
+from sparse_numba.sparse_superlu.superlu_numba_interface import (
+    superlu_solve_csc,
+    superlu_factorize_csc,
+    superlu_solve_factored,
+    superlu_free_factors,
+)
+from sparse_numba.banded.banded_numba import (
+    csc_bandwidth, csc_to_band, banded_solve,
+    banded_factorize, banded_solve_factored,
+    csc_to_tridiagonal, tridiagonal_solve,
+    tridiagonal_factorize, tridiagonal_solve_factored,
+)
+
+
+# ================================================================
+# Problem generation
+# ================================================================
+
+def generate_band_matrix(n, half_width, seed=42):
+    """Diagonally dominant band matrix with kl = ku = half_width, in CSC."""
+    rng = np.random.default_rng(seed)
+    offsets = list(range(-half_width, half_width + 1))
+    diagonals = [rng.standard_normal(n - abs(k)) + (2.0 * half_width + 2.0) * (k == 0)
+                 for k in offsets]
+    A = sp.diags(diagonals, offsets, format='csc')
+    return A.data, A.indices.astype(np.int32), A.indptr.astype(np.int32)
+
+
+@njit(nogil=True)
+def solve_banded_csc(data, indices, indptr, b):
+    kl, ku = csc_bandwidth(indices, indptr)
+    ab = csc_to_band(data, indices, indptr, kl, ku)
+    return banded_solve(ab, kl, ku, b)
+
+
+@njit(nogil=True)
+def solve_tridiagonal_csc(data, indices, indptr, b):
+    dl, d, du = csc_to_tridiagonal(data, indices, indptr)
+    return tridiagonal_solve(dl, d, du, b)
+
+
+@njit(nogil=True)
+def repeated_superlu(data, indices, indptr, B):
+    handle, info = superlu_factorize_csc(data, indices, indptr)
+    for k in range(B.shape[0]):
+        x, info = superlu_solve_factored(handle, B[k])
+    superlu_free_factors(handle)
+
+
+@njit(nogil=True)
+def repeated_banded(data, indices, indptr, B):
+    kl, ku = csc_bandwidth(indices, indptr)
+    factors, info = banded_factorize(csc_to_band(data, indices, indptr, kl, ku), kl, ku)
+    for k in range(B.shape[0]):
+        x, info = banded_solve_factored(factors, B[k])
+
+
+@njit(nogil=True)
+def repeated_tridiagonal(data, indices, indptr, B):
+    dl, d, du = csc_to_tridiagonal(data, indices, indptr)
+    factors, info = tridiagonal_factorize(dl, d, du)
+    for k in range(B.shape[0]):
+        x, info = tridiagonal_solve_factored(factors, B[k])
+
+
+def _time_call(func, args, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+# ================================================================
+# Benchmarks
+# ================================================================
+
+def benchmark_single_solve(sizes, half_width, repeat=5):
+    """One solve per call, conversion from CSC included."""
+    print(f"\n{'='*70}")
+    print(f"Single solve, kl = ku = {half_width}")
+    print(f"{'='*70}")
+
+    results = {'n': list(sizes), 'superlu': [], 'banded': [], 'tridiagonal': []}
+    for n in sizes:
+        data, indices, indptr = generate_band_matrix(n, half_width)
+        b = np.random.default_rng(0).standard_normal(n)
+        args = (data, indices, indptr, b)
+
+        # Warmup (JIT compile) and correctness check
+        ref, _ = superlu_solve_csc(*args)
+        x, info = solve_banded_csc(*args)
+        assert info == 0 and np.allclose(x, ref)
+
+        t_slu = _time_call(superlu_solve_csc, args, repeat)
+        t_band = _time_call(solve_banded_csc, args, repeat)
+        results['superlu'].append(t_slu)
+        results['banded'].append(t_band)
+        line = f"  n={n:8d}: superlu {t_slu:.5f}s, banded {t_band:.5f}s ({t_slu / t_band:.1f}x)"
+        if half_width == 1:
+            x, info = solve_tridiagonal_csc(*args)
+            assert info == 0 and np.allclose(x, ref)
+            t_tri = _time_call(solve_tridiagonal_csc, args, repeat)
+            results['tridiagonal'].append(t_tri)
+            line += f", tridiagonal {t_tri:.5f}s ({t_slu / t_tri:.1f}x)"
+        print(line)
+    return results
+
+
+def benchmark_repeated_solve(n, half_width, n_rhs=100, repeat=3):
+    """Factorize once, solve n_rhs times."""
+    data, indices, indptr = generate_band_matrix(n, half_width)
+    B = np.random.default_rng(0).standard_normal((n_rhs, n))
+    args = (data, indices, indptr, B)
+    funcs = [('superlu', repeated_superlu), ('banded', repeated_banded)]
+    if half_width == 1:
+        funcs.append(('tridiagonal', repeated_tridiagonal))
+
+    print(f"\nFactorize once, {n_rhs} solves (n = {n}, kl = ku = {half_width})")
+    for name, func in funcs:
+        func(*args)  # Warmup
+        print(f"  {name:12s}: {_time_call(func, args, repeat):.5f}s")
+
+
+# ================================================================
+# Plotting
+# ================================================================
+
+def plot_results(results_tri, results_band):
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    for ax, results, title in ((axes[0], results_tri, 'Tridiagonal'),
+                               (axes[1], results_band, 'Banded, kl = ku = 4')):
+        ax.plot(results['n'], results['superlu'], 'o-', label='superlu_solve_csc')
+        ax.plot(results['n'], results['banded'], 's-', label='banded_solve')
+        if results['tridiagonal']:
+            ax.plot(results['n'], results['tridiagonal'], '^-', label='tridiagonal_solve')
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('System Size n')
+        ax.set_ylabel('Time (s)')
+        ax.set_title(title)
+        ax.legend()
+        ax.grid(True)
+    plt.tight_layout()
+    plt.savefig('benchmark_banded.png', dpi=300)
+    plt.show()
+
+
+# ================================================================
+# Main
+# ================================================================
+
+if __name__ == "__main__":
+    print(f"System: {platform.processor()}")
+
+    sizes = [100, 1000, 10000, 100000, 1000000]
+    results_tri = benchmark_single_solve(sizes, 1)
+    results_band = benchmark_single_solve(sizes, 4)
+    benchmark_repeated_solve(100000, 1)
+    benchmark_repeated_solve(100000, 4)
+    plot_results(results_tri, results_band)
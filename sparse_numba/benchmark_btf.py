@@ -0,0 +1,171 @@
+"""
+Benchmark: sparse LU through the block triangular form on reducible matrices
+============================================================================
+
+Generates reducible matrices like those of circuit and network models:
+several uncoupled components, each block upper triangular with many
+singletons and a few larger irreducible blocks, with rows and columns
+numbered at random. Compares
+
+    gplu        gplu_factorize_csc on the whole matrix, AMD ordering
+    btf         btf_factorize_csc (blocks factorized in parallel)
+    scipy       scipy.sparse.linalg.splu (SuperLU, COLAMD)
+
+and reports the fill and the factorize and solve times.
+"""
+
+#  [sparse_numba] (C)2025 Tianqi Hong
+#
+#  BSD License
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+import time
+import platform
+import multiprocessing
+import matplotlib.pyplot as plt
+from numba import njit, get_num_threads
+
+from sparse_numba.ordering.ordering_numba import amd_ordering
+from sparse_numba.gplu.gplu_numba import gplu_factorize_csc, gplu_solve_factored
+from sparse_numba.btf.btf_lu_numba import btf_factorize_csc, btf_solve_factored
+
+
+# ================================================================
+# Problem generation
+# ================================================================
+
+def generate_reducible(n_components, n_blocks, max_block, seed=0):
+    """
+    Uncoupled components, each block upper triangular: half of the blocks
+    are singletons, the others irreducible with up to max_block rows.
+    Rows and columns are scrambled. Returns CSC arrays.
+    """
+    rng = np.random.default_rng(seed)
+    comps = []
+    for _ in range(n_components):
+        blocks = []
+        for k in range(n_blocks):
+            m = 1 if k % 2 == 0 else int(rng.integers(2, max_block + 1))
+            B = sp.random(m, m, density=min(1.0, 4.0 / m), random_state=rng) + 4.0 * sp.eye(m)
+            if m > 1:
+                B = B + sp.csc_matrix((np.ones(m), (np.arange(m), np.roll(np.arange(m), 1))))
+            blocks.append(B)
+        T = sp.block_diag(blocks).tocsc()
+        n0 = T.shape[0]
+        C = sp.triu(sp.random(n0, n0, density=3.0 / n0, random_state=rng), 1)
+        comps.append((T + C).tocsc())
+    A = sp.block_diag(comps).tocsc()
+    n = A.shape[0]
+    A = sp.csc_matrix(A[rng.permutation(n)][:, rng.permutation(n)])
+    A.sort_indices()
+    return A.data.astype(np.float64), A.indices.astype(np.int32), A.indptr.astype(np.int32)
+
+
+# ================================================================
+# Kernels
+# ================================================================
+
+@njit(nogil=True)
+def run_gplu(data, indices, indptr, b):
+    perm = amd_ordering(indices, indptr)
+    factors, info = gplu_factorize_csc(data, indices, indptr, perm, 0.1)
+    x, info = gplu_solve_factored(factors, b)
+    return x, factors.nnz
+
+
+def run_btf(data, indices, indptr, b):
+    factors, info = btf_factorize_csc(data, indices, indptr, 0.1)
+    x, info = btf_solve_factored(factors, b)
+    return x, factors.nnz
+
+
+def run_scipy(data, indices, indptr, b):
+    n = len(indptr) - 1
+    lu = spla.splu(sp.csc_matrix((data, indices, indptr), shape=(n, n)))
+    x = lu.solve(b)
+    return x, lu.L.nnz + lu.U.nnz
+
+
+def _time_call(func, args, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+# ================================================================
+# Benchmark
+# ================================================================
+
+def benchmark_btf(cases, repeat=3):
+    """Fill and factorize + solve time per method for each case."""
+    print(f"\n{'='*70}")
+    print(f"BTF LU on reducible matrices ({get_num_threads()} threads)")
+    print(f"{'='*70}")
+
+    methods = {'gplu': run_gplu, 'btf': run_btf, 'scipy': run_scipy}
+    results = {'label': [], 'n': []}
+    for name in methods:
+        results[f'{name}_fill'] = []
+        results[f'{name}_time'] = []
+
+    for n_components, n_blocks, max_block in cases:
+        data, indices, indptr = generate_reducible(n_components, n_blocks, max_block)
+        n = len(indptr) - 1
+        A = sp.csc_matrix((data, indices, indptr), shape=(n, n))
+        b = np.random.default_rng(1).standard_normal(n)
+        results['label'].append(f'{n_components}x{n_blocks} blocks')
+        results['n'].append(n)
+
+        line = f"  n={n:6d}:"
+        for name, func in methods.items():
+            x, fill = func(data, indices, indptr, b)
+            assert np.linalg.norm(A @ x - b) < 1e-8 * np.linalg.norm(b) * n
+            t = _time_call(func, (data, indices, indptr, b), repeat)
+            results[f'{name}_fill'].append(fill)
+            results[f'{name}_time'].append(t)
+            line += f" {name}: fill {fill:9d} time {t * 1e3:8.2f}ms |"
+        print(line)
+    return results
+
+
+# ================================================================
+# Plotting
+# ================================================================
+
+def plot_results(results):
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    x = np.arange(len(results['label']))
+    width = 0.25
+    for ax, key, title in ((axes[0], 'fill', 'Fill nnz(L + U)'),
+                           (axes[1], 'time', 'Factorize + Solve Time (s)')):
+        for k, name in enumerate(('gplu', 'btf', 'scipy')):
+            ax.bar(x + (k - 1) * width, results[f'{name}_{key}'], width, label=name)
+        ax.set_xticks(x)
+        ax.set_xticklabels(results['label'])
+        ax.set_yscale('log')
+        ax.set_title(title)
+        ax.legend()
+        ax.grid(True, axis='y')
+    plt.tight_layout()
+    plt.savefig('benchmark_btf.png', dpi=300)
+    plt.show()
+
+
+# ================================================================
+# Main
+# ================================================================
+
+if __name__ == "__main__":
+    cpu_count = multiprocessing.cpu_count()
+    print(f"System: {platform.processor()}")
+    print(f"CPU cores: {cpu_count}")
+    print(f"Numba threads: {get_num_threads()}")
+
+    cases = [(1, 40, 30), (4, 40, 30), (8, 100, 60), (16, 100, 60)]
+    results = benchmark_btf(cases)
+    plot_results(results)
@@ -0,0 +1,148 @@
+"""
+Benchmark: Dense Batch LU vs SuperLU for Many Small Systems
+===========================================================
+
+Solves K independent n x n systems (density > 30%) two ways:
+
+    superlu     prange loop over superlu_solve_csc
+    dense       csc_batch_to_dense + dense_batch_solve
+
+for a range of n, and reports the size above which SuperLU is as fast
+as the dense batch solver. The dense timing includes the CSC to dense
+scatter.
+"""
+
+#  [sparse_numba] (C)2025 Tianqi Hong
+#
+#  BSD License
+
+import numpy as np
+import scipy.sparse as sp
+import time
+import platform
+import multiprocessing
+import matplotlib.pyplot as plt
+from numba import njit, prange, get_num_threads
+from numba.typed import List
+
+from sparse_numba.sparse_superlu.superlu_numba_interface import superlu_solve_csc
+from sparse_numba.dense.dense_lu_numba import csc_batch_to_dense, dense_batch_solve
+
+
+# ================================================================
+# Problem generation
+# ================================================================
+
+def generate_batch(num_systems, n, density=0.4, seed=42):
+    """Typed lists of K random diagonally dominant CSC systems and an RHS stack."""
+    rng = np.random.default_rng(seed)
+    data_list, indices_list, indptr_list = List(), List(), List()
+    for k in range(num_systems):
+        A = sp.random(n, n, density=density, random_state=rng) + sp.eye(n) * (n + 1.0)
+        A = A.tocsc()
+        data_list.append(A.data)
+        indices_list.append(A.indices.astype(np.int32))
+        indptr_list.append(A.indptr.astype(np.int32))
+    B = rng.standard_normal((num_systems, n))
+    return data_list, indices_list, indptr_list, B
+
+
+@njit(nogil=True, parallel=True)
+def solve_superlu(data_list, indices_list, indptr_list, B):
+    num_systems, n = B.shape
+    solutions = np.zeros((num_systems, n), dtype=np.float64)
+    for k in prange(num_systems):
+        x, info = superlu_solve_csc(data_list[k], indices_list[k], indptr_list[k], B[k])
+        solutions[k] = x
+    return solutions
+
+
+def solve_dense(data_list, indices_list, indptr_list, B):
+    A_stack = csc_batch_to_dense(data_list, indices_list, indptr_list, B.shape[1])
+    X = B.copy()
+    dense_batch_solve(A_stack, X)
+    return X
+
+
+def _time_call(func, args, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+# ================================================================
+# Benchmark
+# ================================================================
+
+def benchmark_crossover(sizes, num_systems=5000, repeat=3):
+    """Time both strategies for each system size n."""
+    n_threads = get_num_threads()
+    print(f"\n{'='*70}")
+    print(f"Dense Batch LU vs SuperLU ({num_systems} systems, {n_threads} threads)")
+    print(f"{'='*70}")
+
+    results = {'n': list(sizes), 'superlu': [], 'dense': []}
+    for n in sizes:
+        args = generate_batch(num_systems, n)
+
+        # Warmup (JIT compile) and correctness check
+        ref = solve_superlu(*args)
+        assert np.allclose(solve_dense(*args), ref)
+
+        t_superlu = _time_call(solve_superlu, args, repeat)
+        t_dense = _time_call(solve_dense, args, repeat)
+        results['superlu'].append(t_superlu)
+        results['dense'].append(t_dense)
+        print(f"  n={n:4d}: superlu {t_superlu:.4f}s, dense {t_dense:.4f}s  "
+              f"({t_superlu / t_dense:.1f}x)")
+
+    crossover = None
+    for n, ts, td in zip(results['n'], results['superlu'], results['dense']):
+        if ts <= td:
+            crossover = n
+            break
+    if crossover is None:
+        print("\n  Dense batch LU is faster for all tested sizes")
+    else:
+        print(f"\n  Crossover: SuperLU is as fast from n = {crossover}")
+    results['crossover'] = crossover
+    return results
+
+
+# ================================================================
+# Plotting
+# ================================================================
+
+def plot_crossover(results):
+    plt.figure(figsize=(10, 6))
+    plt.plot(results['n'], results['superlu'], 'o-', label='prange over superlu_solve_csc')
+    plt.plot(results['n'], results['dense'], 's-', label='csc_batch_to_dense + dense_batch_solve')
+    if results['crossover'] is not None:
+        plt.axvline(x=results['crossover'], linestyle=':', color='k', alpha=0.5)
+    plt.xscale('log')
+    plt.yscale('log')
+    plt.xlabel('System Size n')
+    plt.ylabel('Time (s)')
+    plt.title('Many Small Dense-ish Systems: Dense LU vs SuperLU')
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    plt.savefig('benchmark_dense_batch.png', dpi=300)
+    plt.show()
+
+
+# ================================================================
+# Main
+# ================================================================
+
+if __name__ == "__main__":
+    cpu_count = multiprocessing.cpu_count()
+    print(f"System: {platform.processor()}")
+    print(f"CPU cores: {cpu_count}")
+    print(f"Numba threads: {get_num_threads()}")
+
+    results = benchmark_crossover([4, 8, 12, 16, 24, 32, 48, 64], num_systems=5000)
+    plot_crossover(results)
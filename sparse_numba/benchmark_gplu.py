@@ -0,0 +1,231 @@
+"""
+Benchmark: Pure-Numba Gilbert-Peierls LU vs SuperLU / UMFPACK
+=============================================================
+
+Factorizes and solves 2D convection-diffusion matrices (unsymmetric,
+5-point stencil) of increasing size n with:
+
+    gplu        gplu_factorize_csc + gplu_solve_factored (RCM column order)
+    gplu-refac  gplu_refactor + gplu_solve_factored (pattern reused)
+    superlu     superlu_factorize_csc + superlu_solve_factored + free
+    umfpack     umfpack_factorize_csc + umfpack_solve_factored + free
+
+Each case is timed as one call and as a prange batch of independent
+systems, and the size up to which the Numba LU is faster is reported.
+"""
+
+#  [sparse_numba] (C)2025 Tianqi Hong
+#
+#  BSD License
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+import time
+import platform
+import multiprocessing
+import matplotlib.pyplot as plt
+from numba import njit, prange, get_num_threads
+
+from sparse_numba.gplu.gplu_numba import (
+    gplu_factorize_csc, gplu_refactor, gplu_solve_factored,
+)
+from sparse_numba.sparse_superlu.superlu_numba_interface import (
+    superlu_factorize_csc, superlu_solve_factored, superlu_free_factors,
+)
+
+try:
+    from sparse_numba.sparse_umfpack.umfpack_numba_interface import (
+        umfpack_factorize_csc, umfpack_solve_factored, umfpack_free_factors,
+    )
+    HAS_UMFPACK = True
+except ImportError:
+    HAS_UMFPACK = False
+
+
+# ================================================================
+# Problem generation
+# ================================================================
+
+def generate_convection_diffusion(m, peclet=5.0):
+    """m x m grid, n = m^2: -Laplacian + upwind convection, as int32 CSC."""
+    h = 1.0 / (m + 1)
+    T = sp.diags([-np.ones(m - 1), 2.0 * np.ones(m), -np.ones(m - 1)], [-1, 0, 1])
+    C = sp.diags([-np.ones(m - 1), np.ones(m)], [-1, 0])
+    I = sp.eye(m)
+    A = (sp.kron(I, T) + sp.kron(T, I)) / h**2 + peclet * (sp.kron(I, C) + sp.kron(C, I)) / h
+    A = A.tocsc()
+    A.sort_indices()
+    perm = reverse_cuthill_mckee(A + A.T, symmetric_mode=True).astype(np.int32)
+    return (A.data.astype(np.float64), A.indices.astype(np.int32),
+            A.indptr.astype(np.int32), perm)
+
+
+# ================================================================
+# Solvers (factorize + one solve)
+# ================================================================
+
+@njit(nogil=True)
+def run_gplu(data, indices, indptr, perm, b):
+    factors, info = gplu_factorize_csc(data, indices, indptr, perm)
+    x, info = gplu_solve_factored(factors, b)
+    return x
+
+
+@njit(nogil=True)
+def run_superlu(data, indices, indptr, perm, b):
+    handle, info = superlu_factorize_csc(data, indices, indptr)
+    x, info = superlu_solve_factored(handle, b)
+    superlu_free_factors(handle)
+    return x
+
+
+if HAS_UMFPACK:
+    @njit(nogil=True)
+    def run_umfpack(data, indices, indptr, perm, b):
+        handle, info = umfpack_factorize_csc(data, indices, indptr)
+        x, info = umfpack_solve_factored(handle, b)
+        umfpack_free_factors(handle)
+        return x
+
+
+@njit(nogil=True)
+def run_gplu_refactor(factors, data, b, n_steps):
+    # Newton-like loop: new values each step, same pattern
+    x = np.zeros(len(b))
+    for step in range(n_steps):
+        gplu_refactor(factors, data * (1.0 + 0.01 * step))
+        x, info = gplu_solve_factored(factors, b)
+    return x
+
+
+def make_batch(runner):
+    @njit(nogil=True, parallel=True)
+    def batch(data, indices, indptr, perm, B):
+        X = np.zeros_like(B)
+        for k in prange(B.shape[0]):
+            X[k] = runner(data, indices, indptr, perm, B[k])
+        return X
+    return batch
+
+
+def _time_call(func, args, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+# ================================================================
+# Benchmark
+# ================================================================
+
+def benchmark_sizes(grid_sizes, num_systems=256, n_steps=10, repeat=3):
+    """Time every solver for each grid; one call and a prange batch."""
+    n_threads = get_num_threads()
+    print(f"\n{'='*70}")
+    print(f"Numba GP-LU vs C backends (batch of {num_systems}, {n_threads} threads)")
+    print(f"{'='*70}")
+
+    runners = {'gplu': run_gplu, 'superlu': run_superlu}
+    if HAS_UMFPACK:
+        runners['umfpack'] = run_umfpack
+    batches = {name: make_batch(r) for name, r in runners.items()}
+
+    results = {'n': [], 'gplu_refactor': []}
+    for name in runners:
+        results[name] = []
+        results[name + '_batch'] = []
+
+    rng = np.random.default_rng(0)
+    for m in grid_sizes:
+        data, indices, indptr, perm = generate_convection_diffusion(m)
+        n = len(indptr) - 1
+        b = rng.standard_normal(n)
+        B = rng.standard_normal((num_systems, n))
+        results['n'].append(n)
+
+        x_ref = run_superlu(data, indices, indptr, perm, b)
+        line = f"  n={n:5d}:"
+        for name, runner in runners.items():
+            x = runner(data, indices, indptr, perm, b)  # warmup + check
+            assert np.allclose(x, x_ref)
+            batches[name](data, indices, indptr, perm, B[:2])
+            t_one = _time_call(runner, (data, indices, indptr, perm, b), repeat)
+            t_batch = _time_call(batches[name], (data, indices, indptr, perm, B), repeat)
+            results[name].append(t_one)
+            results[name + '_batch'].append(t_batch)
+            line += f" {name} {t_one * 1e3:8.3f}ms / {t_batch * 1e3:8.1f}ms |"
+
+        factors, info = gplu_factorize_csc(data, indices, indptr, perm)
+        run_gplu_refactor(factors, data, b, 1)
+        t_refac = _time_call(run_gplu_refactor, (factors, data, b, n_steps), repeat) / n_steps
+        results['gplu_refactor'].append(t_refac)
+        line += f" refactor {t_refac * 1e3:8.3f}ms"
+        print(line)
+
+    crossover = None
+    for n, tg, ts in zip(results['n'], results['gplu'], results['superlu']):
+        if tg > ts:
+            crossover = n
+            break
+    if crossover is None:
+        print("\n  GP-LU is faster than SuperLU for all tested sizes")
+    else:
+        print(f"\n  Crossover: SuperLU is faster from n = {crossover}")
+    results['crossover'] = crossover
+    return results
+
+
+# ================================================================
+# Plotting
+# ================================================================
+
+def plot_sizes(results):
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    ax = axes[0]
+    for name, marker in (('gplu', 'o-'), ('superlu', 's-'), ('umfpack', '^-')):
+        if name in results:
+            ax.plot(results['n'], results[name], marker, label=f'{name} (factorize + solve)')
+    ax.plot(results['n'], results['gplu_refactor'], 'd--', label='gplu_refactor + solve')
+    if results['crossover'] is not None:
+        ax.axvline(x=results['crossover'], linestyle=':', color='k', alpha=0.5)
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel('System Size n')
+    ax.set_ylabel('Time per system (s)')
+    ax.set_title('Single System')
+    ax.legend()
+    ax.grid(True)
+
+    ax = axes[1]
+    for name, marker in (('gplu', 'o-'), ('superlu', 's-'), ('umfpack', '^-')):
+        if name + '_batch' in results:
+            ax.plot(results['n'], results[name + '_batch'], marker, label=name)
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel('System Size n')
+    ax.set_ylabel('Batch time (s)')
+    ax.set_title('prange Batch of Independent Systems')
+    ax.legend()
+    ax.grid(True)
+
+    plt.tight_layout()
+    plt.savefig('benchmark_gplu.png', dpi=300)
+    plt.show()
+
+
+# ================================================================
+# Main
+# ================================================================
+
+if __name__ == "__main__":
+    cpu_count = multiprocessing.cpu_count()
+    print(f"System: {platform.processor()}")
+    print(f"CPU cores: {cpu_count}")
+    print(f"Numba threads: {get_num_threads()}")
+
+    results = benchmark_sizes([5, 10, 20, 30, 45, 70, 100])
+    plot_sizes(results)
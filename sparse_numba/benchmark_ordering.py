@@ -0,0 +1,187 @@
+"""
+Benchmark: Numba RCM, AMD and nested dissection orderings on grid matrices
+==========================================================================
+
+Generates 2D (5-point) and 3D (7-point) grid Laplacians, numbered at
+random as unstructured meshes often are, and compares the orderings:
+
+    natural     the given (random) numbering
+    rcm         rcm_ordering, pseudo-peripheral start
+    amd         amd_ordering
+    nd          nested_dissection (multilevel bisection, AMD leaves)
+
+For each it reports the bandwidth, the fill nnz(L + U) and the time of
+gplu_factorize_csc + solve on P A P^T, the banded solver with the RCM
+bandwidth, and the time of a CSR SpMV (cache locality).
+"""
+
+#  [sparse_numba] (C)2025 Tianqi Hong
+#
+#  BSD License
+
+import numpy as np
+import scipy.sparse as sp
+import time
+import platform
+import multiprocessing
+import matplotlib.pyplot as plt
+from numba import njit, get_num_threads
+
+from sparse_numba.ordering.ordering_numba import (
+    rcm_ordering, amd_ordering, permute_csc, csc_profile,
+)
+from sparse_numba.ordering.nested_dissection_numba import nested_dissection
+from sparse_numba.gplu.gplu_numba import gplu_factorize_csc, gplu_solve_factored
+from sparse_numba.banded.banded_numba import banded_solve_csc
+from sparse_numba.conversion.sparse_products_numba import spmv_csr
+
+
+# ================================================================
+# Problem generation
+# ================================================================
+
+def generate_grid(m, dim, seed=0):
+    """Shifted grid Laplacian with a random numbering of the nodes, as CSC."""
+    T = sp.diags([-np.ones(m - 1), 2.0 * np.ones(m), -np.ones(m - 1)], [-1, 0, 1])
+    I = sp.eye(m)
+    if dim == 2:
+        A = sp.kron(I, T) + sp.kron(T, I)
+    else:
+        A = sp.kron(sp.kron(I, I), T) + sp.kron(sp.kron(I, T), I) + sp.kron(sp.kron(T, I), I)
+    A = A + 0.01 * sp.eye(A.shape[0])
+    s = np.random.default_rng(seed).permutation(A.shape[0])
+    A = sp.csc_matrix(A.tocsc()[s][:, s])
+    A.sort_indices()
+    return A.data.astype(np.float64), A.indices.astype(np.int32), A.indptr.astype(np.int32)
+
+
+# ================================================================
+# Kernels
+# ================================================================
+
+@njit(nogil=True)
+def run_gplu(data, indices, indptr, b):
+    # Symmetric positive definite: diagonal pivots (pivot_thresh 0 keeps them)
+    factors, info = gplu_factorize_csc(data, indices, indptr, None, 0.0)
+    x, info = gplu_solve_factored(factors, b)
+    return x, len(factors.Li) + len(factors.Ui)
+
+
+@njit(nogil=True)
+def run_spmv(data, indices, indptr, x, n_repeat):
+    y = np.zeros(len(x))
+    for _ in range(n_repeat):
+        spmv_csr(data, indices, indptr, x, y)
+    return y
+
+
+def _time_call(func, args, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+# ================================================================
+# Benchmark
+# ================================================================
+
+def benchmark_orderings(cases, repeat=3, n_spmv=50):
+    """Fill, bandwidth and solve / SpMV time per ordering for each grid."""
+    print(f"\n{'='*70}")
+    print(f"Orderings on randomly numbered grids ({get_num_threads()} threads)")
+    print(f"{'='*70}")
+
+    results = {'label': [], 'n': []}
+    for name in ('natural', 'rcm', 'amd', 'nd'):
+        for key in ('fill', 'bandwidth', 't_lu', 't_spmv'):
+            results[f'{name}_{key}'] = []
+    results['t_order_rcm'] = []
+    results['t_order_amd'] = []
+    results['t_order_nd'] = []
+    results['t_banded_rcm'] = []
+
+    for m, dim in cases:
+        data, indices, indptr = generate_grid(m, dim)
+        n = len(indptr) - 1
+        b = np.random.default_rng(1).standard_normal(n)
+        results['label'].append(f'{dim}D {m}^{dim}')
+        results['n'].append(n)
+
+        rcm_ordering(indices, indptr)
+        amd_ordering(indices, indptr)
+        results['t_order_rcm'].append(_time_call(rcm_ordering, (indices, indptr), repeat))
+        results['t_order_amd'].append(_time_call(amd_ordering, (indices, indptr), repeat))
+        nested_dissection(indices, indptr)
+        results['t_order_nd'].append(_time_call(nested_dissection, (indices, indptr), repeat))
+        perms = {'natural': np.arange(n, dtype=np.int32),
+                 'rcm': rcm_ordering(indices, indptr),
+                 'amd': amd_ordering(indices, indptr),
+                 'nd': nested_dissection(indices, indptr)[0]}
+
+        line = f"  {dim}D n={n:6d}:"
+        for name, p in perms.items():
+            d, i, ptr = permute_csc(data, indices, indptr, p, p)
+            bandwidth, _ = csc_profile(i, ptr)
+            x, fill = run_gplu(d, i, ptr, b[p])
+            t_lu = _time_call(run_gplu, (d, i, ptr, b[p]), repeat)
+            # Symmetric matrix: the CSC arrays are also its CSR arrays
+            run_spmv(d, i, ptr, b, 1)
+            t_spmv = _time_call(run_spmv, (d, i, ptr, b, n_spmv), repeat) / n_spmv
+            results[f'{name}_fill'].append(fill)
+            results[f'{name}_bandwidth'].append(bandwidth)
+            results[f'{name}_t_lu'].append(t_lu)
+            results[f'{name}_t_spmv'].append(t_spmv)
+            line += f" {name}: bw {bandwidth:5d} fill {fill:9d} lu {t_lu * 1e3:8.2f}ms |"
+            if name == 'rcm':
+                banded_solve_csc(d, i, ptr, b)
+                t_band = _time_call(banded_solve_csc, (d, i, ptr, b), repeat)
+                results['t_banded_rcm'].append(t_band)
+        print(line)
+        print(f"      spmv natural {results['natural_t_spmv'][-1] * 1e6:8.1f}us"
+              f" rcm {results['rcm_t_spmv'][-1] * 1e6:8.1f}us |"
+              f" banded (rcm) {results['t_banded_rcm'][-1] * 1e3:8.2f}ms |"
+              f" ordering rcm {results['t_order_rcm'][-1] * 1e3:6.2f}ms"
+              f" amd {results['t_order_amd'][-1] * 1e3:6.2f}ms"
+              f" nd {results['t_order_nd'][-1] * 1e3:6.2f}ms")
+    return results
+
+
+# ================================================================
+# Plotting
+# ================================================================
+
+def plot_results(results):
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    x = np.arange(len(results['label']))
+    width = 0.2
+    for ax, key, title in ((axes[0], 'fill', 'Fill nnz(L + U)'),
+                           (axes[1], 't_lu', 'Factorize + Solve Time (s)')):
+        for k, name in enumerate(('natural', 'rcm', 'amd', 'nd')):
+            ax.bar(x + (k - 1.5) * width, results[f'{name}_{key}'], width, label=name)
+        ax.set_xticks(x)
+        ax.set_xticklabels(results['label'])
+        ax.set_yscale('log')
+        ax.set_title(title)
+        ax.legend()
+        ax.grid(True, axis='y')
+    plt.tight_layout()
+    plt.savefig('benchmark_ordering.png', dpi=300)
+    plt.show()
+
+
+# ================================================================
+# Main
+# ================================================================
+
+if __name__ == "__main__":
+    cpu_count = multiprocessing.cpu_count()
+    print(f"System: {platform.processor()}")
+    print(f"CPU cores: {cpu_count}")
+    print(f"Numba threads: {get_num_threads()}")
+
+    cases = [(30, 2), (60, 2), (100, 2), (10, 3), (16, 3), (22, 3)]
+    results = benchmark_orderings(cases)
+    plot_results(results)
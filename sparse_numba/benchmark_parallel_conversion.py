@@ -0,0 +1,165 @@
+"""
+Benchmark: Parallel Conversion Kernels on a Single Large Matrix
+================================================================
+
+Measures how the parallel conversion kernels scale with the number of
+Numba threads, compared with the serial kernels:
+
+    convert_coo_to_csc  vs  convert_coo_to_csc_parallel
+    convert_coo_to_csr  vs  convert_coo_to_csr_parallel
+    convert_csr_to_csc  vs  convert_csr_to_csc_parallel
+
+The parallel results are checked to be identical to the serial ones.
+"""
+
+#  [sparse_numba] (C)2025 Tianqi Hong
+#
+#  BSD License
+
+import numpy as np
+import time
+import platform
+import multiprocessing
+import matplotlib.pyplot as plt
+from numba import set_num_threads, get_num_threads
+
+from sparse_numba.conversion.matrix_conversion_numba import (
+    convert_coo_to_csc,
+    convert_coo_to_csr,
+    convert_csr_to_csc,
+    convert_coo_to_csc_parallel,
+    convert_coo_to_csr_parallel,
+    convert_csr_to_csc_parallel,
+)
+
+
+# ================================================================
+# Problem generation
+# ================================================================
+
+def generate_large_coo(n, nnz_per_row=20, seed=42):
+    """
+    Generate a large square COO matrix with nnz_per_row entries per row in
+    random order, a few percent of them duplicates (as from FEM assembly).
+    """
+    rng = np.random.default_rng(seed)
+    nnz = n * nnz_per_row
+    row = np.repeat(np.arange(n, dtype=np.int32), nnz_per_row)
+    offsets = rng.integers(-50, 51, nnz)
+    col = np.clip(row + offsets, 0, n - 1).astype(np.int32)
+    data = rng.standard_normal(nnz)
+    perm = rng.permutation(nnz)
+    return row[perm], col[perm], data[perm]
+
+
+def _time_call(func, args, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+# ================================================================
+# Benchmark: thread scaling
+# ================================================================
+
+def benchmark_conversion_scaling(n, nnz_per_row=20, max_threads=None, repeat=3):
+    """Time serial and parallel conversions for 1, 2, 4, ... threads."""
+    if max_threads is None:
+        max_threads = multiprocessing.cpu_count()
+
+    print(f"\n{'='*70}")
+    print(f"Conversion Thread Scaling")
+    print(f"  Matrix size: {n}x{n}, NNZ: {n * nnz_per_row}, Max threads: {max_threads}")
+    print(f"{'='*70}")
+
+    row, col, data = generate_large_coo(n, nnz_per_row)
+    csr_data, csr_indices, csr_indptr = convert_coo_to_csr(row, col, data, n, n)
+
+    cases = {
+        'coo_to_csc': (convert_coo_to_csc, convert_coo_to_csc_parallel, (row, col, data, n, n)),
+        'coo_to_csr': (convert_coo_to_csr, convert_coo_to_csr_parallel, (row, col, data, n, n)),
+        'csr_to_csc': (convert_csr_to_csc, convert_csr_to_csc_parallel, (csr_data, csr_indices, csr_indptr)),
+    }
+
+    # Warmup (JIT compile) and correctness check
+    set_num_threads(max_threads)
+    for name, (serial, parallel, args) in cases.items():
+        ref = serial(*args)
+        out = parallel(*args)
+        for a, b in zip(ref, out):
+            assert np.array_equal(a, b), f"{name}: parallel result differs from serial"
+
+    thread_counts = []
+    t = 1
+    while t <= max_threads:
+        thread_counts.append(t)
+        t *= 2
+    if thread_counts[-1] != max_threads:
+        thread_counts.append(max_threads)
+
+    results = {'threads': thread_counts}
+    for name, (serial, parallel, args) in cases.items():
+        serial_time = _time_call(serial, args, repeat)
+        results[name + '_serial'] = serial_time
+        results[name + '_parallel'] = []
+        print(f"\n  {name}: serial {serial_time:.4f}s")
+        for num_t in thread_counts:
+            set_num_threads(num_t)
+            pt = _time_call(parallel, args, repeat)
+            results[name + '_parallel'].append(pt)
+            print(f"    {num_t:2d} threads: {pt:.4f}s  ({serial_time / pt:.1f}x vs serial)")
+
+    set_num_threads(max_threads)
+    return results
+
+
+# ================================================================
+# Plotting
+# ================================================================
+
+def plot_conversion_scaling(results):
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    threads = results['threads']
+
+    for name, marker in (('coo_to_csc', 'o-'), ('coo_to_csr', 's-'), ('csr_to_csc', '^-')):
+        ax1.plot(threads, results[name + '_parallel'], marker, label=f'{name} parallel')
+        ax1.axhline(y=results[name + '_serial'], linestyle=':', alpha=0.5)
+        speedup = [results[name + '_serial'] / t for t in results[name + '_parallel']]
+        ax2.plot(threads, speedup, marker, label=name)
+
+    ax1.set_xlabel('Number of Threads')
+    ax1.set_ylabel('Time (s)')
+    ax1.set_title('Conversion Time (dotted: serial kernel)')
+    ax1.legend()
+    ax1.grid(True)
+
+    ax2.plot(threads, threads, 'k--', alpha=0.3, label='Ideal linear')
+    ax2.set_xlabel('Number of Threads')
+    ax2.set_ylabel('Speedup (vs serial kernel)')
+    ax2.set_title('Thread Scaling')
+    ax2.legend()
+    ax2.grid(True)
+
+    plt.tight_layout()
+    plt.savefig('benchmark_parallel_conversion.png', dpi=300)
+    plt.show()
+
+
+# ================================================================
+# Main
+# ================================================================
+
+if __name__ == "__main__":
+    cpu_count = multiprocessing.cpu_count()
+    print(f"System: {platform.processor()}")
+    print(f"CPU cores: {cpu_count}")
+    print(f"Numba threads: {get_num_threads()}")
+
+    n = 2_000_000          # rows/columns
+    nnz_per_row = 25       # 50M nonzeros
+
+    results = benchmark_conversion_scaling(n, nnz_per_row, max_threads=cpu_count)
+    plot_conversion_scaling(results)
@@ -0,0 +1,186 @@
+"""
+Benchmark: Sparse Product Kernels
+=================================
+
+1. Thread scaling of spmv_csr / spmv_csc / spmv_t_csr on one large matrix,
+   compared with the serial sparse_matvec_csr.
+2. One spmm_csr call on a block of k vectors vs k spmv_csr calls.
+
+All results are checked against scipy.sparse.
+"""
+
+#  [sparse_numba] (C)2025 Tianqi Hong
+#
+#  BSD License
+
+import numpy as np
+import scipy.sparse as sp
+import time
+import platform
+import multiprocessing
+import matplotlib.pyplot as plt
+from numba import set_num_threads, get_num_threads
+
+from sparse_numba.conversion.matrix_conversion_numba import sparse_matvec_csr
+from sparse_numba.conversion.sparse_products_numba import (
+    spmv_csr, spmv_csc, spmv_t_csr, spmm_csr,
+)
+
+
+# ================================================================
+# Problem generation
+# ================================================================
+
+def generate_banded_csr(n, nnz_per_row=20, seed=42):
+    """Random square CSR matrix with nnz_per_row entries near the diagonal."""
+    rng = np.random.default_rng(seed)
+    row = np.repeat(np.arange(n), nnz_per_row)
+    col = np.clip(row + rng.integers(-50, 51, n * nnz_per_row), 0, n - 1)
+    data = rng.standard_normal(n * nnz_per_row)
+    A = sp.csr_matrix((data, (row, col)), shape=(n, n))
+    A.sum_duplicates()
+    return A
+
+
+def _time_call(func, args, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+# ================================================================
+# Benchmark 1: SpMV thread scaling
+# ================================================================
+
+def benchmark_spmv_scaling(n, nnz_per_row=20, max_threads=None, repeat=5):
+    """Time the SpMV kernels for 1, 2, 4, ... threads."""
+    if max_threads is None:
+        max_threads = multiprocessing.cpu_count()
+
+    print(f"\n{'='*70}")
+    print(f"SpMV Thread Scaling")
+    print(f"  Matrix size: {n}x{n}, Max threads: {max_threads}")
+    print(f"{'='*70}")
+
+    A = generate_banded_csr(n, nnz_per_row)
+    A_csc = A.tocsc()
+    csr = (A.data, A.indices.astype(np.int32), A.indptr.astype(np.int32))
+    csc = (A_csc.data, A_csc.indices.astype(np.int32), A_csc.indptr.astype(np.int32))
+    x = np.random.default_rng(0).standard_normal(n)
+    y = np.empty(n)
+    print(f"  NNZ: {A.nnz}")
+
+    cases = {
+        'spmv_csr': (spmv_csr, csr + (x, y), A @ x),
+        'spmv_csc': (spmv_csc, csc + (x, n, y), A @ x),
+        'spmv_t_csr': (spmv_t_csr, csr + (x, n, y), A.T @ x),
+    }
+
+    # Warmup (JIT compile) and correctness check
+    set_num_threads(max_threads)
+    for name, (func, args, ref) in cases.items():
+        assert np.allclose(func(*args), ref), f"{name}: result differs from scipy"
+    serial_time = _time_call(sparse_matvec_csr, csr + (x,), repeat)
+    print(f"\n  sparse_matvec_csr (serial): {serial_time:.4f}s")
+
+    thread_counts = []
+    t = 1
+    while t <= max_threads:
+        thread_counts.append(t)
+        t *= 2
+    if thread_counts[-1] != max_threads:
+        thread_counts.append(max_threads)
+
+    results = {'threads': thread_counts, 'serial': serial_time}
+    for name, (func, args, _) in cases.items():
+        results[name] = []
+        print(f"\n  {name}:")
+        for num_t in thread_counts:
+            set_num_threads(num_t)
+            pt = _time_call(func, args, repeat)
+            results[name].append(pt)
+            print(f"    {num_t:2d} threads: {pt:.4f}s  ({serial_time / pt:.1f}x vs serial)")
+
+    set_num_threads(max_threads)
+    return results
+
+
+# ================================================================
+# Benchmark 2: SpMM vs repeated SpMV
+# ================================================================
+
+def benchmark_spmm_block(n, nnz_per_row=20, block_sizes=(1, 8, 16, 32, 64), repeat=3):
+    """Compare one spmm_csr call on k vectors against k spmv_csr calls."""
+    print(f"\n{'='*70}")
+    print(f"SpMM vs Repeated SpMV ({get_num_threads()} threads)")
+    print(f"{'='*70}")
+
+    A = generate_banded_csr(n, nnz_per_row)
+    csr = (A.data, A.indices.astype(np.int32), A.indptr.astype(np.int32))
+    rng = np.random.default_rng(1)
+
+    def repeated_spmv(data, indices, indptr, X, Y):
+        for r in range(X.shape[1]):
+            Y[:, r] = spmv_csr(data, indices, indptr, X[:, r].copy())
+
+    results = {'k': list(block_sizes), 'spmv': [], 'spmm': []}
+    for k in block_sizes:
+        X = rng.standard_normal((n, k))
+        Y = np.empty((n, k))
+        assert np.allclose(spmm_csr(*csr, X), A @ X), "spmm_csr differs from scipy"
+        spmv_csr(*csr, X[:, 0].copy())
+        t_spmv = _time_call(repeated_spmv, csr + (X, Y), repeat)
+        t_spmm = _time_call(spmm_csr, csr + (X, Y), repeat)
+        results['spmv'].append(t_spmv)
+        results['spmm'].append(t_spmm)
+        print(f"  k={k:3d}: {k} x spmv {t_spmv:.4f}s, spmm {t_spmm:.4f}s  ({t_spmv / t_spmm:.1f}x)")
+    return results
+
+
+# ================================================================
+# Plotting
+# ================================================================
+
+def plot_results(scaling, block):
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+
+    threads = scaling['threads']
+    for name, marker in (('spmv_csr', 'o-'), ('spmv_csc', 's-'), ('spmv_t_csr', '^-')):
+        speedup = [scaling['serial'] / t for t in scaling[name]]
+        ax1.plot(threads, speedup, marker, label=name)
+    ax1.plot(threads, threads, 'k--', alpha=0.3, label='Ideal linear')
+    ax1.set_xlabel('Number of Threads')
+    ax1.set_ylabel('Speedup (vs serial sparse_matvec_csr)')
+    ax1.set_title('SpMV Thread Scaling')
+    ax1.legend()
+    ax1.grid(True)
+
+    ax2.plot(block['k'], block['spmv'], 'o-', label='k x spmv_csr')
+    ax2.plot(block['k'], block['spmm'], 's-', label='spmm_csr')
+    ax2.set_xlabel('Number of Vectors k')
+    ax2.set_ylabel('Time (s)')
+    ax2.set_title('Multi-Vector Product')
+    ax2.legend()
+    ax2.grid(True)
+
+    plt.tight_layout()
+    plt.savefig('benchmark_sparse_products.png', dpi=300)
+    plt.show()
+
+
+# ================================================================
+# Main
+# ================================================================
+
+if __name__ == "__main__":
+    cpu_count = multiprocessing.cpu_count()
+    print(f"System: {platform.processor()}")
+    print(f"CPU cores: {cpu_count}")
+    print(f"Numba threads: {get_num_threads()}")
+
+    scaling = benchmark_spmv_scaling(2_000_000, 20, max_threads=cpu_count)
+    block = benchmark_spmm_block(200_000, 20)
+    plot_results(scaling, block)
@@ -0,0 +1,152 @@
+"""
+Benchmark: Level-scheduled parallel triangular solves vs SuperLU dgstrs
+=======================================================================
+
+Factorizes 2D and 3D Laplacian-like matrices once with SuperLU and times
+the forward/back substitution with:
+
+    dgstrs      superlu_solve_factored / handle_solve_multi (serial, in C)
+    levels      lu_solve / lu_solve_multi on the schedule from lu_schedule
+
+for one right-hand side and for a block of right-hand sides. The analysis
+(factor extraction + level sets) is timed separately; it is paid once per
+factorization. Level-scheduled solves pay off when the factors have many
+rows per level (wide, shallow elimination trees).
+"""
+
+#  [sparse_numba] (C)2025 Tianqi Hong
+#
+#  BSD License
+
+import numpy as np
+import scipy.sparse as sp
+import time
+import platform
+import multiprocessing
+import matplotlib.pyplot as plt
+from numba import get_num_threads
+
+from sparse_numba.sparse_superlu.superlu_numba_interface import (
+    superlu_factorize_csc, superlu_solve_factored, superlu_free_factors,
+)
+from sparse_numba.handle_solve import handle_solve_multi, BACKEND_SUPERLU
+from sparse_numba.trisolve.trisolve_numba import lu_schedule, lu_solve, lu_solve_multi
+
+
+# ================================================================
+# Problem generation
+# ================================================================
+
+def generate_laplacian(m, dim):
+    """Shifted Laplacian on an m^dim grid, with a small unsymmetric part."""
+    T = sp.diags([-np.ones(m - 1), 2.0 * np.ones(m), -0.9 * np.ones(m - 1)], [-1, 0, 1])
+    I = sp.eye(m)
+    if dim == 2:
+        A = sp.kron(I, T) + sp.kron(T, I)
+    else:
+        A = sp.kron(sp.kron(I, I), T) + sp.kron(sp.kron(I, T), I) + sp.kron(sp.kron(T, I), I)
+    A = (A + 0.1 * sp.eye(A.shape[0])).tocsc()
+    A.sort_indices()
+    return A.data.astype(np.float64), A.indices.astype(np.int32), A.indptr.astype(np.int32)
+
+
+def _time_call(func, args, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+# ================================================================
+# Benchmark
+# ================================================================
+
+def benchmark_grids(cases, nrhs=32, repeat=5):
+    """Time dgstrs against the level-scheduled solve for each grid."""
+    n_threads = get_num_threads()
+    print(f"\n{'='*70}")
+    print(f"Level-scheduled solve vs dgstrs ({nrhs} RHS block, {n_threads} threads)")
+    print(f"{'='*70}")
+
+    results = {'n': [], 'levels': [], 'analysis': [],
+               'dgstrs': [], 'levels_1': [], 'dgstrs_multi': [], 'levels_multi': []}
+    rng = np.random.default_rng(0)
+    for m, dim in cases:
+        data, indices, indptr = generate_laplacian(m, dim)
+        n = len(indptr) - 1
+        b = rng.standard_normal(n)
+        B = rng.standard_normal((n, nrhs))
+        handle, info = superlu_factorize_csc(data, indices, indptr)
+
+        lu_schedule(handle, BACKEND_SUPERLU)  # warmup
+        t0 = time.perf_counter()
+        S, info = lu_schedule(handle, BACKEND_SUPERLU)
+        t_analysis = time.perf_counter() - t0
+
+        x_ref, _ = superlu_solve_factored(handle, b)
+        x, _ = lu_solve(S, b)
+        assert np.allclose(x, x_ref)
+        X_ref, _ = handle_solve_multi(handle, B, False, BACKEND_SUPERLU)
+        X, _ = lu_solve_multi(S, B)
+        assert np.allclose(X, X_ref)
+
+        t_d1 = _time_call(superlu_solve_factored, (handle, b), repeat)
+        t_l1 = _time_call(lu_solve, (S, b), repeat)
+        t_dm = _time_call(handle_solve_multi, (handle, B, False, BACKEND_SUPERLU), repeat)
+        t_lm = _time_call(lu_solve_multi, (S, B), repeat)
+        superlu_free_factors(handle)
+
+        results['n'].append(n)
+        results['levels'].append(S.n_levels)
+        results['analysis'].append(t_analysis)
+        results['dgstrs'].append(t_d1)
+        results['levels_1'].append(t_l1)
+        results['dgstrs_multi'].append(t_dm)
+        results['levels_multi'].append(t_lm)
+        print(f"  {dim}D n={n:7d} levels={S.n_levels}: analysis {t_analysis * 1e3:8.2f}ms |"
+              f" 1 RHS dgstrs {t_d1 * 1e3:7.3f}ms levels {t_l1 * 1e3:7.3f}ms"
+              f" ({t_d1 / t_l1:4.1f}x) |"
+              f" {nrhs} RHS dgstrs {t_dm * 1e3:8.2f}ms levels {t_lm * 1e3:8.2f}ms"
+              f" ({t_dm / t_lm:4.1f}x)")
+    return results
+
+
+# ================================================================
+# Plotting
+# ================================================================
+
+def plot_results(results, nrhs=32):
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    for ax, suffix, title in ((axes[0], '', 'One Right-Hand Side'),
+                              (axes[1], '_multi', f'{nrhs} Right-Hand Sides')):
+        dg = results['dgstrs' + suffix]
+        lv = results['levels' + (suffix or '_1')]
+        ax.plot(results['n'], dg, 's-', label='SuperLU dgstrs')
+        ax.plot(results['n'], lv, 'o-', label='level-scheduled')
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('System Size n')
+        ax.set_ylabel('Solve time (s)')
+        ax.set_title(title)
+        ax.legend()
+        ax.grid(True)
+    plt.tight_layout()
+    plt.savefig('benchmark_trisolve.png', dpi=300)
+    plt.show()
+
+
+# ================================================================
+# Main
+# ================================================================
+
+if __name__ == "__main__":
+    cpu_count = multiprocessing.cpu_count()
+    print(f"System: {platform.processor()}")
+    print(f"CPU cores: {cpu_count}")
+    print(f"Numba threads: {get_num_threads()}")
+
+    cases = [(50, 2), (100, 2), (200, 2), (400, 2), (15, 3), (25, 3), (40, 3)]
+    results = benchmark_grids(cases)
+    plot_results(results)
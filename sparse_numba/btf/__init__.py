@@ -0,0 +1,15 @@
+from .btf_lu_numba import (
+    btf_factorize_csc,
+    btf_solve_factored, btf_solve_factored_transpose,
+    btf_free_factors, btf_solve_csc,
+    BTFFactors,
+)
+
+__all__ = [
+    'btf_factorize_csc',
+    'btf_solve_factored', 'btf_solve_factored_transpose',
+    'btf_free_factors', 'btf_solve_csc',
+    'BTFFactors',
+]
+
+__author__ = 'Tianqi Hong'
@@ -0,0 +1,437 @@
+"""
+Sparse LU through the block triangular form, in the manner of KLU: the
+matrix is permuted to block upper triangular form, only the diagonal
+blocks are factorized (in parallel, with the Numba Gilbert-Peierls LU and
+an AMD ordering per block), and the off-diagonal blocks enter the solve as
+coupling in a block back substitution. Blocks of independent connected
+components are also solved in parallel.
+    btf_factorize_csc
+    btf_solve_factored
+    btf_solve_factored_transpose
+    btf_free_factors
+    btf_solve_csc
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: btf_lu_numba.py
+
+import numpy as np
+from numba import njit, prange, int32, int64, float64, types
+from numba.experimental import jitclass
+from numba.typed import List
+
+from sparse_numba.conversion.matrix_conversion_numba import ensure_float64, ensure_int32
+from sparse_numba.gplu.gplu_numba import (
+    GPLUFactors, gplu_factorize_csc, gplu_solve_factored, gplu_solve_factored_transpose,
+)
+from sparse_numba.ordering.ordering_numba import amd_ordering, permute_csc
+from sparse_numba.ordering.btf_numba import btf_decomposition, connected_components
+
+
+@jitclass([
+    ('n', int64),
+    ('row_perm', int32[::1]),
+    ('col_perm', int32[::1]),
+    ('block_ptr', int32[::1]),
+    ('comp_ptr', int32[::1]),
+    ('block_factor', int32[::1]),
+    ('pivots', float64[::1]),
+    ('factors', types.ListType(GPLUFactors.class_type.instance_type)),
+    ('F_data', float64[::1]),
+    ('F_indices', int32[::1]),
+    ('F_indptr', int32[::1]),
+])
+class BTFFactors:
+    """
+    Factors from btf_factorize_csc. C = A[row_perm][:, col_perm] is block
+    upper triangular; diagonal block k covers block_ptr[k]:block_ptr[k + 1]
+    and the blocks of connected component c are comp_ptr[c]:comp_ptr[c + 1].
+    A block of size one is its pivot in pivots; a larger block has its
+    GP-LU factors in factors[block_factor[k]]. The entries of C outside
+    the diagonal blocks are the coupling F, in CSC.
+    """
+
+    def __init__(self, n, row_perm, col_perm, block_ptr, comp_ptr, block_factor, pivots,
+                 factors, F_data, F_indices, F_indptr):
+        self.n = n
+        self.row_perm = row_perm
+        self.col_perm = col_perm
+        self.block_ptr = block_ptr
+        self.comp_ptr = comp_ptr
+        self.block_factor = block_factor
+        self.pivots = pivots
+        self.factors = factors
+        self.F_data = F_data
+        self.F_indices = F_indices
+        self.F_indptr = F_indptr
+
+    @property
+    def n_blocks(self):
+        return len(self.block_ptr) - 1
+
+    @property
+    def n_components(self):
+        return len(self.comp_ptr) - 1
+
+    @property
+    def nnz(self):
+        """Stored entries in the block factors, the pivots and the coupling."""
+        total = len(self.F_indices)
+        for k in range(self.n_blocks):
+            f = self.block_factor[k]
+            if f < 0:
+                total += 1
+            else:
+                total += self.factors[f].nnz
+        return total
+
+
+@njit(nogil=True)
+def _empty_gplu():
+    ptr = np.zeros(1, dtype=np.int32)
+    empty_i = np.zeros(0, dtype=np.int32)
+    empty_x = np.zeros(0, dtype=np.float64)
+    return GPLUFactors(0, ptr, empty_i, empty_x, ptr.copy(), empty_i, empty_x,
+                       empty_i, empty_i, empty_i, ptr.copy())
+
+
+@njit(nogil=True)
+def _empty_btf(n):
+    ident = np.arange(n, dtype=np.int32)
+    factors = List()
+    factors.append(_empty_gplu())
+    factors.pop()
+    return BTFFactors(n, ident, ident.copy(), np.zeros(1, dtype=np.int32),
+                      np.zeros(1, dtype=np.int32), np.zeros(0, dtype=np.int32),
+                      np.zeros(0, dtype=np.float64), factors, np.zeros(0, dtype=np.float64),
+                      np.zeros(0, dtype=np.int32), np.zeros(n + 1, dtype=np.int32))
+
+
+@njit(nogil=True)
+def _factor_block(data, indices, indptr, b0, b1, pivot_thresh):
+    """Extract diagonal block b0:b1 of C and factorize it with AMD + GP-LU."""
+    m = b1 - b0
+    bp = np.zeros(m + 1, dtype=np.int32)
+    for j in range(m):
+        cnt = 0
+        for p in range(indptr[b0 + j], indptr[b0 + j + 1]):
+            if indices[p] >= b0:
+                cnt += 1
+        bp[j + 1] = bp[j] + cnt
+    bi = np.empty(bp[m], dtype=np.int32)
+    bx = np.empty(bp[m], dtype=np.float64)
+    q = 0
+    for j in range(m):
+        for p in range(indptr[b0 + j], indptr[b0 + j + 1]):
+            if indices[p] >= b0:
+                bi[q] = indices[p] - b0
+                bx[q] = data[p]
+                q += 1
+    order = amd_ordering(bi, bp)
+    return gplu_factorize_csc(bx, bi, bp, order, pivot_thresh)
+
+
+@njit(nogil=True, parallel=True)
+def btf_factorize_csc(csc_data, csc_indices, csc_indptr, pivot_thresh=1.0):
+    """
+    Pre-factorize a sparse matrix in CSC format through its block
+    triangular form. Same call as gplu_factorize_csc.
+
+    The diagonal blocks are factorized independently in parallel; blocks
+    of size one (common in circuit and network matrices) cost a division
+    in the solve. Only the diagonal blocks fill in, so a reducible matrix
+    usually needs much less memory and time than a factorization of the
+    whole matrix. An irreducible matrix is one block, factorized as by
+    gplu_factorize_csc with an AMD ordering.
+
+    Parameters:
+    -----------
+    csc_data : ndarray (float64)
+        Nonzero values in CSC format
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    pivot_thresh : float, optional
+        Threshold partial pivoting inside the blocks, in (0, 1]; see
+        gplu_factorize_csc
+
+    Returns:
+    --------
+    factors : BTFFactors
+        Factors for btf_solve_factored
+    info : int
+        Status code (0 for success, k + 1 if the diagonal block starting at
+        position k of the block triangular form is singular, -1/-2 for
+        invalid CSC input, -3 for a non-square matrix)
+    """
+    data = ensure_float64(csc_data)
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+    n = len(indptr) - 1
+    nnz = len(data)
+    if indptr[0] != 0:
+        print("Error: First element of indptr must be 0")
+        return _empty_btf(n), -1
+    if indptr[n] != nnz:
+        print("Error: Last element of indptr must equal nnz")
+        return _empty_btf(n), -2
+    if nnz > 0 and (indices.min() < 0 or indices.max() >= n):
+        print("Error: Matrix must be square")
+        return _empty_btf(n), -3
+
+    row_perm, col_perm, block_ptr, _ = btf_decomposition(indices, indptr)
+    n_blocks = len(block_ptr) - 1
+
+    # Group the blocks by connected component, keeping their order within
+    # a component; no entry couples two components, so C stays triangular
+    _, i0, p0 = permute_csc(data, indices, indptr, row_perm, col_perm)
+    cperm, cptr = connected_components(i0, p0)
+    n_comp = len(cptr) - 1
+    comp_of = np.empty(n, dtype=np.int32)
+    for c in range(n_comp):
+        for k in range(cptr[c], cptr[c + 1]):
+            comp_of[cperm[k]] = c
+    comp_ptr = np.zeros(n_comp + 1, dtype=np.int32)
+    for k in range(n_blocks):
+        comp_ptr[comp_of[block_ptr[k]] + 1] += 1
+    for c in range(n_comp):
+        comp_ptr[c + 1] += comp_ptr[c]
+    slot = comp_ptr[:n_comp].copy()
+    block_order = np.empty(n_blocks, dtype=np.int32)
+    for k in range(n_blocks):
+        c = comp_of[block_ptr[k]]
+        block_order[slot[c]] = k
+        slot[c] += 1
+    new_ptr = np.zeros(n_blocks + 1, dtype=np.int32)
+    rp = np.empty(n, dtype=np.int32)
+    cp = np.empty(n, dtype=np.int32)
+    for t in range(n_blocks):
+        k = block_order[t]
+        start = new_ptr[t]
+        for s in range(block_ptr[k], block_ptr[k + 1]):
+            rp[start + s - block_ptr[k]] = row_perm[s]
+            cp[start + s - block_ptr[k]] = col_perm[s]
+        new_ptr[t + 1] = start + block_ptr[k + 1] - block_ptr[k]
+    row_perm, col_perm, block_ptr = rp, cp, new_ptr
+    C_data, C_indices, C_indptr = permute_csc(data, indices, indptr, row_perm, col_perm)
+
+    # Coupling: entries above the diagonal blocks
+    block_of = np.empty(n, dtype=np.int32)
+    for k in range(n_blocks):
+        for s in range(block_ptr[k], block_ptr[k + 1]):
+            block_of[s] = k
+    F_indptr = np.zeros(n + 1, dtype=np.int32)
+    for j in range(n):
+        b0 = block_ptr[block_of[j]]
+        cnt = 0
+        for p in range(C_indptr[j], C_indptr[j + 1]):
+            if C_indices[p] < b0:
+                cnt += 1
+        F_indptr[j + 1] = F_indptr[j] + cnt
+    F_indices = np.empty(F_indptr[n], dtype=np.int32)
+    F_data = np.empty(F_indptr[n], dtype=np.float64)
+    q = 0
+    for j in range(n):
+        b0 = block_ptr[block_of[j]]
+        for p in range(C_indptr[j], C_indptr[j + 1]):
+            if C_indices[p] < b0:
+                F_indices[q] = C_indices[p]
+                F_data[q] = C_data[p]
+                q += 1
+
+    # Singletons keep their pivot; the other blocks get a slot in factors
+    block_factor = np.full(n_blocks, -1, dtype=np.int32)
+    pivots = np.zeros(n_blocks, dtype=np.float64)
+    big = np.empty(n_blocks, dtype=np.int32)
+    n_big = 0
+    for k in range(n_blocks):
+        b0 = block_ptr[k]
+        if block_ptr[k + 1] - b0 == 1:
+            for p in range(C_indptr[b0], C_indptr[b0 + 1]):
+                if C_indices[p] == b0:
+                    pivots[k] += C_data[p]
+        else:
+            block_factor[k] = n_big
+            big[n_big] = k
+            n_big += 1
+    factors = List()
+    for t in range(n_big):
+        factors.append(_empty_gplu())
+
+    status = np.zeros(n_big, dtype=np.int32)
+    for t in prange(n_big):
+        k = big[t]
+        f, st = _factor_block(C_data, C_indices, C_indptr, block_ptr[k], block_ptr[k + 1],
+                              pivot_thresh)
+        factors[np.int64(t)] = f
+        status[t] = st
+
+    info = 0
+    for k in range(n_blocks):
+        f = block_factor[k]
+        if (f < 0 and pivots[k] == 0.0) or (f >= 0 and status[f] != 0):
+            print("Error: Singular diagonal block in the block triangular form")
+            info = block_ptr[k] + 1
+            break
+    return BTFFactors(n, row_perm, col_perm, block_ptr, comp_ptr, block_factor, pivots,
+                      factors, F_data, F_indices, F_indptr), info
+
+
+@njit(nogil=True, parallel=True)
+def btf_solve_factored(factors, b):
+    """
+    Solve A*x = b using the factors from btf_factorize_csc. The connected
+    components are solved in parallel; within a component, the blocks are
+    solved last to first and their solution is eliminated from the
+    right-hand side of the blocks above through the coupling.
+
+    Parameters:
+    -----------
+    factors : BTFFactors
+        Factors from btf_factorize_csc
+    b : ndarray (float64)
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success, -3 if the length of b does not match)
+    """
+    n = factors.n
+    if len(b) != n:
+        print("Error: Length of b does not match the factors")
+        return np.zeros(len(b), dtype=np.float64), -3
+
+    block_ptr = factors.block_ptr
+    comp_ptr = factors.comp_ptr
+    Fp, Fi, Fx = factors.F_indptr, factors.F_indices, factors.F_data
+    y = np.empty(n, dtype=np.float64)
+    for k in range(n):
+        y[k] = b[factors.row_perm[k]]
+    for c in prange(factors.n_components):
+        for k in range(comp_ptr[c + 1] - 1, comp_ptr[c] - 1, -1):
+            b0 = block_ptr[k]
+            b1 = block_ptr[k + 1]
+            f = factors.block_factor[k]
+            if f < 0:
+                y[b0] /= factors.pivots[k]
+            else:
+                yk, _ = gplu_solve_factored(factors.factors[f], y[b0:b1])
+                y[b0:b1] = yk
+            for j in range(b0, b1):
+                yj = y[j]
+                if yj != 0.0:
+                    for p in range(Fp[j], Fp[j + 1]):
+                        y[Fi[p]] -= Fx[p] * yj
+    x = np.empty(n, dtype=np.float64)
+    for k in range(n):
+        x[factors.col_perm[k]] = y[k]
+    return x, 0
+
+
+@njit(nogil=True, parallel=True)
+def btf_solve_factored_transpose(factors, b):
+    """
+    Solve A^T*x = b using the factors of A from btf_factorize_csc. C^T is
+    block lower triangular, so the blocks of each component are solved
+    first to last.
+
+    Parameters:
+    -----------
+    factors : BTFFactors
+        Factors from btf_factorize_csc
+    b : ndarray (float64)
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success, -3 if the length of b does not match)
+    """
+    n = factors.n
+    if len(b) != n:
+        print("Error: Length of b does not match the factors")
+        return np.zeros(len(b), dtype=np.float64), -3
+
+    block_ptr = factors.block_ptr
+    comp_ptr = factors.comp_ptr
+    Fp, Fi, Fx = factors.F_indptr, factors.F_indices, factors.F_data
+    y = np.empty(n, dtype=np.float64)
+    for k in range(n):
+        y[k] = b[factors.col_perm[k]]
+    for c in prange(factors.n_components):
+        for k in range(comp_ptr[c], comp_ptr[c + 1]):
+            b0 = block_ptr[k]
+            b1 = block_ptr[k + 1]
+            # Column j of F is row j of F^T; its entries are in solved blocks
+            for j in range(b0, b1):
+                s = y[j]
+                for p in range(Fp[j], Fp[j + 1]):
+                    s -= Fx[p] * y[Fi[p]]
+                y[j] = s
+            f = factors.block_factor[k]
+            if f < 0:
+                y[b0] /= factors.pivots[k]
+            else:
+                yk, _ = gplu_solve_factored_transpose(factors.factors[f], y[b0:b1])
+                y[b0:b1] = yk
+    x = np.empty(n, dtype=np.float64)
+    for k in range(n):
+        x[factors.row_perm[k]] = y[k]
+    return x, 0
+
+
+@njit(nogil=True)
+def btf_free_factors(factors):
+    """
+    Counterpart of superlu_free_factors, for drop-in use. The factors are
+    ordinary Numba objects and are released by reference counting, so
+    this does nothing.
+
+    Returns:
+    --------
+    info : int
+        Always 0
+    """
+    return 0
+
+
+@njit(nogil=True)
+def btf_solve_csc(csc_data, csc_indices, csc_indptr, b, pivot_thresh=1.0):
+    """
+    Solve a sparse linear system Ax = b through the block triangular form;
+    btf_factorize_csc followed by btf_solve_factored.
+
+    Parameters:
+    -----------
+    csc_data : ndarray (float64)
+        Nonzero values in CSC format
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    b : ndarray (float64)
+        Right-hand side vector
+    pivot_thresh : float, optional
+        Threshold partial pivoting inside the blocks, in (0, 1]
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success; see btf_factorize_csc)
+    """
+    factors, info = btf_factorize_csc(csc_data, csc_indices, csc_indptr, pivot_thresh)
+    if info != 0:
+        return np.zeros(len(b), dtype=np.float64), info
+    return btf_solve_factored(factors, ensure_float64(b))
@@ -0,0 +1,145 @@
+"""
+Tests for the sparse LU through the block triangular form.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_btf_lu.py
+
+import numpy as np
+import scipy.sparse as sp
+from sparse_numba.btf.btf_lu_numba import (
+    btf_factorize_csc,
+    btf_solve_factored,
+    btf_solve_factored_transpose,
+    btf_free_factors,
+    btf_solve_csc,
+)
+from sparse_numba.gplu.gplu_numba import gplu_factorize_csc
+
+
+def _make_test_matrix(sizes=(1, 6, 1, 25, 3, 1, 40), n_copies=3, seed=0):
+    """
+    Reducible matrix: n_copies uncoupled copies of a block upper triangular
+    matrix with irreducible diagonal blocks of the given sizes, with rows
+    and columns scrambled, as CSC.
+    """
+    rng = np.random.default_rng(seed)
+    blocks = []
+    for m in sizes:
+        # A cycle plus random entries keeps each block irreducible
+        B = sp.random(m, m, density=0.2, random_state=rng) + 4.0 * sp.eye(m)
+        if m > 1:
+            B = B + sp.csc_matrix((np.ones(m), (np.arange(m), np.roll(np.arange(m), 1))))
+        blocks.append(B)
+    T = sp.block_diag(blocks).tolil()
+    n0 = T.shape[0]
+    for _ in range(3 * n0):
+        i, j = np.sort(rng.integers(0, n0, 2))
+        T[i, j] = rng.standard_normal()
+    A = sp.block_diag([T.tocsc()] * n_copies).tocsc()
+    n = A.shape[0]
+    A = sp.csc_matrix(A[rng.permutation(n)][:, rng.permutation(n)])
+    A.sort_indices()
+    A.indices = A.indices.astype(np.int32)
+    A.indptr = A.indptr.astype(np.int32)
+    return A
+
+
+def test_factorize_and_solve():
+    """Solutions of A x = b and A^T x = b; blocks and components are found."""
+    print("Test: btf_factorize_csc + solve")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    b = np.random.default_rng(1).standard_normal(n)
+    for thresh in (1.0, 0.1):
+        factors, info = btf_factorize_csc(A.data, A.indices, A.indptr, thresh)
+        assert info == 0
+        assert factors.n_components == 3
+        assert factors.n_blocks == 3 * 7
+        x, info = btf_solve_factored(factors, b)
+        assert info == 0
+        assert np.linalg.norm(A @ x - b) < 1e-10 * np.linalg.norm(b) * n
+        x, info = btf_solve_factored_transpose(factors, b)
+        assert info == 0
+        assert np.linalg.norm(A.T @ x - b) < 1e-10 * np.linalg.norm(b) * n
+        assert btf_free_factors(factors) == 0
+
+    # Only the diagonal blocks fill in
+    whole, info = gplu_factorize_csc(A.data, A.indices, A.indptr)
+    assert factors.nnz < whole.nnz
+
+    x, info = btf_solve_csc(A.data, A.indices, A.indptr, b)
+    assert info == 0
+    assert np.allclose(A @ x, b)
+    print("  PASSED")
+
+
+def test_irreducible_and_triangular():
+    """One block for an irreducible matrix; n singletons for a triangular one."""
+    print("Test: btf_factorize_csc (irreducible, triangular)")
+    m = 12
+    T = sp.diags([-np.ones(m - 1), 4.0 * np.ones(m), -np.ones(m - 1)], [-1, 0, 1])
+    A = sp.kronsum(T, T).tocsc()
+    n = A.shape[0]
+    b = np.arange(n, dtype=np.float64)
+    factors, info = btf_factorize_csc(A.data, A.indices.astype(np.int32),
+                                      A.indptr.astype(np.int32))
+    assert info == 0 and factors.n_blocks == 1
+    x, _ = btf_solve_factored(factors, b)
+    assert np.allclose(A @ x, b)
+
+    U = sp.triu(sp.random(n, n, density=0.05, random_state=3) + sp.eye(n)).tocsc()
+    s = np.random.default_rng(2).permutation(n)
+    U = sp.csc_matrix(U[s])
+    factors, info = btf_factorize_csc(U.data, U.indices.astype(np.int32),
+                                      U.indptr.astype(np.int32))
+    assert info == 0 and factors.n_blocks == n
+    assert len(factors.factors) == 0
+    x, _ = btf_solve_factored(factors, b)
+    assert np.allclose(U @ x, b)
+    x, _ = btf_solve_factored_transpose(factors, b)
+    assert np.allclose(U.T @ x, b)
+    print("  PASSED")
+
+
+def test_errors():
+    """Singular blocks, invalid input and a wrong right-hand side."""
+    print("Test: btf_factorize_csc (errors)")
+    S = sp.csc_matrix(np.array([[1.0, 1.0, 1.0], [0.0, 0.0, 1.0], [0.0, 0.0, 1.0]]))
+    _, info = btf_factorize_csc(S.data, S.indices.astype(np.int32), S.indptr.astype(np.int32))
+    assert info > 0
+    S = sp.csc_matrix(np.array([[1.0, 2.0, 0.0], [2.0, 4.0, 0.0], [1.0, 0.0, 1.0]]))
+    _, info = btf_factorize_csc(S.data, S.indices.astype(np.int32), S.indptr.astype(np.int32))
+    assert info > 0
+
+    A = _make_test_matrix(n_copies=1)
+    bad = A.indptr.copy()
+    bad[0] = 1
+    _, info = btf_factorize_csc(A.data, A.indices, bad)
+    assert info == -1
+    _, info = btf_factorize_csc(A.data[:-1], A.indices[:-1], A.indptr)
+    assert info == -2
+    factors, info = btf_factorize_csc(A.data, A.indices, A.indptr)
+    x, info = btf_solve_factored(factors, np.ones(A.shape[0] + 1))
+    assert info == -3
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("BTF Sparse LU Tests")
+    print("=" * 60)
+    test_factorize_and_solve()
+    test_irreducible_and_triangular()
+    test_errors()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
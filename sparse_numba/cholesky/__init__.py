@@ -0,0 +1,17 @@
+from .cholesky_numba import (
+    ldl_analyze_csc, ldl_factorize_numeric, ldl_factorize_csc,
+    ldl_solve_factored, ldl_inertia, ldl_free_factors,
+    cholesky_factorize_numeric, cholesky_factorize_csc,
+    cholesky_solve_factored, cholesky_factor_l, cholesky_free_factors,
+    LDLSymbolic, LDLFactors,
+)
+
+__all__ = [
+    'ldl_analyze_csc', 'ldl_factorize_numeric', 'ldl_factorize_csc',
+    'ldl_solve_factored', 'ldl_inertia', 'ldl_free_factors',
+    'cholesky_factorize_numeric', 'cholesky_factorize_csc',
+    'cholesky_solve_factored', 'cholesky_factor_l', 'cholesky_free_factors',
+    'LDLSymbolic', 'LDLFactors',
+]
+
+__author__ = 'Tianqi Hong'
@@ -0,0 +1,534 @@
+"""
+Pure-Numba sparse LDL^T and Cholesky (up-looking) for symmetric matrices,
+with elimination-tree symbolic analysis.
+    ldl_analyze_csc
+    ldl_factorize_csc, ldl_factorize_numeric
+    ldl_solve_factored, ldl_inertia, ldl_free_factors
+    cholesky_factorize_csc, cholesky_factorize_numeric
+    cholesky_solve_factored, cholesky_factor_l, cholesky_free_factors
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: cholesky_numba.py
+
+import numpy as np
+from numba import njit, int32, int64, float64, boolean
+from numba.experimental import jitclass
+
+from sparse_numba.conversion.matrix_conversion_numba import ensure_float64, ensure_int32
+
+
+@jitclass([
+    ('n', int64),
+    ('nnz_a', int64),
+    ('perm', int32[::1]),
+    ('pinv', int32[::1]),
+    ('c_indptr', int32[::1]),
+    ('c_indices', int32[::1]),
+    ('c_map', int32[::1]),
+    ('parent', int32[::1]),
+    ('col_counts', int32[::1]),
+    ('Lp', int32[::1]),
+])
+class LDLSymbolic:
+    """
+    Symbolic analysis from ldl_analyze_csc, reusable for every matrix with
+    the same pattern.
+
+    C = P A P^T is the permuted matrix (row k of C is row perm[k] of A).
+    Its upper triangle is kept as a CSC pattern (c_indptr, c_indices)
+    whose values are csc_data[c_map]. parent is the elimination tree of C
+    (-1 for roots) and col_counts the number of off-diagonal entries in
+    each column of L; Lp is their cumulative sum.
+    """
+
+    def __init__(self, n, nnz_a, perm, pinv, c_indptr, c_indices, c_map,
+                 parent, col_counts, Lp):
+        self.n = n
+        self.nnz_a = nnz_a
+        self.perm = perm
+        self.pinv = pinv
+        self.c_indptr = c_indptr
+        self.c_indices = c_indices
+        self.c_map = c_map
+        self.parent = parent
+        self.col_counts = col_counts
+        self.Lp = Lp
+
+    @property
+    def nnz_l(self):
+        """Off-diagonal entries of L."""
+        return self.Lp[self.n]
+
+
+@jitclass([
+    ('symbolic', LDLSymbolic.class_type.instance_type),
+    ('Li', int32[::1]),
+    ('Lx', float64[::1]),
+    ('D', float64[::1]),
+    ('is_cholesky', boolean),
+])
+class LDLFactors:
+    """
+    Numeric factors P A P^T = L D L^T, L unit lower triangular (diagonal not
+    stored) in CSC with column pointers symbolic.Lp. For a Cholesky
+    factorization D is positive and the Cholesky factor is L sqrt(D).
+    """
+
+    def __init__(self, symbolic, Li, Lx, D, is_cholesky):
+        self.symbolic = symbolic
+        self.Li = Li
+        self.Lx = Lx
+        self.D = D
+        self.is_cholesky = is_cholesky
+
+
+@njit(nogil=True)
+def _empty_symbolic(n, nnz_a):
+    z = np.zeros(0, dtype=np.int32)
+    ptr = np.zeros(n + 1, dtype=np.int32)
+    ident = np.arange(n, dtype=np.int32)
+    return LDLSymbolic(n, nnz_a, ident, ident.copy(), ptr, z, z.copy(),
+                       np.full(n, -1, dtype=np.int32), np.zeros(n, dtype=np.int32), ptr.copy())
+
+
+@njit(nogil=True)
+def ldl_analyze_csc(csc_indices, csc_indptr, perm=None):
+    """
+    Symbolic analysis of a symmetric CSC pattern: permuted upper-triangle
+    pattern, elimination tree and column counts of L. Only entries in the
+    lower triangle of A (row >= column) are used, so either the full
+    symmetric matrix or its lower triangle can be given.
+
+    Parameters:
+    -----------
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    perm : ndarray (int32), optional
+        Symmetric ordering: row/column k of the factors is row/column
+        perm[k] of A (default: natural order). This is where a
+        fill-reducing ordering such as AMD is plugged in.
+
+    Returns:
+    --------
+    symbolic : LDLSymbolic
+        Symbolic analysis for ldl_factorize_numeric and
+        cholesky_factorize_numeric
+    info : int
+        Status code (0 for success, -1/-2 for invalid CSC input, -3 for a
+        non-square matrix or a bad perm)
+    """
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+    n = len(indptr) - 1
+    nnz = len(indices)
+
+    if indptr[0] != 0:
+        print("Error: First element of indptr must be 0")
+        return _empty_symbolic(n, nnz), -1
+    if indptr[n] != nnz:
+        print("Error: Last element of indptr must equal nnz")
+        return _empty_symbolic(n, nnz), -2
+    if nnz > 0 and (indices.min() < 0 or indices.max() >= n):
+        print("Error: Matrix must be square")
+        return _empty_symbolic(n, nnz), -3
+
+    p_arr = np.arange(n, dtype=np.int32)
+    if perm is not None:
+        if len(perm) != n:
+            print("Error: perm must have one entry per row")
+            return _empty_symbolic(n, nnz), -3
+        seen = np.zeros(n, dtype=np.bool_)
+        for k in range(n):
+            c = perm[k]
+            if c < 0 or c >= n or seen[c]:
+                print("Error: perm is not a permutation")
+                return _empty_symbolic(n, nnz), -3
+            seen[c] = True
+            p_arr[k] = c
+    pinv = np.empty(n, dtype=np.int32)
+    for k in range(n):
+        pinv[p_arr[k]] = k
+
+    # Upper triangle of C = P A P^T, by columns, from the lower triangle of A
+    count = np.zeros(n + 1, dtype=np.int32)
+    for j in range(n):
+        for p in range(indptr[j], indptr[j + 1]):
+            i = indices[p]
+            if i >= j:
+                count[max(pinv[i], pinv[j]) + 1] += 1
+    for k in range(n):
+        count[k + 1] += count[k]
+    c_indptr = count.copy()
+    nnz_c = c_indptr[n]
+    c_indices = np.empty(nnz_c, dtype=np.int32)
+    c_map = np.empty(nnz_c, dtype=np.int32)
+    for j in range(n):
+        for p in range(indptr[j], indptr[j + 1]):
+            i = indices[p]
+            if i >= j:
+                a = pinv[i]
+                b = pinv[j]
+                col = max(a, b)
+                q = count[col]
+                c_indices[q] = min(a, b)
+                c_map[q] = p
+                count[col] = q + 1
+
+    # Elimination tree and column counts (row-by-row path compression)
+    parent = np.full(n, -1, dtype=np.int32)
+    col_counts = np.zeros(n, dtype=np.int32)
+    flag = np.empty(n, dtype=np.int32)
+    for k in range(n):
+        flag[k] = k
+        for p in range(c_indptr[k], c_indptr[k + 1]):
+            i = c_indices[p]
+            while i < k and flag[i] != k:
+                if parent[i] == -1:
+                    parent[i] = k
+                col_counts[i] += 1
+                flag[i] = k
+                i = parent[i]
+    Lp = np.zeros(n + 1, dtype=np.int32)
+    for k in range(n):
+        Lp[k + 1] = Lp[k] + col_counts[k]
+
+    return LDLSymbolic(n, nnz, p_arr, pinv, c_indptr, c_indices, c_map,
+                       parent, col_counts, Lp), 0
+
+
+@njit(nogil=True)
+def _ldl_numeric(symbolic, data, cholesky):
+    """Up-looking LDL^T on the analyzed pattern; returns (factors, info)."""
+    n = symbolic.n
+    Lp = symbolic.Lp
+    parent = symbolic.parent
+    c_indptr = symbolic.c_indptr
+    c_indices = symbolic.c_indices
+    c_map = symbolic.c_map
+
+    Li = np.empty(Lp[n], dtype=np.int32)
+    Lx = np.empty(Lp[n], dtype=np.float64)
+    D = np.zeros(n, dtype=np.float64)
+    if len(data) != symbolic.nnz_a:
+        print("Error: numeric factorization needs the analyzed pattern")
+        return LDLFactors(symbolic, Li, Lx, D, cholesky), -3
+
+    y = np.zeros(n, dtype=np.float64)
+    pattern = np.empty(n, dtype=np.int32)
+    flag = np.empty(n, dtype=np.int32)
+    lnz = np.zeros(n, dtype=np.int32)
+    for k in range(n):
+        # Nonzero pattern of row k of L: reach of column k of C in the etree
+        top = n
+        flag[k] = k
+        for p in range(c_indptr[k], c_indptr[k + 1]):
+            i = c_indices[p]
+            y[i] += data[c_map[p]]
+            length = 0
+            while flag[i] != k:
+                pattern[length] = i
+                length += 1
+                flag[i] = k
+                i = parent[i]
+            while length > 0:
+                top -= 1
+                length -= 1
+                pattern[top] = pattern[length]
+
+        # Sparse triangular solve for row k, then the pivot
+        dk = y[k]
+        y[k] = 0.0
+        for t in range(top, n):
+            i = pattern[t]
+            yi = y[i]
+            y[i] = 0.0
+            p2 = Lp[i] + lnz[i]
+            for p in range(Lp[i], p2):
+                y[Li[p]] -= Lx[p] * yi
+            l_ki = yi / D[i]
+            dk -= l_ki * yi
+            Li[p2] = k
+            Lx[p2] = l_ki
+            lnz[i] += 1
+        D[k] = dk
+        if dk == 0.0 or (cholesky and not dk > 0.0):
+            for t in range(top, n):
+                y[pattern[t]] = 0.0
+            return LDLFactors(symbolic, Li, Lx, D, cholesky), k + 1
+
+    return LDLFactors(symbolic, Li, Lx, D, cholesky), 0
+
+
+@njit(nogil=True)
+def ldl_factorize_numeric(symbolic, csc_data):
+    """
+    Numeric LDL^T factorization of new values on the pattern analyzed by
+    ldl_analyze_csc. No pivoting is done, so the matrix must have an LDL^T
+    factorization in the chosen order (true for definite and quasi-definite
+    matrices).
+
+    Parameters:
+    -----------
+    symbolic : LDLSymbolic
+        Symbolic analysis from ldl_analyze_csc
+    csc_data : ndarray (float64)
+        Nonzero values, in the order of the analyzed CSC matrix
+
+    Returns:
+    --------
+    factors : LDLFactors
+        Factors for ldl_solve_factored and ldl_inertia
+    info : int
+        Status code (0 for success, k + 1 if D[k] is exactly zero, -3 if
+        the number of values differs)
+    """
+    return _ldl_numeric(symbolic, ensure_float64(csc_data), False)
+
+
+@njit(nogil=True)
+def ldl_factorize_csc(csc_data, csc_indices, csc_indptr, perm=None):
+    """
+    LDL^T factorization of a symmetric matrix in CSC format (analysis and
+    numeric factorization in one call). Only the lower triangle of A is
+    read.
+
+    Parameters:
+    -----------
+    csc_data : ndarray (float64)
+        Nonzero values in CSC format
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    perm : ndarray (int32), optional
+        Symmetric fill-reducing ordering (see ldl_analyze_csc)
+
+    Returns:
+    --------
+    factors : LDLFactors
+        Factors for ldl_solve_factored and ldl_inertia
+    info : int
+        Status code (0 for success, k + 1 if D[k] is exactly zero)
+    """
+    symbolic, info = ldl_analyze_csc(csc_indices, csc_indptr, perm)
+    if info != 0:
+        n = symbolic.n
+        return LDLFactors(symbolic, np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float64),
+                          np.zeros(n, dtype=np.float64), False), info
+    return _ldl_numeric(symbolic, ensure_float64(csc_data), False)
+
+
+@njit(nogil=True)
+def ldl_solve_factored(factors, b):
+    """
+    Solve A*x = b using the factors from ldl_factorize_* or
+    cholesky_factorize_*.
+
+    Parameters:
+    -----------
+    factors : LDLFactors
+        Factors of A
+    b : ndarray (float64)
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success, -3 if the length of b does not match)
+    """
+    symbolic = factors.symbolic
+    n = symbolic.n
+    if len(b) != n:
+        print("Error: Length of b does not match the factors")
+        return np.zeros(len(b), dtype=np.float64), -3
+
+    Lp = symbolic.Lp
+    Li = factors.Li
+    Lx = factors.Lx
+    y = np.empty(n, dtype=np.float64)
+    for k in range(n):
+        y[k] = b[symbolic.perm[k]]
+    for j in range(n):
+        yj = y[j]
+        for p in range(Lp[j], Lp[j + 1]):
+            y[Li[p]] -= Lx[p] * yj
+    for j in range(n):
+        y[j] /= factors.D[j]
+    for j in range(n - 1, -1, -1):
+        s = y[j]
+        for p in range(Lp[j], Lp[j + 1]):
+            s -= Lx[p] * y[Li[p]]
+        y[j] = s
+    x = np.empty(n, dtype=np.float64)
+    for k in range(n):
+        x[symbolic.perm[k]] = y[k]
+    return x, 0
+
+
+@njit(nogil=True)
+def ldl_inertia(factors):
+    """
+    Inertia of A from its LDL^T factors (Sylvester's law of inertia).
+
+    Parameters:
+    -----------
+    factors : LDLFactors
+        Factors from ldl_factorize_*
+
+    Returns:
+    --------
+    n_pos : int
+        Number of positive eigenvalues
+    n_neg : int
+        Number of negative eigenvalues (negative pivots)
+    n_zero : int
+        Number of zero eigenvalues
+    """
+    n_pos = 0
+    n_neg = 0
+    n_zero = 0
+    for d in factors.D:
+        if d > 0.0:
+            n_pos += 1
+        elif d < 0.0:
+            n_neg += 1
+        else:
+            n_zero += 1
+    return n_pos, n_neg, n_zero
+
+
+@njit(nogil=True)
+def ldl_free_factors(factors):
+    """
+    Counterpart of superlu_free_factors, for drop-in use. The factors are
+    ordinary Numba objects released by reference counting; does nothing.
+
+    Returns:
+    --------
+    info : int
+        Always 0
+    """
+    return 0
+
+
+@njit(nogil=True)
+def cholesky_factorize_numeric(symbolic, csc_data):
+    """
+    Numeric Cholesky factorization of new values on the pattern analyzed
+    by ldl_analyze_csc. Computed as L D L^T with every pivot checked to be
+    positive; cholesky_factor_l returns the Cholesky factor L sqrt(D).
+
+    Parameters:
+    -----------
+    symbolic : LDLSymbolic
+        Symbolic analysis from ldl_analyze_csc
+    csc_data : ndarray (float64)
+        Nonzero values, in the order of the analyzed CSC matrix
+
+    Returns:
+    --------
+    factors : LDLFactors
+        Factors for cholesky_solve_factored
+    info : int
+        Status code (0 for success, k + 1 if A is not positive definite and
+        pivot k is not positive, -3 if the number of values differs)
+    """
+    return _ldl_numeric(symbolic, ensure_float64(csc_data), True)
+
+
+@njit(nogil=True)
+def cholesky_factorize_csc(csc_data, csc_indices, csc_indptr, perm=None):
+    """
+    Cholesky factorization of a symmetric positive definite matrix in CSC
+    format (analysis and numeric factorization in one call). Only the
+    lower triangle of A is read.
+
+    Parameters:
+    -----------
+    csc_data : ndarray (float64)
+        Nonzero values in CSC format
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    perm : ndarray (int32), optional
+        Symmetric fill-reducing ordering (see ldl_analyze_csc)
+
+    Returns:
+    --------
+    factors : LDLFactors
+        Factors for cholesky_solve_factored
+    info : int
+        Status code (0 for success, k + 1 if A is not positive definite)
+    """
+    symbolic, info = ldl_analyze_csc(csc_indices, csc_indptr, perm)
+    if info != 0:
+        n = symbolic.n
+        return LDLFactors(symbolic, np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float64),
+                          np.zeros(n, dtype=np.float64), True), info
+    return _ldl_numeric(symbolic, ensure_float64(csc_data), True)
+
+
+@njit(nogil=True)
+def cholesky_solve_factored(factors, b):
+    """
+    Solve A*x = b using the factors from cholesky_factorize_*.
+    Same as ldl_solve_factored.
+    """
+    return ldl_solve_factored(factors, b)
+
+
+@njit(nogil=True)
+def cholesky_factor_l(factors):
+    """
+    Cholesky factor of P A P^T = L_c L_c^T as a CSC matrix, L_c = L sqrt(D),
+    with the diagonal stored first in each column.
+
+    Parameters:
+    -----------
+    factors : LDLFactors
+        Factors from cholesky_factorize_*
+
+    Returns:
+    --------
+    data : ndarray (float64)
+        Nonzero values of L_c
+    indices : ndarray (int32)
+        Row indices of L_c
+    indptr : ndarray (int32)
+        Column pointers of L_c
+    """
+    symbolic = factors.symbolic
+    n = symbolic.n
+    Lp = symbolic.Lp
+    indptr = np.empty(n + 1, dtype=np.int32)
+    indices = np.empty(Lp[n] + n, dtype=np.int32)
+    data = np.empty(Lp[n] + n, dtype=np.float64)
+    q = 0
+    for j in range(n):
+        indptr[j] = q
+        s = np.sqrt(factors.D[j])
+        indices[q] = j
+        data[q] = s
+        q += 1
+        for p in range(Lp[j], Lp[j + 1]):
+            indices[q] = factors.Li[p]
+            data[q] = factors.Lx[p] * s
+            q += 1
+    indptr[n] = q
+    return data, indices, indptr
+
+
+@njit(nogil=True)
+def cholesky_free_factors(factors):
+    """No-op counterpart of superlu_free_factors (see ldl_free_factors)."""
+    return 0
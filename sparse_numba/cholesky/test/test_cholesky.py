@@ -0,0 +1,176 @@
+"""
+Tests for the pure-Numba sparse Cholesky and LDL^T.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_cholesky.py
+
+import numpy as np
+import scipy.sparse as sp
+from numba import njit, prange
+from sparse_numba.cholesky.cholesky_numba import (
+    ldl_analyze_csc,
+    ldl_factorize_numeric,
+    ldl_factorize_csc,
+    ldl_solve_factored,
+    ldl_inertia,
+    ldl_free_factors,
+    cholesky_factorize_csc,
+    cholesky_factorize_numeric,
+    cholesky_solve_factored,
+    cholesky_factor_l,
+)
+
+
+def _make_test_matrix(n=150, density=0.03, seed=42):
+    """Random symmetric positive definite sparse matrix, as CSC."""
+    A = sp.random(n, n, density=density, dtype=np.float64, random_state=seed)
+    A = A + A.T
+    A = A + sp.diags(np.abs(A).sum(axis=1).A1 + 1.0)
+    return A.tocsc()
+
+
+def test_etree():
+    """Elimination tree and column counts of a small arrow matrix."""
+    print("Test: elimination tree and column counts")
+    # Lower triangle: column 0 couples to 3, column 1 to 2 and 3
+    dense = np.eye(4) * 4.0
+    for i, j in ((3, 0), (2, 1), (3, 1)):
+        dense[i, j] = dense[j, i] = 1.0
+    A = sp.csc_matrix(dense)
+    symbolic, info = ldl_analyze_csc(A.indices, A.indptr)
+    assert info == 0
+    assert list(symbolic.parent) == [3, 2, 3, -1]
+    assert list(symbolic.col_counts) == [1, 2, 1, 0]
+    assert symbolic.nnz_l == 4
+
+    # The counts match the pattern of the dense Cholesky factor
+    A = _make_test_matrix(60)
+    symbolic, info = ldl_analyze_csc(A.indices, A.indptr)
+    L = np.linalg.cholesky(A.toarray())
+    counts = (np.abs(np.tril(L, -1)) > 1e-14).sum(axis=0)
+    assert np.all(symbolic.col_counts >= counts)
+    assert symbolic.nnz_l == np.count_nonzero(np.tril(L, -1))
+    print("  PASSED")
+
+
+def test_cholesky_solve():
+    """Cholesky solutions and factor, with and without an ordering."""
+    print("Test: cholesky_factorize_csc + solve")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    rng = np.random.default_rng(0)
+    b = rng.standard_normal(n)
+    perm = rng.permutation(n).astype(np.int32)
+
+    for p in (None, perm):
+        factors, info = cholesky_factorize_csc(A.data, A.indices, A.indptr, p)
+        assert info == 0
+        x, info = cholesky_solve_factored(factors, b)
+        assert info == 0
+        assert np.allclose(A @ x, b)
+
+        data, indices, indptr = cholesky_factor_l(factors)
+        L = sp.csc_matrix((data, indices, indptr), shape=(n, n))
+        q = np.arange(n) if p is None else p
+        PAP = A.toarray()[np.ix_(q, q)]
+        assert np.allclose((L @ L.T).toarray(), PAP)
+
+    # Lower triangle only gives the same factors
+    lower = sp.tril(A).tocsc()
+    factors, info = cholesky_factorize_csc(lower.data, lower.indices, lower.indptr)
+    x, info = cholesky_solve_factored(factors, b)
+    assert np.allclose(A @ x, b)
+    print("  PASSED")
+
+
+def test_ldl_inertia():
+    """LDL^T of a quasi-definite matrix: solution and negative pivots."""
+    print("Test: ldl_factorize_csc + ldl_inertia")
+    H = _make_test_matrix(40, seed=1)
+    J = sp.random(15, 40, density=0.2, random_state=2)
+    K = sp.bmat([[H, J.T], [J, -sp.eye(15)]]).tocsc()
+    b = np.arange(55.0)
+
+    factors, info = ldl_factorize_csc(K.data, K.indices, K.indptr)
+    assert info == 0
+    x, info = ldl_solve_factored(factors, b)
+    assert info == 0
+    assert np.allclose(K @ x, b)
+
+    eig = np.linalg.eigvalsh(K.toarray())
+    assert ldl_inertia(factors) == ((eig > 0).sum(), (eig < 0).sum(), 0)
+    assert ldl_free_factors(factors) == 0
+
+    # The same matrix is not positive definite
+    factors, info = cholesky_factorize_csc(K.data, K.indices, K.indptr)
+    assert info == 41
+    print("  PASSED")
+
+
+def test_refactorize():
+    """New values on an analyzed pattern, and error codes."""
+    print("Test: numeric refactorization and error codes")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    b = np.ones(n)
+    symbolic, info = ldl_analyze_csc(A.indices, A.indptr)
+    assert info == 0
+    for scale in (1.0, 2.0, 3.5):
+        factors, info = cholesky_factorize_numeric(symbolic, A.data * scale)
+        assert info == 0
+        x, info = cholesky_solve_factored(factors, b)
+        assert np.allclose(A @ x * scale, b)
+    factors, info = ldl_factorize_numeric(symbolic, -A.data)
+    assert info == 0 and ldl_inertia(factors) == (0, n, 0)
+
+    _, info = ldl_factorize_numeric(symbolic, A.data[:-1])
+    assert info == -3
+    _, info = ldl_analyze_csc(A.indices, A.indptr, np.zeros(n, dtype=np.int32))
+    assert info == -3
+    _, info = ldl_solve_factored(factors, np.ones(n - 1))
+    assert info == -3
+    print("  PASSED")
+
+
+@njit(nogil=True, parallel=True)
+def _solve_batch(data, indices, indptr, B):
+    X = np.zeros_like(B)
+    symbolic, info = ldl_analyze_csc(indices, indptr)
+    for k in prange(B.shape[0]):
+        factors, info = cholesky_factorize_numeric(symbolic, data * (k + 1.0))
+        x, info = cholesky_solve_factored(factors, B[k])
+        X[k] = x * (k + 1.0)
+    return X
+
+
+def test_inside_prange():
+    """One analysis shared by numeric factorizations in a parallel loop."""
+    print("Test: cholesky inside prange")
+    A = _make_test_matrix(60)
+    B = np.random.default_rng(3).standard_normal((8, 60))
+    X = _solve_batch(A.data, A.indices.astype(np.int32), A.indptr.astype(np.int32), B)
+    assert np.allclose((A @ X.T).T, B)
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Sparse Cholesky / LDL^T Tests")
+    print("=" * 60)
+    test_etree()
+    test_cholesky_solve()
+    test_ldl_inertia()
+    test_refactorize()
+    test_inside_prange()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
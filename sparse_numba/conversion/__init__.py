@@ -1,11 +1,39 @@
 from .matrix_conversion_numba import (
     convert_coo_to_csc, convert_csr_to_csc,
     convert_coo_to_csr, sparse_matvec_csr,
+    convert_coo_to_csc_parallel, convert_csr_to_csc_parallel,
+    convert_coo_to_csr_parallel,
+    ensure_float64, ensure_int32, has_canonical_format,
+    stack_block_diagonal_csc,
+)
+from .sparse_products_numba import (
+    spmv_csr, spmv_csc, spmv_t_csr, spmv_t_csc,
+    spmm_csr, spmm_csc, spmm_t_csr, spmm_t_csc,
+    spgemm_csr, spgemm_csc,
+    spgemm_symbolic_csr, spgemm_numeric_csr,
+    spgemm_symbolic_csc, spgemm_numeric_csc,
+    spadd, spadd_symbolic, spadd_numeric,
+)
+from .sparse_matrix_numba import (
+    CSCMatrix, CSRMatrix, COOMatrix,
+    as_csc_matrix, as_csr_matrix, as_coo_matrix,
 )
 
 __all__ = [
     'convert_coo_to_csc', 'convert_csr_to_csc',
     'convert_coo_to_csr', 'sparse_matvec_csr',
+    'convert_coo_to_csc_parallel', 'convert_csr_to_csc_parallel',
+    'convert_coo_to_csr_parallel',
+    'ensure_float64', 'ensure_int32', 'has_canonical_format',
+    'stack_block_diagonal_csc',
+    'spmv_csr', 'spmv_csc', 'spmv_t_csr', 'spmv_t_csc',
+    'spmm_csr', 'spmm_csc', 'spmm_t_csr', 'spmm_t_csc',
+    'spgemm_csr', 'spgemm_csc',
+    'spgemm_symbolic_csr', 'spgemm_numeric_csr',
+    'spgemm_symbolic_csc', 'spgemm_numeric_csc',
+    'spadd', 'spadd_symbolic', 'spadd_numeric',
+    'CSCMatrix', 'CSRMatrix', 'COOMatrix',
+    'as_csc_matrix', 'as_csr_matrix', 'as_coo_matrix',
 ]
 
-__author__ = 'Tianqi Hong'
\ No newline at end of file
+__author__ = 'Tianqi Hong'
@@ -4,6 +4,13 @@ Conversion functions module.
     convert_csr_to_csc
     convert_coo_to_csr
     sparse_matvec_csr
+    ensure_float64
+    ensure_int32
+    has_canonical_format
+    stack_block_diagonal_csc
+    convert_coo_to_csc_parallel
+    convert_csr_to_csc_parallel
+    convert_coo_to_csr_parallel
 """
 
 #  [sparse_numba] (C)2025-2025 Tianqi Hong
@@ -14,10 +21,11 @@ Conversion functions module.
 #  File name: matrix_conversion_numba.py
 
 import numpy as np
-from numba import njit, types
+from numba import njit, prange, types, get_num_threads
+from numba.extending import overload
 
 
-@njit
+@njit(nogil=True)
 def convert_coo_to_csc(row_indices, col_indices, data, n_rows, n_cols):
     """
     Convert COO format to CSC format required by UMFPACK.
@@ -155,21 +163,54 @@ def convert_coo_to_csc(row_indices, col_indices, data, n_rows, n_cols):
     return final_data, final_indices, final_indptr
 
 
-@njit
-def convert_csr_to_csc(csr_data, csr_indices, csr_indptr):
+@njit(nogil=True)
+def convert_csr_to_csc(csr_data, csr_indices, csr_indptr, shape=None, sum_duplicates=True):
     """
-    Convert CSR format to CSC format while ensuring the indices are sorted.
+    Convert CSR format to CSC format with sorted row indices.
+
+    Rows are scattered in increasing order, so the row indices within each
+    CSC column come out sorted without a sorting pass, whatever the column
+    order inside the CSR rows.
+
+    Parameters:
+    -----------
+    csr_data : ndarray
+        Nonzero values in CSR format
+    csr_indices : ndarray
+        Column indices in CSR format
+    csr_indptr : ndarray
+        Row pointers in CSR format
+    shape : tuple, optional
+        Shape of the matrix as (n_rows, n_cols). When omitted, n_cols is
+        taken from the largest column index, which costs an extra pass and
+        drops trailing empty columns.
+    sum_duplicates : bool, optional
+        Sum entries with the same (row, col). Pass False when the CSR input
+        is known to be free of duplicates (e.g. canonical scipy output) to
+        make the conversion a single O(nnz) scatter.
+
+    Returns:
+    --------
+    csc_data : ndarray
+        Nonzero values in CSC format
+    csc_indices : ndarray
+        Row indices in CSC format
+    csc_indptr : ndarray
+        Column pointers in CSC format
     """
     n_rows = len(csr_indptr) - 1
     nnz = len(csr_data)
 
-    # Determine n_cols by finding the maximum column index
-    n_cols = 0
-    for i in range(nnz):
-        col = csr_indices[i]
-        if col > n_cols:
-            n_cols = col
-    n_cols += 1  # Adjust for 0-indexing
+    if shape is None:
+        # Determine n_cols by finding the maximum column index
+        n_cols = 0
+        for i in range(nnz):
+            col = csr_indices[i]
+            if col > n_cols:
+                n_cols = col
+        n_cols += 1  # Adjust for 0-indexing
+    else:
+        n_cols = shape[1]
 
     # Initialize CSC arrays
     csc_data = np.zeros_like(csr_data)
@@ -185,42 +226,20 @@ def convert_csr_to_csc(csr_data, csr_indices, csr_indptr):
     for i in range(1, n_cols + 1):
         csc_indptr[i] += csc_indptr[i - 1]
 
-    # Create a copy of indptr to keep track of current position in each column
-    col_counts = np.zeros(n_cols, dtype=np.int32)
+    # Current insert position in each column
+    col_pos = csc_indptr[:n_cols].copy()
 
-    # Fill in CSC data and row indices (first pass)
+    # Scatter rows in order; row indices per column end up sorted
     for i in range(n_rows):
         for j in range(csr_indptr[i], csr_indptr[i + 1]):
             col = csr_indices[j]
-            val = csr_data[j]
-
-            pos = csc_indptr[col] + col_counts[col]
-            csc_data[pos] = val
+            pos = col_pos[col]
+            csc_data[pos] = csr_data[j]
             csc_indices[pos] = i
-            col_counts[col] += 1
+            col_pos[col] = pos + 1
 
-    # Now sort row indices within each column
-    for j in range(n_cols):
-        start = csc_indptr[j]
-        end = csc_indptr[j + 1]
-
-        # Skip empty columns or columns with just one entry
-        if end - start <= 1:
-            continue
-
-        # Simple insertion sort for row indices within this column
-        for i in range(start + 1, end):
-            key_row = csc_indices[i]
-            key_data = csc_data[i]
-
-            k = i - 1
-            while k >= start and csc_indices[k] > key_row:
-                csc_indices[k + 1] = csc_indices[k]
-                csc_data[k + 1] = csc_data[k]
-                k -= 1
-
-            csc_indices[k + 1] = key_row
-            csc_data[k + 1] = key_data
+    if not sum_duplicates:
+        return csc_data, csc_indices, csc_indptr
 
     # Handle duplicate entries by summing their values
     if nnz > 0:  # Only process if there are non-zero elements
@@ -278,7 +297,7 @@ def convert_csr_to_csc(csr_data, csr_indices, csr_indptr):
     return csc_data, csc_indices, csc_indptr
 
 
-@njit
+@njit(nogil=True)
 def validate_sparse_matrix(data, indices, indptr=None, shape=None):
     """
     Validate sparse matrix inputs and return dimensions.
@@ -322,7 +341,7 @@ def validate_sparse_matrix(data, indices, indptr=None, shape=None):
     return n_rows, n_cols
 
 
-@njit
+@njit(nogil=True)
 def check_matrix_properties(csc_data, csc_indices, csc_indptr, n_rows):
     """
     Check matrix properties for potential issues with ill-conditioning.
@@ -343,7 +362,10 @@ def check_matrix_properties(csc_data, csc_indices, csc_indptr, n_rows):
     is_singular : bool
         True if matrix appears singular
     condition_est : float
-        Rough estimate of condition number (infinity norm)
+        Lower bound on the 1-norm condition number, the ratio of the
+        largest to the smallest column 1-norm (inf for an empty column).
+        For an actual estimate use sparse_numba.condest.condest with the
+        factors of the matrix
     diag_ratio : float
         Ratio of min/max diagonal element (0.0 if no diagonal)
     """
@@ -380,33 +402,23 @@ def check_matrix_properties(csc_data, csc_indices, csc_indptr, n_rows):
             if abs_diag > max_diag:
                 max_diag = abs_diag
 
-    # Calculate row and column norms (infinity norm)
-    row_norms = np.zeros(n_rows)
-    col_norms = np.zeros(n_cols)
-
-    for j in range(n_cols):
-        col_start = csc_indptr[j]
-        col_end = csc_indptr[j + 1]
-
-        for k in range(col_start, col_end):
-            i = csc_indices[k]
-            abs_val = abs(csc_data[k])
-            row_norms[i] += abs_val
-            col_norms[j] += abs_val
-
-    # Find max norms
-    max_row_norm = 0.0
+    # Column 1-norms: ||A||_1 is the largest, and ||A^{-1}||_1 is at least
+    # 1 / ||A e_j||_1 for every column j
     max_col_norm = 0.0
-    for i in range(n_rows):
-        if row_norms[i] > max_row_norm:
-            max_row_norm = row_norms[i]
+    min_col_norm = np.inf
     for j in range(n_cols):
-        if col_norms[j] > max_col_norm:
-            max_col_norm = col_norms[j]
-
-    # Estimate condition number using norms
-    condition_est = max_row_norm * max_col_norm
-    if condition_est == 0.0:
+        col_norm = 0.0
+        for k in range(csc_indptr[j], csc_indptr[j + 1]):
+            col_norm += abs(csc_data[k])
+        if col_norm > max_col_norm:
+            max_col_norm = col_norm
+        if col_norm < min_col_norm:
+            min_col_norm = col_norm
+
+    # Cheap lower bound on cond_1(A), no solves
+    if min_col_norm > 0.0:
+        condition_est = max_col_norm / min_col_norm
+    else:
         condition_est = np.inf
 
     # Calculate diagonal ratio
@@ -420,7 +432,7 @@ def check_matrix_properties(csc_data, csc_indices, csc_indptr, n_rows):
     return is_singular, condition_est, diag_ratio
 
 
-@njit
+@njit(nogil=True)
 def convert_coo_to_csr(row_indices, col_indices, data, n_rows, n_cols):
     """
     Convert COO format to CSR format.
@@ -533,7 +545,7 @@ def convert_coo_to_csr(row_indices, col_indices, data, n_rows, n_cols):
 
 
 @njit(nogil=True)
-def sparse_matvec_csr(data, indices, indptr, x):
+def sparse_matvec_csr(data, indices, indptr, x, out=None):
     """
     Sparse CSR matrix-vector product: y = A @ x.
 
@@ -547,6 +559,10 @@ def sparse_matvec_csr(data, indices, indptr, x):
         Row pointers in CSR format
     x : ndarray (float64)
         Input vector
+    out : ndarray (float64), optional
+        Preallocated result vector of length n_rows. It is filled and
+        returned, so repeated products (e.g. in iterative solvers) do not
+        allocate. Must not be x.
 
     Returns:
     --------
@@ -554,7 +570,10 @@ def sparse_matvec_csr(data, indices, indptr, x):
         Result vector (A @ x)
     """
     n_rows = len(indptr) - 1
-    y = np.zeros(n_rows, dtype=np.float64)
+    if out is None:
+        y = np.zeros(n_rows, dtype=np.float64)
+    else:
+        y = out
     for i in range(n_rows):
         s = 0.0
         for j in range(indptr[i], indptr[i + 1]):
@@ -563,6 +582,481 @@ def sparse_matvec_csr(data, indices, indptr, x):
     return y
 
 
+# ================================================================
+# Input normalization: copy only when dtype or layout differ
+# ================================================================
+
+def ensure_float64(a):
+    """
+    Return a as a C-contiguous float64 array. The input itself is returned
+    (no copy) when it already is one.
+    """
+    return np.ascontiguousarray(a, dtype=np.float64)
+
+
+def ensure_int32(a):
+    """
+    Return a as a C-contiguous int32 array. The input itself is returned
+    (no copy) when it already is one.
+    """
+    return np.ascontiguousarray(a, dtype=np.int32)
+
+
+def _make_ensure_dtype(dtype, np_dtype):
+    def impl(a):
+        if not isinstance(a, types.Array):
+            return None
+        if a.dtype == dtype:
+            if a.layout == 'C':
+                return lambda a: a
+            return lambda a: np.ascontiguousarray(a)
+        return lambda a: a.astype(np_dtype)
+    return impl
+
+
+overload(ensure_float64)(_make_ensure_dtype(types.float64, np.float64))
+overload(ensure_int32)(_make_ensure_dtype(types.int32, np.int32))
+
+
+@njit(nogil=True)
+def has_canonical_format(indices, indptr):
+    """
+    Check that the minor indices of a CSR (or CSC) matrix are strictly
+    increasing within every row (column), i.e. sorted and free of
+    duplicates. Runs in a single O(nnz) pass.
+
+    Parameters:
+    -----------
+    indices : ndarray
+        Column indices (for CSR) or row indices (for CSC)
+    indptr : ndarray
+        Row pointers (for CSR) or column pointers (for CSC)
+
+    Returns:
+    --------
+    canonical : bool
+        True if the matrix is in canonical format
+    """
+    n = len(indptr) - 1
+    for i in range(n):
+        for j in range(indptr[i] + 1, indptr[i + 1]):
+            if indices[j] <= indices[j - 1]:
+                return False
+    return True
+
+
+# ================================================================
+# Block-diagonal stacking of many small matrices
+# ================================================================
+
+@njit(nogil=True)
+def _stack_block_diagonal(data_list, indices_list, indptr_list, first, last):
+    """Stack CSC matrices first..last-1 of the lists into one block-diagonal CSC."""
+    n_total = 0
+    nnz_total = 0
+    for k in range(first, last):
+        n_total += len(indptr_list[k]) - 1
+        nnz_total += len(data_list[k])
+
+    data = np.empty(nnz_total, dtype=np.float64)
+    indices = np.empty(nnz_total, dtype=np.int32)
+    indptr = np.empty(n_total + 1, dtype=np.int32)
+    indptr[0] = 0
+
+    offset = 0  # Row/column offset of the current block
+    pos = 0     # Nonzero offset of the current block
+    for k in range(first, last):
+        d = data_list[k]
+        idx = indices_list[k]
+        ptr = indptr_list[k]
+        n_k = len(ptr) - 1
+        for j in range(n_k):
+            indptr[offset + j + 1] = pos + ptr[j + 1]
+        for t in range(len(d)):
+            data[pos + t] = d[t]
+            indices[pos + t] = idx[t] + offset
+        offset += n_k
+        pos += len(d)
+
+    return data, indices, indptr
+
+
+@njit(nogil=True)
+def stack_block_diagonal_csc(data_list, indices_list, indptr_list):
+    """
+    Stack K square CSC matrices into one block-diagonal CSC matrix.
+
+    Parameters:
+    -----------
+    data_list : numba.typed.List of ndarray
+        Nonzero values of each matrix
+    indices_list : numba.typed.List of ndarray
+        Row indices of each matrix
+    indptr_list : numba.typed.List of ndarray
+        Column pointers of each matrix
+
+    Returns:
+    --------
+    data : ndarray (float64)
+        Nonzero values of the block-diagonal matrix
+    indices : ndarray (int32)
+        Row indices of the block-diagonal matrix
+    indptr : ndarray (int32)
+        Column pointers of the block-diagonal matrix
+    offsets : ndarray (int64)
+        Block k covers rows/columns offsets[k] to offsets[k + 1] - 1
+    """
+    n_blocks = len(indptr_list)
+    offsets = np.zeros(n_blocks + 1, dtype=np.int64)
+    for k in range(n_blocks):
+        offsets[k + 1] = offsets[k] + len(indptr_list[k]) - 1
+    data, indices, indptr = _stack_block_diagonal(
+        data_list, indices_list, indptr_list, 0, n_blocks
+    )
+    return data, indices, indptr, offsets
+
+
+# ================================================================
+# Parallel conversion kernels: one very large matrix, many threads
+# ================================================================
+
+@njit(nogil=True)
+def _chunk_bounds(n, n_chunks):
+    """Split range(n) into n_chunks contiguous pieces of (almost) equal length."""
+    bounds = np.zeros(n_chunks + 1, dtype=np.int64)
+    for t in range(n_chunks + 1):
+        bounds[t] = (n * t) // n_chunks
+    return bounds
+
+
+@njit(nogil=True)
+def _nnz_balanced_partition(indptr, n_parts):
+    """
+    Split the rows (or columns) of a compressed matrix into n_parts contiguous
+    blocks holding roughly the same number of nonzeros.
+
+    Parameters:
+    -----------
+    indptr : ndarray
+        Row pointers (CSR) or column pointers (CSC)
+    n_parts : int
+        Number of blocks
+
+    Returns:
+    --------
+    bounds : ndarray (int64)
+        Block t covers rows bounds[t] to bounds[t + 1] - 1
+    """
+    n = len(indptr) - 1
+    nnz = indptr[n]
+    bounds = np.zeros(n_parts + 1, dtype=np.int64)
+    bounds[n_parts] = n
+    for t in range(1, n_parts):
+        target = (nnz * t) // n_parts
+        r = np.searchsorted(indptr, target)
+        if r > n:
+            r = n
+        if r < bounds[t - 1]:
+            r = bounds[t - 1]
+        bounds[t] = r
+    return bounds
+
+
+@njit(nogil=True, parallel=True)
+def _parallel_exclusive_scan(counts, ptr):
+    """
+    Blocked two-pass prefix sum: ptr[0] = 0, ptr[i + 1] = sum(counts[:i + 1]).
+    """
+    n = len(counts)
+    n_chunks = max(1, min(get_num_threads(), n))
+    bounds = _chunk_bounds(n, n_chunks)
+
+    # Pass 1: sum of each block
+    block_offsets = np.zeros(n_chunks + 1, dtype=np.int64)
+    for t in prange(n_chunks):
+        s = 0
+        for i in range(bounds[t], bounds[t + 1]):
+            s += counts[i]
+        block_offsets[t + 1] = s
+    for t in range(n_chunks):
+        block_offsets[t + 1] += block_offsets[t]
+
+    # Pass 2: local scan of each block, shifted by its offset
+    ptr[0] = 0
+    for t in prange(n_chunks):
+        s = block_offsets[t]
+        for i in range(bounds[t], bounds[t + 1]):
+            s += counts[i]
+            ptr[i + 1] = s
+
+
+@njit(nogil=True, parallel=True)
+def _merge_sorted_duplicates_parallel(minor, values, ptr, n_major):
+    """
+    Sum entries with the same minor index inside each (already sorted) major
+    slice, in the order they appear. Returns the compacted arrays.
+    """
+    counts = np.zeros(n_major, dtype=np.int32)
+    for j in prange(n_major):
+        end = ptr[j + 1]
+        k = ptr[j]
+        u = 0
+        while k < end:
+            u += 1
+            k += 1
+            while k < end and minor[k] == minor[k - 1]:
+                k += 1
+        counts[j] = u
+
+    final_ptr = np.zeros(n_major + 1, dtype=np.int32)
+    _parallel_exclusive_scan(counts, final_ptr)
+
+    final_values = np.zeros(final_ptr[n_major], dtype=values.dtype)
+    final_minor = np.zeros(final_ptr[n_major], dtype=minor.dtype)
+    for j in prange(n_major):
+        pos = final_ptr[j]
+        end = ptr[j + 1]
+        k = ptr[j]
+        while k < end:
+            curr = minor[k]
+            value_sum = values[k]
+            k += 1
+            while k < end and minor[k] == curr:
+                value_sum += values[k]
+                k += 1
+            final_minor[pos] = curr
+            final_values[pos] = value_sum
+            pos += 1
+
+    return final_values, final_minor, final_ptr
+
+
+@njit(nogil=True, parallel=True)
+def _coo_to_compressed_parallel(major_indices, minor_indices, data, n_major):
+    """
+    Shared kernel for COO -> CSC (major = column) and COO -> CSR (major = row).
+
+    Each thread histograms a contiguous chunk of the triplets. Exclusive
+    prefix sums over (major index, chunk) give every chunk a private write
+    window inside each slice, so the scatter is race-free and stable: entries
+    land in the same order as in the serial kernels, and duplicates are summed
+    in the same order, giving bit-identical results.
+    """
+    nnz = len(data)
+    n_chunks = max(1, min(get_num_threads(), nnz))
+    bounds = _chunk_bounds(nnz, n_chunks)
+
+    # Per-chunk histograms of the major index
+    hist = np.zeros((n_chunks, n_major), dtype=np.int32)
+    for t in prange(n_chunks):
+        for i in range(bounds[t], bounds[t + 1]):
+            hist[t, major_indices[i]] += 1
+
+    # Slice sizes and pointers
+    counts = np.zeros(n_major, dtype=np.int32)
+    for j in prange(n_major):
+        s = 0
+        for t in range(n_chunks):
+            s += hist[t, j]
+        counts[j] = s
+    ptr = np.zeros(n_major + 1, dtype=np.int32)
+    _parallel_exclusive_scan(counts, ptr)
+
+    # Turn histograms into per-chunk write positions
+    for j in prange(n_major):
+        offset = ptr[j]
+        for t in range(n_chunks):
+            c = hist[t, j]
+            hist[t, j] = offset
+            offset += c
+
+    # Scatter
+    sorted_minor = np.zeros_like(minor_indices)
+    sorted_data = np.zeros_like(data)
+    for t in prange(n_chunks):
+        for i in range(bounds[t], bounds[t + 1]):
+            j = major_indices[i]
+            dest = hist[t, j]
+            sorted_minor[dest] = minor_indices[i]
+            sorted_data[dest] = data[i]
+            hist[t, j] = dest + 1
+
+    # Stable insertion sort of each slice by minor index
+    for j in prange(n_major):
+        start = ptr[j]
+        end = ptr[j + 1]
+        for i in range(start + 1, end):
+            key = sorted_minor[i]
+            key_data = sorted_data[i]
+            k = i - 1
+            while k >= start and sorted_minor[k] > key:
+                sorted_minor[k + 1] = sorted_minor[k]
+                sorted_data[k + 1] = sorted_data[k]
+                k -= 1
+            sorted_minor[k + 1] = key
+            sorted_data[k + 1] = key_data
+
+    return _merge_sorted_duplicates_parallel(sorted_minor, sorted_data, ptr, n_major)
+
+
+@njit(nogil=True)
+def convert_coo_to_csc_parallel(row_indices, col_indices, data, n_rows, n_cols):
+    """
+    Parallel version of convert_coo_to_csc for a single large matrix.
+    Duplicate entries are summed. The result is identical to the serial
+    version, including the summation order of duplicates.
+
+    Parameters:
+    -----------
+    row_indices : ndarray
+        Row indices for COO format
+    col_indices : ndarray
+        Column indices for COO format
+    data : ndarray
+        Nonzero values in COO format
+    n_rows : int
+        Number of rows in the matrix
+    n_cols : int
+        Number of columns in the matrix
+
+    Returns:
+    --------
+    data_csc : ndarray
+        Nonzero values in CSC format
+    row_indices_csc : ndarray
+        Row indices in CSC format
+    col_ptr : ndarray
+        Column pointers in CSC format
+    """
+    return _coo_to_compressed_parallel(col_indices, row_indices, data, n_cols)
+
+
+@njit(nogil=True)
+def convert_coo_to_csr_parallel(row_indices, col_indices, data, n_rows, n_cols):
+    """
+    Parallel version of convert_coo_to_csr for a single large matrix.
+    Duplicate entries are summed. The result is identical to the serial version.
+
+    Parameters:
+    -----------
+    row_indices : ndarray (int32)
+        Row indices for COO format
+    col_indices : ndarray (int32)
+        Column indices for COO format
+    data : ndarray (float64)
+        Nonzero values in COO format
+    n_rows : int
+        Number of rows in the matrix
+    n_cols : int
+        Number of columns in the matrix
+
+    Returns:
+    --------
+    data_csr : ndarray
+        Nonzero values in CSR format
+    col_indices_csr : ndarray
+        Column indices in CSR format
+    row_ptr : ndarray
+        Row pointers in CSR format
+    """
+    return _coo_to_compressed_parallel(row_indices, col_indices, data, n_rows)
+
+
+@njit(nogil=True, parallel=True)
+def convert_csr_to_csc_parallel(csr_data, csr_indices, csr_indptr, shape=None, sum_duplicates=True):
+    """
+    Parallel version of convert_csr_to_csc for a single large matrix.
+
+    Rows are split into per-thread blocks of roughly equal nnz. Because each
+    block is scattered in row order into its own window of every column, the
+    row indices come out sorted without a sorting pass. The result is
+    identical to the serial version.
+
+    Parameters:
+    -----------
+    csr_data : ndarray
+        Nonzero values in CSR format
+    csr_indices : ndarray
+        Column indices in CSR format
+    csr_indptr : ndarray
+        Row pointers in CSR format
+    shape : tuple, optional
+        Shape of the matrix as (n_rows, n_cols); see convert_csr_to_csc
+    sum_duplicates : bool, optional
+        Sum entries with the same (row, col); see convert_csr_to_csc
+
+    Returns:
+    --------
+    csc_data : ndarray
+        Nonzero values in CSC format
+    csc_indices : ndarray
+        Row indices in CSC format
+    csc_indptr : ndarray
+        Column pointers in CSC format
+    """
+    n_rows = len(csr_indptr) - 1
+    nnz = len(csr_data)
+    n_chunks = max(1, min(get_num_threads(), nnz))
+
+    if shape is None:
+        # Determine n_cols by finding the maximum column index
+        chunk_max = np.zeros(n_chunks, dtype=np.int64)
+        bounds = _chunk_bounds(nnz, n_chunks)
+        for t in prange(n_chunks):
+            m = 0
+            for i in range(bounds[t], bounds[t + 1]):
+                if csr_indices[i] > m:
+                    m = csr_indices[i]
+            chunk_max[t] = m
+        n_cols = 0
+        for t in range(n_chunks):
+            if chunk_max[t] > n_cols:
+                n_cols = chunk_max[t]
+        n_cols += 1  # Adjust for 0-indexing
+    else:
+        n_cols = np.int64(shape[1])
+
+    # Row blocks with balanced nnz, one per chunk
+    row_bounds = _nnz_balanced_partition(csr_indptr, n_chunks)
+
+    hist = np.zeros((n_chunks, n_cols), dtype=np.int32)
+    for t in prange(n_chunks):
+        for j in range(csr_indptr[row_bounds[t]], csr_indptr[row_bounds[t + 1]]):
+            hist[t, csr_indices[j]] += 1
+
+    counts = np.zeros(n_cols, dtype=np.int32)
+    for c in prange(n_cols):
+        s = 0
+        for t in range(n_chunks):
+            s += hist[t, c]
+        counts[c] = s
+    csc_indptr = np.zeros(n_cols + 1, dtype=np.int32)
+    _parallel_exclusive_scan(counts, csc_indptr)
+
+    for c in prange(n_cols):
+        offset = csc_indptr[c]
+        for t in range(n_chunks):
+            k = hist[t, c]
+            hist[t, c] = offset
+            offset += k
+
+    csc_data = np.zeros_like(csr_data)
+    csc_indices = np.zeros_like(csr_indices)
+    for t in prange(n_chunks):
+        for i in range(row_bounds[t], row_bounds[t + 1]):
+            for j in range(csr_indptr[i], csr_indptr[i + 1]):
+                col = csr_indices[j]
+                pos = hist[t, col]
+                csc_data[pos] = csr_data[j]
+                csc_indices[pos] = i
+                hist[t, col] = pos + 1
+
+    if nnz == 0 or not sum_duplicates:
+        return csc_data, csc_indices, csc_indptr
+
+    return _merge_sorted_duplicates_parallel(csc_indices, csc_data, csc_indptr, n_cols)
+
+
 def validate_csc_matrix(data, indices, indptr, nrows, ncols):
     """Validate CSC matrix format for UMFPACK."""
     nnz = len(data)
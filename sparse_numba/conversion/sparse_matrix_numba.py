@@ -0,0 +1,326 @@
+"""
+Sparse matrix container types usable inside Numba code.
+    CSCMatrix, CSRMatrix, COOMatrix
+    as_csc_matrix, as_csr_matrix, as_coo_matrix
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: sparse_matrix_numba.py
+
+import numpy as np
+from numba import njit, int32, int64, float64, boolean
+from numba.experimental import jitclass
+
+from sparse_numba.conversion.matrix_conversion_numba import (
+    convert_coo_to_csc, convert_coo_to_csr, convert_csr_to_csc,
+    ensure_float64, ensure_int32,
+)
+
+
+@njit(nogil=True)
+def _index_flags(indices, indptr, n_minor):
+    """
+    Return (sorted_indices, no_duplicates) for a compressed matrix in a
+    single O(nnz + n_minor) pass.
+    """
+    sorted_indices = True
+    no_duplicates = True
+    marker = np.full(n_minor, -1, dtype=np.int64)
+    for i in range(len(indptr) - 1):
+        for j in range(indptr[i], indptr[i + 1]):
+            k = indices[j]
+            if j > indptr[i] and k < indices[j - 1]:
+                sorted_indices = False
+            if marker[k] == i:
+                no_duplicates = False
+            marker[k] = i
+    return sorted_indices, no_duplicates
+
+
+_compressed_spec = [
+    ('data', float64[::1]),
+    ('indices', int32[::1]),
+    ('indptr', int32[::1]),
+    ('n_rows', int64),
+    ('n_cols', int64),
+    ('sorted_indices', boolean),
+    ('no_duplicates', boolean),
+    ('_alt_data', float64[::1]),
+    ('_alt_indices', int32[::1]),
+    ('_alt_indptr', int32[::1]),
+    ('_has_alt', boolean),
+]
+
+
+@jitclass(_compressed_spec)
+class CSCMatrix:
+    """
+    Sparse matrix in CSC format (float64 values, int32 indices).
+
+    The sortedness and no-duplicates flags are computed once at
+    construction. The CSR form is computed on first use and cached; call
+    clear_cache() after changing data in place.
+    """
+
+    def __init__(self, data, indices, indptr, n_rows, n_cols):
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.sorted_indices, self.no_duplicates = _index_flags(indices, indptr, n_rows)
+        self._alt_data = np.empty(0, dtype=np.float64)
+        self._alt_indices = np.empty(0, dtype=np.int32)
+        self._alt_indptr = np.empty(0, dtype=np.int32)
+        self._has_alt = False
+
+    @property
+    def shape(self):
+        return (self.n_rows, self.n_cols)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    @property
+    def has_canonical_format(self):
+        return self.sorted_indices and self.no_duplicates
+
+    def csr_arrays(self):
+        """Return (data, indices, indptr) of the same matrix in canonical CSR."""
+        if not self._has_alt:
+            # The CSC arrays of A are the CSR arrays of A.T
+            self._alt_data, self._alt_indices, self._alt_indptr = convert_csr_to_csc(
+                self.data, self.indices, self.indptr, (self.n_cols, self.n_rows)
+            )
+            self._has_alt = True
+        return self._alt_data, self._alt_indices, self._alt_indptr
+
+    def sum_duplicates(self):
+        """Sort indices and sum duplicates in place (no-op if canonical)."""
+        if self.sorted_indices and self.no_duplicates:
+            return
+        d, i, p = self.csr_arrays()
+        self.data, self.indices, self.indptr = convert_csr_to_csc(
+            d, i, p, (self.n_rows, self.n_cols), False
+        )
+        self.sorted_indices = True
+        self.no_duplicates = True
+
+    def clear_cache(self):
+        """Drop the cached CSR form."""
+        self._has_alt = False
+
+
+@jitclass(_compressed_spec)
+class CSRMatrix:
+    """
+    Sparse matrix in CSR format (float64 values, int32 indices).
+
+    The sortedness and no-duplicates flags are computed once at
+    construction. The CSC form is computed on first use and cached; call
+    clear_cache() after changing data in place.
+    """
+
+    def __init__(self, data, indices, indptr, n_rows, n_cols):
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.sorted_indices, self.no_duplicates = _index_flags(indices, indptr, n_cols)
+        self._alt_data = np.empty(0, dtype=np.float64)
+        self._alt_indices = np.empty(0, dtype=np.int32)
+        self._alt_indptr = np.empty(0, dtype=np.int32)
+        self._has_alt = False
+
+    @property
+    def shape(self):
+        return (self.n_rows, self.n_cols)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    @property
+    def has_canonical_format(self):
+        return self.sorted_indices and self.no_duplicates
+
+    def csc_arrays(self):
+        """Return (data, indices, indptr) of the same matrix in canonical CSC."""
+        if not self._has_alt:
+            self._alt_data, self._alt_indices, self._alt_indptr = convert_csr_to_csc(
+                self.data, self.indices, self.indptr, (self.n_rows, self.n_cols)
+            )
+            self._has_alt = True
+        return self._alt_data, self._alt_indices, self._alt_indptr
+
+    def sum_duplicates(self):
+        """Sort indices and sum duplicates in place (no-op if canonical)."""
+        if self.sorted_indices and self.no_duplicates:
+            return
+        d, i, p = self.csc_arrays()
+        # The CSC arrays of A are the CSR arrays of A.T
+        self.data, self.indices, self.indptr = convert_csr_to_csc(
+            d, i, p, (self.n_cols, self.n_rows), False
+        )
+        self.sorted_indices = True
+        self.no_duplicates = True
+
+    def clear_cache(self):
+        """Drop the cached CSC form."""
+        self._has_alt = False
+
+
+@jitclass([
+    ('row', int32[::1]),
+    ('col', int32[::1]),
+    ('data', float64[::1]),
+    ('n_rows', int64),
+    ('n_cols', int64),
+    ('_csc_data', float64[::1]),
+    ('_csc_indices', int32[::1]),
+    ('_csc_indptr', int32[::1]),
+    ('_has_csc', boolean),
+    ('_csr_data', float64[::1]),
+    ('_csr_indices', int32[::1]),
+    ('_csr_indptr', int32[::1]),
+    ('_has_csr', boolean),
+])
+class COOMatrix:
+    """
+    Sparse matrix in COO format (float64 values, int32 indices).
+
+    The CSC and CSR forms (canonical, duplicates summed) are computed on
+    first use and cached; call clear_cache() after changing data in place.
+    """
+
+    def __init__(self, row, col, data, n_rows, n_cols):
+        self.row = row
+        self.col = col
+        self.data = data
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self._csc_data = np.empty(0, dtype=np.float64)
+        self._csc_indices = np.empty(0, dtype=np.int32)
+        self._csc_indptr = np.empty(0, dtype=np.int32)
+        self._has_csc = False
+        self._csr_data = np.empty(0, dtype=np.float64)
+        self._csr_indices = np.empty(0, dtype=np.int32)
+        self._csr_indptr = np.empty(0, dtype=np.int32)
+        self._has_csr = False
+
+    @property
+    def shape(self):
+        return (self.n_rows, self.n_cols)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def csc_arrays(self):
+        """Return (data, indices, indptr) of the same matrix in canonical CSC."""
+        if not self._has_csc:
+            self._csc_data, self._csc_indices, self._csc_indptr = convert_coo_to_csc(
+                self.row, self.col, self.data, self.n_rows, self.n_cols
+            )
+            self._has_csc = True
+        return self._csc_data, self._csc_indices, self._csc_indptr
+
+    def csr_arrays(self):
+        """Return (data, indices, indptr) of the same matrix in canonical CSR."""
+        if not self._has_csr:
+            self._csr_data, self._csr_indices, self._csr_indptr = convert_coo_to_csr(
+                self.row, self.col, self.data, self.n_rows, self.n_cols
+            )
+            self._has_csr = True
+        return self._csr_data, self._csr_indices, self._csr_indptr
+
+    def clear_cache(self):
+        """Drop the cached CSC and CSR forms."""
+        self._has_csc = False
+        self._has_csr = False
+
+
+CSCMatrixType = CSCMatrix.class_type.instance_type
+CSRMatrixType = CSRMatrix.class_type.instance_type
+COOMatrixType = COOMatrix.class_type.instance_type
+
+
+@njit(nogil=True)
+def as_csc_matrix(data, indices, indptr, shape):
+    """
+    Build a CSCMatrix. Arrays that already are contiguous float64 / int32
+    are used without copying.
+
+    Parameters:
+    -----------
+    data : ndarray
+        Nonzero values in CSC format
+    indices : ndarray
+        Row indices in CSC format
+    indptr : ndarray
+        Column pointers in CSC format
+    shape : tuple
+        Shape of the matrix as (n_rows, n_cols)
+
+    Returns:
+    --------
+    A : CSCMatrix
+    """
+    return CSCMatrix(ensure_float64(data), ensure_int32(indices), ensure_int32(indptr),
+                     shape[0], shape[1])
+
+
+@njit(nogil=True)
+def as_csr_matrix(data, indices, indptr, shape):
+    """
+    Build a CSRMatrix. Arrays that already are contiguous float64 / int32
+    are used without copying.
+
+    Parameters:
+    -----------
+    data : ndarray
+        Nonzero values in CSR format
+    indices : ndarray
+        Column indices in CSR format
+    indptr : ndarray
+        Row pointers in CSR format
+    shape : tuple
+        Shape of the matrix as (n_rows, n_cols)
+
+    Returns:
+    --------
+    A : CSRMatrix
+    """
+    return CSRMatrix(ensure_float64(data), ensure_int32(indices), ensure_int32(indptr),
+                     shape[0], shape[1])
+
+
+@njit(nogil=True)
+def as_coo_matrix(row, col, data, shape):
+    """
+    Build a COOMatrix. Arrays that already are contiguous float64 / int32
+    are used without copying.
+
+    Parameters:
+    -----------
+    row : ndarray
+        Row indices for COO format
+    col : ndarray
+        Column indices for COO format
+    data : ndarray
+        Nonzero values in COO format
+    shape : tuple
+        Shape of the matrix as (n_rows, n_cols)
+
+    Returns:
+    --------
+    A : COOMatrix
+    """
+    return COOMatrix(ensure_int32(row), ensure_int32(col), ensure_float64(data),
+                     shape[0], shape[1])
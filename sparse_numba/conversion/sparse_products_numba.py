@@ -0,0 +1,921 @@
+"""
+Sparse matrix product kernels module.
+    spmv_csr, spmv_csc          y = alpha * A @ x + beta * y
+    spmv_t_csr, spmv_t_csc      y = alpha * A.T @ x + beta * y
+    spmm_csr, spmm_csc          Y = alpha * A @ X + beta * Y
+    spmm_t_csr, spmm_t_csc      Y = alpha * A.T @ X + beta * Y
+    spgemm_csr, spgemm_csc      C = A @ B (with symbolic / numeric phases)
+    spadd                       C = A + alpha * B (with symbolic / numeric phases)
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: sparse_products_numba.py
+
+import numpy as np
+from numba import njit, prange, get_num_threads
+
+from sparse_numba.conversion.matrix_conversion_numba import (
+    _chunk_bounds, _nnz_balanced_partition, _parallel_exclusive_scan,
+)
+
+
+# ================================================================
+# Core kernels
+#
+# A compressed matrix (CSR or CSC) is either read along its major
+# axis ("gather": each output entry is a dot product, e.g. CSR A @ x)
+# or across it ("scatter": each input entry updates many outputs,
+# e.g. CSC A @ x). Gather kernels write disjoint outputs per thread;
+# scatter kernels accumulate into per-thread buffers and reduce.
+#
+# beta == 0 means the output is not read, so it may hold garbage.
+# ================================================================
+
+@njit(nogil=True, parallel=True)
+def _gather_mv(data, indices, indptr, x, y, alpha, beta):
+    n_major = len(indptr) - 1
+    n_chunks = max(1, min(get_num_threads(), n_major))
+    bounds = _nnz_balanced_partition(indptr, n_chunks)
+    for t in prange(n_chunks):
+        for i in range(bounds[t], bounds[t + 1]):
+            s = 0.0
+            for j in range(indptr[i], indptr[i + 1]):
+                s += data[j] * x[indices[j]]
+            if beta == 0.0:
+                y[i] = alpha * s
+            else:
+                y[i] = alpha * s + beta * y[i]
+
+
+@njit(nogil=True, parallel=True)
+def _scatter_mv(data, indices, indptr, x, y, alpha, beta):
+    n_major = len(indptr) - 1
+    n_out = len(y)
+    n_chunks = max(1, min(get_num_threads(), n_major))
+    bounds = _nnz_balanced_partition(indptr, n_chunks)
+
+    acc = np.zeros((n_chunks, n_out), dtype=np.float64)
+    for t in prange(n_chunks):
+        for j in range(bounds[t], bounds[t + 1]):
+            xj = x[j]
+            for k in range(indptr[j], indptr[j + 1]):
+                acc[t, indices[k]] += data[k] * xj
+
+    out_bounds = _chunk_bounds(n_out, n_chunks)
+    for t in prange(n_chunks):
+        for i in range(out_bounds[t], out_bounds[t + 1]):
+            s = 0.0
+            for u in range(n_chunks):
+                s += acc[u, i]
+            if beta == 0.0:
+                y[i] = alpha * s
+            else:
+                y[i] = alpha * s + beta * y[i]
+
+
+@njit(nogil=True, parallel=True)
+def _gather_mm(data, indices, indptr, X, Y, alpha, beta):
+    n_major = len(indptr) - 1
+    n_vec = X.shape[1]
+    n_chunks = max(1, min(get_num_threads(), n_major))
+    bounds = _nnz_balanced_partition(indptr, n_chunks)
+    for t in prange(n_chunks):
+        s = np.empty(n_vec, dtype=np.float64)
+        for i in range(bounds[t], bounds[t + 1]):
+            s[:] = 0.0
+            # Each (index, value) pair is loaded once for all vectors
+            for j in range(indptr[i], indptr[i + 1]):
+                v = data[j]
+                c = indices[j]
+                for r in range(n_vec):
+                    s[r] += v * X[c, r]
+            if beta == 0.0:
+                for r in range(n_vec):
+                    Y[i, r] = alpha * s[r]
+            else:
+                for r in range(n_vec):
+                    Y[i, r] = alpha * s[r] + beta * Y[i, r]
+
+
+@njit(nogil=True, parallel=True)
+def _scatter_mm_private(data, indices, indptr, X, Y, alpha, beta):
+    n_major = len(indptr) - 1
+    n_out = Y.shape[0]
+    n_vec = X.shape[1]
+    n_chunks = max(1, min(get_num_threads(), n_major))
+    bounds = _nnz_balanced_partition(indptr, n_chunks)
+
+    acc = np.zeros((n_chunks, n_out, n_vec), dtype=np.float64)
+    for t in prange(n_chunks):
+        for j in range(bounds[t], bounds[t + 1]):
+            for k in range(indptr[j], indptr[j + 1]):
+                v = data[k]
+                i = indices[k]
+                for r in range(n_vec):
+                    acc[t, i, r] += v * X[j, r]
+
+    out_bounds = _chunk_bounds(n_out, n_chunks)
+    for t in prange(n_chunks):
+        for i in range(out_bounds[t], out_bounds[t + 1]):
+            for r in range(n_vec):
+                s = 0.0
+                for u in range(n_chunks):
+                    s += acc[u, i, r]
+                if beta == 0.0:
+                    Y[i, r] = alpha * s
+                else:
+                    Y[i, r] = alpha * s + beta * Y[i, r]
+
+
+@njit(nogil=True, parallel=True)
+def _scatter_mm_by_vector(data, indices, indptr, X, Y, alpha, beta):
+    n_major = len(indptr) - 1
+    n_out = Y.shape[0]
+    n_vec = X.shape[1]
+    n_chunks = max(1, min(get_num_threads(), n_vec))
+    vec_bounds = _chunk_bounds(n_vec, n_chunks)
+
+    # Each thread owns a block of output columns and sweeps the whole matrix
+    for t in prange(n_chunks):
+        r0 = vec_bounds[t]
+        r1 = vec_bounds[t + 1]
+        acc = np.zeros((n_out, r1 - r0), dtype=np.float64)
+        for j in range(n_major):
+            for k in range(indptr[j], indptr[j + 1]):
+                v = data[k]
+                i = indices[k]
+                for r in range(r0, r1):
+                    acc[i, r - r0] += v * X[j, r]
+        for i in range(n_out):
+            for r in range(r0, r1):
+                if beta == 0.0:
+                    Y[i, r] = alpha * acc[i, r - r0]
+                else:
+                    Y[i, r] = alpha * acc[i, r - r0] + beta * Y[i, r]
+
+
+@njit(nogil=True)
+def _scatter_mm(data, indices, indptr, X, Y, alpha, beta):
+    # Private accumulators cost n_threads * n_out * n_vec doubles. Once
+    # there are at least as many vectors as threads, split the vectors
+    # among threads instead, which needs no reduction and no extra copies.
+    if X.shape[1] >= get_num_threads():
+        _scatter_mm_by_vector(data, indices, indptr, X, Y, alpha, beta)
+    else:
+        _scatter_mm_private(data, indices, indptr, X, Y, alpha, beta)
+
+
+# ================================================================
+# Sparse matrix - vector products
+# ================================================================
+
+@njit(nogil=True)
+def spmv_csr(data, indices, indptr, x, out=None, alpha=1.0, beta=0.0):
+    """
+    Compute y = alpha * A @ x + beta * y for A in CSR format.
+    Rows are split among threads with balanced nnz.
+
+    Parameters:
+    -----------
+    data : ndarray (float64)
+        Nonzero values in CSR format
+    indices : ndarray (int32)
+        Column indices in CSR format
+    indptr : ndarray (int32)
+        Row pointers in CSR format
+    x : ndarray (float64)
+        Input vector, length n_cols
+    out : ndarray (float64), optional
+        Output vector y, length n_rows, updated in place. A new vector is
+        allocated when omitted.
+    alpha : float, optional
+        Scale of the product (default 1.0)
+    beta : float, optional
+        Scale of the existing out (default 0.0; out is then not read)
+
+    Returns:
+    --------
+    y : ndarray (float64)
+        Result vector (out, if given)
+    """
+    n_rows = len(indptr) - 1
+    if out is None:
+        y = np.zeros(n_rows, dtype=np.float64)
+    else:
+        y = out
+    _gather_mv(data, indices, indptr, x, y, alpha, beta)
+    return y
+
+
+@njit(nogil=True)
+def spmv_csc(data, indices, indptr, x, n_rows, out=None, alpha=1.0, beta=0.0):
+    """
+    Compute y = alpha * A @ x + beta * y for A in CSC format.
+    Columns are split among threads with balanced nnz; each thread
+    accumulates into a private buffer of length n_rows.
+
+    Parameters:
+    -----------
+    data : ndarray (float64)
+        Nonzero values in CSC format
+    indices : ndarray (int32)
+        Row indices in CSC format
+    indptr : ndarray (int32)
+        Column pointers in CSC format
+    x : ndarray (float64)
+        Input vector, length n_cols
+    n_rows : int
+        Number of rows of A
+    out : ndarray (float64), optional
+        Output vector y, length n_rows, updated in place
+    alpha : float, optional
+        Scale of the product (default 1.0)
+    beta : float, optional
+        Scale of the existing out (default 0.0; out is then not read)
+
+    Returns:
+    --------
+    y : ndarray (float64)
+        Result vector (out, if given)
+    """
+    if out is None:
+        y = np.zeros(n_rows, dtype=np.float64)
+    else:
+        y = out
+    _scatter_mv(data, indices, indptr, x, y, alpha, beta)
+    return y
+
+
+@njit(nogil=True)
+def spmv_t_csr(data, indices, indptr, x, n_cols, out=None, alpha=1.0, beta=0.0):
+    """
+    Compute y = alpha * A.T @ x + beta * y for A in CSR format,
+    without forming A.T.
+
+    Parameters:
+    -----------
+    data : ndarray (float64)
+        Nonzero values in CSR format
+    indices : ndarray (int32)
+        Column indices in CSR format
+    indptr : ndarray (int32)
+        Row pointers in CSR format
+    x : ndarray (float64)
+        Input vector, length n_rows
+    n_cols : int
+        Number of columns of A
+    out : ndarray (float64), optional
+        Output vector y, length n_cols, updated in place
+    alpha : float, optional
+        Scale of the product (default 1.0)
+    beta : float, optional
+        Scale of the existing out (default 0.0; out is then not read)
+
+    Returns:
+    --------
+    y : ndarray (float64)
+        Result vector (out, if given)
+    """
+    if out is None:
+        y = np.zeros(n_cols, dtype=np.float64)
+    else:
+        y = out
+    _scatter_mv(data, indices, indptr, x, y, alpha, beta)
+    return y
+
+
+@njit(nogil=True)
+def spmv_t_csc(data, indices, indptr, x, out=None, alpha=1.0, beta=0.0):
+    """
+    Compute y = alpha * A.T @ x + beta * y for A in CSC format,
+    without forming A.T.
+
+    Parameters:
+    -----------
+    data : ndarray (float64)
+        Nonzero values in CSC format
+    indices : ndarray (int32)
+        Row indices in CSC format
+    indptr : ndarray (int32)
+        Column pointers in CSC format
+    x : ndarray (float64)
+        Input vector, length n_rows
+    out : ndarray (float64), optional
+        Output vector y, length n_cols, updated in place
+    alpha : float, optional
+        Scale of the product (default 1.0)
+    beta : float, optional
+        Scale of the existing out (default 0.0; out is then not read)
+
+    Returns:
+    --------
+    y : ndarray (float64)
+        Result vector (out, if given)
+    """
+    n_cols = len(indptr) - 1
+    if out is None:
+        y = np.zeros(n_cols, dtype=np.float64)
+    else:
+        y = out
+    _gather_mv(data, indices, indptr, x, y, alpha, beta)
+    return y
+
+
+# ================================================================
+# Sparse matrix - multi-vector products
+# X and Y are 2-D with one vector per column, preferably C-contiguous
+# so that the k values used with one matrix entry are adjacent.
+# ================================================================
+
+@njit(nogil=True)
+def spmm_csr(data, indices, indptr, X, out=None, alpha=1.0, beta=0.0):
+    """
+    Compute Y = alpha * A @ X + beta * Y for A in CSR format and a block
+    of vectors X. Every matrix entry is loaded once for all vectors.
+
+    Parameters:
+    -----------
+    data : ndarray (float64)
+        Nonzero values in CSR format
+    indices : ndarray (int32)
+        Column indices in CSR format
+    indptr : ndarray (int32)
+        Row pointers in CSR format
+    X : ndarray (float64)
+        Input block, shape (n_cols, k)
+    out : ndarray (float64), optional
+        Output block Y, shape (n_rows, k), updated in place
+    alpha : float, optional
+        Scale of the product (default 1.0)
+    beta : float, optional
+        Scale of the existing out (default 0.0; out is then not read)
+
+    Returns:
+    --------
+    Y : ndarray (float64)
+        Result block (out, if given)
+    """
+    n_rows = len(indptr) - 1
+    if out is None:
+        Y = np.zeros((n_rows, X.shape[1]), dtype=np.float64)
+    else:
+        Y = out
+    _gather_mm(data, indices, indptr, X, Y, alpha, beta)
+    return Y
+
+
+@njit(nogil=True)
+def spmm_csc(data, indices, indptr, X, n_rows, out=None, alpha=1.0, beta=0.0):
+    """
+    Compute Y = alpha * A @ X + beta * Y for A in CSC format and a block
+    of vectors X. Every matrix entry is loaded once for all vectors.
+
+    Parameters:
+    -----------
+    data : ndarray (float64)
+        Nonzero values in CSC format
+    indices : ndarray (int32)
+        Row indices in CSC format
+    indptr : ndarray (int32)
+        Column pointers in CSC format
+    X : ndarray (float64)
+        Input block, shape (n_cols, k)
+    n_rows : int
+        Number of rows of A
+    out : ndarray (float64), optional
+        Output block Y, shape (n_rows, k), updated in place
+    alpha : float, optional
+        Scale of the product (default 1.0)
+    beta : float, optional
+        Scale of the existing out (default 0.0; out is then not read)
+
+    Returns:
+    --------
+    Y : ndarray (float64)
+        Result block (out, if given)
+    """
+    if out is None:
+        Y = np.zeros((n_rows, X.shape[1]), dtype=np.float64)
+    else:
+        Y = out
+    _scatter_mm(data, indices, indptr, X, Y, alpha, beta)
+    return Y
+
+
+@njit(nogil=True)
+def spmm_t_csr(data, indices, indptr, X, n_cols, out=None, alpha=1.0, beta=0.0):
+    """
+    Compute Y = alpha * A.T @ X + beta * Y for A in CSR format and a
+    block of vectors X, without forming A.T.
+
+    Parameters:
+    -----------
+    data : ndarray (float64)
+        Nonzero values in CSR format
+    indices : ndarray (int32)
+        Column indices in CSR format
+    indptr : ndarray (int32)
+        Row pointers in CSR format
+    X : ndarray (float64)
+        Input block, shape (n_rows, k)
+    n_cols : int
+        Number of columns of A
+    out : ndarray (float64), optional
+        Output block Y, shape (n_cols, k), updated in place
+    alpha : float, optional
+        Scale of the product (default 1.0)
+    beta : float, optional
+        Scale of the existing out (default 0.0; out is then not read)
+
+    Returns:
+    --------
+    Y : ndarray (float64)
+        Result block (out, if given)
+    """
+    if out is None:
+        Y = np.zeros((n_cols, X.shape[1]), dtype=np.float64)
+    else:
+        Y = out
+    _scatter_mm(data, indices, indptr, X, Y, alpha, beta)
+    return Y
+
+
+@njit(nogil=True)
+def spmm_t_csc(data, indices, indptr, X, out=None, alpha=1.0, beta=0.0):
+    """
+    Compute Y = alpha * A.T @ X + beta * Y for A in CSC format and a
+    block of vectors X, without forming A.T.
+
+    Parameters:
+    -----------
+    data : ndarray (float64)
+        Nonzero values in CSC format
+    indices : ndarray (int32)
+        Row indices in CSC format
+    indptr : ndarray (int32)
+        Column pointers in CSC format
+    X : ndarray (float64)
+        Input block, shape (n_rows, k)
+    out : ndarray (float64), optional
+        Output block Y, shape (n_cols, k), updated in place
+    alpha : float, optional
+        Scale of the product (default 1.0)
+    beta : float, optional
+        Scale of the existing out (default 0.0; out is then not read)
+
+    Returns:
+    --------
+    Y : ndarray (float64)
+        Result block (out, if given)
+    """
+    n_cols = len(indptr) - 1
+    if out is None:
+        Y = np.zeros((n_cols, X.shape[1]), dtype=np.float64)
+    else:
+        Y = out
+    _gather_mm(data, indices, indptr, X, Y, alpha, beta)
+    return Y
+
+
+# ================================================================
+# Sparse matrix - sparse matrix products (Gustavson)
+#
+# The symbolic phase computes the pattern of C = A @ B, the numeric
+# phase fills in its values. When only the values of A and B change
+# (e.g. a Jacobian rebuilt at every Newton step), compute the pattern
+# once and call the numeric phase only. Column (row) indices of the
+# result are sorted, so CSC output can go straight into
+# superlu_factorize_csc / umfpack_factorize_csc.
+#
+# In CSC, C = A @ B has the arrays of C.T = B.T @ A.T in CSR, and the
+# CSC arrays of a matrix are the CSR arrays of its transpose, so the
+# CSC functions run the CSR kernels with A and B swapped.
+# ================================================================
+
+@njit(nogil=True, parallel=True)
+def _spgemm_symbolic(a_indices, a_indptr, b_indices, b_indptr, n_cols):
+    n_rows = len(a_indptr) - 1
+    n_chunks = max(1, min(get_num_threads(), n_rows))
+    bounds = _nnz_balanced_partition(a_indptr, n_chunks)
+
+    # Pass 1: number of distinct columns in each row of C
+    row_nnz = np.zeros(n_rows, dtype=np.int32)
+    for t in prange(n_chunks):
+        marker = np.full(n_cols, -1, dtype=np.int64)
+        for i in range(bounds[t], bounds[t + 1]):
+            count = 0
+            for jj in range(a_indptr[i], a_indptr[i + 1]):
+                k = a_indices[jj]
+                for kk in range(b_indptr[k], b_indptr[k + 1]):
+                    j = b_indices[kk]
+                    if marker[j] != i:
+                        marker[j] = i
+                        count += 1
+            row_nnz[i] = count
+
+    c_indptr = np.zeros(n_rows + 1, dtype=np.int32)
+    _parallel_exclusive_scan(row_nnz, c_indptr)
+
+    # Pass 2: fill and sort the column indices of each row
+    c_indices = np.empty(c_indptr[n_rows], dtype=np.int32)
+    for t in prange(n_chunks):
+        marker = np.full(n_cols, -1, dtype=np.int64)
+        for i in range(bounds[t], bounds[t + 1]):
+            pos = c_indptr[i]
+            for jj in range(a_indptr[i], a_indptr[i + 1]):
+                k = a_indices[jj]
+                for kk in range(b_indptr[k], b_indptr[k + 1]):
+                    j = b_indices[kk]
+                    if marker[j] != i:
+                        marker[j] = i
+                        c_indices[pos] = j
+                        pos += 1
+            c_indices[c_indptr[i]:c_indptr[i + 1]].sort()
+
+    return c_indices, c_indptr
+
+
+@njit(nogil=True, parallel=True)
+def _spgemm_numeric(a_data, a_indices, a_indptr, b_data, b_indices, b_indptr,
+                    c_indices, c_indptr, n_cols, c_data):
+    n_rows = len(a_indptr) - 1
+    n_chunks = max(1, min(get_num_threads(), n_rows))
+    bounds = _nnz_balanced_partition(a_indptr, n_chunks)
+    for t in prange(n_chunks):
+        acc = np.zeros(n_cols, dtype=np.float64)
+        for i in range(bounds[t], bounds[t + 1]):
+            for jj in range(a_indptr[i], a_indptr[i + 1]):
+                k = a_indices[jj]
+                v = a_data[jj]
+                for kk in range(b_indptr[k], b_indptr[k + 1]):
+                    acc[b_indices[kk]] += v * b_data[kk]
+            # Gather the row and reset only the entries that were touched
+            for p in range(c_indptr[i], c_indptr[i + 1]):
+                j = c_indices[p]
+                c_data[p] = acc[j]
+                acc[j] = 0.0
+
+
+@njit(nogil=True)
+def spgemm_symbolic_csr(a_indices, a_indptr, b_indices, b_indptr, n_cols):
+    """
+    Symbolic phase of C = A @ B for A, B in CSR format: the sparsity
+    pattern of C, with sorted column indices.
+
+    Parameters:
+    -----------
+    a_indices, a_indptr : ndarray (int32)
+        Column indices and row pointers of A (n_rows x n_inner)
+    b_indices, b_indptr : ndarray (int32)
+        Column indices and row pointers of B (n_inner x n_cols)
+    n_cols : int
+        Number of columns of B
+
+    Returns:
+    --------
+    c_indices : ndarray (int32)
+        Column indices of C in CSR format
+    c_indptr : ndarray (int32)
+        Row pointers of C in CSR format
+    """
+    return _spgemm_symbolic(a_indices, a_indptr, b_indices, b_indptr, n_cols)
+
+
+@njit(nogil=True)
+def spgemm_numeric_csr(a_data, a_indices, a_indptr, b_data, b_indices, b_indptr,
+                       c_indices, c_indptr, n_cols, out=None):
+    """
+    Numeric phase of C = A @ B for A, B in CSR format, on a pattern from
+    spgemm_symbolic_csr. The pattern must have been computed from the same
+    sparsity patterns of A and B; only their values may differ.
+
+    Parameters:
+    -----------
+    a_data, a_indices, a_indptr : ndarray
+        A in CSR format
+    b_data, b_indices, b_indptr : ndarray
+        B in CSR format
+    c_indices, c_indptr : ndarray (int32)
+        Pattern of C from spgemm_symbolic_csr
+    n_cols : int
+        Number of columns of B
+    out : ndarray (float64), optional
+        Values of C, length len(c_indices), overwritten in place
+
+    Returns:
+    --------
+    c_data : ndarray (float64)
+        Nonzero values of C in CSR format (out, if given)
+    """
+    if out is None:
+        c_data = np.empty(len(c_indices), dtype=np.float64)
+    else:
+        c_data = out
+    _spgemm_numeric(a_data, a_indices, a_indptr, b_data, b_indices, b_indptr,
+                    c_indices, c_indptr, n_cols, c_data)
+    return c_data
+
+
+@njit(nogil=True)
+def spgemm_csr(a_data, a_indices, a_indptr, b_data, b_indices, b_indptr, n_cols):
+    """
+    Compute C = A @ B for A, B in CSR format.
+
+    Parameters:
+    -----------
+    a_data, a_indices, a_indptr : ndarray
+        A in CSR format (n_rows x n_inner)
+    b_data, b_indices, b_indptr : ndarray
+        B in CSR format (n_inner x n_cols)
+    n_cols : int
+        Number of columns of B
+
+    Returns:
+    --------
+    c_data : ndarray (float64)
+        Nonzero values of C in CSR format
+    c_indices : ndarray (int32)
+        Column indices of C (sorted within each row)
+    c_indptr : ndarray (int32)
+        Row pointers of C
+    """
+    c_indices, c_indptr = _spgemm_symbolic(a_indices, a_indptr, b_indices, b_indptr, n_cols)
+    c_data = np.empty(len(c_indices), dtype=np.float64)
+    _spgemm_numeric(a_data, a_indices, a_indptr, b_data, b_indices, b_indptr,
+                    c_indices, c_indptr, n_cols, c_data)
+    return c_data, c_indices, c_indptr
+
+
+@njit(nogil=True)
+def spgemm_symbolic_csc(a_indices, a_indptr, b_indices, b_indptr, n_rows):
+    """
+    Symbolic phase of C = A @ B for A, B in CSC format: the sparsity
+    pattern of C, with sorted row indices.
+
+    Parameters:
+    -----------
+    a_indices, a_indptr : ndarray (int32)
+        Row indices and column pointers of A (n_rows x n_inner)
+    b_indices, b_indptr : ndarray (int32)
+        Row indices and column pointers of B (n_inner x n_cols)
+    n_rows : int
+        Number of rows of A
+
+    Returns:
+    --------
+    c_indices : ndarray (int32)
+        Row indices of C in CSC format
+    c_indptr : ndarray (int32)
+        Column pointers of C in CSC format
+    """
+    return _spgemm_symbolic(b_indices, b_indptr, a_indices, a_indptr, n_rows)
+
+
+@njit(nogil=True)
+def spgemm_numeric_csc(a_data, a_indices, a_indptr, b_data, b_indices, b_indptr,
+                       c_indices, c_indptr, n_rows, out=None):
+    """
+    Numeric phase of C = A @ B for A, B in CSC format, on a pattern from
+    spgemm_symbolic_csc. The pattern must have been computed from the same
+    sparsity patterns of A and B; only their values may differ.
+
+    Parameters:
+    -----------
+    a_data, a_indices, a_indptr : ndarray
+        A in CSC format
+    b_data, b_indices, b_indptr : ndarray
+        B in CSC format
+    c_indices, c_indptr : ndarray (int32)
+        Pattern of C from spgemm_symbolic_csc
+    n_rows : int
+        Number of rows of A
+    out : ndarray (float64), optional
+        Values of C, length len(c_indices), overwritten in place
+
+    Returns:
+    --------
+    c_data : ndarray (float64)
+        Nonzero values of C in CSC format (out, if given)
+    """
+    if out is None:
+        c_data = np.empty(len(c_indices), dtype=np.float64)
+    else:
+        c_data = out
+    _spgemm_numeric(b_data, b_indices, b_indptr, a_data, a_indices, a_indptr,
+                    c_indices, c_indptr, n_rows, c_data)
+    return c_data
+
+
+@njit(nogil=True)
+def spgemm_csc(a_data, a_indices, a_indptr, b_data, b_indices, b_indptr, n_rows):
+    """
+    Compute C = A @ B for A, B in CSC format. The result is canonical CSC
+    (sorted row indices, no duplicates) and can be passed directly to
+    superlu_factorize_csc or umfpack_factorize_csc.
+
+    Parameters:
+    -----------
+    a_data, a_indices, a_indptr : ndarray
+        A in CSC format (n_rows x n_inner)
+    b_data, b_indices, b_indptr : ndarray
+        B in CSC format (n_inner x n_cols)
+    n_rows : int
+        Number of rows of A
+
+    Returns:
+    --------
+    c_data : ndarray (float64)
+        Nonzero values of C in CSC format
+    c_indices : ndarray (int32)
+        Row indices of C (sorted within each column)
+    c_indptr : ndarray (int32)
+        Column pointers of C
+    """
+    return spgemm_csr(b_data, b_indices, b_indptr, a_data, a_indices, a_indptr, n_rows)
+
+
+# ================================================================
+# Sparse addition with a cached pattern
+#
+# Works on CSR and CSC alike (both operands in the same format). The
+# symbolic phase returns the union pattern plus, for every entry of A
+# and B, its position in C; the numeric phase is then a plain O(nnz)
+# scatter.
+# ================================================================
+
+@njit(nogil=True, parallel=True)
+def _spadd_symbolic(a_indices, a_indptr, b_indices, b_indptr, n_minor):
+    n_major = len(a_indptr) - 1
+    n_chunks = max(1, min(get_num_threads(), n_major))
+    bounds = _nnz_balanced_partition(a_indptr, n_chunks)
+
+    # Pass 1: size of the union in each row (column)
+    major_nnz = np.zeros(n_major, dtype=np.int32)
+    for t in prange(n_chunks):
+        marker = np.full(n_minor, -1, dtype=np.int64)
+        for i in range(bounds[t], bounds[t + 1]):
+            count = 0
+            for jj in range(a_indptr[i], a_indptr[i + 1]):
+                j = a_indices[jj]
+                if marker[j] != i:
+                    marker[j] = i
+                    count += 1
+            for jj in range(b_indptr[i], b_indptr[i + 1]):
+                j = b_indices[jj]
+                if marker[j] != i:
+                    marker[j] = i
+                    count += 1
+            major_nnz[i] = count
+
+    c_indptr = np.zeros(n_major + 1, dtype=np.int32)
+    _parallel_exclusive_scan(major_nnz, c_indptr)
+
+    # Pass 2: sorted union, then the position of every A and B entry in C
+    c_indices = np.empty(c_indptr[n_major], dtype=np.int32)
+    a_map = np.empty(len(a_indices), dtype=np.int32)
+    b_map = np.empty(len(b_indices), dtype=np.int32)
+    for t in prange(n_chunks):
+        marker = np.full(n_minor, -1, dtype=np.int64)
+        position = np.empty(n_minor, dtype=np.int32)
+        for i in range(bounds[t], bounds[t + 1]):
+            pos = c_indptr[i]
+            for jj in range(a_indptr[i], a_indptr[i + 1]):
+                j = a_indices[jj]
+                if marker[j] != i:
+                    marker[j] = i
+                    c_indices[pos] = j
+                    pos += 1
+            for jj in range(b_indptr[i], b_indptr[i + 1]):
+                j = b_indices[jj]
+                if marker[j] != i:
+                    marker[j] = i
+                    c_indices[pos] = j
+                    pos += 1
+            c_indices[c_indptr[i]:c_indptr[i + 1]].sort()
+            for p in range(c_indptr[i], c_indptr[i + 1]):
+                position[c_indices[p]] = p
+            for jj in range(a_indptr[i], a_indptr[i + 1]):
+                a_map[jj] = position[a_indices[jj]]
+            for jj in range(b_indptr[i], b_indptr[i + 1]):
+                b_map[jj] = position[b_indices[jj]]
+
+    return c_indices, c_indptr, a_map, b_map
+
+
+@njit(nogil=True, parallel=True)
+def _spadd_numeric(a_data, a_indptr, b_data, b_indptr, c_indptr, a_map, b_map, alpha, c_data):
+    n_major = len(a_indptr) - 1
+    n_chunks = max(1, min(get_num_threads(), n_major))
+    bounds = _nnz_balanced_partition(c_indptr, n_chunks)
+    # Entries of row (column) i only map into row (column) i of C, and
+    # duplicates within A or B are summed, so each thread owns its rows.
+    for t in prange(n_chunks):
+        for i in range(bounds[t], bounds[t + 1]):
+            for p in range(c_indptr[i], c_indptr[i + 1]):
+                c_data[p] = 0.0
+            for jj in range(a_indptr[i], a_indptr[i + 1]):
+                c_data[a_map[jj]] += a_data[jj]
+            for jj in range(b_indptr[i], b_indptr[i + 1]):
+                c_data[b_map[jj]] += alpha * b_data[jj]
+
+
+@njit(nogil=True)
+def spadd_symbolic(a_indices, a_indptr, b_indices, b_indptr, n_minor):
+    """
+    Symbolic phase of C = A + alpha * B for A, B both in CSR or both in
+    CSC format: the union pattern (sorted, duplicates merged) and the
+    position in C of every entry of A and B.
+
+    Parameters:
+    -----------
+    a_indices, a_indptr : ndarray (int32)
+        Indices and pointers of A
+    b_indices, b_indptr : ndarray (int32)
+        Indices and pointers of B (same shape and format as A)
+    n_minor : int
+        Number of columns (CSR) or rows (CSC)
+
+    Returns:
+    --------
+    c_indices : ndarray (int32)
+        Indices of C
+    c_indptr : ndarray (int32)
+        Pointers of C
+    a_map : ndarray (int32)
+        Position in C of each entry of A
+    b_map : ndarray (int32)
+        Position in C of each entry of B
+    """
+    return _spadd_symbolic(a_indices, a_indptr, b_indices, b_indptr, n_minor)
+
+
+@njit(nogil=True)
+def spadd_numeric(a_data, a_indptr, b_data, b_indptr, c_indptr, a_map, b_map,
+                  alpha=1.0, out=None):
+    """
+    Numeric phase of C = A + alpha * B on a pattern from spadd_symbolic.
+    A single O(nnz) pass; only the values of A and B may differ from
+    those used for the pattern.
+
+    Parameters:
+    -----------
+    a_data, a_indptr : ndarray
+        Values and pointers of A
+    b_data, b_indptr : ndarray
+        Values and pointers of B
+    c_indptr, a_map, b_map : ndarray (int32)
+        Pattern of C and position maps from spadd_symbolic
+    alpha : float, optional
+        Scale of B (default 1.0)
+    out : ndarray (float64), optional
+        Values of C, length c_indptr[-1], overwritten in place
+
+    Returns:
+    --------
+    c_data : ndarray (float64)
+        Nonzero values of C (out, if given)
+    """
+    if out is None:
+        c_data = np.empty(c_indptr[len(c_indptr) - 1], dtype=np.float64)
+    else:
+        c_data = out
+    _spadd_numeric(a_data, a_indptr, b_data, b_indptr, c_indptr, a_map, b_map, alpha, c_data)
+    return c_data
+
+
+@njit(nogil=True)
+def spadd(a_data, a_indices, a_indptr, b_data, b_indices, b_indptr, n_minor, alpha=1.0):
+    """
+    Compute C = A + alpha * B for A, B both in CSR or both in CSC format.
+    The result has sorted indices and no duplicates.
+
+    Parameters:
+    -----------
+    a_data, a_indices, a_indptr : ndarray
+        A in CSR or CSC format
+    b_data, b_indices, b_indptr : ndarray
+        B in the same format and shape as A
+    n_minor : int
+        Number of columns (CSR) or rows (CSC)
+    alpha : float, optional
+        Scale of B (default 1.0)
+
+    Returns:
+    --------
+    c_data : ndarray (float64)
+        Nonzero values of C
+    c_indices : ndarray (int32)
+        Indices of C
+    c_indptr : ndarray (int32)
+        Pointers of C
+    """
+    c_indices, c_indptr, a_map, b_map = _spadd_symbolic(
+        a_indices, a_indptr, b_indices, b_indptr, n_minor
+    )
+    c_data = np.empty(len(c_indices), dtype=np.float64)
+    _spadd_numeric(a_data, a_indptr, b_data, b_indptr, c_indptr, a_map, b_map, alpha, c_data)
+    return c_data, c_indices, c_indptr
@@ -0,0 +1,146 @@
+"""
+Tests for the shape-aware, sort-free CSR -> CSC conversion and the
+input normalization helpers used by the CSR solvers.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_csr_to_csc_shape.py
+
+import numpy as np
+import scipy.sparse as sp
+from numba import njit
+from sparse_numba.conversion.matrix_conversion_numba import (
+    convert_csr_to_csc,
+    convert_csr_to_csc_parallel,
+    ensure_float64,
+    ensure_int32,
+    has_canonical_format,
+)
+
+
+def _make_test_matrix(n_rows=80, n_cols=60, density=0.1, n_empty=7, seed=42):
+    """Random canonical CSR matrix whose last n_empty columns are empty."""
+    A = sp.random(n_rows, n_cols - n_empty, density=density, format='csr',
+                  dtype=np.float64, random_state=seed)
+    A = sp.hstack([A, sp.csr_matrix((n_rows, n_empty))]).tocsr()
+    A.sort_indices()
+    return A
+
+
+def test_shape_keeps_trailing_empty_columns():
+    """With shape given, trailing empty columns are kept."""
+    print("Test: convert_csr_to_csc with shape")
+    A = _make_test_matrix()
+    indices = A.indices.astype(np.int32)
+    indptr = A.indptr.astype(np.int32)
+
+    for convert in (convert_csr_to_csc, convert_csr_to_csc_parallel):
+        data, rows, colptr = convert(A.data, indices, indptr, A.shape)
+        assert len(colptr) == A.shape[1] + 1
+        B = sp.csc_matrix((data, rows, colptr), shape=A.shape)
+        assert np.abs(B.toarray() - A.toarray()).max() == 0.0
+
+        # Without shape the empty trailing columns cannot be seen
+        _, _, colptr = convert(A.data, indices, indptr)
+        assert len(colptr) < A.shape[1] + 1
+    print("  PASSED")
+
+
+def test_rows_sorted_without_sort_pass():
+    """Row indices come out sorted even if CSR column indices are not."""
+    print("Test: convert_csr_to_csc output is sorted")
+    A = _make_test_matrix(density=0.3, n_empty=0)
+    indices = A.indices.astype(np.int32).copy()
+    data = A.data.copy()
+    # Reverse the column order inside every row
+    for i in range(A.shape[0]):
+        s, e = A.indptr[i], A.indptr[i + 1]
+        indices[s:e] = indices[s:e][::-1]
+        data[s:e] = data[s:e][::-1]
+
+    csc_data, csc_rows, csc_colptr = convert_csr_to_csc(
+        data, indices, A.indptr.astype(np.int32), A.shape, False
+    )
+    assert has_canonical_format(csc_rows, csc_colptr)
+    ref = A.tocsc()
+    assert np.array_equal(csc_rows, ref.indices)
+    assert np.array_equal(csc_data, ref.data)
+    print("  PASSED")
+
+
+def test_sum_duplicates_flag():
+    """sum_duplicates=False matches the default on duplicate-free input."""
+    print("Test: convert_csr_to_csc sum_duplicates")
+    A = _make_test_matrix()
+    indices = A.indices.astype(np.int32)
+    indptr = A.indptr.astype(np.int32)
+    full = convert_csr_to_csc(A.data, indices, indptr, A.shape)
+    fast = convert_csr_to_csc(A.data, indices, indptr, A.shape, False)
+    fast_par = convert_csr_to_csc_parallel(A.data, indices, indptr, A.shape, False)
+    for a, b, c in zip(full, fast, fast_par):
+        assert np.array_equal(a, b) and np.array_equal(a, c)
+
+    # With duplicates, the default still sums them
+    dup_indices = np.array([0, 0, 1], dtype=np.int32)
+    dup_indptr = np.array([0, 3, 3], dtype=np.int32)
+    dup_data = np.array([1.0, 2.0, 4.0])
+    data, rows, colptr = convert_csr_to_csc(dup_data, dup_indices, dup_indptr, (2, 2))
+    assert np.array_equal(data, [3.0, 4.0])
+    assert np.array_equal(colptr, [0, 1, 2])
+    print("  PASSED")
+
+
+def test_has_canonical_format():
+    """Sorted, duplicate-free indices are canonical; anything else is not."""
+    print("Test: has_canonical_format")
+    indptr = np.array([0, 2, 4], dtype=np.int32)
+    assert has_canonical_format(np.array([0, 1, 0, 2], dtype=np.int32), indptr)
+    assert not has_canonical_format(np.array([1, 0, 0, 2], dtype=np.int32), indptr)
+    assert not has_canonical_format(np.array([0, 1, 2, 2], dtype=np.int32), indptr)
+    print("  PASSED")
+
+
+@njit
+def _normalize(data, indices):
+    return ensure_float64(data), ensure_int32(indices)
+
+
+def test_ensure_dtype_no_copy():
+    """Matching arrays are passed through; others are converted."""
+    print("Test: ensure_float64 / ensure_int32")
+    data = np.arange(5, dtype=np.float64)
+    indices = np.arange(5, dtype=np.int32)
+    d, i = _normalize(data, indices)
+    assert np.shares_memory(d, data) and np.shares_memory(i, indices)
+
+    d, i = _normalize(np.arange(5), np.arange(5))
+    assert d.dtype == np.float64 and i.dtype == np.int32
+
+    d, i = _normalize(data[::2], indices[::2])
+    assert d.flags.c_contiguous and i.flags.c_contiguous
+    assert np.array_equal(d, data[::2]) and np.array_equal(i, indices[::2])
+
+    assert ensure_int32(indices) is indices
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("CSR -> CSC Conversion Tests")
+    print("=" * 60)
+    test_shape_keeps_trailing_empty_columns()
+    test_rows_sorted_without_sort_pass()
+    test_sum_duplicates_flag()
+    test_has_canonical_format()
+    test_ensure_dtype_no_copy()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,118 @@
+"""
+Tests for the parallel conversion kernels.
+The parallel versions must give results identical to the serial ones.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_parallel_conversion.py
+
+import numpy as np
+import scipy.sparse as sp
+from sparse_numba.conversion.matrix_conversion_numba import (
+    convert_coo_to_csc,
+    convert_coo_to_csr,
+    convert_csr_to_csc,
+    convert_coo_to_csc_parallel,
+    convert_coo_to_csr_parallel,
+    convert_csr_to_csc_parallel,
+)
+
+
+def _make_coo_with_duplicates(n_rows=300, n_cols=200, nnz=5000, seed=42):
+    """Random unsorted COO triplets with many duplicate (row, col) pairs."""
+    rng = np.random.default_rng(seed)
+    row = rng.integers(0, n_rows, nnz).astype(np.int32)
+    col = rng.integers(0, n_cols, nnz).astype(np.int32)
+    data = rng.standard_normal(nnz)
+    return row, col, data
+
+
+def _assert_identical(result_serial, result_parallel, name):
+    for a, b in zip(result_serial, result_parallel):
+        assert a.dtype == b.dtype, f"{name}: dtype mismatch {a.dtype} vs {b.dtype}"
+        assert np.array_equal(a, b), f"{name}: arrays differ"
+
+
+def test_coo_to_csc_parallel_identical():
+    """Parallel COO -> CSC matches the serial kernel bit for bit."""
+    print("Test: convert_coo_to_csc_parallel")
+    row, col, data = _make_coo_with_duplicates()
+    serial = convert_coo_to_csc(row, col, data, 300, 200)
+    parallel = convert_coo_to_csc_parallel(row, col, data, 300, 200)
+    _assert_identical(serial, parallel, "coo_to_csc")
+
+    # Also check against scipy
+    A_ref = sp.coo_matrix((data, (row, col)), shape=(300, 200)).toarray()
+    A_par = sp.csc_matrix(parallel, shape=(300, 200)).toarray()
+    assert np.abs(A_ref - A_par).max() < 1e-12
+    print("  PASSED")
+
+
+def test_coo_to_csr_parallel_identical():
+    """Parallel COO -> CSR matches the serial kernel bit for bit."""
+    print("Test: convert_coo_to_csr_parallel")
+    row, col, data = _make_coo_with_duplicates(seed=7)
+    serial = convert_coo_to_csr(row, col, data, 300, 200)
+    parallel = convert_coo_to_csr_parallel(row, col, data, 300, 200)
+    _assert_identical(serial, parallel, "coo_to_csr")
+    print("  PASSED")
+
+
+def test_csr_to_csc_parallel_identical():
+    """Parallel CSR -> CSC matches the serial kernel, including duplicates."""
+    print("Test: convert_csr_to_csc_parallel")
+    rng = np.random.default_rng(3)
+    n_rows, n_cols = 400, 120
+    indptr = np.zeros(n_rows + 1, dtype=np.int32)
+    cols = []
+    for i in range(n_rows):
+        k = rng.integers(0, 10)
+        cols.append(rng.integers(0, n_cols, k))  # unsorted, may repeat
+        indptr[i + 1] = indptr[i] + k
+    indices = np.concatenate(cols).astype(np.int32)
+    data = rng.standard_normal(len(indices))
+
+    serial = convert_csr_to_csc(data, indices, indptr)
+    parallel = convert_csr_to_csc_parallel(data, indices, indptr)
+    _assert_identical(serial, parallel, "csr_to_csc")
+    print("  PASSED")
+
+
+def test_empty_matrix():
+    """Edge case: no nonzeros."""
+    print("Test: parallel conversion of an empty matrix")
+    empty_idx = np.zeros(0, dtype=np.int32)
+    empty_data = np.zeros(0, dtype=np.float64)
+    _assert_identical(
+        convert_coo_to_csc(empty_idx, empty_idx, empty_data, 4, 3),
+        convert_coo_to_csc_parallel(empty_idx, empty_idx, empty_data, 4, 3),
+        "empty coo_to_csc",
+    )
+    indptr = np.zeros(5, dtype=np.int32)
+    _assert_identical(
+        convert_csr_to_csc(empty_data, empty_idx, indptr),
+        convert_csr_to_csc_parallel(empty_data, empty_idx, indptr),
+        "empty csr_to_csc",
+    )
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Parallel Conversion Tests")
+    print("=" * 60)
+    test_coo_to_csc_parallel_identical()
+    test_coo_to_csr_parallel_identical()
+    test_csr_to_csc_parallel_identical()
+    test_empty_matrix()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,148 @@
+"""
+Tests for the CSCMatrix / CSRMatrix / COOMatrix container types.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_sparse_matrix_types.py
+
+import numpy as np
+import scipy.sparse as sp
+from numba import njit
+from sparse_numba.conversion.sparse_matrix_numba import (
+    as_csc_matrix,
+    as_csr_matrix,
+    as_coo_matrix,
+)
+
+
+def _make_test_matrix(n_rows=40, n_cols=30, density=0.15, seed=42):
+    return sp.random(n_rows, n_cols, density=density, format='csr',
+                     dtype=np.float64, random_state=seed)
+
+
+def test_flags_and_shape():
+    """Shape and canonical flags are set at construction."""
+    print("Test: container shape and flags")
+    A = _make_test_matrix()
+    M = as_csr_matrix(A.data, A.indices, A.indptr, A.shape)
+    assert M.shape == A.shape
+    assert M.nnz == A.nnz
+    assert M.sorted_indices and M.no_duplicates and M.has_canonical_format
+
+    # Unsorted row with a duplicate
+    M = as_csr_matrix(np.array([1.0, 2.0, 3.0]), np.array([2, 0, 2]),
+                      np.array([0, 3, 3]), (2, 3))
+    assert not M.sorted_indices
+    assert not M.no_duplicates
+
+    # Sorted but with a duplicate
+    M = as_csc_matrix(np.array([1.0, 2.0]), np.array([1, 1]),
+                      np.array([0, 2]), (2, 1))
+    assert M.sorted_indices and not M.no_duplicates
+    print("  PASSED")
+
+
+def test_no_copy_for_matching_arrays():
+    """float64 / int32 contiguous inputs are stored without copying."""
+    print("Test: container construction without copies")
+    A = _make_test_matrix()
+    indices = A.indices.astype(np.int32)
+    indptr = A.indptr.astype(np.int32)
+    M = as_csr_matrix(A.data, indices, indptr, A.shape)
+    assert np.shares_memory(M.data, A.data)
+    assert np.shares_memory(M.indices, indices)
+    print("  PASSED")
+
+
+def test_cached_alternate_format():
+    """The alternate format is correct and computed only once."""
+    print("Test: cached alternate format")
+    A = _make_test_matrix()
+    M = as_csr_matrix(A.data, A.indices, A.indptr, A.shape)
+    d1, i1, p1 = M.csc_arrays()
+    ref = A.tocsc()
+    assert np.array_equal(i1, ref.indices) and np.array_equal(p1, ref.indptr)
+    assert np.allclose(d1, ref.data)
+    d2, _, _ = M.csc_arrays()
+    assert np.shares_memory(d1, d2)
+
+    M.clear_cache()
+    d3, _, _ = M.csc_arrays()
+    assert not np.shares_memory(d1, d3)
+
+    Ac = A.tocsc()
+    N = as_csc_matrix(Ac.data, Ac.indices, Ac.indptr, A.shape)
+    d, i, p = N.csr_arrays()
+    assert np.abs(sp.csr_matrix((d, i, p), shape=A.shape) - A).max() == 0.0
+
+    Ao = A.tocoo()
+    C = as_coo_matrix(Ao.row, Ao.col, Ao.data, A.shape)
+    d, i, p = C.csc_arrays()
+    assert np.abs(sp.csc_matrix((d, i, p), shape=A.shape) - A).max() == 0.0
+    d, i, p = C.csr_arrays()
+    assert np.abs(sp.csr_matrix((d, i, p), shape=A.shape) - A).max() == 0.0
+    print("  PASSED")
+
+
+def test_sum_duplicates_in_place():
+    """sum_duplicates makes a matrix canonical without changing its value."""
+    print("Test: sum_duplicates")
+    data = np.array([1.0, 2.0, 3.0, 4.0])
+    indices = np.array([2, 0, 2, 1], dtype=np.int32)
+    indptr = np.array([0, 3, 4], dtype=np.int32)
+    dense = sp.csr_matrix((data, indices, indptr), shape=(2, 3)).toarray()
+
+    M = as_csr_matrix(data, indices, indptr, (2, 3))
+    M.sum_duplicates()
+    assert M.has_canonical_format
+    assert np.array_equal(M.indices, [0, 2, 1])
+    assert np.array_equal(sp.csr_matrix((M.data, M.indices, M.indptr), shape=(2, 3)).toarray(), dense)
+
+    # Same arrays read as CSC of the transpose
+    N = as_csc_matrix(data, indices, indptr, (3, 2))
+    N.sum_duplicates()
+    assert N.has_canonical_format
+    assert np.array_equal(sp.csc_matrix((N.data, N.indices, N.indptr), shape=(3, 2)).toarray(), dense.T)
+    print("  PASSED")
+
+
+@njit(nogil=True)
+def _trace_in_numba(M):
+    total = 0.0
+    data, indices, indptr = M.csc_arrays()
+    for j in range(M.n_cols):
+        for k in range(indptr[j], indptr[j + 1]):
+            if indices[k] == j:
+                total += data[k]
+    return total
+
+
+def test_use_inside_numba():
+    """Containers can be passed to and used in nogil jitted code."""
+    print("Test: containers inside Numba code")
+    A = (_make_test_matrix(20, 20) + sp.eye(20)).tocsr()
+    M = as_csr_matrix(A.data, A.indices, A.indptr, A.shape)
+    assert abs(_trace_in_numba(M) - A.diagonal().sum()) < 1e-12
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Sparse Matrix Container Tests")
+    print("=" * 60)
+    test_flags_and_shape()
+    test_no_copy_for_matching_arrays()
+    test_cached_alternate_format()
+    test_sum_duplicates_in_place()
+    test_use_inside_numba()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,157 @@
+"""
+Tests for sparse matrix-matrix products (SpGEMM) and pattern-cached
+sparse addition. Results are compared against scipy.sparse.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_spgemm_spadd.py
+
+import numpy as np
+import scipy.sparse as sp
+from sparse_numba.conversion.matrix_conversion_numba import (
+    convert_csr_to_csc,
+    has_canonical_format,
+)
+from sparse_numba.conversion.sparse_products_numba import (
+    spgemm_csr, spgemm_csc,
+    spgemm_symbolic_csr, spgemm_numeric_csr,
+    spgemm_symbolic_csc, spgemm_numeric_csc,
+    spadd, spadd_symbolic, spadd_numeric,
+)
+
+
+def _make_test_matrix(n_rows, n_cols, density=0.1, seed=42, fmt='csr'):
+    A = sp.random(n_rows, n_cols, density=density, format=fmt,
+                  dtype=np.float64, random_state=seed)
+    A.indices = A.indices.astype(np.int32)
+    A.indptr = A.indptr.astype(np.int32)
+    return A
+
+
+def _assert_same(data, indices, indptr, ref, fmt):
+    assert has_canonical_format(indices, indptr)
+    assert indices.dtype == np.int32 and indptr.dtype == np.int32
+    if fmt == 'csr':
+        ours = sp.csr_matrix((data, indices, indptr), shape=ref.shape)
+    else:
+        ours = sp.csc_matrix((data, indices, indptr), shape=ref.shape)
+    assert np.abs(ours.toarray() - ref.toarray()).max() < 1e-12
+
+
+def test_spgemm_csr_csc():
+    """A @ B matches scipy in both formats, for rectangular shapes."""
+    print("Test: spgemm_csr / spgemm_csc")
+    A = _make_test_matrix(60, 40, seed=1)
+    B = _make_test_matrix(40, 70, seed=2)
+    ref = A @ B
+
+    _assert_same(*spgemm_csr(A.data, A.indices, A.indptr,
+                             B.data, B.indices, B.indptr, 70), ref, 'csr')
+
+    Ac = A.tocsc()
+    Bc = B.tocsc()
+    _assert_same(*spgemm_csc(Ac.data, Ac.indices.astype(np.int32), Ac.indptr.astype(np.int32),
+                             Bc.data, Bc.indices.astype(np.int32), Bc.indptr.astype(np.int32),
+                             60), ref, 'csc')
+    print("  PASSED")
+
+
+def test_spgemm_pattern_reuse():
+    """The numeric phase on a cached pattern follows new values."""
+    print("Test: spgemm symbolic / numeric reuse")
+    A = _make_test_matrix(50, 50, seed=3)
+    B = _make_test_matrix(50, 50, seed=4)
+    c_indices, c_indptr = spgemm_symbolic_csr(A.indices, A.indptr, B.indices, B.indptr, 50)
+
+    c_data = np.empty(len(c_indices))
+    for scale in (1.0, -3.0):
+        A2 = A.copy()
+        A2.data = A.data * scale + 1.0
+        r = spgemm_numeric_csr(A2.data, A2.indices, A2.indptr, B.data, B.indices, B.indptr,
+                               c_indices, c_indptr, 50, c_data)
+        assert np.shares_memory(r, c_data)
+        _assert_same(c_data, c_indices, c_indptr, A2 @ B, 'csr')
+
+    Ac = A.tocsc()
+    Bc = B.tocsc()
+    ai, ap = Ac.indices.astype(np.int32), Ac.indptr.astype(np.int32)
+    bi, bp = Bc.indices.astype(np.int32), Bc.indptr.astype(np.int32)
+    c_indices, c_indptr = spgemm_symbolic_csc(ai, ap, bi, bp, 50)
+    c_data = spgemm_numeric_csc(Ac.data, ai, ap, Bc.data, bi, bp, c_indices, c_indptr, 50)
+    _assert_same(c_data, c_indices, c_indptr, A @ B, 'csc')
+    print("  PASSED")
+
+
+def test_btdb_csc():
+    """B.T @ D @ B built in CSC from a CSC matrix B."""
+    print("Test: B.T D B in CSC")
+    B = _make_test_matrix(80, 30, density=0.15, seed=5, fmt='csc')
+    d = np.linspace(1.0, 2.0, 80)
+
+    # The CSC arrays of B are the CSR arrays of B.T
+    bt_data, bt_indices, bt_indptr = convert_csr_to_csc(
+        B.data, B.indices, B.indptr, (30, 80), False
+    )
+    db_data = B.data * d[B.indices]
+    c = spgemm_csc(bt_data, bt_indices, bt_indptr, db_data, B.indices, B.indptr, 30)
+    _assert_same(*c, B.T @ sp.diags(d) @ B, 'csc')
+    print("  PASSED")
+
+
+def test_spadd():
+    """A + alpha * B matches scipy, with duplicates and unsorted input."""
+    print("Test: spadd")
+    A = _make_test_matrix(40, 30, seed=6)
+    B = _make_test_matrix(40, 30, seed=7)
+    _assert_same(*spadd(A.data, A.indices, A.indptr, B.data, B.indices, B.indptr, 30, -0.5),
+                 A - 0.5 * B, 'csr')
+
+    # Row 0 of B holds an unsorted pair with a duplicate
+    b_data = np.array([1.0, 2.0, 3.0])
+    b_indices = np.array([5, 2, 5], dtype=np.int32)
+    b_indptr = np.zeros(41, dtype=np.int32)
+    b_indptr[1:] = 3
+    B2 = sp.csr_matrix((b_data, b_indices, b_indptr), shape=(40, 30))
+    _assert_same(*spadd(A.data, A.indices, A.indptr, b_data, b_indices, b_indptr, 30, 2.0),
+                 A + 2.0 * B2, 'csr')
+    print("  PASSED")
+
+
+def test_spadd_pattern_reuse():
+    """A + sigma * M for several sigma on one cached pattern (CSC)."""
+    print("Test: spadd symbolic / numeric reuse")
+    A = _make_test_matrix(50, 50, seed=8, fmt='csc')
+    M = (sp.eye(50) + _make_test_matrix(50, 50, density=0.02, seed=9)).tocsc()
+    m_indices = M.indices.astype(np.int32)
+    m_indptr = M.indptr.astype(np.int32)
+    c_indices, c_indptr, a_map, m_map = spadd_symbolic(
+        A.indices, A.indptr, m_indices, m_indptr, 50
+    )
+    c_data = np.empty(len(c_indices))
+    for sigma in (0.0, 1.0, -2.5):
+        spadd_numeric(A.data, A.indptr, M.data, m_indptr, c_indptr,
+                      a_map, m_map, sigma, c_data)
+        _assert_same(c_data, c_indices, c_indptr, A + sigma * M, 'csc')
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("SpGEMM / Sparse Addition Tests")
+    print("=" * 60)
+    test_spgemm_csr_csc()
+    test_spgemm_pattern_reuse()
+    test_btdb_csc()
+    test_spadd()
+    test_spadd_pattern_reuse()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,11 @@
+from .dense_lu_numba import (
+    dense_batch_solve, dense_solve, dense_solve_csc,
+    csc_to_dense, csc_batch_to_dense,
+)
+
+__all__ = [
+    'dense_batch_solve', 'dense_solve', 'dense_solve_csc',
+    'csc_to_dense', 'csc_batch_to_dense',
+]
+
+__author__ = 'Tianqi Hong'
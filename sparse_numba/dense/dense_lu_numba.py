@@ -0,0 +1,288 @@
+"""
+Dense LU solvers for very small systems.
+    dense_batch_solve
+    dense_solve
+    dense_solve_csc
+    csc_to_dense
+    csc_batch_to_dense
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: dense_lu_numba.py
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(nogil=True)
+def _lu_solve_inplace(A, b):
+    """
+    Gaussian elimination with partial pivoting on the augmented system
+    [A | b], in place. Row swaps are applied to b as they happen, so no
+    pivot array is needed. On return b holds the solution and A holds U
+    (upper triangle) and the multipliers (strict lower triangle).
+
+    Returns 0 on success, or j + 1 if the pivot in column j is zero.
+    """
+    n = A.shape[0]
+    for j in range(n):
+        # Pivot search
+        p = j
+        amax = abs(A[j, j])
+        for i in range(j + 1, n):
+            v = abs(A[i, j])
+            if v > amax:
+                amax = v
+                p = i
+        if amax == 0.0:
+            return j + 1
+        if p != j:
+            for c in range(j, n):
+                tmp = A[j, c]
+                A[j, c] = A[p, c]
+                A[p, c] = tmp
+            tmp = b[j]
+            b[j] = b[p]
+            b[p] = tmp
+
+        # Eliminate below the pivot
+        inv_pivot = 1.0 / A[j, j]
+        for i in range(j + 1, n):
+            f = A[i, j] * inv_pivot
+            if f != 0.0:
+                A[i, j] = f
+                for c in range(j + 1, n):
+                    A[i, c] -= f * A[j, c]
+                b[i] -= f * b[j]
+
+    # Back substitution
+    for i in range(n - 1, -1, -1):
+        s = b[i]
+        for c in range(i + 1, n):
+            s -= A[i, c] * b[c]
+        b[i] = s / A[i, i]
+    return 0
+
+
+@njit(nogil=True)
+def _lu_factor_inplace(A, piv):
+    """
+    Partial-pivot LU of A in place, keeping the row interchanges in piv
+    (row j was swapped with row piv[j]) so the factors can be reused.
+
+    Returns 0 on success, or j + 1 if the pivot in column j is zero.
+    """
+    n = A.shape[0]
+    for j in range(n):
+        p = j
+        amax = abs(A[j, j])
+        for i in range(j + 1, n):
+            v = abs(A[i, j])
+            if v > amax:
+                amax = v
+                p = i
+        piv[j] = p
+        if amax == 0.0:
+            return j + 1
+        if p != j:
+            for c in range(n):
+                tmp = A[j, c]
+                A[j, c] = A[p, c]
+                A[p, c] = tmp
+
+        inv_pivot = 1.0 / A[j, j]
+        for i in range(j + 1, n):
+            f = A[i, j] * inv_pivot
+            A[i, j] = f
+            if f != 0.0:
+                for c in range(j + 1, n):
+                    A[i, c] -= f * A[j, c]
+    return 0
+
+
+@njit(nogil=True)
+def _lu_solve_factored_inplace(LU, piv, b):
+    """Solve with the factors from _lu_factor_inplace; b is overwritten with x."""
+    n = LU.shape[0]
+    for j in range(n):
+        p = piv[j]
+        if p != j:
+            tmp = b[j]
+            b[j] = b[p]
+            b[p] = tmp
+    for i in range(1, n):
+        s = b[i]
+        for c in range(i):
+            s -= LU[i, c] * b[c]
+        b[i] = s
+    for i in range(n - 1, -1, -1):
+        s = b[i]
+        for c in range(i + 1, n):
+            s -= LU[i, c] * b[c]
+        b[i] = s / LU[i, i]
+
+
+@njit(nogil=True, parallel=True)
+def dense_batch_solve(A_stack, B_stack):
+    """
+    Solve K dense systems A_k x_k = b_k in parallel with partial-pivot LU.
+
+    Works in place and allocates nothing per system: A_stack is overwritten
+    with the LU factors and B_stack with the solutions. Meant for many small
+    systems (n up to a few dozen) where sparse LU is pure overhead.
+
+    Parameters:
+    -----------
+    A_stack : ndarray (float64)
+        Matrices, shape (K, n, n), overwritten
+    B_stack : ndarray (float64)
+        Right-hand sides, shape (K, n), overwritten with the solutions
+
+    Returns:
+    --------
+    info : ndarray (int32)
+        Status code of each system (0 for success, j + 1 if the matrix is
+        singular with a zero pivot in column j)
+    """
+    n_systems = A_stack.shape[0]
+    info = np.zeros(n_systems, dtype=np.int32)
+    for k in prange(n_systems):
+        info[k] = _lu_solve_inplace(A_stack[k], B_stack[k])
+    return info
+
+
+@njit(nogil=True)
+def dense_solve(A, b):
+    """
+    Solve a dense linear system Ax = b with partial-pivot LU.
+    The inputs are not modified.
+
+    Parameters:
+    -----------
+    A : ndarray (float64)
+        Square matrix, shape (n, n)
+    b : ndarray (float64)
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray
+        Solution vector
+    info : int
+        Status code (0 for success)
+    """
+    LU = A.astype(np.float64)
+    x = b.astype(np.float64)
+    info = _lu_solve_inplace(LU, x)
+    return x, info
+
+
+@njit(nogil=True)
+def csc_to_dense(data, indices, indptr, n_rows, out=None):
+    """
+    Scatter a CSC matrix into a dense C-ordered array (duplicates summed).
+
+    Parameters:
+    -----------
+    data : ndarray
+        Nonzero values in CSC format
+    indices : ndarray
+        Row indices in CSC format
+    indptr : ndarray
+        Column pointers in CSC format
+    n_rows : int
+        Number of rows
+    out : ndarray (float64), optional
+        Output array, shape (n_rows, n_cols), overwritten
+
+    Returns:
+    --------
+    A : ndarray (float64)
+        Dense matrix (out, if given)
+    """
+    n_cols = len(indptr) - 1
+    if out is None:
+        A = np.zeros((n_rows, n_cols), dtype=np.float64)
+    else:
+        A = out
+        A[:, :] = 0.0
+    for j in range(n_cols):
+        for k in range(indptr[j], indptr[j + 1]):
+            A[indices[k], j] += data[k]
+    return A
+
+
+@njit(nogil=True, parallel=True)
+def csc_batch_to_dense(data_list, indices_list, indptr_list, n, out=None):
+    """
+    Convert a batch of K small n x n CSC matrices into the stacked dense
+    layout used by dense_batch_solve.
+
+    Parameters:
+    -----------
+    data_list : numba.typed.List of ndarray
+        Nonzero values of each CSC matrix
+    indices_list : numba.typed.List of ndarray
+        Row indices of each CSC matrix
+    indptr_list : numba.typed.List of ndarray
+        Column pointers of each CSC matrix
+    n : int
+        Size of every matrix
+    out : ndarray (float64), optional
+        Output array, shape (K, n, n), overwritten
+
+    Returns:
+    --------
+    A_stack : ndarray (float64)
+        Dense matrices, shape (K, n, n) (out, if given)
+    """
+    n_systems = len(data_list)
+    if out is None:
+        A_stack = np.empty((n_systems, n, n), dtype=np.float64)
+    else:
+        A_stack = out
+    for t in prange(n_systems):
+        k = np.int64(t)  # typed List indexing expects a signed index
+        csc_to_dense(data_list[k], indices_list[k], indptr_list[k], n, A_stack[k])
+    return A_stack
+
+
+@njit(nogil=True)
+def dense_solve_csc(csc_data, csc_indices, csc_indptr, b):
+    """
+    Solve Ax = b for a small CSC matrix by dense partial-pivot LU.
+    Same interface as superlu_solve_csc; faster for n up to a few dozen
+    when the matrix is not very sparse.
+
+    Parameters:
+    -----------
+    csc_data : ndarray
+        Nonzero values in CSC format
+    csc_indices : ndarray
+        Row indices in CSC format
+    csc_indptr : ndarray
+        Column pointers in CSC format
+    b : ndarray
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray
+        Solution vector
+    info : int
+        Status code (0 for success, -3 if A is not square or does not
+        match the length of b)
+    """
+    n = len(b)
+    if len(csc_indptr) - 1 != n or (len(csc_indices) > 0 and
+                                    (csc_indices.min() < 0 or csc_indices.max() >= n)):
+        print("Error: Matrix must be square and match the length of b")
+        return np.zeros(n, dtype=np.float64), -3
+    A = csc_to_dense(csc_data, csc_indices, csc_indptr, n)
+    x = b.astype(np.float64)
+    info = _lu_solve_inplace(A, x)
+    return x, info
@@ -0,0 +1,136 @@
+"""
+Tests for the batched dense LU solver and the CSC to dense helpers.
+Results are compared against numpy.linalg.solve.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_dense_batch.py
+
+import numpy as np
+import scipy.sparse as sp
+from numba import njit
+from numba.typed import List
+from sparse_numba.dense.dense_lu_numba import (
+    dense_batch_solve,
+    dense_solve,
+    dense_solve_csc,
+    csc_to_dense,
+    csc_batch_to_dense,
+)
+
+
+def _make_batch(num_systems=50, n=12, density=0.4, seed=42):
+    """Random small CSC systems that need pivoting (zero diagonals allowed)."""
+    rng = np.random.default_rng(seed)
+    matrices = []
+    data_list, indices_list, indptr_list = List(), List(), List()
+    for k in range(num_systems):
+        A = sp.random(n, n, density=density, random_state=rng) + sp.eye(n, k=1) * 3.0
+        A = (A + sp.eye(n, k=-(n - 1)) * 3.0).tocsc()
+        matrices.append(A)
+        data_list.append(A.data)
+        indices_list.append(A.indices.astype(np.int32))
+        indptr_list.append(A.indptr.astype(np.int32))
+    B = rng.standard_normal((num_systems, n))
+    return matrices, data_list, indices_list, indptr_list, B
+
+
+def test_dense_batch_solve():
+    """Batch solutions match numpy, inputs are overwritten in place."""
+    print("Test: dense_batch_solve")
+    matrices, data_list, indices_list, indptr_list, B = _make_batch()
+    A_stack = csc_batch_to_dense(data_list, indices_list, indptr_list, 12)
+    ref = np.linalg.solve(A_stack, B[:, :, None])[:, :, 0]
+
+    X = B.copy()
+    info = dense_batch_solve(A_stack, X)
+    assert np.all(info == 0)
+    err = np.abs(X - ref).max()
+    print(f"  Max error vs numpy: {err:.2e}")
+    assert err < 1e-10
+    print("  PASSED")
+
+
+def test_singular_system():
+    """A singular member is reported; the others are still solved."""
+    print("Test: dense_batch_solve with a singular system")
+    rng = np.random.default_rng(1)
+    A_stack = rng.standard_normal((3, 5, 5))
+    A_stack[1, :, 2] = 0.0
+    A_ref = A_stack.copy()
+    B = rng.standard_normal((3, 5))
+    X = B.copy()
+    info = dense_batch_solve(A_stack, X)
+    assert info[1] > 0
+    assert info[0] == 0 and info[2] == 0
+    for k in (0, 2):
+        assert np.allclose(A_ref[k] @ X[k], B[k])
+    print("  PASSED")
+
+
+def test_csc_to_dense():
+    """CSC scatter matches scipy, including duplicate entries."""
+    print("Test: csc_to_dense / csc_batch_to_dense")
+    matrices, data_list, indices_list, indptr_list, _ = _make_batch(num_systems=5)
+    stack = csc_batch_to_dense(data_list, indices_list, indptr_list, 12)
+    for k, A in enumerate(matrices):
+        assert np.array_equal(stack[k], A.toarray())
+
+    data = np.array([1.0, 2.0, 5.0])
+    indices = np.array([0, 0, 1], dtype=np.int32)
+    indptr = np.array([0, 2, 3], dtype=np.int32)
+    out = np.full((2, 2), 7.0)
+    csc_to_dense(data, indices, indptr, 2, out)
+    assert np.array_equal(out, [[3.0, 0.0], [0.0, 5.0]])
+    print("  PASSED")
+
+
+@njit(nogil=True)
+def _solve_in_numba(data, indices, indptr, b):
+    return dense_solve_csc(data, indices, indptr, b)
+
+
+def test_single_system_api():
+    """dense_solve and dense_solve_csc match numpy and work inside njit."""
+    print("Test: dense_solve / dense_solve_csc")
+    matrices, _, _, _, B = _make_batch(num_systems=1)
+    A = matrices[0]
+    ref = np.linalg.solve(A.toarray(), B[0])
+
+    A_dense = A.toarray()
+    x, info = dense_solve(A_dense, B[0])
+    assert info == 0 and np.allclose(x, ref)
+    assert np.array_equal(A_dense, A.toarray())  # input untouched
+
+    x, info = _solve_in_numba(A.data, A.indices.astype(np.int32), A.indptr.astype(np.int32), B[0])
+    assert info == 0 and np.allclose(x, ref)
+
+    # b of the wrong length, and a row index past the last column
+    _, info = _solve_in_numba(A.data, A.indices.astype(np.int32), A.indptr.astype(np.int32), B[0][:-1])
+    assert info == -3
+    indices = A.indices.astype(np.int32)
+    indices[-1] = A.shape[0] + 2
+    _, info = _solve_in_numba(A.data, indices, A.indptr.astype(np.int32), B[0])
+    assert info == -3
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Dense Batch LU Tests")
+    print("=" * 60)
+    test_dense_batch_solve()
+    test_singular_system()
+    test_csc_to_dense()
+    test_single_system_api()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,15 @@
+from .gplu_numba import (
+    gplu_factorize_csc, gplu_refactor,
+    gplu_solve_factored, gplu_solve_factored_transpose,
+    gplu_free_factors, gplu_solve_csc,
+    GPLUFactors,
+)
+
+__all__ = [
+    'gplu_factorize_csc', 'gplu_refactor',
+    'gplu_solve_factored', 'gplu_solve_factored_transpose',
+    'gplu_free_factors', 'gplu_solve_csc',
+    'GPLUFactors',
+]
+
+__author__ = 'Tianqi Hong'
@@ -0,0 +1,506 @@
+"""
+Pure-Numba sparse LU (left-looking Gilbert-Peierls) for small and medium
+matrices, with no C dependency.
+    gplu_factorize_csc, gplu_refactor
+    gplu_solve_factored, gplu_solve_factored_transpose
+    gplu_free_factors
+    gplu_solve_csc
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: gplu_numba.py
+
+import numpy as np
+from numba import njit, int32, int64, float64
+from numba.experimental import jitclass
+
+from sparse_numba.conversion.matrix_conversion_numba import ensure_float64, ensure_int32
+
+
+@jitclass([
+    ('n', int64),
+    ('Lp', int32[::1]),
+    ('Li', int32[::1]),
+    ('Lx', float64[::1]),
+    ('Up', int32[::1]),
+    ('Ui', int32[::1]),
+    ('Ux', float64[::1]),
+    ('pinv', int32[::1]),
+    ('q', int32[::1]),
+    ('a_indices', int32[::1]),
+    ('a_indptr', int32[::1]),
+])
+class GPLUFactors:
+    """
+    Sparse LU factors from gplu_factorize_csc, P A Q = L U.
+
+    L (unit diagonal stored first in each column) and U (diagonal stored
+    last) are CSC with row indices in pivot order. Row i of A is pivot row
+    pinv[i]; column k of L U is column q[k] of A. The pattern of A is kept
+    for gplu_refactor.
+    """
+
+    def __init__(self, n, Lp, Li, Lx, Up, Ui, Ux, pinv, q, a_indices, a_indptr):
+        self.n = n
+        self.Lp = Lp
+        self.Li = Li
+        self.Lx = Lx
+        self.Up = Up
+        self.Ui = Ui
+        self.Ux = Ux
+        self.pinv = pinv
+        self.q = q
+        self.a_indices = a_indices
+        self.a_indptr = a_indptr
+
+    @property
+    def nnz(self):
+        """Stored entries in L and U (diagonals counted in both)."""
+        return self.Lp[self.n] + self.Up[self.n]
+
+
+@njit(nogil=True)
+def _grow(arr, size):
+    out = np.empty(size, dtype=arr.dtype)
+    out[:len(arr)] = arr
+    return out
+
+
+@njit(nogil=True)
+def _reach(Lp, Li, a_indices, a_start, a_end, pinv, mark, stamp,
+           xi, stack, pstack, n):
+    """
+    Rows reachable from the pattern of one column of A in the graph of the
+    L computed so far (depth-first, non-recursive). They are written to
+    xi[top:n] in topological order; returns top.
+    """
+    top = n
+    for p in range(a_start, a_end):
+        j = a_indices[p]
+        if mark[j] == stamp:
+            continue
+        head = 0
+        stack[0] = j
+        while head >= 0:
+            j = stack[head]
+            jnew = pinv[j]
+            if mark[j] != stamp:
+                mark[j] = stamp
+                pstack[head] = 0 if jnew < 0 else Lp[jnew]
+            done = True
+            p2 = 0 if jnew < 0 else Lp[jnew + 1]
+            for pp in range(pstack[head], p2):
+                i = Li[pp]
+                if mark[i] == stamp:
+                    continue
+                pstack[head] = pp + 1
+                head += 1
+                stack[head] = i
+                done = False
+                break
+            if done:
+                head -= 1
+                top -= 1
+                xi[top] = j
+    return top
+
+
+@njit(nogil=True)
+def _gplu_factor(data, indices, indptr, q, pivot_thresh):
+    """Left-looking LU with threshold partial pivoting; returns (factors, info)."""
+    n = len(indptr) - 1
+    nnz = indptr[n]
+
+    l_cap = 2 * nnz + n
+    u_cap = 2 * nnz + n
+    Lp = np.zeros(n + 1, dtype=np.int32)
+    Li = np.empty(l_cap, dtype=np.int32)
+    Lx = np.empty(l_cap, dtype=np.float64)
+    Up = np.zeros(n + 1, dtype=np.int32)
+    Ui = np.empty(u_cap, dtype=np.int32)
+    Ux = np.empty(u_cap, dtype=np.float64)
+
+    pinv = np.full(n, -1, dtype=np.int32)
+    x = np.zeros(n, dtype=np.float64)
+    xi = np.empty(n, dtype=np.int32)
+    stack = np.empty(n, dtype=np.int32)
+    pstack = np.empty(n, dtype=np.int32)
+    mark = np.full(n, -1, dtype=np.int64)
+
+    lnz = 0
+    unz = 0
+    info = 0
+    for k in range(n):
+        Lp[k] = lnz
+        Up[k] = unz
+        if lnz + n > l_cap:
+            l_cap = 2 * l_cap + n
+            Li = _grow(Li, l_cap)
+            Lx = _grow(Lx, l_cap)
+        if unz + n > u_cap:
+            u_cap = 2 * u_cap + n
+            Ui = _grow(Ui, u_cap)
+            Ux = _grow(Ux, u_cap)
+
+        # x = L \ A(:, col), on the reach of A(:, col) only
+        col = q[k]
+        top = _reach(Lp, Li, indices, indptr[col], indptr[col + 1], pinv,
+                     mark, k, xi, stack, pstack, n)
+        for p in range(top, n):
+            x[xi[p]] = 0.0
+        for p in range(indptr[col], indptr[col + 1]):
+            x[indices[p]] += data[p]
+        for px in range(top, n):
+            j = xi[px]
+            J = pinv[j]
+            if J < 0:
+                continue
+            xj = x[j]
+            for p in range(Lp[J] + 1, Lp[J + 1]):
+                x[Li[p]] -= Lx[p] * xj
+
+        # Split x into U(:, k) and pivot candidates
+        ipiv = -1
+        amax = -1.0
+        for px in range(top, n):
+            i = xi[px]
+            if pinv[i] < 0:
+                t = abs(x[i])
+                if t > amax:
+                    amax = t
+                    ipiv = i
+            else:
+                Ui[unz] = pinv[i]
+                Ux[unz] = x[i]
+                unz += 1
+        if ipiv == -1 or amax <= 0.0:
+            info = k + 1
+            break
+        # Keep the diagonal if it is large enough
+        if pinv[col] < 0 and abs(x[col]) >= amax * pivot_thresh:
+            ipiv = col
+
+        pivot = x[ipiv]
+        Ui[unz] = k
+        Ux[unz] = pivot
+        unz += 1
+        pinv[ipiv] = k
+        Li[lnz] = ipiv
+        Lx[lnz] = 1.0
+        lnz += 1
+        for px in range(top, n):
+            i = xi[px]
+            if pinv[i] < 0:
+                Li[lnz] = i
+                Lx[lnz] = x[i] / pivot
+                lnz += 1
+            x[i] = 0.0
+
+    if info != 0:
+        # Partial factors are unusable; return an empty shell
+        for k in range(n):
+            if pinv[k] < 0:
+                pinv[k] = 0
+        Lp[:] = 0
+        Up[:] = 0
+        return GPLUFactors(n, Lp, Li[:0].copy(), Lx[:0].copy(), Up, Ui[:0].copy(),
+                           Ux[:0].copy(), pinv, q, indices.copy(), indptr.copy()), info
+
+    Lp[n] = lnz
+    Up[n] = unz
+    # Row indices of L in pivot order
+    for p in range(lnz):
+        Li[p] = pinv[Li[p]]
+    return GPLUFactors(n, Lp, Li[:lnz].copy(), Lx[:lnz].copy(), Up, Ui[:unz].copy(),
+                       Ux[:unz].copy(), pinv, q, indices.copy(), indptr.copy()), 0
+
+
+@njit(nogil=True)
+def gplu_factorize_csc(csc_data, csc_indices, csc_indptr, perm_c=None, pivot_thresh=1.0):
+    """
+    Pre-factorize a sparse matrix in CSC format with a left-looking
+    Gilbert-Peierls LU, written in Numba. Same call as superlu_factorize_csc;
+    the factors are a Numba object instead of a C handle, so everything
+    can be inlined into user jitted code and run inside prange.
+
+    Each column costs time proportional to its flops (sparse triangular
+    solve on the reach of the column), with no setup or C transition, which
+    is what matters for n up to a few thousand.
+
+    Parameters:
+    -----------
+    csc_data : ndarray (float64)
+        Nonzero values in CSC format
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    perm_c : ndarray (int32), optional
+        Column ordering: column k of the factors is column perm_c[k] of A
+        (default: natural order). A fill-reducing ordering can cut fill a
+        lot on unstructured matrices.
+    pivot_thresh : float, optional
+        Threshold partial pivoting, in (0, 1]. The diagonal is kept as the
+        pivot if |a_kk| >= pivot_thresh * max |a_ik|. 1.0 (default) is
+        classical partial pivoting; smaller values keep more diagonal
+        pivots and usually less fill.
+
+    Returns:
+    --------
+    factors : GPLUFactors
+        Factors for gplu_solve_factored and gplu_refactor
+    info : int
+        Status code (0 for success, k + 1 if no nonzero pivot was found in
+        step k, -1/-2 for invalid CSC input, -3 for a non-square matrix or a
+        bad perm_c)
+    """
+    data = ensure_float64(csc_data)
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+    n = len(indptr) - 1
+    nnz = len(data)
+
+    q = np.arange(n, dtype=np.int32)
+    info = 0
+    if indptr[0] != 0:
+        print("Error: First element of indptr must be 0")
+        info = -1
+    elif indptr[n] != nnz:
+        print("Error: Last element of indptr must equal nnz")
+        info = -2
+    elif nnz > 0 and (indices.min() < 0 or indices.max() >= n):
+        print("Error: Matrix must be square")
+        info = -3
+    elif perm_c is not None:
+        if len(perm_c) != n:
+            print("Error: perm_c must have one entry per column")
+            info = -3
+        else:
+            seen = np.zeros(n, dtype=np.bool_)
+            for k in range(n):
+                c = perm_c[k]
+                if c < 0 or c >= n or seen[c]:
+                    print("Error: perm_c is not a permutation")
+                    info = -3
+                    break
+                seen[c] = True
+                q[k] = c
+    if info != 0:
+        empty_i = np.zeros(0, dtype=np.int32)
+        empty_x = np.zeros(0, dtype=np.float64)
+        ptr = np.zeros(n + 1, dtype=np.int32)
+        return GPLUFactors(n, ptr, empty_i, empty_x, ptr.copy(), empty_i, empty_x,
+                           q.copy(), q, indices, indptr), info
+
+    return _gplu_factor(data, indices, indptr, q, pivot_thresh)
+
+
+@njit(nogil=True)
+def gplu_refactor(factors, csc_data):
+    """
+    Refactorize in place for new values on the pattern given to
+    gplu_factorize_csc, reusing the column ordering, the pivot sequence and
+    the patterns of L and U. No graph search or pivot search is done, so
+    this is the fast path for Newton iterations and time stepping.
+
+    If the new values make a reused pivot tiny, the result is inaccurate;
+    factorize again if the residual grows.
+
+    Parameters:
+    -----------
+    factors : GPLUFactors
+        Factors from gplu_factorize_csc (updated in place)
+    csc_data : ndarray (float64)
+        New nonzero values, in the order of the factorized CSC matrix
+
+    Returns:
+    --------
+    info : int
+        Status code (0 for success, k + 1 if pivot k became zero, -3 if the
+        number of values differs)
+    """
+    data = ensure_float64(csc_data)
+    indices = factors.a_indices
+    indptr = factors.a_indptr
+    n = factors.n
+    if len(data) != len(indices):
+        print("Error: refactor needs the same pattern")
+        return -3
+    if factors.Up[n] == 0 and n > 0:
+        print("Error: factors are not valid")
+        return -3
+
+    Lp, Li, Lx = factors.Lp, factors.Li, factors.Lx
+    Up, Ui, Ux = factors.Up, factors.Ui, factors.Ux
+    pinv = factors.pinv
+    x = np.zeros(n, dtype=np.float64)
+    for k in range(n):
+        col = factors.q[k]
+        for p in range(indptr[col], indptr[col + 1]):
+            x[pinv[indices[p]]] += data[p]
+        # U(:, k) is stored in topological order, diagonal last
+        for p in range(Up[k], Up[k + 1] - 1):
+            J = Ui[p]
+            u = x[J]
+            Ux[p] = u
+            x[J] = 0.0
+            for pl in range(Lp[J] + 1, Lp[J + 1]):
+                x[Li[pl]] -= Lx[pl] * u
+        pivot = x[k]
+        x[k] = 0.0
+        if pivot == 0.0:
+            return k + 1
+        Ux[Up[k + 1] - 1] = pivot
+        for p in range(Lp[k] + 1, Lp[k + 1]):
+            i = Li[p]
+            Lx[p] = x[i] / pivot
+            x[i] = 0.0
+    return 0
+
+
+@njit(nogil=True)
+def gplu_solve_factored(factors, b):
+    """
+    Solve A*x = b using the factors from gplu_factorize_csc.
+
+    Parameters:
+    -----------
+    factors : GPLUFactors
+        Factors from gplu_factorize_csc
+    b : ndarray (float64)
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success, -3 if the length of b does not match)
+    """
+    n = factors.n
+    if len(b) != n:
+        print("Error: Length of b does not match the factors")
+        return np.zeros(len(b), dtype=np.float64), -3
+
+    Lp, Li, Lx = factors.Lp, factors.Li, factors.Lx
+    Up, Ui, Ux = factors.Up, factors.Ui, factors.Ux
+    y = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        y[factors.pinv[i]] = b[i]
+    for j in range(n):
+        yj = y[j]
+        if yj != 0.0:
+            for p in range(Lp[j] + 1, Lp[j + 1]):
+                y[Li[p]] -= Lx[p] * yj
+    for j in range(n - 1, -1, -1):
+        yj = y[j] / Ux[Up[j + 1] - 1]
+        y[j] = yj
+        if yj != 0.0:
+            for p in range(Up[j], Up[j + 1] - 1):
+                y[Ui[p]] -= Ux[p] * yj
+    x = np.empty(n, dtype=np.float64)
+    for k in range(n):
+        x[factors.q[k]] = y[k]
+    return x, 0
+
+
+@njit(nogil=True)
+def gplu_solve_factored_transpose(factors, b):
+    """
+    Solve A^T*x = b using the factors of A from gplu_factorize_csc.
+
+    Parameters:
+    -----------
+    factors : GPLUFactors
+        Factors from gplu_factorize_csc
+    b : ndarray (float64)
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success, -3 if the length of b does not match)
+    """
+    n = factors.n
+    if len(b) != n:
+        print("Error: Length of b does not match the factors")
+        return np.zeros(len(b), dtype=np.float64), -3
+
+    Lp, Li, Lx = factors.Lp, factors.Li, factors.Lx
+    Up, Ui, Ux = factors.Up, factors.Ui, factors.Ux
+    y = np.empty(n, dtype=np.float64)
+    for k in range(n):
+        y[k] = b[factors.q[k]]
+    # U^T is lower triangular: column j of U is row j of U^T
+    for j in range(n):
+        s = y[j]
+        for p in range(Up[j], Up[j + 1] - 1):
+            s -= Ux[p] * y[Ui[p]]
+        y[j] = s / Ux[Up[j + 1] - 1]
+    for j in range(n - 1, -1, -1):
+        s = y[j]
+        for p in range(Lp[j] + 1, Lp[j + 1]):
+            s -= Lx[p] * y[Li[p]]
+        y[j] = s
+    x = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        x[i] = y[factors.pinv[i]]
+    return x, 0
+
+
+@njit(nogil=True)
+def gplu_free_factors(factors):
+    """
+    Counterpart of superlu_free_factors, for drop-in use. The factors are
+    ordinary Numba objects and are released by reference counting, so
+    this does nothing.
+
+    Returns:
+    --------
+    info : int
+        Always 0
+    """
+    return 0
+
+
+@njit(nogil=True)
+def gplu_solve_csc(csc_data, csc_indices, csc_indptr, b, perm_c=None, pivot_thresh=1.0):
+    """
+    Solve a sparse linear system Ax = b with the Numba Gilbert-Peierls LU.
+    Same call as superlu_solve_csc.
+
+    Parameters:
+    -----------
+    csc_data : ndarray
+        Nonzero values in CSC format
+    csc_indices : ndarray
+        Row indices in CSC format
+    csc_indptr : ndarray
+        Column pointers in CSC format
+    b : ndarray
+        Right-hand side vector
+    perm_c : ndarray (int32), optional
+        Column ordering (see gplu_factorize_csc)
+    pivot_thresh : float, optional
+        Threshold partial pivoting (see gplu_factorize_csc)
+
+    Returns:
+    --------
+    x : ndarray
+        Solution vector
+    info : int
+        Status code (0 for success)
+    """
+    factors, info = gplu_factorize_csc(csc_data, csc_indices, csc_indptr, perm_c, pivot_thresh)
+    if info != 0:
+        return np.zeros(len(b), dtype=np.float64), info
+    if len(b) != factors.n:
+        print("Error: Matrix must be square and match the length of b")
+        return np.zeros(len(b), dtype=np.float64), -3
+    return gplu_solve_factored(factors, b)
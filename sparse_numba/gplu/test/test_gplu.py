@@ -0,0 +1,145 @@
+"""
+Tests for the pure-Numba Gilbert-Peierls sparse LU.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_gplu.py
+
+import numpy as np
+import scipy.sparse as sp
+from numba import njit, prange
+from sparse_numba.gplu.gplu_numba import (
+    gplu_factorize_csc,
+    gplu_refactor,
+    gplu_solve_factored,
+    gplu_solve_factored_transpose,
+    gplu_free_factors,
+    gplu_solve_csc,
+)
+
+
+def _make_test_matrix(n=150, density=0.03, seed=42):
+    """Random unsymmetric sparse matrix with a nonzero diagonal, as CSC."""
+    A = sp.random(n, n, density=density, dtype=np.float64, random_state=seed)
+    return (A + sp.eye(n)).tocsc()
+
+
+def test_factorize_and_solve():
+    """Solutions of A x = b and A^T x = b for several thresholds and orderings."""
+    print("Test: gplu_factorize_csc + solve")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    rng = np.random.default_rng(0)
+    b = rng.standard_normal(n)
+    perm = rng.permutation(n).astype(np.int32)
+
+    for perm_c in (None, perm):
+        for thresh in (1.0, 0.1):
+            factors, info = gplu_factorize_csc(A.data, A.indices, A.indptr, perm_c, thresh)
+            assert info == 0
+            x, info = gplu_solve_factored(factors, b)
+            assert info == 0
+            assert np.linalg.norm(A @ x - b) < 1e-10 * np.linalg.norm(b) * n
+            x, info = gplu_solve_factored_transpose(factors, b)
+            assert info == 0
+            assert np.linalg.norm(A.T @ x - b) < 1e-10 * np.linalg.norm(b) * n
+            assert gplu_free_factors(factors) == 0
+
+    x, info = gplu_solve_csc(A.data, A.indices, A.indptr, b)
+    assert info == 0
+    assert np.allclose(A @ x, b)
+    print("  PASSED")
+
+
+def test_pivoting():
+    """A zero diagonal needs row interchanges."""
+    print("Test: partial pivoting")
+    A = sp.csc_matrix(np.array([[0.0, 2.0, 1.0],
+                                [3.0, 0.0, 1.0],
+                                [1.0, 1.0, 0.0]]))
+    b = np.array([1.0, 2.0, 3.0])
+    factors, info = gplu_factorize_csc(A.data, A.indices, A.indptr)
+    assert info == 0
+    x, info = gplu_solve_factored(factors, b)
+    assert np.allclose(x, np.linalg.solve(A.toarray(), b))
+    print("  PASSED")
+
+
+def test_refactor():
+    """gplu_refactor reuses the pattern and pivots for new values."""
+    print("Test: gplu_refactor")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    rng = np.random.default_rng(1)
+    b = rng.standard_normal(n)
+
+    factors, info = gplu_factorize_csc(A.data, A.indices, A.indptr)
+    assert info == 0
+    for step in range(3):
+        A_new = A.copy()
+        A_new.data = A.data * (1.0 + 0.1 * rng.random(A.nnz))
+        assert gplu_refactor(factors, A_new.data) == 0
+        x, info = gplu_solve_factored(factors, b)
+        assert info == 0
+        assert np.allclose(A_new @ x, b)
+
+    assert gplu_refactor(factors, A.data[:-1]) == -3
+    print("  PASSED")
+
+
+def test_singular_and_invalid():
+    """Singular matrices and bad orderings are reported."""
+    print("Test: singular matrices and invalid input")
+    A = sp.csc_matrix(np.array([[1.0, 2.0, 0.0],
+                                [2.0, 4.0, 0.0],
+                                [0.0, 0.0, 1.0]]))
+    factors, info = gplu_factorize_csc(A.data, A.indices, A.indptr)
+    assert info == 2
+    x, info = gplu_solve_csc(A.data, A.indices, A.indptr, np.ones(3))
+    assert info == 2
+
+    factors, info = gplu_factorize_csc(A.data, A.indices, A.indptr, np.array([0, 0, 1]))
+    assert info == -3
+    print("  PASSED")
+
+
+@njit(nogil=True, parallel=True)
+def _solve_batch(data, indices, indptr, B):
+    X = np.zeros_like(B)
+    for k in prange(B.shape[0]):
+        factors, info = gplu_factorize_csc(data, indices, indptr)
+        x, info = gplu_solve_factored(factors, B[k])
+        X[k] = x
+    return X
+
+
+def test_inside_prange():
+    """Factorize and solve from inside a parallel jitted loop."""
+    print("Test: gplu inside prange")
+    A = _make_test_matrix(60)
+    B = np.random.default_rng(2).standard_normal((8, 60))
+    X = _solve_batch(A.data, A.indices.astype(np.int32), A.indptr.astype(np.int32), B)
+    assert np.allclose((A @ X.T).T, B)
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Gilbert-Peierls LU Tests")
+    print("=" * 60)
+    test_factorize_and_solve()
+    test_pivoting()
+    test_refactor()
+    test_singular_and_invalid()
+    test_inside_prange()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
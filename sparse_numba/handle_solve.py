@@ -0,0 +1,285 @@
+"""
+Factorize, solve and free with a factor handle of any of the C backends
+(SuperLU, UMFPACK, KLU), selected by a backend code. Used by the algorithms
+that build on an existing factorization (low-rank updates, Schur
+complements, condition estimation).
+    handle_factorize_csc
+    handle_free
+    handle_solve_into
+    handle_solve
+    handle_solve_multi
+    concurrent_solves_safe
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: handle_solve.py
+
+import numpy as np
+from numba import njit
+
+from sparse_numba.conversion.matrix_conversion_numba import ensure_float64
+
+try:
+    from sparse_numba.sparse_superlu.superlu_numba_interface import (
+        c_solve_with_factors_trans as _c_superlu_solve,
+        superlu_factorize_csc as _superlu_factorize,
+        superlu_free_factors as _superlu_free,
+    )
+    _HAS_SUPERLU = True
+except ImportError:
+    _HAS_SUPERLU = False
+
+try:
+    from sparse_numba.sparse_umfpack.umfpack_numba_interface import (
+        c_solve_with_factors_trans as _c_umfpack_solve,
+        umfpack_factorize_csc as _umfpack_factorize,
+        umfpack_free_factors as _umfpack_free,
+    )
+    _HAS_UMFPACK = True
+except ImportError:
+    _HAS_UMFPACK = False
+
+try:
+    from sparse_numba.sparse_klu.klu_numba_interface import (
+        c_solve_with_factors_trans as _c_klu_solve,
+        klu_factorize_csc as _klu_factorize,
+        klu_free_factors as _klu_free,
+    )
+    _HAS_KLU = True
+except ImportError:
+    _HAS_KLU = False
+
+__all__ = [
+    'handle_factorize_csc', 'handle_free',
+    'handle_solve_into', 'handle_solve', 'handle_solve_multi', 'concurrent_solves_safe',
+    'BACKEND_SUPERLU', 'BACKEND_UMFPACK', 'BACKEND_KLU',
+]
+
+# Which *_factorize_* produced the handle
+BACKEND_SUPERLU = 0
+BACKEND_UMFPACK = 1
+BACKEND_KLU = 2
+
+
+if _HAS_SUPERLU:
+    @njit(nogil=True)
+    def _superlu_solve(handle, rhs, sol, nrhs, trans):
+        return _c_superlu_solve(handle, rhs.ctypes.data, sol.ctypes.data, nrhs, trans)
+else:
+    @njit(nogil=True)
+    def _superlu_solve(handle, rhs, sol, nrhs, trans):
+        print("Error: SuperLU is not available")
+        return -5
+
+    @njit(nogil=True)
+    def _superlu_factorize(csc_data, csc_indices, csc_indptr):
+        print("Error: SuperLU is not available")
+        return np.int64(0), -5
+
+    @njit(nogil=True)
+    def _superlu_free(handle):
+        print("Error: SuperLU is not available")
+        return -5
+
+
+if _HAS_UMFPACK:
+    @njit(nogil=True)
+    def _umfpack_solve(handle, rhs, sol, nrhs, trans):
+        return _c_umfpack_solve(handle, rhs.ctypes.data, sol.ctypes.data, nrhs, trans)
+else:
+    @njit(nogil=True)
+    def _umfpack_solve(handle, rhs, sol, nrhs, trans):
+        print("Error: UMFPACK is not available")
+        return -5
+
+    @njit(nogil=True)
+    def _umfpack_factorize(csc_data, csc_indices, csc_indptr):
+        print("Error: UMFPACK is not available")
+        return np.int64(0), -5
+
+    @njit(nogil=True)
+    def _umfpack_free(handle):
+        print("Error: UMFPACK is not available")
+        return -5
+
+
+if _HAS_KLU:
+    @njit(nogil=True)
+    def _klu_solve(handle, rhs, sol, nrhs, trans):
+        return _c_klu_solve(handle, rhs.ctypes.data, sol.ctypes.data, nrhs, trans)
+else:
+    @njit(nogil=True)
+    def _klu_solve(handle, rhs, sol, nrhs, trans):
+        print("Error: KLU is not available")
+        return -5
+
+    @njit(nogil=True)
+    def _klu_factorize(csc_data, csc_indices, csc_indptr):
+        print("Error: KLU is not available")
+        return np.int64(0), -5
+
+    @njit(nogil=True)
+    def _klu_free(handle):
+        print("Error: KLU is not available")
+        return -5
+
+
+@njit(nogil=True)
+def handle_factorize_csc(csc_data, csc_indices, csc_indptr, backend=BACKEND_SUPERLU):
+    """
+    Factorize a sparse matrix in CSC format with the chosen backend.
+
+    Parameters:
+    -----------
+    csc_data : ndarray (float64)
+        Nonzero values in CSC format
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    backend : int
+        BACKEND_SUPERLU, BACKEND_UMFPACK or BACKEND_KLU
+
+    Returns:
+    --------
+    handle : int64
+        Factors handle; free with handle_free(handle, backend)
+    info : int
+        Status code (0 for success, -5 if the backend is not available)
+    """
+    if backend == BACKEND_SUPERLU:
+        return _superlu_factorize(csc_data, csc_indices, csc_indptr)
+    if backend == BACKEND_UMFPACK:
+        return _umfpack_factorize(csc_data, csc_indices, csc_indptr)
+    if backend == BACKEND_KLU:
+        return _klu_factorize(csc_data, csc_indices, csc_indptr)
+    print("Error: Unknown factorization backend")
+    return np.int64(0), -5
+
+
+@njit(nogil=True)
+def handle_free(handle, backend=BACKEND_SUPERLU):
+    """Free the factors behind a handle from handle_factorize_csc."""
+    if backend == BACKEND_SUPERLU:
+        return _superlu_free(handle)
+    if backend == BACKEND_UMFPACK:
+        return _umfpack_free(handle)
+    if backend == BACKEND_KLU:
+        return _klu_free(handle)
+    print("Error: Unknown factorization backend")
+    return -5
+
+
+@njit(nogil=True)
+def concurrent_solves_safe(backend):
+    """
+    True if several threads may solve with the same handle at once.
+    SuperLU and UMFPACK allocate their solve workspace per call; KLU solves
+    in the workspace stored with the numeric factors.
+    """
+    return backend == BACKEND_SUPERLU or backend == BACKEND_UMFPACK
+
+
+@njit(nogil=True)
+def handle_solve_into(handle, rhs, sol, nrhs=1, trans=False, backend=BACKEND_SUPERLU):
+    """
+    Solve A X = B (or A^T X = B) with existing factors, writing X into a
+    preallocated array. No memory is allocated here.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from superlu_/umfpack_/klu_factorize_*()
+    rhs : ndarray (float64, C-contiguous)
+        Right-hand sides, n * nrhs values with each right-hand side stored
+        contiguously (a vector, or an array of shape (nrhs, n))
+    sol : ndarray (float64, C-contiguous)
+        Output, same layout as rhs; must not overlap it
+    nrhs : int
+        Number of right-hand sides
+    trans : bool
+        Solve with A^T instead of A
+    backend : int
+        BACKEND_SUPERLU, BACKEND_UMFPACK or BACKEND_KLU
+
+    Returns:
+    --------
+    info : int
+        Status code of the backend (0 for success, -5 if the backend is
+        not available or unknown)
+    """
+    t = 1 if trans else 0
+    if backend == BACKEND_SUPERLU:
+        return _superlu_solve(handle, rhs, sol, nrhs, t)
+    if backend == BACKEND_UMFPACK:
+        return _umfpack_solve(handle, rhs, sol, nrhs, t)
+    if backend == BACKEND_KLU:
+        return _klu_solve(handle, rhs, sol, nrhs, t)
+    print("Error: Unknown factorization backend")
+    return -5
+
+
+@njit(nogil=True)
+def handle_solve(handle, b, trans=False, backend=BACKEND_SUPERLU):
+    """
+    Solve A x = b (or A^T x = b) with existing factors.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from superlu_/umfpack_/klu_factorize_*()
+    b : ndarray (float64)
+        Right-hand side vector
+    trans : bool
+        Solve with A^T instead of A
+    backend : int
+        BACKEND_SUPERLU, BACKEND_UMFPACK or BACKEND_KLU
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success)
+    """
+    rhs = ensure_float64(b)
+    x = np.zeros(len(rhs), dtype=np.float64)
+    info = handle_solve_into(handle, rhs, x, 1, trans, backend)
+    return x, info
+
+
+@njit(nogil=True)
+def handle_solve_multi(handle, B, trans=False, backend=BACKEND_SUPERLU):
+    """
+    Solve A X = B (or A^T X = B) for several right-hand sides in one call.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from superlu_/umfpack_/klu_factorize_*()
+    B : ndarray (float64)
+        Right-hand sides, shape (n, nrhs)
+    trans : bool
+        Solve with A^T instead of A
+    backend : int
+        BACKEND_SUPERLU, BACKEND_UMFPACK or BACKEND_KLU
+
+    Returns:
+    --------
+    X : ndarray (float64)
+        Solutions, shape (n, nrhs)
+    info : int
+        Status code (0 for success)
+    """
+    n = B.shape[0]
+    nrhs = B.shape[1]
+    Bt = np.ascontiguousarray(B.T).astype(np.float64)
+    Xt = np.zeros((nrhs, n), dtype=np.float64)
+    if nrhs == 0:
+        return Xt.T, 0
+    info = handle_solve_into(handle, Bt, Xt, nrhs, trans, backend)
+    return Xt.T, info
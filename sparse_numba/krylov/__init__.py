@@ -0,0 +1,23 @@
+from .krylov_numba import (
+    cg_csr, bicgstab_csr, gmres_csr,
+    krylov_workspace, KrylovWorkspace,
+)
+from .precond_numba import (
+    precond_identity, jacobi_setup, precond_jacobi,
+    block_jacobi_setup, precond_block_jacobi, BlockJacobiPrecond,
+    ilu0_setup, precond_ilu0, precond_ilu0_parallel,
+    ic0_setup, precond_ic0, precond_ic0_parallel, IncompleteFactors,
+    precond_superlu, precond_umfpack, precond_gplu, precond_ldl,
+)
+
+__all__ = [
+    'cg_csr', 'bicgstab_csr', 'gmres_csr',
+    'krylov_workspace', 'KrylovWorkspace',
+    'precond_identity', 'jacobi_setup', 'precond_jacobi',
+    'block_jacobi_setup', 'precond_block_jacobi', 'BlockJacobiPrecond',
+    'ilu0_setup', 'precond_ilu0', 'precond_ilu0_parallel',
+    'ic0_setup', 'precond_ic0', 'precond_ic0_parallel', 'IncompleteFactors',
+    'precond_superlu', 'precond_umfpack', 'precond_gplu', 'precond_ldl',
+]
+
+__author__ = 'Tianqi Hong'
@@ -0,0 +1,523 @@
+"""
+Preconditioned Krylov solvers in Numba for CSR matrices.
+    krylov_workspace
+    cg_csr
+    bicgstab_csr
+    gmres_csr
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: krylov_numba.py
+
+import numpy as np
+from numba import njit, int64, float64
+from numba.experimental import jitclass
+
+from sparse_numba.conversion.matrix_conversion_numba import (
+    ensure_float64, ensure_int32, sparse_matvec_csr,
+)
+from sparse_numba.krylov.precond_numba import precond_identity
+
+
+@jitclass([
+    ('n', int64),
+    ('maxiter', int64),
+    ('restart', int64),
+    ('vecs', float64[:, ::1]),
+    ('H', float64[:, ::1]),
+    ('cs', float64[::1]),
+    ('sn', float64[::1]),
+    ('g', float64[::1]),
+    ('x', float64[::1]),
+    ('history', float64[::1]),
+])
+class KrylovWorkspace:
+    """
+    Work arrays for cg_csr, bicgstab_csr and gmres_csr. Passing one to a
+    solver makes the solve allocation-free; the solution and residual
+    history returned are views into x and history, overwritten by the
+    next solve with the same workspace.
+    """
+
+    def __init__(self, n, maxiter, restart):
+        self.n = n
+        self.maxiter = maxiter
+        self.restart = restart
+        self.vecs = np.zeros((max(8, restart + 4), n), dtype=np.float64)
+        self.H = np.zeros((restart + 1, max(restart, 1)), dtype=np.float64)
+        self.cs = np.zeros(restart + 1, dtype=np.float64)
+        self.sn = np.zeros(restart + 1, dtype=np.float64)
+        self.g = np.zeros(restart + 1, dtype=np.float64)
+        self.x = np.zeros(n, dtype=np.float64)
+        self.history = np.zeros(maxiter + 1, dtype=np.float64)
+
+
+@njit(nogil=True)
+def krylov_workspace(n, maxiter=1000, restart=30):
+    """
+    Allocate a KrylovWorkspace for systems of size n.
+
+    Parameters:
+    -----------
+    n : int
+        System size
+    maxiter : int
+        Largest maxiter the workspace will be used with
+    restart : int
+        GMRES restart length m (ignored by CG and BiCGSTAB)
+
+    Returns:
+    --------
+    work : KrylovWorkspace
+        Workspace for the solvers' work argument
+    """
+    return KrylovWorkspace(n, maxiter, restart)
+
+
+# ================================================================
+# Vector kernels (no temporaries)
+# ================================================================
+
+@njit(nogil=True)
+def _dot(u, v):
+    s = 0.0
+    for i in range(len(u)):
+        s += u[i] * v[i]
+    return s
+
+
+@njit(nogil=True)
+def _axpy(alpha, x, y):
+    """y += alpha * x"""
+    for i in range(len(y)):
+        y[i] += alpha * x[i]
+
+
+@njit(nogil=True)
+def _residual(data, indices, indptr, b, x, r):
+    """r = b - A x"""
+    sparse_matvec_csr(data, indices, indptr, x, r)
+    for i in range(len(r)):
+        r[i] = b[i] - r[i]
+
+
+@njit(nogil=True)
+def _setup(n, b, x0, maxiter, restart, work):
+    """Workspace, initial guess and status (0, or -3 on a size mismatch)."""
+    if work is None:
+        ws = KrylovWorkspace(n, maxiter, restart)
+    else:
+        ws = work
+    if len(b) != n or ws.n != n or ws.maxiter < maxiter or ws.restart < restart:
+        print("Error: Length of b or the workspace does not match the matrix")
+        return ws, -3
+    if x0 is None:
+        ws.x[:] = 0.0
+    else:
+        if len(x0) != n:
+            print("Error: Length of x0 does not match the matrix")
+            return ws, -3
+        for i in range(n):
+            ws.x[i] = x0[i]
+    return ws, 0
+
+
+# ================================================================
+# Conjugate gradients
+# ================================================================
+
+@njit(nogil=True)
+def cg_csr(csr_data, csr_indices, csr_indptr, b, x0=None, tol=1e-8, maxiter=1000,
+           precond=None, M=None, work=None):
+    """
+    Preconditioned conjugate gradients for symmetric positive definite A.
+
+    Parameters:
+    -----------
+    csr_data : ndarray (float64)
+        Nonzero values in CSR format
+    csr_indices : ndarray (int32)
+        Column indices in CSR format
+    csr_indptr : ndarray (int32)
+        Row pointers in CSR format
+    b : ndarray (float64)
+        Right-hand side vector
+    x0 : ndarray (float64), optional
+        Initial guess (warm start); zero if not given. Not modified.
+    tol : float
+        Stop when ||b - A x|| <= tol * ||b||
+    maxiter : int
+        Maximum number of iterations
+    precond : function, optional
+        Preconditioner apply(M, r, z) from precond_numba (or any njit
+        function with that signature). SPD for CG. Identity if not given.
+    M : object, optional
+        Preconditioner data passed to precond (inverse diagonal, factor
+        handle, ...)
+    work : KrylovWorkspace, optional
+        Workspace from krylov_workspace; makes the solve allocation-free
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    n_iter : int
+        Number of iterations performed
+    history : ndarray (float64)
+        Relative residual norms ||r_k|| / ||b||, k = 0..n_iter
+    info : int
+        Status code (0 for convergence, 1 if maxiter was reached, -3 for
+        mismatched sizes, -4 for a breakdown (A or M not SPD), otherwise
+        the nonzero status of precond)
+    """
+    data = ensure_float64(csr_data)
+    indices = ensure_int32(csr_indices)
+    indptr = ensure_int32(csr_indptr)
+    n = len(indptr) - 1
+    ws, info = _setup(n, b, x0, maxiter, 0, work)
+    if info != 0:
+        return ws.x, 0, ws.history[:1], info
+
+    x = ws.x
+    hist = ws.history
+    r = ws.vecs[0]
+    z = ws.vecs[1]
+    p = ws.vecs[2]
+    q = ws.vecs[3]
+
+    bnorm = np.sqrt(_dot(b, b))
+    if bnorm == 0.0:
+        x[:] = 0.0
+        hist[0] = 0.0
+        return x, 0, hist[:1], 0
+
+    _residual(data, indices, indptr, b, x, r)
+    rnorm = np.sqrt(_dot(r, r))
+    hist[0] = rnorm / bnorm
+    if rnorm <= tol * bnorm:
+        return x, 0, hist[:1], 0
+
+    if precond is None:
+        info = precond_identity(M, r, z)
+    else:
+        info = precond(M, r, z)
+    if info != 0:
+        return x, 0, hist[:1], info
+    p[:] = z
+    rz = _dot(r, z)
+
+    for it in range(1, maxiter + 1):
+        sparse_matvec_csr(data, indices, indptr, p, q)
+        pq = _dot(p, q)
+        if pq <= 0.0 or rz <= 0.0:
+            return x, it - 1, hist[:it], -4
+        alpha = rz / pq
+        _axpy(alpha, p, x)
+        _axpy(-alpha, q, r)
+        rnorm = np.sqrt(_dot(r, r))
+        hist[it] = rnorm / bnorm
+        if rnorm <= tol * bnorm:
+            return x, it, hist[:it + 1], 0
+
+        if precond is None:
+            info = precond_identity(M, r, z)
+        else:
+            info = precond(M, r, z)
+        if info != 0:
+            return x, it, hist[:it + 1], info
+        rz_new = _dot(r, z)
+        beta = rz_new / rz
+        rz = rz_new
+        for i in range(n):
+            p[i] = z[i] + beta * p[i]
+
+    return x, maxiter, hist[:maxiter + 1], 1
+
+
+# ================================================================
+# BiCGSTAB
+# ================================================================
+
+@njit(nogil=True)
+def bicgstab_csr(csr_data, csr_indices, csr_indptr, b, x0=None, tol=1e-8, maxiter=1000,
+                 precond=None, M=None, work=None):
+    """
+    Right-preconditioned BiCGSTAB for general (unsymmetric) A. The residual
+    history is that of the unpreconditioned system.
+
+    Parameters:
+    -----------
+    csr_data, csr_indices, csr_indptr : ndarray
+        Matrix in CSR format
+    b : ndarray (float64)
+        Right-hand side vector
+    x0 : ndarray (float64), optional
+        Initial guess (warm start); zero if not given. Not modified.
+    tol : float
+        Stop when ||b - A x|| <= tol * ||b||
+    maxiter : int
+        Maximum number of iterations
+    precond : function, optional
+        Preconditioner apply(M, r, z); identity if not given
+    M : object, optional
+        Preconditioner data passed to precond
+    work : KrylovWorkspace, optional
+        Workspace from krylov_workspace; makes the solve allocation-free
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    n_iter : int
+        Number of iterations performed
+    history : ndarray (float64)
+        Relative residual norms ||r_k|| / ||b||, k = 0..n_iter
+    info : int
+        Status code (0 for convergence, 1 if maxiter was reached, -3 for
+        mismatched sizes, -4 for a breakdown, otherwise the nonzero status
+        of precond)
+    """
+    data = ensure_float64(csr_data)
+    indices = ensure_int32(csr_indices)
+    indptr = ensure_int32(csr_indptr)
+    n = len(indptr) - 1
+    ws, info = _setup(n, b, x0, maxiter, 0, work)
+    if info != 0:
+        return ws.x, 0, ws.history[:1], info
+
+    x = ws.x
+    hist = ws.history
+    r = ws.vecs[0]
+    rhat = ws.vecs[1]
+    p = ws.vecs[2]
+    v = ws.vecs[3]
+    s = ws.vecs[4]
+    t = ws.vecs[5]
+    phat = ws.vecs[6]
+    shat = ws.vecs[7]
+
+    bnorm = np.sqrt(_dot(b, b))
+    if bnorm == 0.0:
+        x[:] = 0.0
+        hist[0] = 0.0
+        return x, 0, hist[:1], 0
+
+    _residual(data, indices, indptr, b, x, r)
+    rnorm = np.sqrt(_dot(r, r))
+    hist[0] = rnorm / bnorm
+    if rnorm <= tol * bnorm:
+        return x, 0, hist[:1], 0
+
+    rhat[:] = r
+    p[:] = 0.0
+    v[:] = 0.0
+    rho_old = 1.0
+    alpha = 1.0
+    omega = 1.0
+
+    for it in range(1, maxiter + 1):
+        rho = _dot(rhat, r)
+        if rho == 0.0 or omega == 0.0:
+            return x, it - 1, hist[:it], -4
+        beta = (rho / rho_old) * (alpha / omega)
+        for i in range(n):
+            p[i] = r[i] + beta * (p[i] - omega * v[i])
+
+        if precond is None:
+            info = precond_identity(M, p, phat)
+        else:
+            info = precond(M, p, phat)
+        if info != 0:
+            return x, it - 1, hist[:it], info
+        sparse_matvec_csr(data, indices, indptr, phat, v)
+        rv = _dot(rhat, v)
+        if rv == 0.0:
+            return x, it - 1, hist[:it], -4
+        alpha = rho / rv
+        for i in range(n):
+            s[i] = r[i] - alpha * v[i]
+        snorm = np.sqrt(_dot(s, s))
+        if snorm <= tol * bnorm:
+            _axpy(alpha, phat, x)
+            r[:] = s
+            hist[it] = snorm / bnorm
+            return x, it, hist[:it + 1], 0
+
+        if precond is None:
+            info = precond_identity(M, s, shat)
+        else:
+            info = precond(M, s, shat)
+        if info != 0:
+            return x, it - 1, hist[:it], info
+        sparse_matvec_csr(data, indices, indptr, shat, t)
+        tt = _dot(t, t)
+        omega = _dot(t, s) / tt if tt > 0.0 else 0.0
+        for i in range(n):
+            x[i] += alpha * phat[i] + omega * shat[i]
+            r[i] = s[i] - omega * t[i]
+        rnorm = np.sqrt(_dot(r, r))
+        hist[it] = rnorm / bnorm
+        if rnorm <= tol * bnorm:
+            return x, it, hist[:it + 1], 0
+        rho_old = rho
+
+    return x, maxiter, hist[:maxiter + 1], 1
+
+
+# ================================================================
+# Restarted GMRES
+# ================================================================
+
+@njit(nogil=True)
+def gmres_csr(csr_data, csr_indices, csr_indptr, b, x0=None, tol=1e-8, maxiter=1000,
+              restart=30, precond=None, M=None, work=None):
+    """
+    Right-preconditioned restarted GMRES(m) for general A, with modified
+    Gram-Schmidt and Givens rotations. Every inner (Arnoldi) step counts
+    as one iteration; its residual estimate is that of the
+    unpreconditioned system.
+
+    Parameters:
+    -----------
+    csr_data, csr_indices, csr_indptr : ndarray
+        Matrix in CSR format
+    b : ndarray (float64)
+        Right-hand side vector
+    x0 : ndarray (float64), optional
+        Initial guess (warm start); zero if not given. Not modified.
+    tol : float
+        Stop when ||b - A x|| <= tol * ||b||
+    maxiter : int
+        Maximum total number of inner iterations
+    restart : int
+        Krylov subspace size m between restarts
+    precond : function, optional
+        Preconditioner apply(M, r, z); identity if not given
+    M : object, optional
+        Preconditioner data passed to precond
+    work : KrylovWorkspace, optional
+        Workspace from krylov_workspace(n, maxiter, restart) (or a larger
+        restart); makes the solve allocation-free
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    n_iter : int
+        Number of inner iterations performed
+    history : ndarray (float64)
+        Relative residual norms ||r_k|| / ||b||, k = 0..n_iter
+    info : int
+        Status code (0 for convergence, 1 if maxiter was reached, -3 for
+        mismatched sizes or restart < 1, otherwise the nonzero status of
+        precond)
+    """
+    data = ensure_float64(csr_data)
+    indices = ensure_int32(csr_indices)
+    indptr = ensure_int32(csr_indptr)
+    n = len(indptr) - 1
+    if restart < 1:
+        print("Error: restart must be positive")
+        ws, info = _setup(n, b, x0, maxiter, 1, work)
+        return ws.x, 0, ws.history[:1], -3
+    ws, info = _setup(n, b, x0, maxiter, restart, work)
+    if info != 0:
+        return ws.x, 0, ws.history[:1], info
+
+    x = ws.x
+    hist = ws.history
+    V = ws.vecs
+    w = V[restart + 1]
+    u = V[restart + 2]
+    z = V[restart + 3]
+    H = ws.H
+    cs = ws.cs
+    sn = ws.sn
+    g = ws.g
+
+    bnorm = np.sqrt(_dot(b, b))
+    if bnorm == 0.0:
+        x[:] = 0.0
+        hist[0] = 0.0
+        return x, 0, hist[:1], 0
+
+    it = 0
+    while True:
+        _residual(data, indices, indptr, b, x, w)
+        beta = np.sqrt(_dot(w, w))
+        if it == 0:
+            hist[0] = beta / bnorm
+        if beta <= tol * bnorm:
+            return x, it, hist[:it + 1], 0
+        if it >= maxiter:
+            return x, it, hist[:it + 1], 1
+
+        for i in range(n):
+            V[0, i] = w[i] / beta
+        g[:] = 0.0
+        g[0] = beta
+
+        k = 0
+        for j in range(restart):
+            it += 1
+            k = j + 1
+            if precond is None:
+                info = precond_identity(M, V[j], z)
+            else:
+                info = precond(M, V[j], z)
+            if info != 0:
+                return x, it - 1, hist[:it], info
+            sparse_matvec_csr(data, indices, indptr, z, w)
+            for i in range(j + 1):
+                h = _dot(w, V[i])
+                H[i, j] = h
+                _axpy(-h, V[i], w)
+            h_next = np.sqrt(_dot(w, w))
+            if h_next > 0.0:
+                for i in range(n):
+                    V[j + 1, i] = w[i] / h_next
+
+            # Apply the previous rotations, then eliminate H[j + 1, j]
+            for i in range(j):
+                tmp = cs[i] * H[i, j] + sn[i] * H[i + 1, j]
+                H[i + 1, j] = -sn[i] * H[i, j] + cs[i] * H[i + 1, j]
+                H[i, j] = tmp
+            denom = np.sqrt(H[j, j] * H[j, j] + h_next * h_next)
+            if denom == 0.0:
+                cs[j] = 1.0
+                sn[j] = 0.0
+            else:
+                cs[j] = H[j, j] / denom
+                sn[j] = h_next / denom
+            H[j, j] = cs[j] * H[j, j] + sn[j] * h_next
+            g[j + 1] = -sn[j] * g[j]
+            g[j] = cs[j] * g[j]
+
+            resid = abs(g[j + 1])
+            hist[it] = resid / bnorm
+            if resid <= tol * bnorm or h_next == 0.0 or it >= maxiter:
+                break
+
+        # y = H[:k, :k]^{-1} g[:k] (stored in g), x += M^{-1} V[:k]^T y
+        for i in range(k - 1, -1, -1):
+            s = g[i]
+            for l in range(i + 1, k):
+                s -= H[i, l] * g[l]
+            g[i] = s / H[i, i] if H[i, i] != 0.0 else 0.0
+        u[:] = 0.0
+        for i in range(k):
+            _axpy(g[i], V[i], u)
+        if precond is None:
+            info = precond_identity(M, u, z)
+        else:
+            info = precond(M, u, z)
+        if info != 0:
+            return x, it, hist[:it + 1], info
+        _axpy(1.0, z, x)
+
+        if hist[it] * bnorm <= tol * bnorm:
+            return x, it, hist[:it + 1], 0
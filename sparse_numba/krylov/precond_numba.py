@@ -0,0 +1,623 @@
+"""
+Preconditioners for the Krylov solvers in krylov_numba.
+A preconditioner is a pair (apply, M): apply(M, r, z) writes M^{-1} r
+into z and returns a status code (0 for success).
+    precond_identity
+    jacobi_setup, precond_jacobi
+    block_jacobi_setup, precond_block_jacobi
+    ilu0_setup, precond_ilu0, precond_ilu0_parallel
+    ic0_setup, precond_ic0, precond_ic0_parallel
+    precond_superlu, precond_umfpack
+    precond_gplu, precond_ldl
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: precond_numba.py
+
+import numpy as np
+from numba import njit, prange, int32, int64, float64
+from numba.experimental import jitclass
+
+from sparse_numba.conversion.matrix_conversion_numba import ensure_float64, ensure_int32
+from sparse_numba.dense.dense_lu_numba import _lu_factor_inplace, _lu_solve_factored_inplace
+from sparse_numba.gplu.gplu_numba import gplu_solve_factored
+from sparse_numba.cholesky.cholesky_numba import ldl_solve_factored
+
+try:
+    from sparse_numba.sparse_superlu.superlu_numba_interface import (
+        c_solve_with_factors as _c_superlu_solve_with_factors,
+    )
+    _HAS_SUPERLU = True
+except ImportError:
+    _HAS_SUPERLU = False
+
+try:
+    from sparse_numba.sparse_umfpack.umfpack_numba_interface import (
+        c_solve_with_factors as _c_umfpack_solve_with_factors,
+    )
+    _HAS_UMFPACK = True
+except ImportError:
+    _HAS_UMFPACK = False
+
+
+@njit(nogil=True)
+def precond_identity(M, r, z):
+    """No preconditioning: z = r. M is ignored."""
+    for i in range(len(r)):
+        z[i] = r[i]
+    return 0
+
+
+@njit(nogil=True)
+def jacobi_setup(csr_data, csr_indices, csr_indptr):
+    """
+    Build the point Jacobi preconditioner M = diag(A).
+
+    Parameters:
+    -----------
+    csr_data : ndarray (float64)
+        Nonzero values in CSR format
+    csr_indices : ndarray (int32)
+        Column indices in CSR format
+    csr_indptr : ndarray (int32)
+        Row pointers in CSR format
+
+    Returns:
+    --------
+    inv_diag : ndarray (float64)
+        Inverse diagonal of A, the M argument of precond_jacobi
+    info : int
+        Status code (0 for success, k + 1 if the diagonal entry of row k is
+        zero or missing)
+    """
+    data = ensure_float64(csr_data)
+    indices = ensure_int32(csr_indices)
+    indptr = ensure_int32(csr_indptr)
+    n = len(indptr) - 1
+    diag = np.zeros(n, dtype=np.float64)
+    for i in range(n):
+        for p in range(indptr[i], indptr[i + 1]):
+            if indices[p] == i:
+                diag[i] += data[p]
+
+    inv_diag = np.ones(n, dtype=np.float64)
+    for i in range(n):
+        if diag[i] == 0.0:
+            print("Error: Zero diagonal entry in Jacobi preconditioner")
+            return inv_diag, i + 1
+        inv_diag[i] = 1.0 / diag[i]
+    return inv_diag, 0
+
+
+@njit(nogil=True)
+def precond_jacobi(inv_diag, r, z):
+    """Point Jacobi: z = D^{-1} r, with inv_diag from jacobi_setup."""
+    for i in range(len(r)):
+        z[i] = inv_diag[i] * r[i]
+    return 0
+
+
+# ================================================================
+# Block-Jacobi
+# ================================================================
+
+@jitclass([
+    ('block_ptr', int32[::1]),
+    ('lu', float64[:, :, ::1]),
+    ('piv', int32[:, ::1]),
+])
+class BlockJacobiPrecond:
+    """
+    LU factors of the dense diagonal blocks of A. Block k covers rows and
+    columns block_ptr[k]:block_ptr[k + 1]; its factors are in the leading
+    corner of lu[k] and piv[k].
+    """
+
+    def __init__(self, block_ptr, lu, piv):
+        self.block_ptr = block_ptr
+        self.lu = lu
+        self.piv = piv
+
+
+@njit(nogil=True)
+def block_jacobi_setup(csr_data, csr_indices, csr_indptr, block_size=4, block_ptr=None):
+    """
+    Build a block-Jacobi preconditioner: the dense diagonal blocks of A,
+    each factorized with partial pivoting. Entries outside the blocks are
+    ignored.
+
+    Parameters:
+    -----------
+    csr_data : ndarray (float64)
+        Nonzero values in CSR format
+    csr_indices : ndarray (int32)
+        Column indices in CSR format
+    csr_indptr : ndarray (int32)
+        Row pointers in CSR format
+    block_size : int
+        Size of the blocks (the last block may be smaller)
+    block_ptr : ndarray (int32), optional
+        Block boundaries [0, ..., n] for blocks of varying size; overrides
+        block_size
+
+    Returns:
+    --------
+    M : BlockJacobiPrecond
+        The M argument of precond_block_jacobi
+    info : int
+        Status code (0 for success, i + 1 if the block containing row i
+        has a zero pivot there, -3 for invalid block sizes)
+    """
+    data = ensure_float64(csr_data)
+    indices = ensure_int32(csr_indices)
+    indptr = ensure_int32(csr_indptr)
+    n = len(indptr) - 1
+
+    if block_ptr is None:
+        bs = max(block_size, 1)
+        nb = (n + bs - 1) // bs
+        bptr = np.empty(nb + 1, dtype=np.int32)
+        for k in range(nb):
+            bptr[k] = k * bs
+        bptr[nb] = n
+    else:
+        bptr = ensure_int32(block_ptr).copy()
+        nb = len(bptr) - 1
+    m_max = 0
+    valid = nb >= 1 and bptr[0] == 0 and bptr[nb] == n
+    for k in range(nb):
+        if bptr[k + 1] <= bptr[k]:
+            valid = False
+        m_max = max(m_max, bptr[k + 1] - bptr[k])
+    if not valid:
+        print("Error: Block boundaries must increase from 0 to n")
+        return BlockJacobiPrecond(np.zeros(1, dtype=np.int32), np.zeros((0, 0, 0)),
+                                  np.zeros((0, 0), dtype=np.int32)), -3
+
+    lu = np.zeros((nb, m_max, m_max), dtype=np.float64)
+    piv = np.zeros((nb, m_max), dtype=np.int32)
+    for k in range(nb):
+        start = bptr[k]
+        stop = bptr[k + 1]
+        for i in range(start, stop):
+            for p in range(indptr[i], indptr[i + 1]):
+                j = indices[p]
+                if start <= j < stop:
+                    lu[k, i - start, j - start] += data[p]
+    M = BlockJacobiPrecond(bptr, lu, piv)
+    for k in range(nb):
+        m = bptr[k + 1] - bptr[k]
+        info = _lu_factor_inplace(lu[k, :m, :m], piv[k, :m])
+        if info != 0:
+            print("Error: Singular diagonal block in block-Jacobi preconditioner")
+            return M, bptr[k] + info
+    return M, 0
+
+
+@njit(nogil=True)
+def precond_block_jacobi(M, r, z):
+    """Block-Jacobi: z = blockdiag(A)^{-1} r, with M from block_jacobi_setup."""
+    bptr = M.block_ptr
+    for k in range(len(bptr) - 1):
+        start = bptr[k]
+        stop = bptr[k + 1]
+        for i in range(start, stop):
+            z[i] = r[i]
+        m = stop - start
+        _lu_solve_factored_inplace(M.lu[k, :m, :m], M.piv[k, :m], z[start:stop])
+    return 0
+
+
+# ================================================================
+# Incomplete factorizations: ILU(0) and IC(0)
+# ================================================================
+
+@jitclass([
+    ('n', int64),
+    ('l_indptr', int32[::1]),
+    ('l_indices', int32[::1]),
+    ('l_data', float64[::1]),
+    ('l_diag', float64[::1]),
+    ('u_indptr', int32[::1]),
+    ('u_indices', int32[::1]),
+    ('u_data', float64[::1]),
+    ('u_diag', float64[::1]),
+    ('l_level_ptr', int32[::1]),
+    ('l_level_rows', int32[::1]),
+    ('u_level_ptr', int32[::1]),
+    ('u_level_rows', int32[::1]),
+])
+class IncompleteFactors:
+    """
+    Incomplete factors M = L U from ilu0_setup or ic0_setup. The strictly
+    lower part of L and strictly upper part of U are CSR matrices; their
+    diagonals are l_diag and u_diag (l_diag is all ones for ILU(0), and
+    U = L^T for IC(0)).
+
+    The level sets group rows whose triangular-solve updates are
+    independent: rows l_level_rows[l_level_ptr[l]:l_level_ptr[l + 1]] of
+    L depend only on rows in earlier levels (likewise for U, backwards).
+    """
+
+    def __init__(self, n, l_indptr, l_indices, l_data, l_diag,
+                 u_indptr, u_indices, u_data, u_diag):
+        self.n = n
+        self.l_indptr = l_indptr
+        self.l_indices = l_indices
+        self.l_data = l_data
+        self.l_diag = l_diag
+        self.u_indptr = u_indptr
+        self.u_indices = u_indices
+        self.u_data = u_data
+        self.u_diag = u_diag
+        level_ptr, level_rows = _level_sets(n, l_indptr, l_indices, False)
+        self.l_level_ptr = level_ptr
+        self.l_level_rows = level_rows
+        level_ptr, level_rows = _level_sets(n, u_indptr, u_indices, True)
+        self.u_level_ptr = level_ptr
+        self.u_level_rows = level_rows
+
+    @property
+    def n_levels(self):
+        """Number of levels in the forward and backward solves."""
+        return len(self.l_level_ptr) - 1, len(self.u_level_ptr) - 1
+
+
+@njit(nogil=True)
+def _level_sets(n, indptr, indices, upper):
+    """
+    Level schedule of a strictly triangular CSR matrix: level[i] is one
+    more than the highest level among the rows that row i depends on.
+    Returns level_ptr and the rows sorted by level.
+    """
+    level = np.zeros(n, dtype=np.int32)
+    n_levels = 0
+    for t in range(n):
+        i = n - 1 - t if upper else t
+        lev = 0
+        for p in range(indptr[i], indptr[i + 1]):
+            lev = max(lev, level[indices[p]] + 1)
+        level[i] = lev
+        n_levels = max(n_levels, lev + 1)
+
+    level_ptr = np.zeros(n_levels + 1, dtype=np.int32)
+    for i in range(n):
+        level_ptr[level[i] + 1] += 1
+    for lev in range(n_levels):
+        level_ptr[lev + 1] += level_ptr[lev]
+    fill = level_ptr[:n_levels].copy()
+    level_rows = np.empty(n, dtype=np.int32)
+    for i in range(n):
+        level_rows[fill[level[i]]] = i
+        fill[level[i]] += 1
+    return level_ptr, level_rows
+
+
+@njit(nogil=True)
+def _sorted_csr(csr_data, csr_indices, csr_indptr):
+    """Copy of a CSR matrix with sorted column indices in every row."""
+    data = ensure_float64(csr_data).copy()
+    indices = ensure_int32(csr_indices).copy()
+    indptr = ensure_int32(csr_indptr)
+    for i in range(len(indptr) - 1):
+        start = indptr[i]
+        stop = indptr[i + 1]
+        for p in range(start + 1, stop):
+            if indices[p] < indices[p - 1]:
+                order = np.argsort(indices[start:stop], kind='mergesort')
+                indices[start:stop] = indices[start:stop][order]
+                data[start:stop] = data[start:stop][order]
+                break
+    return data, indices, indptr
+
+
+@njit(nogil=True)
+def _split_triangles(n, indptr, indices, data):
+    """Strictly lower and strictly upper CSR parts, and the diagonal."""
+    l_cnt = np.zeros(n + 1, dtype=np.int32)
+    u_cnt = np.zeros(n + 1, dtype=np.int32)
+    for i in range(n):
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            if j < i:
+                l_cnt[i + 1] += 1
+            elif j > i:
+                u_cnt[i + 1] += 1
+    for i in range(n):
+        l_cnt[i + 1] += l_cnt[i]
+        u_cnt[i + 1] += u_cnt[i]
+    l_indices = np.empty(l_cnt[n], dtype=np.int32)
+    l_data = np.empty(l_cnt[n], dtype=np.float64)
+    u_indices = np.empty(u_cnt[n], dtype=np.int32)
+    u_data = np.empty(u_cnt[n], dtype=np.float64)
+    diag = np.zeros(n, dtype=np.float64)
+    for i in range(n):
+        ql = l_cnt[i]
+        qu = u_cnt[i]
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            if j < i:
+                l_indices[ql] = j
+                l_data[ql] = data[p]
+                ql += 1
+            elif j > i:
+                u_indices[qu] = j
+                u_data[qu] = data[p]
+                qu += 1
+            else:
+                diag[i] = data[p]
+    return l_cnt, l_indices, l_data, u_cnt, u_indices, u_data, diag
+
+
+@njit(nogil=True)
+def ilu0_setup(csr_data, csr_indices, csr_indptr):
+    """
+    Incomplete LU factorization with zero fill-in, ILU(0): L and U keep
+    the sparsity pattern of A.
+
+    Parameters:
+    -----------
+    csr_data : ndarray (float64)
+        Nonzero values in CSR format (duplicates must be summed)
+    csr_indices : ndarray (int32)
+        Column indices in CSR format
+    csr_indptr : ndarray (int32)
+        Row pointers in CSR format
+
+    Returns:
+    --------
+    M : IncompleteFactors
+        The M argument of precond_ilu0 / precond_ilu0_parallel
+    info : int
+        Status code (0 for success, i + 1 if the pivot of row i is zero or
+        the diagonal entry is missing)
+    """
+    data, indices, indptr = _sorted_csr(csr_data, csr_indices, csr_indptr)
+    n = len(indptr) - 1
+    diag_ptr = np.full(n, -1, dtype=np.int32)
+    for i in range(n):
+        for p in range(indptr[i], indptr[i + 1]):
+            if indices[p] == i:
+                diag_ptr[i] = p
+
+    info = 0
+    pos = np.full(n, -1, dtype=np.int32)
+    for i in range(n):
+        if diag_ptr[i] < 0:
+            info = i + 1
+            break
+        for p in range(indptr[i], indptr[i + 1]):
+            pos[indices[p]] = p
+        for p in range(indptr[i], diag_ptr[i]):
+            k = indices[p]
+            l_ik = data[p] / data[diag_ptr[k]]
+            data[p] = l_ik
+            for q in range(diag_ptr[k] + 1, indptr[k + 1]):
+                t = pos[indices[q]]
+                if t >= 0:
+                    data[t] -= l_ik * data[q]
+        for p in range(indptr[i], indptr[i + 1]):
+            pos[indices[p]] = -1
+        if data[diag_ptr[i]] == 0.0:
+            info = i + 1
+            break
+
+    l_ptr, l_idx, l_val, u_ptr, u_idx, u_val, diag = _split_triangles(n, indptr, indices, data)
+    M = IncompleteFactors(n, l_ptr, l_idx, l_val, np.ones(n, dtype=np.float64),
+                          u_ptr, u_idx, u_val, diag)
+    if info != 0:
+        print("Error: Zero pivot in ILU(0)")
+    return M, info
+
+
+@njit(nogil=True)
+def ic0_setup(csr_data, csr_indices, csr_indptr):
+    """
+    Incomplete Cholesky factorization with zero fill-in, IC(0), of a
+    symmetric positive definite matrix: M = L L^T with L on the pattern
+    of the lower triangle of A. Only the lower triangle is read.
+
+    Parameters:
+    -----------
+    csr_data : ndarray (float64)
+        Nonzero values in CSR format (duplicates must be summed)
+    csr_indices : ndarray (int32)
+        Column indices in CSR format
+    csr_indptr : ndarray (int32)
+        Row pointers in CSR format
+
+    Returns:
+    --------
+    M : IncompleteFactors
+        The M argument of precond_ic0 / precond_ic0_parallel
+    info : int
+        Status code (0 for success, i + 1 if the pivot of row i is not
+        positive; IC(0) can break down even for SPD A)
+    """
+    data, indices, indptr = _sorted_csr(csr_data, csr_indices, csr_indptr)
+    n = len(indptr) - 1
+
+    # Lower triangle (diagonal last in each row)
+    lptr = np.zeros(n + 1, dtype=np.int32)
+    for i in range(n):
+        for p in range(indptr[i], indptr[i + 1]):
+            if indices[p] <= i:
+                lptr[i + 1] += 1
+    for i in range(n):
+        lptr[i + 1] += lptr[i]
+    lidx = np.empty(lptr[n], dtype=np.int32)
+    lval = np.empty(lptr[n], dtype=np.float64)
+    q = 0
+    for i in range(n):
+        for p in range(indptr[i], indptr[i + 1]):
+            if indices[p] <= i:
+                lidx[q] = indices[p]
+                lval[q] = data[p]
+                q += 1
+
+    info = 0
+    for i in range(n):
+        if lptr[i + 1] == lptr[i] or lidx[lptr[i + 1] - 1] != i:
+            info = i + 1
+            break
+        for p in range(lptr[i], lptr[i + 1]):
+            j = lidx[p]
+            # s = a_ij - sum_{k < j} L_ik L_jk over the common pattern
+            s = lval[p]
+            a = lptr[i]
+            b = lptr[j]
+            while a < p and b < lptr[j + 1] - 1:
+                ca = lidx[a]
+                cb = lidx[b]
+                if ca == cb:
+                    s -= lval[a] * lval[b]
+                    a += 1
+                    b += 1
+                elif ca < cb:
+                    a += 1
+                else:
+                    b += 1
+            if j < i:
+                lval[p] = s / lval[lptr[j + 1] - 1]
+            elif s > 0.0:
+                lval[p] = np.sqrt(s)
+            else:
+                info = i + 1
+                break
+        if info != 0:
+            break
+
+    if info != 0:
+        print("Error: Non-positive pivot in IC(0)")
+
+    # L without its diagonal, and U = L^T by rows
+    l_ptr, l_idx, l_val, _, _, _, diag = _split_triangles(n, lptr, lidx, lval)
+    u_ptr = np.zeros(n + 1, dtype=np.int32)
+    for p in range(len(l_idx)):
+        u_ptr[l_idx[p] + 1] += 1
+    for i in range(n):
+        u_ptr[i + 1] += u_ptr[i]
+    fill = u_ptr[:n].copy()
+    u_idx = np.empty(len(l_idx), dtype=np.int32)
+    u_val = np.empty(len(l_idx), dtype=np.float64)
+    for i in range(n):
+        for p in range(l_ptr[i], l_ptr[i + 1]):
+            j = l_idx[p]
+            u_idx[fill[j]] = i
+            u_val[fill[j]] = l_val[p]
+            fill[j] += 1
+    return IncompleteFactors(n, l_ptr, l_idx, l_val, diag.copy(),
+                             u_ptr, u_idx, u_val, diag), info
+
+
+@njit(nogil=True)
+def _forward_row(M, i, r, z):
+    s = r[i]
+    for p in range(M.l_indptr[i], M.l_indptr[i + 1]):
+        s -= M.l_data[p] * z[M.l_indices[p]]
+    z[i] = s / M.l_diag[i]
+
+
+@njit(nogil=True)
+def _backward_row(M, i, z):
+    s = z[i]
+    for p in range(M.u_indptr[i], M.u_indptr[i + 1]):
+        s -= M.u_data[p] * z[M.u_indices[p]]
+    z[i] = s / M.u_diag[i]
+
+
+@njit(nogil=True)
+def precond_ilu0(M, r, z):
+    """z = (L U)^{-1} r with the factors from ilu0_setup or ic0_setup."""
+    n = M.n
+    for i in range(n):
+        _forward_row(M, i, r, z)
+    for i in range(n - 1, -1, -1):
+        _backward_row(M, i, z)
+    return 0
+
+
+@njit(nogil=True, parallel=True)
+def precond_ilu0_parallel(M, r, z):
+    """
+    Same as precond_ilu0, with the rows of each level solved in parallel.
+    Worth it for large systems with few levels; inside a prange batch use
+    the serial precond_ilu0.
+    """
+    lp = M.l_level_ptr
+    lr = M.l_level_rows
+    for lev in range(len(lp) - 1):
+        for t in prange(lp[lev], lp[lev + 1]):
+            _forward_row(M, lr[t], r, z)
+    up = M.u_level_ptr
+    ur = M.u_level_rows
+    for lev in range(len(up) - 1):
+        for t in prange(up[lev], up[lev + 1]):
+            _backward_row(M, ur[t], z)
+    return 0
+
+
+@njit(nogil=True)
+def precond_ic0(M, r, z):
+    """z = (L L^T)^{-1} r with the factors from ic0_setup."""
+    return precond_ilu0(M, r, z)
+
+
+@njit(nogil=True)
+def precond_ic0_parallel(M, r, z):
+    """Level-scheduled parallel precond_ic0."""
+    return precond_ilu0_parallel(M, r, z)
+
+
+if _HAS_SUPERLU:
+    @njit(nogil=True)
+    def precond_superlu(handle, r, z):
+        """
+        Solve with SuperLU factors of M (a handle from superlu_factorize_*).
+        Writes directly into z, so no memory is allocated.
+        """
+        return _c_superlu_solve_with_factors(handle, r.ctypes.data, z.ctypes.data, 1)
+else:
+    @njit(nogil=True)
+    def precond_superlu(handle, r, z):
+        """SuperLU is not available in this installation."""
+        print("Error: SuperLU is not available")
+        return -5
+
+
+if _HAS_UMFPACK:
+    @njit(nogil=True)
+    def precond_umfpack(handle, r, z):
+        """
+        Solve with UMFPACK factors of M (a handle from umfpack_factorize_*).
+        Writes directly into z, so no memory is allocated.
+        """
+        return _c_umfpack_solve_with_factors(handle, r.ctypes.data, z.ctypes.data, 1)
+else:
+    @njit(nogil=True)
+    def precond_umfpack(handle, r, z):
+        """UMFPACK is not available in this installation."""
+        print("Error: UMFPACK is not available")
+        return -5
+
+
+@njit(nogil=True)
+def precond_gplu(factors, r, z):
+    """Solve with GPLUFactors of M from gplu_factorize_csc."""
+    x, info = gplu_solve_factored(factors, r)
+    for i in range(len(x)):
+        z[i] = x[i]
+    return info
+
+
+@njit(nogil=True)
+def precond_ldl(factors, r, z):
+    """Solve with LDLFactors of M from ldl_factorize_* or cholesky_factorize_*."""
+    x, info = ldl_solve_factored(factors, r)
+    for i in range(len(x)):
+        z[i] = x[i]
+    return info
@@ -0,0 +1,186 @@
+"""
+Tests for the Krylov solvers (CG, BiCGSTAB, GMRES) and the basic
+preconditioners. Only pure-Numba preconditioners are used, so the tests
+run without the SuperLU / UMFPACK libraries.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_krylov.py
+
+import numpy as np
+import scipy.sparse as sp
+from numba import njit, prange
+from numba.typed import List
+from sparse_numba.krylov.krylov_numba import (
+    cg_csr,
+    bicgstab_csr,
+    gmres_csr,
+    krylov_workspace,
+)
+from sparse_numba.krylov.precond_numba import (
+    jacobi_setup,
+    precond_jacobi,
+    precond_gplu,
+    precond_ldl,
+)
+from sparse_numba.gplu.gplu_numba import gplu_factorize_csc
+from sparse_numba.cholesky.cholesky_numba import cholesky_factorize_csc
+
+
+def _laplacian_2d(m):
+    """SPD 5-point Laplacian with a varying diagonal, as CSR."""
+    T = sp.diags([-np.ones(m - 1), 4.0 * np.ones(m), -np.ones(m - 1)], [-1, 0, 1])
+    A = sp.kronsum(T, T) + sp.diags(np.linspace(0.0, 10.0, m * m))
+    return A.tocsr()
+
+
+def _make_test_matrix(n=200, density=0.02, seed=42):
+    """Random unsymmetric, diagonally dominant matrix, as CSR."""
+    A = sp.random(n, n, density=density, random_state=seed)
+    A = A + sp.diags(np.abs(A).sum(axis=1).A1 + 1.0)
+    return A.tocsr()
+
+
+def test_cg():
+    """CG with and without Jacobi, and a warm start."""
+    print("Test: cg_csr")
+    A = _laplacian_2d(20)
+    n = A.shape[0]
+    b = np.random.default_rng(0).standard_normal(n)
+
+    x, n_iter, hist, info = cg_csr(A.data, A.indices, A.indptr, b, tol=1e-10)
+    assert info == 0 and len(hist) == n_iter + 1
+    assert np.linalg.norm(A @ x - b) <= 1e-10 * np.linalg.norm(b) * 1.01
+    assert hist[-1] <= 1e-10 and hist[0] == 1.0
+
+    inv_diag, info = jacobi_setup(A.data, A.indices, A.indptr)
+    assert info == 0
+    xj, n_jac, hist, info = cg_csr(A.data, A.indices, A.indptr, b, None, 1e-10, 1000,
+                                   precond_jacobi, inv_diag)
+    assert info == 0 and n_jac <= n_iter
+    assert np.allclose(xj, x)
+
+    # Warm start from the solution converges immediately
+    _, n_warm, _, info = cg_csr(A.data, A.indices, A.indptr, b, x, 1e-8)
+    assert info == 0 and n_warm == 0
+
+    # Not enough iterations
+    _, n_iter, hist, info = cg_csr(A.data, A.indices, A.indptr, b, None, 1e-12, 5)
+    assert info == 1 and n_iter == 5 and len(hist) == 6
+    print("  PASSED")
+
+
+def test_bicgstab_and_gmres():
+    """Unsymmetric solvers with identity, Jacobi and GP-LU preconditioners."""
+    print("Test: bicgstab_csr and gmres_csr")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    b = np.random.default_rng(1).standard_normal(n)
+    inv_diag, _ = jacobi_setup(A.data, A.indices, A.indptr)
+
+    for solver in (bicgstab_csr, gmres_csr):
+        x, n_iter, hist, info = solver(A.data, A.indices, A.indptr, b, tol=1e-10)
+        assert info == 0 and len(hist) == n_iter + 1
+        assert np.linalg.norm(A @ x - b) <= 1e-9 * np.linalg.norm(b)
+
+        x, _, _, info = solver(A.data, A.indices, A.indptr, b, None, 1e-10, 1000,
+                               precond=precond_jacobi, M=inv_diag)
+        assert info == 0
+        assert np.linalg.norm(A @ x - b) <= 1e-9 * np.linalg.norm(b)
+
+    # An exact factorization of A makes the preconditioned system trivial
+    Ac = A.tocsc()
+    factors, info = gplu_factorize_csc(Ac.data, Ac.indices, Ac.indptr)
+    x, n_iter, _, info = gmres_csr(A.data, A.indices, A.indptr, b, tol=1e-10,
+                                   precond=precond_gplu, M=factors)
+    assert info == 0 and n_iter <= 2
+
+    # Small restart still converges; the history covers every inner step
+    x, n_iter, hist, info = gmres_csr(A.data, A.indices, A.indptr, b, None, 1e-10, 1000, 5)
+    assert info == 0 and len(hist) == n_iter + 1
+    assert np.linalg.norm(A @ x - b) <= 1e-9 * np.linalg.norm(b)
+    print("  PASSED")
+
+
+def test_workspace_and_errors():
+    """Reusing a workspace, error codes and a zero right-hand side."""
+    print("Test: workspace reuse and error codes")
+    A = _laplacian_2d(10)
+    n = A.shape[0]
+    work = krylov_workspace(n, 200, 10)
+    Ac = A.tocsc()
+    factors, _ = cholesky_factorize_csc(Ac.data, Ac.indices, Ac.indptr)
+    for k in range(3):
+        b = np.full(n, k + 1.0)
+        x, _, _, info = cg_csr(A.data, A.indices, A.indptr, b, None, 1e-10, 200,
+                               precond_ldl, factors, work)
+        assert info == 0 and np.allclose(A @ x, b)
+        x, _, _, info = gmres_csr(A.data, A.indices, A.indptr, b, None, 1e-10, 200, 10,
+                                  None, None, work)
+        assert info == 0 and np.allclose(A @ x, b)
+
+    x, n_iter, _, info = cg_csr(A.data, A.indices, A.indptr, np.zeros(n))
+    assert info == 0 and n_iter == 0 and not x.any()
+    _, _, _, info = cg_csr(A.data, A.indices, A.indptr, np.ones(n - 1))
+    assert info == -3
+    _, _, _, info = gmres_csr(A.data, A.indices, A.indptr, np.ones(n), None, 1e-8, 200, 20,
+                              None, None, work)
+    assert info == -3
+
+    # CG on an indefinite matrix breaks down
+    D = sp.diags(np.r_[np.ones(5), -np.ones(5)]).tocsr()
+    _, _, _, info = cg_csr(D.data, D.indices, D.indptr, np.ones(10))
+    assert info == -4
+    _, info = jacobi_setup(np.array([1.0]), np.array([1], dtype=np.int32),
+                           np.array([0, 1, 1], dtype=np.int32))
+    assert info == 1
+    print("  PASSED")
+
+
+@njit(nogil=True, parallel=True)
+def _solve_batch(data, indices, indptr, inv_diag, B, works):
+    X = np.zeros_like(B)
+    n_chunks = len(works)
+    n_sys = B.shape[0]
+    for t in prange(n_chunks):
+        work = works[np.int64(t)]
+        for k in range(t * n_sys // n_chunks, (t + 1) * n_sys // n_chunks):
+            x, n_iter, hist, info = bicgstab_csr(data, indices, indptr, B[k], None, 1e-10,
+                                                 500, precond_jacobi, inv_diag, work)
+            X[k] = x
+    return X
+
+
+def test_inside_prange():
+    """One workspace per chunk: allocation-free solves in a parallel loop."""
+    print("Test: Krylov solves inside prange")
+    A = _make_test_matrix(80, density=0.05)
+    n = A.shape[0]
+    inv_diag, _ = jacobi_setup(A.data, A.indices, A.indptr)
+    B = np.random.default_rng(2).standard_normal((16, n))
+    works = List([krylov_workspace(n, 500, 0) for _ in range(4)])
+    X = _solve_batch(A.data, A.indices.astype(np.int32), A.indptr.astype(np.int32),
+                     inv_diag, B, works)
+    assert np.allclose((A @ X.T).T, B)
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Krylov Solver Tests")
+    print("=" * 60)
+    test_cg()
+    test_bicgstab_and_gmres()
+    test_workspace_and_errors()
+    test_inside_prange()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,208 @@
+"""
+Tests for the block-Jacobi, ILU(0) and IC(0) preconditioners.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_precond.py
+
+import numpy as np
+import scipy.sparse as sp
+from numba import njit, prange
+from sparse_numba.krylov.krylov_numba import cg_csr, gmres_csr
+from sparse_numba.krylov.precond_numba import (
+    block_jacobi_setup,
+    precond_block_jacobi,
+    ilu0_setup,
+    precond_ilu0,
+    precond_ilu0_parallel,
+    ic0_setup,
+    precond_ic0,
+    precond_ic0_parallel,
+)
+
+
+def _laplacian_2d(m):
+    """SPD 5-point Laplacian, as CSR."""
+    T = sp.diags([-np.ones(m - 1), 4.0 * np.ones(m), -np.ones(m - 1)], [-1, 0, 1])
+    return sp.kronsum(T, T).tocsr()
+
+
+def _make_test_matrix(n=200, density=0.02, seed=42):
+    """Random unsymmetric, diagonally dominant matrix, as CSR."""
+    A = sp.random(n, n, density=density, random_state=seed)
+    A = A + sp.diags(np.abs(A).sum(axis=1).A1 + 1.0)
+    return A.tocsr()
+
+
+def _dense_factors(M):
+    """Dense L and U of IncompleteFactors."""
+    n = M.n
+    L = sp.csr_matrix((M.l_data, M.l_indices, M.l_indptr), shape=(n, n)) + sp.diags(M.l_diag)
+    U = sp.csr_matrix((M.u_data, M.u_indices, M.u_indptr), shape=(n, n)) + sp.diags(M.u_diag)
+    return L.toarray(), U.toarray()
+
+
+def test_ilu0():
+    """L U matches A on the pattern of A; exact for a tridiagonal matrix."""
+    print("Test: ilu0_setup + precond_ilu0")
+    A = _make_test_matrix()
+    M, info = ilu0_setup(A.data, A.indices, A.indptr)
+    assert info == 0
+    L, U = _dense_factors(M)
+    mask = A.toarray() != 0
+    assert np.allclose((L @ U)[mask], A.toarray()[mask])
+
+    n = 50
+    T = sp.diags([np.ones(n - 1), 3.0 * np.ones(n), 2.0 * np.ones(n - 1)], [-1, 0, 1]).tocsr()
+    M, info = ilu0_setup(T.data, T.indices, T.indptr)
+    r = np.arange(1.0, n + 1.0)
+    z = np.zeros(n)
+    assert precond_ilu0(M, r, z) == 0
+    assert np.allclose(T @ z, r)
+    assert M.n_levels == (n, n)
+
+    # Unsorted column indices give the same factors
+    B = A.copy()
+    for i in range(B.shape[0]):
+        s, e = B.indptr[i], B.indptr[i + 1]
+        B.indices[s:e] = B.indices[s:e][::-1].copy()
+        B.data[s:e] = B.data[s:e][::-1].copy()
+    M, info = ilu0_setup(A.data, A.indices, A.indptr)
+    L, U = _dense_factors(M)
+    M2, info = ilu0_setup(B.data, B.indices, B.indptr)
+    assert info == 0
+    L2, U2 = _dense_factors(M2)
+    assert np.allclose(L2, L) and np.allclose(U2, U)
+    print("  PASSED")
+
+
+def test_ic0():
+    """L L^T matches A on the lower pattern of A; CG converges faster."""
+    print("Test: ic0_setup + precond_ic0")
+    A = _laplacian_2d(15)
+    n = A.shape[0]
+    M, info = ic0_setup(A.data, A.indices, A.indptr)
+    assert info == 0
+    L, U = _dense_factors(M)
+    assert np.allclose(U, L.T)
+    mask = np.tril(A.toarray()) != 0
+    assert np.allclose((L @ L.T)[mask], A.toarray()[mask])
+
+    b = np.ones(n)
+    _, it_plain, _, info = cg_csr(A.data, A.indices, A.indptr, b, None, 1e-10)
+    x, it_ic, _, info = cg_csr(A.data, A.indices, A.indptr, b, None, 1e-10, 1000,
+                               precond_ic0, M)
+    assert info == 0 and it_ic < it_plain
+    assert np.allclose(A @ x, b)
+
+    # Not positive definite
+    D = sp.diags(np.r_[np.ones(3), -np.ones(3)]).tocsr()
+    _, info = ic0_setup(D.data, D.indices, D.indptr)
+    assert info == 4
+    print("  PASSED")
+
+
+def test_parallel_apply():
+    """Level-scheduled parallel solves match the serial ones."""
+    print("Test: level-scheduled parallel apply")
+    A = _laplacian_2d(30)
+    n = A.shape[0]
+    r = np.random.default_rng(0).standard_normal(n)
+    for setup, serial, parallel in ((ilu0_setup, precond_ilu0, precond_ilu0_parallel),
+                                    (ic0_setup, precond_ic0, precond_ic0_parallel)):
+        M, info = setup(A.data, A.indices, A.indptr)
+        assert info == 0
+        # Level l of a 2D grid in natural order is an anti-diagonal
+        assert M.n_levels == (59, 59)
+        z1 = np.zeros(n)
+        z2 = np.zeros(n)
+        serial(M, r, z1)
+        parallel(M, r, z2)
+        assert np.allclose(z1, z2)
+
+    x, _, _, info = gmres_csr(A.data, A.indices, A.indptr, r, None, 1e-10, 500, 30,
+                              precond_ilu0_parallel, ilu0_setup(A.data, A.indices, A.indptr)[0])
+    assert info == 0 and np.allclose(A @ x, r)
+    print("  PASSED")
+
+
+def test_block_jacobi():
+    """Exact on block-diagonal matrices, with fixed and variable blocks."""
+    print("Test: block_jacobi_setup + precond_block_jacobi")
+    rng = np.random.default_rng(1)
+    sizes = [3, 5, 2, 4]
+    blocks = [rng.standard_normal((m, m)) + m * np.eye(m) for m in sizes]
+    A = sp.block_diag(blocks).tocsr()
+    n = A.shape[0]
+    r = rng.standard_normal(n)
+    z = np.zeros(n)
+
+    bptr = np.r_[0, np.cumsum(sizes)].astype(np.int32)
+    M, info = block_jacobi_setup(A.data, A.indices, A.indptr, 4, bptr)
+    assert info == 0
+    precond_block_jacobi(M, r, z)
+    assert np.allclose(A @ z, r)
+
+    # One block holding the whole matrix is an exact solve
+    M, info = block_jacobi_setup(A.data, A.indices, A.indptr, n)
+    precond_block_jacobi(M, r, z)
+    assert np.allclose(A @ z, r)
+
+    # Uneven last block, used inside GMRES
+    B = _make_test_matrix(101)
+    M, info = block_jacobi_setup(B.data, B.indices, B.indptr, 8)
+    assert info == 0 and len(M.block_ptr) == 14
+    b = np.ones(101)
+    x, _, _, info = gmres_csr(B.data, B.indices, B.indptr, b, None, 1e-10, 500, 30,
+                              precond_block_jacobi, M)
+    assert info == 0 and np.allclose(B @ x, b)
+
+    _, info = block_jacobi_setup(A.data, A.indices, A.indptr, 4, np.array([0, 5, 3, n], dtype=np.int32))
+    assert info == -3
+    S = sp.csr_matrix(np.array([[1.0, 2.0], [2.0, 4.0]]))
+    _, info = block_jacobi_setup(S.data, S.indices, S.indptr, 2)
+    assert info == 2
+    print("  PASSED")
+
+
+@njit(nogil=True, parallel=True)
+def _setup_batch(data, indices, indptr, scales, r):
+    Z = np.zeros((len(scales), len(r)))
+    for k in prange(len(scales)):
+        M, info = ilu0_setup(data * scales[k], indices, indptr)
+        precond_ilu0(M, r, Z[k])
+    return Z
+
+
+def test_setup_inside_prange():
+    """Many ILU(0) builds in a parallel loop."""
+    print("Test: ilu0_setup inside prange")
+    A = _make_test_matrix(80, density=0.05)
+    r = np.ones(80)
+    scales = np.array([1.0, 2.0, 4.0, 8.0])
+    Z = _setup_batch(A.data, A.indices.astype(np.int32), A.indptr.astype(np.int32), scales, r)
+    for k in range(4):
+        assert np.allclose(Z[k] * scales[k], Z[0])
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Preconditioner Tests")
+    print("=" * 60)
+    test_ilu0()
+    test_ic0()
+    test_parallel_apply()
+    test_block_jacobi()
+    test_setup_inside_prange()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,11 @@
+from .lowrank_numba import (
+    lowrank_from_entries, lowrank_update, lowrank_solve, lowrank_solve_batch,
+    LowRankUpdate,
+)
+
+__all__ = [
+    'lowrank_from_entries', 'lowrank_update', 'lowrank_solve', 'lowrank_solve_batch',
+    'LowRankUpdate',
+]
+
+__author__ = 'Tianqi Hong'
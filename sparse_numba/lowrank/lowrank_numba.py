@@ -0,0 +1,262 @@
+"""
+Low-rank updates of an existing factorization (Sherman-Morrison-Woodbury).
+Solves (A + U V^T) x = b with the SuperLU / UMFPACK / KLU factors of A and
+a small k x k capacitance matrix, so a change of a few entries of A costs a
+few solves instead of a refactorization.
+    lowrank_from_entries
+    lowrank_update
+    lowrank_solve
+    lowrank_solve_batch
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: lowrank_numba.py
+
+import numpy as np
+from numba import njit, prange, int32, int64, float64
+from numba.experimental import jitclass
+
+from sparse_numba.conversion.matrix_conversion_numba import ensure_float64
+from sparse_numba.dense.dense_lu_numba import _lu_factor_inplace, _lu_solve_factored_inplace
+from sparse_numba.handle_solve import (
+    handle_solve_into, concurrent_solves_safe, BACKEND_SUPERLU,
+)
+
+
+_lowrank_spec = [
+    ('backend', int64),
+    ('handle', int64),
+    ('n', int64),
+    ('k', int64),
+    ('Zt', float64[:, ::1]),
+    ('Vt', float64[:, ::1]),
+    ('cap', float64[:, ::1]),
+    ('cap_piv', int32[::1]),
+]
+
+
+@jitclass(_lowrank_spec)
+class LowRankUpdate:
+    """
+    A + U V^T on top of the factors of A. Zt holds (A^{-1} U)^T, cap the LU
+    of the capacitance matrix I + V^T A^{-1} U with its pivots in cap_piv.
+    The base factors stay owned by the caller and must outlive the update.
+    """
+
+    def __init__(self, backend, handle, Zt, Vt, cap, cap_piv):
+        self.backend = backend
+        self.handle = handle
+        self.n = Zt.shape[1]
+        self.k = Zt.shape[0]
+        self.Zt = Zt
+        self.Vt = Vt
+        self.cap = cap
+        self.cap_piv = cap_piv
+
+
+@njit(nogil=True)
+def lowrank_from_entries(n, rows, cols, deltas):
+    """
+    Write a change of individual entries, A[rows[j], cols[j]] += deltas[j],
+    as U V^T. Changes in the same column share one rank, so the rank is the
+    number of distinct columns touched (2 for a branch outage).
+
+    Parameters:
+    -----------
+    n : int
+        Dimension of A
+    rows, cols : ndarray (int)
+        Positions of the changed entries
+    deltas : ndarray (float64)
+        Changes of the entries
+
+    Returns:
+    --------
+    U : ndarray (float64)
+        Shape (n, k)
+    V : ndarray (float64)
+        Shape (n, k), columns of the identity
+    """
+    slot = np.full(n, -1, dtype=np.int64)
+    k = 0
+    for j in range(len(cols)):
+        if slot[cols[j]] < 0:
+            slot[cols[j]] = k
+            k += 1
+    U = np.zeros((n, k), dtype=np.float64)
+    V = np.zeros((n, k), dtype=np.float64)
+    for j in range(len(cols)):
+        c = slot[cols[j]]
+        U[rows[j], c] += deltas[j]
+        V[cols[j], c] = 1.0
+    return U, V
+
+
+@njit(nogil=True)
+def lowrank_update(handle, U, V, backend=BACKEND_SUPERLU):
+    """
+    Prepare solves with A + U V^T, reusing the factors of A.
+    Costs one solve with k right-hand sides and a k x k factorization.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors of A from superlu_/umfpack_/klu_factorize_*()
+    U : ndarray (float64)
+        Shape (n, k)
+    V : ndarray (float64)
+        Shape (n, k)
+    backend : int
+        BACKEND_SUPERLU, BACKEND_UMFPACK or BACKEND_KLU (from handle_solve)
+
+    Returns:
+    --------
+    update : LowRankUpdate
+        Pass to lowrank_solve
+    info : int
+        Status code (0 for success, -3 for mismatched shapes, j + 1 if the
+        capacitance matrix has a zero pivot in column j, i.e. A + U V^T is
+        singular, otherwise the status of the solve)
+    """
+    n = U.shape[0]
+    k = U.shape[1]
+    Ut = np.ascontiguousarray(U.T).astype(np.float64)
+    Vt = np.ascontiguousarray(V.T).astype(np.float64)
+    Zt = np.zeros((k, n), dtype=np.float64)
+    cap = np.zeros((k, k), dtype=np.float64)
+    piv = np.zeros(k, dtype=np.int32)
+    if V.shape[0] != n or V.shape[1] != k:
+        return LowRankUpdate(backend, handle, Zt, Vt, cap, piv), -3
+    if k == 0:
+        return LowRankUpdate(backend, handle, Zt, Vt, cap, piv), 0
+
+    info = handle_solve_into(handle, Ut, Zt, k, False, backend)
+    if info != 0:
+        return LowRankUpdate(backend, handle, Zt, Vt, cap, piv), info
+
+    # I + V^T Z
+    for i in range(k):
+        for j in range(k):
+            s = 0.0
+            for l in range(n):
+                s += Vt[i, l] * Zt[j, l]
+            cap[i, j] = s
+        cap[i, i] += 1.0
+    info = _lu_factor_inplace(cap, piv)
+    return LowRankUpdate(backend, handle, Zt, Vt, cap, piv), info
+
+
+@njit(nogil=True)
+def _lowrank_correct(update, y, x):
+    """x = y - Z C^{-1} V^T y, with y = A^{-1} b already computed."""
+    k = update.k
+    n = update.n
+    s = np.zeros(k, dtype=np.float64)
+    for i in range(k):
+        acc = 0.0
+        for l in range(n):
+            acc += update.Vt[i, l] * y[l]
+        s[i] = acc
+    if k > 0:
+        _lu_solve_factored_inplace(update.cap, update.cap_piv, s)
+    for l in range(n):
+        x[l] = y[l]
+    for i in range(k):
+        si = s[i]
+        if si != 0.0:
+            for l in range(n):
+                x[l] -= update.Zt[i, l] * si
+
+
+@njit(nogil=True)
+def lowrank_solve(update, b):
+    """
+    Solve (A + U V^T) x = b with one solve against the factors of A.
+
+    Parameters:
+    -----------
+    update : LowRankUpdate
+        From lowrank_update
+    b : ndarray (float64)
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success, -3 if b has the wrong length)
+    """
+    rhs = ensure_float64(b)
+    n = update.n
+    x = np.zeros(n, dtype=np.float64)
+    if len(rhs) != n:
+        return x, -3
+    y = np.zeros(n, dtype=np.float64)
+    info = handle_solve_into(update.handle, rhs, y, 1, False, update.backend)
+    if info != 0:
+        return x, info
+    _lowrank_correct(update, y, x)
+    return x, 0
+
+
+@njit(nogil=True)
+def _lowrank_scenario(handle, U, V, y, x, backend):
+    """One scenario of lowrank_solve_batch, written into x."""
+    if U.shape[0] != len(y):
+        return -3
+    update, info = lowrank_update(handle, U, V, backend)
+    if info == 0:
+        _lowrank_correct(update, y, x)
+    return info
+
+
+@njit(nogil=True, parallel=True)
+def lowrank_solve_batch(handle, U_list, V_list, b, backend=BACKEND_SUPERLU):
+    """
+    Solve (A + U_s V_s^T) x_s = b for many scenarios s in parallel, all
+    against one factorization of A. A^{-1} b is computed once and shared.
+    KLU handles are not safe for concurrent solves, so with BACKEND_KLU
+    the scenarios run one after another.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors of A from superlu_/umfpack_/klu_factorize_*()
+    U_list, V_list : numba.typed.List of ndarray (float64)
+        U_s and V_s, each of shape (n, k_s); the rank may vary by scenario
+    b : ndarray (float64)
+        Right-hand side vector, shared by all scenarios
+    backend : int
+        BACKEND_SUPERLU, BACKEND_UMFPACK or BACKEND_KLU
+
+    Returns:
+    --------
+    X : ndarray (float64)
+        Solutions, shape (n_scenarios, n)
+    info : ndarray (int32)
+        Status code per scenario, as for lowrank_update
+    """
+    rhs = ensure_float64(b)
+    n = len(rhs)
+    ns = len(U_list)
+    X = np.zeros((ns, n), dtype=np.float64)
+    info = np.zeros(ns, dtype=np.int32)
+    y = np.zeros(n, dtype=np.float64)
+    base = handle_solve_into(handle, rhs, y, 1, False, backend)
+    if base != 0:
+        info[:] = base
+        return X, info
+
+    if concurrent_solves_safe(backend):
+        for s in prange(ns):
+            info[s] = _lowrank_scenario(handle, U_list[np.int64(s)], V_list[np.int64(s)],
+                                        y, X[s], backend)
+    else:
+        for s in range(ns):
+            info[s] = _lowrank_scenario(handle, U_list[s], V_list[s], y, X[s], backend)
+    return X, info
@@ -0,0 +1,149 @@
+"""
+Tests for the Sherman-Morrison-Woodbury low-rank updates.
+The base factorization comes from SuperLU.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_lowrank.py
+
+import numpy as np
+import scipy.sparse as sp
+from numba.typed import List
+from sparse_numba.sparse_superlu.superlu_numba_interface import (
+    superlu_factorize_csc,
+    superlu_free_factors,
+)
+from sparse_numba.lowrank.lowrank_numba import (
+    lowrank_from_entries,
+    lowrank_update,
+    lowrank_solve,
+    lowrank_solve_batch,
+)
+
+
+def _make_test_matrix(n=200, density=0.02, seed=42):
+    """Random unsymmetric, diagonally dominant matrix, as CSC."""
+    A = sp.random(n, n, density=density, random_state=seed)
+    A = A + sp.diags(np.abs(A).sum(axis=1).A1 + 1.0)
+    return A.tocsc()
+
+
+def _outage(A, i, j):
+    """Entry changes that remove the coupling between buses i and j."""
+    y = A[i, j]
+    rows = np.array([i, j, i, j])
+    cols = np.array([j, i, i, j])
+    deltas = np.array([-y, -y, y, y])
+    return rows, cols, deltas
+
+
+def test_update_and_solve():
+    """Matches a direct solve of the modified matrix."""
+    print("Test: lowrank_update + lowrank_solve")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    handle, info = superlu_factorize_csc(A.data, A.indices, A.indptr)
+    assert info == 0
+    rng = np.random.default_rng(0)
+    b = rng.standard_normal(n)
+
+    U = rng.standard_normal((n, 3))
+    V = rng.standard_normal((n, 3))
+    update, info = lowrank_update(handle, U, V)
+    assert info == 0
+    x, info = lowrank_solve(update, b)
+    assert info == 0
+    assert np.allclose((A.toarray() + U @ V.T) @ x, b)
+
+    # Entry changes, grouped by column
+    rows, cols, deltas = _outage(A, 3, 7)
+    U, V = lowrank_from_entries(n, rows, cols, deltas)
+    assert U.shape == (n, 2)
+    dA = sp.csc_matrix((deltas, (rows, cols)), shape=(n, n))
+    assert np.allclose(U @ V.T, dA.toarray())
+    update, info = lowrank_update(handle, U, V)
+    x, info = lowrank_solve(update, b)
+    assert info == 0 and np.allclose((A + dA) @ x, b)
+
+    # Rank zero is the base solve
+    update, info = lowrank_update(handle, np.zeros((n, 0)), np.zeros((n, 0)))
+    x, info = lowrank_solve(update, b)
+    assert info == 0 and np.allclose(A @ x, b)
+    superlu_free_factors(handle)
+    print("  PASSED")
+
+
+def test_batch():
+    """Parallel scenarios with varying rank match the single solves."""
+    print("Test: lowrank_solve_batch")
+    A = _make_test_matrix(150)
+    n = A.shape[0]
+    handle, info = superlu_factorize_csc(A.data, A.indices, A.indptr)
+    rng = np.random.default_rng(1)
+    b = rng.standard_normal(n)
+    U_list, V_list = List(), List()
+    for s in range(12):
+        k = 1 + s % 4
+        U_list.append(0.1 * rng.standard_normal((n, k)))
+        V_list.append(rng.standard_normal((n, k)))
+    X, info = lowrank_solve_batch(handle, U_list, V_list, b)
+    assert np.all(info == 0)
+    for s in range(12):
+        update, _ = lowrank_update(handle, U_list[s], V_list[s])
+        x, _ = lowrank_solve(update, b)
+        assert np.allclose(X[s], x)
+        assert np.allclose((A.toarray() + U_list[s] @ V_list[s].T) @ X[s], b)
+    superlu_free_factors(handle)
+    print("  PASSED")
+
+
+def test_errors():
+    """Singular updates and mismatched shapes."""
+    print("Test: low-rank update error codes")
+    n = 20
+    A = sp.eye(n, format='csc') * 2.0
+    handle, info = superlu_factorize_csc(A.data, A.indices, A.indptr)
+
+    # A + U V^T = 2 I - 2 e_0 e_0^T is singular
+    U = np.zeros((n, 1))
+    U[0, 0] = -2.0
+    V = np.zeros((n, 1))
+    V[0, 0] = 1.0
+    _, info = lowrank_update(handle, U, V)
+    assert info == 1
+
+    _, info = lowrank_update(handle, np.ones((n, 2)), np.ones((n, 3)))
+    assert info == -3
+    update, info = lowrank_update(handle, np.ones((n, 1)), np.ones((n, 1)))
+    _, info = lowrank_solve(update, np.ones(n + 1))
+    assert info == -3
+
+    U_list, V_list = List(), List()
+    U_list.append(U)
+    V_list.append(V)
+    U_list.append(0.5 * U)
+    V_list.append(V)
+    _, info = lowrank_solve_batch(handle, U_list, V_list, np.ones(n))
+    assert info[0] == 1 and info[1] == 0
+    superlu_free_factors(handle)
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Low-Rank Update Tests")
+    print("=" * 60)
+    test_update_and_solve()
+    test_batch()
+    test_errors()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
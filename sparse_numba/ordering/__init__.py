@@ -0,0 +1,31 @@
+from .matching_numba import (
+    mc21_matching, hopcroft_karp_matching,
+    structural_rank, zero_free_diagonal,
+    permute_rows_csc,
+)
+from .ordering_numba import (
+    rcm_ordering, amd_ordering,
+    inverse_permutation, permute_csc, permute_csr,
+    csc_profile,
+)
+from .nested_dissection_numba import (
+    SeparatorTree, nested_dissection, separator_tree_levels,
+)
+from .btf_numba import (
+    connected_components, strongly_connected_components,
+    btf_decomposition,
+)
+
+__all__ = [
+    'mc21_matching', 'hopcroft_karp_matching',
+    'structural_rank', 'zero_free_diagonal',
+    'permute_rows_csc',
+    'rcm_ordering', 'amd_ordering',
+    'inverse_permutation', 'permute_csc', 'permute_csr',
+    'csc_profile',
+    'SeparatorTree', 'nested_dissection', 'separator_tree_levels',
+    'connected_components', 'strongly_connected_components',
+    'btf_decomposition',
+]
+
+__author__ = 'Tianqi Hong'
@@ -0,0 +1,223 @@
+"""
+Block triangular form (BTF) and connected components of sparse matrices.
+A matrix that splits into independent components, or whose graph has
+several strongly connected components, only needs its diagonal blocks
+factorized; the rest of the matrix enters the solve as coupling.
+    connected_components
+    strongly_connected_components
+    btf_decomposition
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: btf_numba.py
+
+import numpy as np
+from numba import njit
+
+from sparse_numba.conversion.matrix_conversion_numba import ensure_int32
+from sparse_numba.ordering.ordering_numba import _symmetric_pattern, inverse_permutation
+from sparse_numba.ordering.matching_numba import zero_free_diagonal
+
+
+@njit(nogil=True)
+def connected_components(csc_indices, csc_indptr):
+    """
+    Connected components of the graph of A + A^T for a square matrix.
+    Unknowns in different components are not coupled at all, so the
+    components can be factorized and solved independently.
+
+    Parameters:
+    -----------
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+
+    Returns:
+    --------
+    perm : ndarray (int32)
+        Nodes grouped by component, in increasing order within each
+        component; components are ordered by their smallest node
+    comp_ptr : ndarray (int32)
+        Component c is perm[comp_ptr[c]:comp_ptr[c + 1]]
+    """
+    Ai = ensure_int32(csc_indices)
+    Ap = ensure_int32(csc_indptr)
+    n = len(Ap) - 1
+    ptr, adj = _symmetric_pattern(Ai, Ap, n)
+
+    comp = np.full(n, -1, dtype=np.int32)
+    queue = np.empty(n, dtype=np.int32)
+    n_comp = 0
+    for s in range(n):
+        if comp[s] != -1:
+            continue
+        comp[s] = n_comp
+        queue[0] = s
+        head = 0
+        tail = 1
+        while head < tail:
+            v = queue[head]
+            head += 1
+            for p in range(ptr[v], ptr[v + 1]):
+                u = adj[p]
+                if comp[u] == -1:
+                    comp[u] = n_comp
+                    queue[tail] = u
+                    tail += 1
+        n_comp += 1
+
+    comp_ptr = np.zeros(n_comp + 1, dtype=np.int32)
+    for v in range(n):
+        comp_ptr[comp[v] + 1] += 1
+    for c in range(n_comp):
+        comp_ptr[c + 1] += comp_ptr[c]
+    fill = comp_ptr[:n_comp].copy()
+    perm = np.empty(n, dtype=np.int32)
+    for v in range(n):
+        perm[fill[comp[v]]] = v
+        fill[comp[v]] += 1
+    return perm, comp_ptr
+
+
+@njit(nogil=True)
+def strongly_connected_components(csc_indices, csc_indptr):
+    """
+    Strongly connected components of the directed graph of a square
+    matrix, with an edge j -> i for every entry (i, j), by Tarjan's
+    algorithm (iterative, O(n + nnz)). The components come out in an
+    order that makes the symmetric permutation A[perm][:, perm] upper
+    block triangular.
+
+    Parameters:
+    -----------
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+
+    Returns:
+    --------
+    perm : ndarray (int32)
+        Nodes grouped by strongly connected component
+    block_ptr : ndarray (int32)
+        Component k is perm[block_ptr[k]:block_ptr[k + 1]]
+    """
+    Ai = ensure_int32(csc_indices)
+    Ap = ensure_int32(csc_indptr)
+    n = len(Ap) - 1
+    index = np.full(n, -1, dtype=np.int32)
+    low = np.empty(n, dtype=np.int32)
+    on_stack = np.zeros(n, dtype=np.bool_)
+    stack = np.empty(n, dtype=np.int32)
+    calls = np.empty(n, dtype=np.int32)
+    it = np.empty(n, dtype=np.int32)
+    perm = np.empty(n, dtype=np.int32)
+    ptr = np.zeros(n + 1, dtype=np.int32)
+    top = 0
+    counter = 0
+    n_blocks = 0
+    k = 0
+
+    for s in range(n):
+        if index[s] != -1:
+            continue
+        depth = 0
+        calls[0] = s
+        it[s] = Ap[s]
+        index[s] = counter
+        low[s] = counter
+        counter += 1
+        stack[top] = s
+        top += 1
+        on_stack[s] = True
+        while depth >= 0:
+            v = calls[depth]
+            if it[v] < Ap[v + 1]:
+                w = Ai[it[v]]
+                it[v] += 1
+                if index[w] == -1:
+                    index[w] = counter
+                    low[w] = counter
+                    counter += 1
+                    stack[top] = w
+                    top += 1
+                    on_stack[w] = True
+                    it[w] = Ap[w]
+                    depth += 1
+                    calls[depth] = w
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+            # v is finished: it is the root of a component if nothing
+            # on the stack below it is reachable from it
+            if low[v] == index[v]:
+                start = top - 1
+                while stack[start] != v:
+                    start -= 1
+                for q in range(start, top):
+                    w = stack[q]
+                    on_stack[w] = False
+                    perm[k] = w
+                    k += 1
+                top = start
+                n_blocks += 1
+                ptr[n_blocks] = k
+            depth -= 1
+            if depth >= 0:
+                u = calls[depth]
+                if low[v] < low[u]:
+                    low[u] = low[v]
+    return perm, ptr[:n_blocks + 1].copy()
+
+
+@njit(nogil=True)
+def btf_decomposition(csc_indices, csc_indptr):
+    """
+    Block upper triangular form of a square matrix, as in KLU and
+    cs_dmperm: a maximum matching puts nonzeros on the diagonal, then the
+    strongly connected components of the matched graph become the
+    diagonal blocks. A[row_perm][:, col_perm] is block upper triangular
+    with a zero-free diagonal, and Ax = b can be solved by factorizing the
+    diagonal blocks only.
+
+    Parameters:
+    -----------
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+
+    Returns:
+    --------
+    row_perm : ndarray (int32)
+        Row row_perm[k] of A becomes row k
+    col_perm : ndarray (int32)
+        Column col_perm[k] of A becomes column k
+    block_ptr : ndarray (int32)
+        Diagonal block k covers rows and columns block_ptr[k]:block_ptr[k + 1]
+    info : int
+        Status code (0 for success, k + 1 if A is structurally singular and
+        column k could not be matched; the form is still returned, with
+        some diagonal entries not stored)
+    """
+    Ai = ensure_int32(csc_indices)
+    Ap = ensure_int32(csc_indptr)
+    n = len(Ap) - 1
+    match, info = zero_free_diagonal(Ai, Ap)
+
+    # Pattern of P A, whose diagonal is (structurally) nonzero
+    pinv = inverse_permutation(match)
+    Bi = np.empty(len(Ai), dtype=np.int32)
+    for p in range(Ap[n]):
+        Bi[p] = pinv[Ai[p]]
+    col_perm, block_ptr = strongly_connected_components(Bi, Ap)
+
+    row_perm = np.empty(n, dtype=np.int32)
+    for k in range(n):
+        row_perm[k] = match[col_perm[k]]
+    return row_perm, col_perm, block_ptr, info
@@ -0,0 +1,338 @@
+"""
+Structural analysis of sparse matrices: maximum bipartite matching between
+rows and columns (maximum transversal), structural rank and a row
+permutation that puts nonzeros on the whole diagonal. A matrix whose
+structural rank is below n is singular for every choice of values, which
+is found here in about O(nnz) before any factorization is attempted.
+    mc21_matching
+    hopcroft_karp_matching
+    structural_rank
+    zero_free_diagonal
+    permute_rows_csc
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: matching_numba.py
+
+import numpy as np
+from numba import njit
+
+from sparse_numba.conversion.matrix_conversion_numba import (
+    ensure_float64, ensure_int32, convert_csr_to_csc,
+)
+
+
+@njit(nogil=True)
+def mc21_matching(csc_indices, csc_indptr, n_rows):
+    """
+    Maximum matching of columns to rows by depth-first augmenting paths
+    with a cheap-assignment lookahead (Duff's MC21, as in cs_maxtrans).
+    Matrices with a zero-free diagonal are matched by the lookahead alone,
+    in O(nnz); the worst case is O(n nnz).
+
+    Parameters:
+    -----------
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    n_rows : int
+        Number of rows
+
+    Returns:
+    --------
+    row_of_col : ndarray (int32)
+        Row matched to each column, -1 if unmatched
+    n_matched : int
+        Size of the matching (the structural rank)
+    """
+    Ai = ensure_int32(csc_indices)
+    Ap = ensure_int32(csc_indptr)
+    n_cols = len(Ap) - 1
+    col_of_row = np.full(n_rows, -1, dtype=np.int32)
+    row_of_col = np.full(n_cols, -1, dtype=np.int32)
+    cheap = Ap[:n_cols].copy()
+    visited = np.full(n_cols, -1, dtype=np.int32)
+    js = np.empty(n_cols, dtype=np.int32)
+    is_ = np.empty(n_cols, dtype=np.int32)
+    ps = np.empty(n_cols, dtype=np.int32)
+    n_matched = 0
+
+    for k in range(n_cols):
+        found = False
+        head = 0
+        js[0] = k
+        while head >= 0:
+            j = js[head]
+            if visited[j] != k:
+                # First visit: look for an unmatched row in column j
+                visited[j] = k
+                p = cheap[j]
+                while p < Ap[j + 1] and not found:
+                    i = Ai[p]
+                    found = col_of_row[i] == -1
+                    p += 1
+                cheap[j] = p
+                if found:
+                    is_[head] = Ai[p - 1]
+                    break
+                ps[head] = Ap[j]
+            # Go deeper through a matched row whose column is unvisited
+            p = ps[head]
+            stop = Ap[j + 1]
+            while p < stop:
+                i = Ai[p]
+                if visited[col_of_row[i]] != k:
+                    ps[head] = p + 1
+                    is_[head] = i
+                    head += 1
+                    js[head] = col_of_row[i]
+                    break
+                p += 1
+            if p == stop:
+                head -= 1
+        if found:
+            for q in range(head, -1, -1):
+                col_of_row[is_[q]] = js[q]
+                row_of_col[js[q]] = is_[q]
+            n_matched += 1
+    return row_of_col, n_matched
+
+
+@njit(nogil=True)
+def hopcroft_karp_matching(csc_indices, csc_indptr, n_rows):
+    """
+    Maximum matching of columns to rows with the Hopcroft-Karp algorithm:
+    breadth-first layering, then vertex-disjoint shortest augmenting paths
+    per phase, O(sqrt(n) nnz) in the worst case. Starts from a greedy
+    matching, so a zero-free diagonal costs one O(nnz) pass.
+
+    Parameters:
+    -----------
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    n_rows : int
+        Number of rows
+
+    Returns:
+    --------
+    row_of_col : ndarray (int32)
+        Row matched to each column, -1 if unmatched
+    n_matched : int
+        Size of the matching (the structural rank)
+    """
+    Ai = ensure_int32(csc_indices)
+    Ap = ensure_int32(csc_indptr)
+    n_cols = len(Ap) - 1
+    col_of_row = np.full(n_rows, -1, dtype=np.int32)
+    row_of_col = np.full(n_cols, -1, dtype=np.int32)
+    n_matched = 0
+
+    # Greedy start, diagonal first
+    for j in range(n_cols):
+        for p in range(Ap[j], Ap[j + 1]):
+            if Ai[p] == j and col_of_row[j] == -1:
+                col_of_row[j] = j
+                row_of_col[j] = j
+                n_matched += 1
+                break
+    for j in range(n_cols):
+        if row_of_col[j] == -1:
+            for p in range(Ap[j], Ap[j + 1]):
+                i = Ai[p]
+                if col_of_row[i] == -1:
+                    col_of_row[i] = j
+                    row_of_col[j] = i
+                    n_matched += 1
+                    break
+
+    inf = n_cols + 1
+    dist = np.empty(n_cols, dtype=np.int64)
+    queue = np.empty(n_cols, dtype=np.int32)
+    it = np.empty(n_cols, dtype=np.int32)
+    stack = np.empty(n_cols, dtype=np.int32)
+    rows = np.empty(n_cols, dtype=np.int32)
+    while True:
+        # Layers of columns reachable from the free columns by alternating paths
+        tail = 0
+        for j in range(n_cols):
+            if row_of_col[j] == -1:
+                dist[j] = 0
+                queue[tail] = j
+                tail += 1
+            else:
+                dist[j] = inf
+        found = False
+        head = 0
+        while head < tail:
+            j = queue[head]
+            head += 1
+            for p in range(Ap[j], Ap[j + 1]):
+                j2 = col_of_row[Ai[p]]
+                if j2 == -1:
+                    found = True
+                elif dist[j2] == inf:
+                    dist[j2] = dist[j] + 1
+                    queue[tail] = j2
+                    tail += 1
+        if not found:
+            break
+
+        # Vertex-disjoint augmenting paths along the layers
+        for j in range(n_cols):
+            it[j] = Ap[j]
+        for j0 in range(n_cols):
+            if row_of_col[j0] != -1:
+                continue
+            top = 0
+            stack[0] = j0
+            while top >= 0:
+                j = stack[top]
+                advanced = False
+                augmented = False
+                while it[j] < Ap[j + 1]:
+                    i = Ai[it[j]]
+                    it[j] += 1
+                    j2 = col_of_row[i]
+                    if j2 == -1:
+                        rows[top] = i
+                        augmented = True
+                        break
+                    if dist[j2] == dist[j] + 1:
+                        rows[top] = i
+                        top += 1
+                        stack[top] = j2
+                        advanced = True
+                        break
+                if augmented:
+                    for t in range(top, -1, -1):
+                        col_of_row[rows[t]] = stack[t]
+                        row_of_col[stack[t]] = rows[t]
+                    n_matched += 1
+                    break
+                if not advanced:
+                    dist[j] = inf
+                    top -= 1
+    return row_of_col, n_matched
+
+
+@njit(nogil=True)
+def structural_rank(csc_indices, csc_indptr, n_rows):
+    """
+    Structural rank: the largest rank of any matrix with this sparsity
+    pattern, i.e. the size of a maximum matching. A square matrix with
+    structural rank below n is singular whatever its values.
+
+    Parameters:
+    -----------
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    n_rows : int
+        Number of rows
+
+    Returns:
+    --------
+    rank : int
+        Structural rank
+    """
+    _, n_matched = hopcroft_karp_matching(csc_indices, csc_indptr, n_rows)
+    return n_matched
+
+
+@njit(nogil=True)
+def zero_free_diagonal(csc_indices, csc_indptr):
+    """
+    Row permutation of a square matrix that gives it a zero-free diagonal:
+    row perm[j] of A becomes row j of P A, and (P A)[j, j] is a stored
+    entry. Factorizing P A instead of A needs fewer row interchanges.
+
+    Parameters:
+    -----------
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+
+    Returns:
+    --------
+    perm : ndarray (int32)
+        Row permutation (always a full permutation; unmatched columns get
+        the unmatched rows)
+    info : int
+        Status code (0 for success, k + 1 if A is structurally singular and
+        column k could not be matched)
+    """
+    n = len(csc_indptr) - 1
+    perm, n_matched = hopcroft_karp_matching(csc_indices, csc_indptr, n)
+    if n_matched == n:
+        return perm, 0
+    used = np.zeros(n, dtype=np.bool_)
+    for j in range(n):
+        if perm[j] >= 0:
+            used[perm[j]] = True
+    info = 0
+    i = 0
+    for j in range(n):
+        if perm[j] < 0:
+            if info == 0:
+                info = j + 1
+            while used[i]:
+                i += 1
+            perm[j] = i
+            used[i] = True
+    return perm, info
+
+
+@njit(nogil=True)
+def permute_rows_csc(csc_data, csc_indices, csc_indptr, perm):
+    """
+    P A for a square CSC matrix: row perm[j] of A becomes row j. The row
+    indices of the result are sorted.
+
+    Parameters:
+    -----------
+    csc_data : ndarray (float64)
+        Nonzero values in CSC format
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    perm : ndarray (int32)
+        Row permutation, e.g. from zero_free_diagonal
+
+    Returns:
+    --------
+    data : ndarray (float64)
+    indices : ndarray (int32)
+    indptr : ndarray (int32)
+        P A in CSC format
+    """
+    n = len(csc_indptr) - 1
+    # Rows of A are the columns of A^T
+    r_data, r_indices, r_indptr = convert_csr_to_csc(ensure_float64(csc_data),
+                                                     ensure_int32(csc_indices),
+                                                     ensure_int32(csc_indptr), (n, n), False)
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    for p in range(len(r_indices)):
+        indptr[r_indices[p] + 1] += 1
+    for j in range(n):
+        indptr[j + 1] += indptr[j]
+    fill = indptr[:n].copy()
+    indices = np.empty(len(r_indices), dtype=np.int32)
+    data = np.empty(len(r_indices), dtype=np.float64)
+    for j in range(n):
+        i = perm[j]
+        for p in range(r_indptr[i], r_indptr[i + 1]):
+            c = r_indices[p]
+            indices[fill[c]] = j
+            data[fill[c]] = r_data[p]
+            fill[c] += 1
+    return data, indices, indptr
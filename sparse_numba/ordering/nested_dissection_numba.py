@@ -0,0 +1,750 @@
+"""
+Nested dissection ordering by multilevel graph bisection, with no METIS
+dependency. The graph of A + A^T is coarsened by heavy-edge matching,
+bisected by greedy graph growing on the coarsest graph and refined by
+Fiduccia-Mattheyses on the way back; the cut edges are then covered by a
+minimum vertex separator (Konig's theorem). Separators are numbered last,
+recursively, and small parts are ordered by AMD. Subtrees of the
+separator tree are independent diagonal blocks of the factors, so they
+can be factorized in parallel.
+    SeparatorTree
+    nested_dissection
+    separator_tree_levels
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: nested_dissection_numba.py
+
+import numpy as np
+from numba import njit, int32, int64
+from numba.experimental import jitclass
+
+from sparse_numba.conversion.matrix_conversion_numba import ensure_int32
+from sparse_numba.ordering.ordering_numba import _symmetric_pattern, amd_ordering
+from sparse_numba.ordering.matching_numba import hopcroft_karp_matching
+
+# Parts of at most this many nodes are ordered by AMD
+ND_LEAF_SIZE = 128
+# Coarsening stops at this many nodes
+_COARSEN_TO = 100
+# Each side of a bisection may hold up to (1 + _IMBALANCE) / 2 of the weight
+_IMBALANCE = 0.1
+# Greedy-growing trials on the coarsest graph
+_N_INIT_TRIALS = 4
+# FM passes per level
+_FM_PASSES = 8
+
+
+@jitclass([
+    ('n_nodes', int64),
+    ('parent', int32[::1]),
+    ('first', int32[::1]),
+    ('sep_first', int32[::1]),
+    ('last', int32[::1]),
+    ('depth', int32[::1]),
+])
+class SeparatorTree:
+    """
+    Separator tree of a nested dissection ordering, nodes in postorder
+    (children before parents, the root last). Node t owns positions
+    sep_first[t]:last[t] of the ordering (its separator, or a whole leaf
+    part) and its subtree owns first[t]:last[t]. Disjoint subtrees share no
+    entries in A or in its factors, so nodes of equal depth can be
+    processed at the same time once their children are done.
+    """
+
+    def __init__(self, n_nodes, parent, first, sep_first, last, depth):
+        self.n_nodes = n_nodes
+        self.parent = parent
+        self.first = first
+        self.sep_first = sep_first
+        self.last = last
+        self.depth = depth
+
+    @property
+    def n_levels(self):
+        """Number of sequential steps of a bottom-up traversal."""
+        if self.n_nodes == 0:
+            return 0
+        return int(self.depth.max()) + 1
+
+
+@njit(nogil=True)
+def _heap_push(keys, vals, size, key, val):
+    """Push onto a binary max-heap stored in keys/vals[:size]; returns the new size."""
+    i = size
+    while i > 0:
+        p = (i - 1) // 2
+        if keys[p] >= key:
+            break
+        keys[i] = keys[p]
+        vals[i] = vals[p]
+        i = p
+    keys[i] = key
+    vals[i] = val
+    return size + 1
+
+
+@njit(nogil=True)
+def _heap_pop(keys, vals, size):
+    """Remove the top of the heap; returns the new size."""
+    size -= 1
+    key = keys[size]
+    val = vals[size]
+    i = 0
+    while True:
+        c = 2 * i + 1
+        if c >= size:
+            break
+        if c + 1 < size and keys[c + 1] > keys[c]:
+            c += 1
+        if keys[c] <= key:
+            break
+        keys[i] = keys[c]
+        vals[i] = vals[c]
+        i = c
+    if size > 0:
+        keys[i] = key
+        vals[i] = val
+    return size
+
+
+@njit(nogil=True)
+def _induced_subgraph(ptr, adj, verts, lo, hi, loc, mark, tag):
+    """Adjacency of the subgraph induced by verts[lo:hi], in local numbering."""
+    m = hi - lo
+    for k in range(m):
+        v = verts[lo + k]
+        loc[v] = k
+        mark[v] = tag
+    sptr = np.zeros(m + 1, dtype=np.int32)
+    for k in range(m):
+        v = verts[lo + k]
+        c = 0
+        for p in range(ptr[v], ptr[v + 1]):
+            if mark[adj[p]] == tag:
+                c += 1
+        sptr[k + 1] = sptr[k] + c
+    sadj = np.empty(sptr[m], dtype=np.int32)
+    q = 0
+    for k in range(m):
+        v = verts[lo + k]
+        for p in range(ptr[v], ptr[v + 1]):
+            u = adj[p]
+            if mark[u] == tag:
+                sadj[q] = loc[u]
+                q += 1
+    return sptr, sadj
+
+
+@njit(nogil=True)
+def _components(ptr, adj, m):
+    """Connected components; returns (count, component of each node)."""
+    comp = np.full(m, -1, dtype=np.int32)
+    queue = np.empty(m, dtype=np.int32)
+    n_comp = 0
+    for s in range(m):
+        if comp[s] != -1:
+            continue
+        comp[s] = n_comp
+        queue[0] = s
+        head = 0
+        tail = 1
+        while head < tail:
+            v = queue[head]
+            head += 1
+            for p in range(ptr[v], ptr[v + 1]):
+                u = adj[p]
+                if comp[u] == -1:
+                    comp[u] = n_comp
+                    queue[tail] = u
+                    tail += 1
+        n_comp += 1
+    return n_comp, comp
+
+
+@njit(nogil=True)
+def _coarsen(ptr, adj, ewgt, vwgt, max_vwgt):
+    """
+    One level of heavy-edge matching: nodes are visited in random order
+    and merged with the unmatched neighbour of heaviest connecting edge.
+    Returns (cmap, nc, cptr, cadj, cewgt, cvwgt) for the coarse graph.
+    """
+    m = len(ptr) - 1
+    match = np.full(m, -1, dtype=np.int32)
+    cmap = np.empty(m, dtype=np.int32)
+    nc = 0
+    for v in np.random.permutation(m):
+        if match[v] != -1:
+            continue
+        best = -1
+        best_w = -1
+        for p in range(ptr[v], ptr[v + 1]):
+            u = adj[p]
+            if match[u] == -1 and ewgt[p] > best_w and vwgt[v] + vwgt[u] <= max_vwgt:
+                best = u
+                best_w = ewgt[p]
+        if best == -1:
+            match[v] = v
+            cmap[v] = nc
+        else:
+            match[v] = best
+            match[best] = v
+            cmap[v] = nc
+            cmap[best] = nc
+        nc += 1
+
+    rep = np.empty(nc, dtype=np.int32)
+    for v in range(m):
+        if match[v] >= v:
+            rep[cmap[v]] = v
+    cptr = np.zeros(nc + 1, dtype=np.int32)
+    cadj = np.empty(len(adj), dtype=np.int32)
+    cewgt = np.empty(len(adj), dtype=np.int64)
+    cvwgt = np.zeros(nc, dtype=np.int64)
+    row = np.full(nc, -1, dtype=np.int64)
+    pos = np.empty(nc, dtype=np.int64)
+    q = 0
+    for c in range(nc):
+        cptr[c] = q
+        v = rep[c]
+        for k in range(2):
+            x = v if k == 0 else match[v]
+            if k == 1 and x == v:
+                break
+            cvwgt[c] += vwgt[x]
+            for p in range(ptr[x], ptr[x + 1]):
+                cu = cmap[adj[p]]
+                if cu == c:
+                    continue
+                if row[cu] == c:
+                    cewgt[pos[cu]] += ewgt[p]
+                else:
+                    row[cu] = c
+                    pos[cu] = q
+                    cadj[q] = cu
+                    cewgt[q] = ewgt[p]
+                    q += 1
+    cptr[nc] = q
+    return cmap, nc, cptr, cadj[:q].copy(), cewgt[:q].copy(), cvwgt
+
+
+@njit(nogil=True)
+def _cut_gains(ptr, adj, ewgt, part, gain):
+    """gain[v] = external - internal edge weight of v; returns the edge cut."""
+    m = len(ptr) - 1
+    cut = 0
+    for v in range(m):
+        g = 0
+        for p in range(ptr[v], ptr[v + 1]):
+            if part[adj[p]] != part[v]:
+                g += ewgt[p]
+                cut += ewgt[p]
+            else:
+                g -= ewgt[p]
+        gain[v] = g
+    return cut // 2
+
+
+@njit(nogil=True)
+def _fm_refine(ptr, adj, ewgt, vwgt, part, max_w, n_passes):
+    """
+    Fiduccia-Mattheyses refinement of a bisection, in place: each pass
+    moves boundary nodes one at a time by largest gain (hill-climbing
+    through negative gains), with every node moved at most once, then
+    rolls back to the best prefix. A side heavier than max_w is drained
+    first. Returns the edge cut.
+    """
+    m = len(ptr) - 1
+    gain = np.empty(m, dtype=np.int64)
+    cut = _cut_gains(ptr, adj, ewgt, part, gain)
+    w = np.zeros(2, dtype=np.int64)
+    for v in range(m):
+        w[part[v]] += vwgt[v]
+
+    cap = m + len(adj) + 1
+    keys = np.empty((2, cap), dtype=np.int64)
+    vals = np.empty((2, cap), dtype=np.int32)
+    size = np.zeros(2, dtype=np.int64)
+    locked = np.zeros(m, dtype=np.bool_)
+    moved = np.empty(m, dtype=np.int32)
+    top = np.empty(2, dtype=np.int64)
+    limit = max(100, m // 100)
+
+    for _ in range(n_passes):
+        size[:] = 0
+        locked[:] = False
+        for v in range(m):
+            for p in range(ptr[v], ptr[v + 1]):
+                if part[adj[p]] != part[v]:
+                    s = part[v]
+                    size[s] = _heap_push(keys[s], vals[s], size[s], gain[v], v)
+                    break
+
+        best_cut = cut
+        best_feasible = max(w[0], w[1]) <= max_w
+        best_imb = abs(w[0] - w[1])
+        best_k = 0
+        n_moves = 0
+        while n_moves - best_k <= limit:
+            # Valid top of each heap (stale entries are dropped)
+            for s in range(2):
+                top[s] = -1
+                while size[s] > 0:
+                    v = vals[s, 0]
+                    if not locked[v] and part[v] == s and keys[s, 0] == gain[v]:
+                        top[s] = v
+                        break
+                    size[s] = _heap_pop(keys[s], vals[s], size[s])
+            side = -1
+            if w[0] > max_w and top[0] >= 0:
+                side = 0
+            elif w[1] > max_w and top[1] >= 0:
+                side = 1
+            else:
+                for s in range(2):
+                    v = top[s]
+                    if v < 0 or w[1 - s] + vwgt[v] > max_w:
+                        continue
+                    if (side == -1 or gain[v] > gain[top[side]]
+                            or (gain[v] == gain[top[side]] and w[s] > w[side])):
+                        side = s
+            if side == -1:
+                break
+
+            v = top[side]
+            size[side] = _heap_pop(keys[side], vals[side], size[side])
+            part[v] = 1 - side
+            w[side] -= vwgt[v]
+            w[1 - side] += vwgt[v]
+            cut -= gain[v]
+            gain[v] = -gain[v]
+            locked[v] = True
+            moved[n_moves] = v
+            n_moves += 1
+            for p in range(ptr[v], ptr[v + 1]):
+                u = adj[p]
+                if part[u] == part[v]:
+                    gain[u] -= 2 * ewgt[p]
+                else:
+                    gain[u] += 2 * ewgt[p]
+                if not locked[u]:
+                    s = part[u]
+                    size[s] = _heap_push(keys[s], vals[s], size[s], gain[u], u)
+
+            feasible = max(w[0], w[1]) <= max_w
+            imb = abs(w[0] - w[1])
+            if feasible and not best_feasible:
+                better = True
+            elif feasible == best_feasible:
+                if feasible:
+                    better = cut < best_cut or (cut == best_cut and imb < best_imb)
+                else:
+                    better = imb < best_imb
+            else:
+                better = False
+            if better:
+                best_cut = cut
+                best_feasible = feasible
+                best_imb = imb
+                best_k = n_moves
+
+        for q in range(n_moves - 1, best_k - 1, -1):
+            v = moved[q]
+            w[part[v]] -= vwgt[v]
+            part[v] = 1 - part[v]
+            w[part[v]] += vwgt[v]
+        if n_moves > best_k:
+            cut = _cut_gains(ptr, adj, ewgt, part, gain)
+        if best_k == 0:
+            break
+    return cut
+
+
+@njit(nogil=True)
+def _initial_partition(ptr, adj, ewgt, vwgt, max_w):
+    """
+    Greedy graph growing: a breadth-first region from a random node is
+    grown to half the weight (restarting in another component if needed)
+    and refined by FM. The best of several trials is kept.
+    """
+    m = len(ptr) - 1
+    total = vwgt.sum()
+    best = np.zeros(m, dtype=np.int8)
+    best_cut = -1
+    part = np.empty(m, dtype=np.int8)
+    queued = np.empty(m, dtype=np.bool_)
+    queue = np.empty(m, dtype=np.int32)
+    for _ in range(_N_INIT_TRIALS):
+        part[:] = 1
+        queued[:] = False
+        w0 = 0
+        head = 0
+        tail = 0
+        scan = np.random.randint(0, m)
+        while 2 * w0 < total:
+            if head == tail:
+                # Next component (or first seed), from a random position
+                found = False
+                for t in range(m):
+                    s = (scan + t) % m
+                    if not queued[s]:
+                        found = True
+                        break
+                if not found:
+                    break
+                queued[s] = True
+                queue[tail] = s
+                tail += 1
+            v = queue[head]
+            head += 1
+            if w0 + vwgt[v] > max_w:
+                continue
+            part[v] = 0
+            w0 += vwgt[v]
+            for p in range(ptr[v], ptr[v + 1]):
+                u = adj[p]
+                if not queued[u]:
+                    queued[u] = True
+                    queue[tail] = u
+                    tail += 1
+        cut = _fm_refine(ptr, adj, ewgt, vwgt, part, max_w, _FM_PASSES)
+        if best_cut < 0 or cut < best_cut:
+            best_cut = cut
+            best[:] = part
+    return best
+
+
+@njit(nogil=True)
+def _bisect(ptr, adj):
+    """Multilevel edge bisection of a connected graph; returns the side of each node."""
+    m = len(ptr) - 1
+    max_vwgt = max(2, int(1.5 * m / _COARSEN_TO))
+    max_w = max(int((1.0 + _IMBALANCE) * m / 2), (m + 1) // 2)
+
+    g_ptr = [ptr]
+    g_adj = [adj]
+    g_ewgt = [np.ones(len(adj), dtype=np.int64)]
+    g_vwgt = [np.ones(m, dtype=np.int64)]
+    cmaps = [np.empty(0, dtype=np.int32)]
+    while len(g_ptr[-1]) - 1 > _COARSEN_TO:
+        cur = len(g_ptr) - 1
+        mc = len(g_ptr[cur]) - 1
+        cmap, nc, cptr, cadj, cewgt, cvwgt = _coarsen(g_ptr[cur], g_adj[cur], g_ewgt[cur],
+                                                      g_vwgt[cur], max_vwgt)
+        if nc > 0.95 * mc:
+            break
+        g_ptr.append(cptr)
+        g_adj.append(cadj)
+        g_ewgt.append(cewgt)
+        g_vwgt.append(cvwgt)
+        cmaps.append(cmap)
+
+    L = len(g_ptr) - 1
+    part = _initial_partition(g_ptr[L], g_adj[L], g_ewgt[L], g_vwgt[L], max_w)
+    for lev in range(L - 1, -1, -1):
+        cmap = cmaps[lev + 1]
+        fine = np.empty(len(cmap), dtype=np.int8)
+        for v in range(len(cmap)):
+            fine[v] = part[cmap[v]]
+        part = fine
+        _fm_refine(g_ptr[lev], g_adj[lev], g_ewgt[lev], g_vwgt[lev], part, max_w, _FM_PASSES)
+    return part
+
+
+@njit(nogil=True)
+def _vertex_separator(ptr, adj, part):
+    """
+    Smallest set of nodes covering every cut edge of a bisection: a
+    maximum matching between the boundary nodes of the two sides, then
+    Konig's construction by alternating search from the unmatched side-0
+    nodes. Returns a mask of the separator nodes.
+    """
+    m = len(ptr) - 1
+    bidx = np.full(m, -1, dtype=np.int32)
+    n0 = 0
+    n1 = 0
+    for v in range(m):
+        for p in range(ptr[v], ptr[v + 1]):
+            if part[adj[p]] != part[v]:
+                if part[v] == 0:
+                    bidx[v] = n0
+                    n0 += 1
+                else:
+                    bidx[v] = n1
+                    n1 += 1
+                break
+    sep = np.zeros(m, dtype=np.bool_)
+    if n0 == 0:
+        return sep
+    b0 = np.empty(n0, dtype=np.int32)
+    b1 = np.empty(n1, dtype=np.int32)
+    for v in range(m):
+        if bidx[v] >= 0:
+            if part[v] == 0:
+                b0[bidx[v]] = v
+            else:
+                b1[bidx[v]] = v
+
+    # Bipartite graph of the cut edges: columns side 0, rows side 1
+    bptr = np.zeros(n0 + 1, dtype=np.int32)
+    for c in range(n0):
+        v = b0[c]
+        k = 0
+        for p in range(ptr[v], ptr[v + 1]):
+            if part[adj[p]] == 1:
+                k += 1
+        bptr[c + 1] = bptr[c] + k
+    bind = np.empty(bptr[n0], dtype=np.int32)
+    q = 0
+    for c in range(n0):
+        v = b0[c]
+        for p in range(ptr[v], ptr[v + 1]):
+            u = adj[p]
+            if part[u] == 1:
+                bind[q] = bidx[u]
+                q += 1
+    row_of_col, _ = hopcroft_karp_matching(bind, bptr, n1)
+    col_of_row = np.full(n1, -1, dtype=np.int32)
+    for c in range(n0):
+        if row_of_col[c] >= 0:
+            col_of_row[row_of_col[c]] = c
+
+    # Alternating search: columns by any edge to rows, rows by matching back
+    seen_c = np.zeros(n0, dtype=np.bool_)
+    seen_r = np.zeros(n1, dtype=np.bool_)
+    queue = np.empty(n0, dtype=np.int32)
+    tail = 0
+    for c in range(n0):
+        if row_of_col[c] == -1:
+            seen_c[c] = True
+            queue[tail] = c
+            tail += 1
+    head = 0
+    while head < tail:
+        c = queue[head]
+        head += 1
+        for p in range(bptr[c], bptr[c + 1]):
+            r = bind[p]
+            if not seen_r[r]:
+                seen_r[r] = True
+                c2 = col_of_row[r]
+                if c2 >= 0 and not seen_c[c2]:
+                    seen_c[c2] = True
+                    queue[tail] = c2
+                    tail += 1
+    for c in range(n0):
+        if not seen_c[c]:
+            sep[b0[c]] = True
+    for r in range(n1):
+        if seen_r[r]:
+            sep[b1[r]] = True
+    return sep
+
+
+@njit(nogil=True)
+def _order_leaf(sptr, sadj, verts, lo, hi):
+    """AMD ordering of the part verts[lo:hi], in place."""
+    local = amd_ordering(sadj, sptr)
+    block = verts[lo:hi].copy()
+    for k in range(hi - lo):
+        verts[lo + k] = block[local[k]]
+
+
+@njit(nogil=True)
+def nested_dissection(csc_indices, csc_indptr, leaf_size=ND_LEAF_SIZE, seed=0):
+    """
+    Nested dissection ordering of the graph of A + A^T by multilevel
+    bisection: coarsening by heavy-edge matching, greedy graph growing on
+    the coarsest graph, FM refinement at every level, and a minimum vertex
+    cover of the cut edges as the separator. The two parts are ordered
+    recursively before the separator; disconnected parts are split with an
+    empty separator, and parts of at most leaf_size nodes are ordered by
+    AMD. On 2D / 3D meshes this gives less fill than minimum degree, and
+    the separator tree exposes independent subtrees for parallel
+    factorization.
+
+    The ordering is symmetric; use it as the column ordering of
+    superlu_factorize_csc_perm or umfpack_factorize_csc_perm, or apply it
+    with permute_csc(data, indices, indptr, perm, perm).
+
+    Parameters:
+    -----------
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    leaf_size : int, optional
+        Parts of at most this many nodes are not dissected further
+    seed : int, optional
+        Seed of the randomized matching and initial partitions
+
+    Returns:
+    --------
+    perm : ndarray (int32)
+        Row / column perm[k] of A becomes row / column k
+    tree : SeparatorTree
+        Separator tree; node t owns perm[tree.sep_first[t]:tree.last[t]]
+    """
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+    n = len(indptr) - 1
+    ptr, adj = _symmetric_pattern(indices, indptr, n)
+    np.random.seed(seed)
+    leaf_size = max(leaf_size, 1)
+
+    verts = np.arange(n).astype(np.int32)
+    loc = np.empty(n, dtype=np.int32)
+    mark = np.full(n, -1, dtype=np.int64)
+    cap = 2 * n + 1
+    parent = np.empty(cap, dtype=np.int32)
+    first = np.empty(cap, dtype=np.int32)
+    sep_first = np.empty(cap, dtype=np.int32)
+    last = np.empty(cap, dtype=np.int32)
+    depth = np.empty(cap, dtype=np.int32)
+    # Pending parts: (lo, hi, parent, depth)
+    stack = np.empty((cap, 4), dtype=np.int64)
+    top = 0
+    if n > 0:
+        stack[0, 0] = 0
+        stack[0, 1] = n
+        stack[0, 2] = -1
+        stack[0, 3] = 0
+        top = 1
+    n_nodes = 0
+    while top > 0:
+        top -= 1
+        lo = stack[top, 0]
+        hi = stack[top, 1]
+        t = n_nodes
+        n_nodes += 1
+        parent[t] = stack[top, 2]
+        depth[t] = stack[top, 3]
+        first[t] = lo
+        last[t] = hi
+        sep_first[t] = lo
+        m = hi - lo
+
+        sptr, sadj = _induced_subgraph(ptr, adj, verts, lo, hi, loc, mark, t)
+        if m <= leaf_size:
+            _order_leaf(sptr, sadj, verts, lo, hi)
+            continue
+        n_comp, comp = _components(sptr, sadj, m)
+        if n_comp > 1:
+            # Independent components: two groups of about equal size
+            csize = np.zeros(n_comp, dtype=np.int64)
+            for k in range(m):
+                csize[comp[k]] += 1
+            side = np.zeros(n_comp, dtype=np.int8)
+            gsize = np.zeros(2, dtype=np.int64)
+            for c in np.argsort(-csize):
+                g = 0 if gsize[0] <= gsize[1] else 1
+                side[c] = g
+                gsize[g] += csize[c]
+            part = np.empty(m, dtype=np.int8)
+            for k in range(m):
+                part[k] = side[comp[k]]
+            sep = np.zeros(m, dtype=np.bool_)
+        else:
+            part = _bisect(sptr, sadj)
+            sep = _vertex_separator(sptr, sadj, part)
+
+        n0 = 0
+        n1 = 0
+        for k in range(m):
+            if not sep[k]:
+                if part[k] == 0:
+                    n0 += 1
+                else:
+                    n1 += 1
+        if n0 == 0 or n1 == 0:
+            # No useful separator (e.g. a clique)
+            _order_leaf(sptr, sadj, verts, lo, hi)
+            continue
+
+        block = verts[lo:hi].copy()
+        i0 = lo
+        i1 = lo + n0
+        i_s = lo + n0 + n1
+        for k in range(m):
+            if sep[k]:
+                verts[i_s] = block[k]
+                i_s += 1
+            elif part[k] == 0:
+                verts[i0] = block[k]
+                i0 += 1
+            else:
+                verts[i1] = block[k]
+                i1 += 1
+        sep_first[t] = lo + n0 + n1
+        stack[top, 0] = lo + n0
+        stack[top, 1] = lo + n0 + n1
+        stack[top, 2] = t
+        stack[top, 3] = depth[t] + 1
+        stack[top + 1, 0] = lo
+        stack[top + 1, 1] = lo + n0
+        stack[top + 1, 2] = t
+        stack[top + 1, 3] = depth[t] + 1
+        top += 2
+
+    # Preorder to postorder: by end position, deeper nodes first on ties
+    key = np.empty(n_nodes, dtype=np.int64)
+    for t in range(n_nodes):
+        key[t] = np.int64(last[t]) * (n + 1) + (n - depth[t])
+    order = np.argsort(key)
+    new_id = np.empty(n_nodes, dtype=np.int32)
+    for k in range(n_nodes):
+        new_id[order[k]] = k
+    t_parent = np.empty(n_nodes, dtype=np.int32)
+    t_first = np.empty(n_nodes, dtype=np.int32)
+    t_sep_first = np.empty(n_nodes, dtype=np.int32)
+    t_last = np.empty(n_nodes, dtype=np.int32)
+    t_depth = np.empty(n_nodes, dtype=np.int32)
+    for k in range(n_nodes):
+        t = order[k]
+        t_parent[k] = new_id[parent[t]] if parent[t] >= 0 else -1
+        t_first[k] = first[t]
+        t_sep_first[k] = sep_first[t]
+        t_last[k] = last[t]
+        t_depth[k] = depth[t]
+    tree = SeparatorTree(n_nodes, t_parent, t_first, t_sep_first, t_last, t_depth)
+    return verts, tree
+
+
+@njit(nogil=True)
+def separator_tree_levels(tree):
+    """
+    Bottom-up schedule of a separator tree: level l holds the nodes
+    level_nodes[level_ptr[l]:level_ptr[l + 1]], deepest level first. The
+    nodes of a level are independent and all their children are in
+    earlier levels, so each level can run in prange.
+
+    Parameters:
+    -----------
+    tree : SeparatorTree
+        From nested_dissection
+
+    Returns:
+    --------
+    level_ptr : ndarray (int32)
+        Start of each level in level_nodes
+    level_nodes : ndarray (int32)
+        Tree nodes grouped by level
+    """
+    n_levels = tree.n_levels
+    level_ptr = np.zeros(n_levels + 1, dtype=np.int32)
+    for t in range(tree.n_nodes):
+        level_ptr[n_levels - tree.depth[t]] += 1
+    for lev in range(n_levels):
+        level_ptr[lev + 1] += level_ptr[lev]
+    fill = level_ptr[:n_levels].copy()
+    level_nodes = np.empty(tree.n_nodes, dtype=np.int32)
+    for t in range(tree.n_nodes):
+        lev = n_levels - 1 - tree.depth[t]
+        level_nodes[fill[lev]] = t
+        fill[lev] += 1
+    return level_ptr, level_nodes
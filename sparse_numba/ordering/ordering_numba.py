@@ -0,0 +1,695 @@
+"""
+Fill- and bandwidth-reducing orderings on the graph of A + A^T, computed
+once per sparsity pattern and reusable with every backend, the banded
+solver and the SpMV kernels; plus helpers that apply P A Q^T.
+    rcm_ordering
+    amd_ordering
+    inverse_permutation
+    permute_csc, permute_csr
+    csc_profile
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: ordering_numba.py
+
+import numpy as np
+from numba import njit
+
+from sparse_numba.conversion.matrix_conversion_numba import ensure_float64, ensure_int32
+
+
+@njit(nogil=True)
+def _symmetric_pattern(indices, indptr, n):
+    """
+    Adjacency of the graph of A + A^T: no diagonal, no duplicates.
+    Returns (ptr, adj) in CSR/CSC form (the pattern is symmetric).
+    """
+    cnt = np.zeros(n + 1, dtype=np.int64)
+    for j in range(n):
+        for p in range(indptr[j], indptr[j + 1]):
+            i = indices[p]
+            if i != j:
+                cnt[i + 1] += 1
+                cnt[j + 1] += 1
+    for j in range(n):
+        cnt[j + 1] += cnt[j]
+    adj = np.empty(cnt[n], dtype=np.int32)
+    fill = cnt[:n].copy()
+    for j in range(n):
+        for p in range(indptr[j], indptr[j + 1]):
+            i = indices[p]
+            if i != j:
+                adj[fill[j]] = i
+                fill[j] += 1
+                adj[fill[i]] = j
+                fill[i] += 1
+
+    # Drop duplicates in place; the write position never passes the read one
+    mark = np.full(n, -1, dtype=np.int64)
+    ptr = np.zeros(n + 1, dtype=np.int32)
+    q = 0
+    for j in range(n):
+        ptr[j] = q
+        for p in range(cnt[j], cnt[j + 1]):
+            i = adj[p]
+            if mark[i] != j:
+                mark[i] = j
+                adj[q] = i
+                q += 1
+    ptr[n] = q
+    return ptr, adj[:q].copy()
+
+
+@njit(nogil=True)
+def _bfs(ptr, adj, root, visited, stamp, queue):
+    """
+    Breadth-first search of the component of root, writing the nodes to
+    queue. Returns (number of nodes, number of levels, start of last level).
+    """
+    visited[root] = stamp
+    queue[0] = root
+    head = 0
+    tail = 1
+    n_levels = 0
+    level_start = 0
+    while head < tail:
+        level_start = head
+        level_end = tail
+        n_levels += 1
+        while head < level_end:
+            v = queue[head]
+            head += 1
+            for p in range(ptr[v], ptr[v + 1]):
+                u = adj[p]
+                if visited[u] != stamp:
+                    visited[u] = stamp
+                    queue[tail] = u
+                    tail += 1
+    return tail, n_levels, level_start
+
+
+@njit(nogil=True)
+def _pseudo_peripheral(ptr, adj, start, deg, visited, stamp, queue):
+    """
+    George-Liu search for a node of large eccentricity in the component of
+    start: move to a minimum-degree node of the last BFS level while the
+    number of levels grows. Returns (root, next free stamp).
+    """
+    root = start
+    size, ecc, last = _bfs(ptr, adj, root, visited, stamp, queue)
+    stamp += 1
+    while True:
+        cand = queue[last]
+        for t in range(last + 1, size):
+            if deg[queue[t]] < deg[cand]:
+                cand = queue[t]
+        _, ecc_c, last_c = _bfs(ptr, adj, cand, visited, stamp, queue)
+        stamp += 1
+        if ecc_c <= ecc:
+            break
+        root = cand
+        ecc = ecc_c
+        last = last_c
+    return root, stamp
+
+
+@njit(nogil=True)
+def rcm_ordering(csc_indices, csc_indptr):
+    """
+    Reverse Cuthill-McKee ordering of the graph of A + A^T. Each connected
+    component starts from a pseudo-peripheral node, neighbours are visited
+    in order of increasing degree, and the final order is reversed. Gives
+    a small bandwidth and profile, for the banded solver and for cache
+    locality of SpMV.
+
+    Parameters:
+    -----------
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+
+    Returns:
+    --------
+    perm : ndarray (int32)
+        Row / column perm[k] of A becomes row / column k
+    """
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+    n = len(indptr) - 1
+    ptr, adj = _symmetric_pattern(indices, indptr, n)
+    deg = np.empty(n, dtype=np.int32)
+    for v in range(n):
+        deg[v] = ptr[v + 1] - ptr[v]
+
+    visited = np.zeros(n, dtype=np.int64)
+    queue = np.empty(n, dtype=np.int32)
+    placed = np.zeros(n, dtype=np.bool_)
+    order = np.empty(n, dtype=np.int32)
+    stamp = 1
+    pos = 0
+    for s in range(n):
+        if placed[s]:
+            continue
+        root, stamp = _pseudo_peripheral(ptr, adj, s, deg, visited, stamp, queue)
+
+        # Cuthill-McKee from root: each node's new neighbours by degree
+        placed[root] = True
+        order[pos] = root
+        head = pos
+        pos += 1
+        while head < pos:
+            v = order[head]
+            head += 1
+            first = pos
+            for p in range(ptr[v], ptr[v + 1]):
+                u = adj[p]
+                if not placed[u]:
+                    placed[u] = True
+                    # insertion by degree, stable
+                    t = pos
+                    while t > first and deg[order[t - 1]] > deg[u]:
+                        order[t] = order[t - 1]
+                        t -= 1
+                    order[t] = u
+                    pos += 1
+    return order[::-1].copy()
+
+
+@njit(nogil=True)
+def _flip(i):
+    return -i - 2
+
+
+@njit(nogil=True)
+def _wclear(mark, lemax, w, n):
+    if mark < 2 or mark + lemax < 0:
+        for k in range(n):
+            if w[k] != 0:
+                w[k] = 1
+        mark = 2
+    return mark
+
+
+@njit(nogil=True)
+def _tdfs(j, k, head, next_, post, stack):
+    """Depth-first postorder of the tree rooted at j (child lists head/next_)."""
+    top = 0
+    stack[0] = j
+    while top >= 0:
+        p = stack[top]
+        i = head[p]
+        if i == -1:
+            top -= 1
+            post[k] = p
+            k += 1
+        else:
+            head[p] = next_[i]
+            top += 1
+            stack[top] = i
+    return k
+
+
+@njit(nogil=True)
+def amd_ordering(csc_indices, csc_indptr, dense=-1):
+    """
+    Approximate minimum degree ordering of the graph of A + A^T, on the
+    quotient graph with element absorption, mass elimination, supervariable
+    detection and approximate external degrees (the AMD variant of
+    CSparse's cs_amd). Reduces the fill of Cholesky / symmetric-pivot LU
+    and is a good column ordering for any sparse LU.
+
+    Parameters:
+    -----------
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    dense : int, optional
+        Nodes of larger degree are ordered last; default max(16, 10 sqrt(n))
+
+    Returns:
+    --------
+    perm : ndarray (int32)
+        Row / column perm[k] of A becomes row / column k
+    """
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+    n = len(indptr) - 1
+    if n == 0:
+        return np.zeros(0, dtype=np.int32)
+    if dense < 0:
+        dense = max(16, int(10.0 * np.sqrt(n)))
+    dense = min(n - 2, dense)
+
+    sp_ptr, sp_adj = _symmetric_pattern(indices, indptr, n)
+    cnz = sp_ptr[n]
+    nzmax = cnz + cnz // 5 + 2 * n
+    Ci = np.empty(nzmax, dtype=np.int64)
+    Ci[:cnz] = sp_adj
+    Cp = np.empty(n + 1, dtype=np.int64)
+    Cp[:] = sp_ptr
+
+    P = np.empty(n + 1, dtype=np.int64)
+    length = np.empty(n + 1, dtype=np.int64)
+    nv = np.empty(n + 1, dtype=np.int64)
+    next_ = np.empty(n + 1, dtype=np.int64)
+    head = np.empty(n + 1, dtype=np.int64)
+    elen = np.empty(n + 1, dtype=np.int64)
+    degree = np.empty(n + 1, dtype=np.int64)
+    w = np.empty(n + 1, dtype=np.int64)
+    hhead = np.empty(n + 1, dtype=np.int64)
+    last = P
+
+    # Quotient graph: every node is a variable with its own adjacency list
+    for k in range(n):
+        length[k] = Cp[k + 1] - Cp[k]
+    length[n] = 0
+    for i in range(n + 1):
+        head[i] = -1
+        last[i] = -1
+        next_[i] = -1
+        hhead[i] = -1
+        nv[i] = 1
+        w[i] = 1
+        elen[i] = 0
+        degree[i] = length[i]
+    mark = _wclear(0, 0, w, n)
+    elen[n] = -2
+    Cp[n] = -1
+    w[n] = 0
+
+    # Degree lists; empty nodes are eliminated, dense ones go last (into n)
+    nel = 0
+    for i in range(n):
+        d = degree[i]
+        if d == 0:
+            elen[i] = -2
+            nel += 1
+            Cp[i] = -1
+            w[i] = 0
+        elif d > dense:
+            nv[i] = 0
+            elen[i] = -1
+            nel += 1
+            Cp[i] = _flip(n)
+            nv[n] += 1
+        else:
+            if head[d] != -1:
+                last[head[d]] = i
+            next_[i] = head[d]
+            head[d] = i
+
+    mindeg = 0
+    lemax = 0
+    while nel < n:
+        # Node of minimum approximate degree
+        k = -1
+        while mindeg < n:
+            k = head[mindeg]
+            if k != -1:
+                break
+            mindeg += 1
+        if next_[k] != -1:
+            last[next_[k]] = -1
+        head[mindeg] = next_[k]
+        elenk = elen[k]
+        nvk = nv[k]
+        nel += nvk
+
+        # Garbage collection of Ci
+        if elenk > 0 and cnz + mindeg >= nzmax:
+            for j in range(n):
+                p = Cp[j]
+                if p >= 0:
+                    Cp[j] = Ci[p]
+                    Ci[p] = _flip(j)
+            q = 0
+            p = 0
+            while p < cnz:
+                j = _flip(Ci[p])
+                p += 1
+                if j >= 0:
+                    Ci[q] = Cp[j]
+                    Cp[j] = q
+                    q += 1
+                    for k3 in range(length[j] - 1):
+                        Ci[q] = Ci[p]
+                        q += 1
+                        p += 1
+            cnz = q
+
+        # New element Lk: union of the elements adjacent to k and its variables
+        dk = 0
+        nv[k] = -nvk
+        p = Cp[k]
+        pk1 = p if elenk == 0 else cnz
+        pk2 = pk1
+        for k1 in range(1, elenk + 2):
+            if k1 > elenk:
+                e = k
+                pj = p
+                ln = length[k] - elenk
+            else:
+                e = Ci[p]
+                p += 1
+                pj = Cp[e]
+                ln = length[e]
+            for k2 in range(ln):
+                i = Ci[pj]
+                pj += 1
+                nvi = nv[i]
+                if nvi <= 0:
+                    continue
+                dk += nvi
+                nv[i] = -nvi
+                Ci[pk2] = i
+                pk2 += 1
+                if next_[i] != -1:
+                    last[next_[i]] = last[i]
+                if last[i] != -1:
+                    next_[last[i]] = next_[i]
+                else:
+                    head[degree[i]] = next_[i]
+            if e != k:
+                Cp[e] = _flip(k)
+                w[e] = 0
+        if elenk != 0:
+            cnz = pk2
+        degree[k] = dk
+        Cp[k] = pk1
+        length[k] = pk2 - pk1
+        elen[k] = -2
+
+        # |Le \ Lk| for every element e adjacent to a variable of Lk
+        mark = _wclear(mark, lemax, w, n)
+        for pk in range(pk1, pk2):
+            i = Ci[pk]
+            eln = elen[i]
+            if eln <= 0:
+                continue
+            nvi = -nv[i]
+            wnvi = mark - nvi
+            for p in range(Cp[i], Cp[i] + eln):
+                e = Ci[p]
+                if w[e] >= mark:
+                    w[e] -= nvi
+                elif w[e] != 0:
+                    w[e] = degree[e] + wnvi
+
+        # Approximate degrees, aggressive absorption, hashes for supervariables
+        for pk in range(pk1, pk2):
+            i = Ci[pk]
+            p1 = Cp[i]
+            p2 = p1 + elen[i] - 1
+            pn = p1
+            h = 0
+            d = 0
+            for p in range(p1, p2 + 1):
+                e = Ci[p]
+                if w[e] != 0:
+                    dext = w[e] - mark
+                    if dext > 0:
+                        d += dext
+                        Ci[pn] = e
+                        pn += 1
+                        h += e
+                    else:
+                        Cp[e] = _flip(k)
+                        w[e] = 0
+            elen[i] = pn - p1 + 1
+            p3 = pn
+            p4 = p1 + length[i]
+            for p in range(p2 + 1, p4):
+                j = Ci[p]
+                nvj = nv[j]
+                if nvj <= 0:
+                    continue
+                d += nvj
+                Ci[pn] = j
+                pn += 1
+                h += j
+            if d == 0:
+                # Mass elimination: i is only adjacent to k
+                Cp[i] = _flip(k)
+                nvi = -nv[i]
+                dk -= nvi
+                nvk += nvi
+                nel += nvi
+                nv[i] = 0
+                elen[i] = -1
+            else:
+                degree[i] = min(degree[i], d)
+                Ci[pn] = Ci[p3]
+                Ci[p3] = Ci[p1]
+                Ci[p1] = k
+                length[i] = pn - p1 + 1
+                h = abs(h) % n
+                next_[i] = hhead[h]
+                hhead[h] = i
+                last[i] = h
+        degree[k] = dk
+        lemax = max(lemax, dk)
+        mark = _wclear(mark + lemax, lemax, w, n)
+
+        # Supervariables: merge variables with identical adjacency
+        for pk in range(pk1, pk2):
+            i = Ci[pk]
+            if nv[i] >= 0:
+                continue
+            h = last[i]
+            i = hhead[h]
+            hhead[h] = -1
+            while i != -1 and next_[i] != -1:
+                ln = length[i]
+                eln = elen[i]
+                for p in range(Cp[i] + 1, Cp[i] + ln):
+                    w[Ci[p]] = mark
+                jlast = i
+                j = next_[i]
+                while j != -1:
+                    ok = length[j] == ln and elen[j] == eln
+                    p = Cp[j] + 1
+                    while ok and p <= Cp[j] + ln - 1:
+                        if w[Ci[p]] != mark:
+                            ok = False
+                        p += 1
+                    if ok:
+                        Cp[j] = _flip(i)
+                        nv[i] += nv[j]
+                        nv[j] = 0
+                        elen[j] = -1
+                        j = next_[j]
+                        next_[jlast] = j
+                    else:
+                        jlast = j
+                        j = next_[j]
+                i = next_[i]
+                mark += 1
+
+        # Finalize Lk and put its variables back in the degree lists
+        p = pk1
+        for pk in range(pk1, pk2):
+            i = Ci[pk]
+            nvi = -nv[i]
+            if nvi <= 0:
+                continue
+            nv[i] = nvi
+            d = degree[i] + dk - nvi
+            d = min(d, n - nel - nvi)
+            if head[d] != -1:
+                last[head[d]] = i
+            next_[i] = head[d]
+            last[i] = -1
+            head[d] = i
+            mindeg = min(mindeg, d)
+            degree[i] = d
+            Ci[p] = i
+            p += 1
+        nv[k] = nvk
+        length[k] = p - pk1
+        if length[k] == 0:
+            Cp[k] = -1
+            w[k] = 0
+        if elenk != 0:
+            cnz = p
+
+    # Postorder the assembly tree
+    for i in range(n):
+        Cp[i] = _flip(Cp[i])
+    for j in range(n + 1):
+        head[j] = -1
+    for j in range(n, -1, -1):
+        if nv[j] > 0:
+            continue
+        next_[j] = head[Cp[j]]
+        head[Cp[j]] = j
+    for e in range(n, -1, -1):
+        if nv[e] <= 0:
+            continue
+        if Cp[e] != -1:
+            next_[e] = head[Cp[e]]
+            head[Cp[e]] = e
+    k = 0
+    for i in range(n + 1):
+        if Cp[i] == -1:
+            k = _tdfs(i, k, head, next_, P, w)
+    return P[:n].astype(np.int32)
+
+
+@njit(nogil=True)
+def inverse_permutation(perm):
+    """pinv with pinv[perm[k]] = k."""
+    pinv = np.empty(len(perm), dtype=np.int32)
+    for k in range(len(perm)):
+        pinv[perm[k]] = k
+    return pinv
+
+
+@njit(nogil=True)
+def _permute_compressed(data, indices, indptr, outer_perm, inner_pinv):
+    """
+    Reorder the outer dimension (columns of CSC / rows of CSR) by copying
+    whole segments, and rename the inner indices, sorting a segment only
+    if the renaming left it out of order.
+    """
+    n_outer = len(indptr) - 1
+    ptr = np.zeros(n_outer + 1, dtype=np.int32)
+    for k in range(n_outer):
+        c = outer_perm[k]
+        ptr[k + 1] = ptr[k] + indptr[c + 1] - indptr[c]
+    out_indices = np.empty(ptr[n_outer], dtype=np.int32)
+    out_data = np.empty(ptr[n_outer], dtype=np.float64)
+    for k in range(n_outer):
+        c = outer_perm[k]
+        q = ptr[k]
+        for p in range(indptr[c], indptr[c + 1]):
+            out_indices[q] = inner_pinv[indices[p]]
+            out_data[q] = data[p]
+            q += 1
+        start = ptr[k]
+        stop = ptr[k + 1]
+        for p in range(start + 1, stop):
+            if out_indices[p] < out_indices[p - 1]:
+                order = np.argsort(out_indices[start:stop], kind='mergesort')
+                out_indices[start:stop] = out_indices[start:stop][order]
+                out_data[start:stop] = out_data[start:stop][order]
+                break
+    return out_data, out_indices, ptr
+
+
+@njit(nogil=True)
+def permute_csc(csc_data, csc_indices, csc_indptr, row_perm=None, col_perm=None):
+    """
+    P A Q^T for a CSC matrix: row row_perm[k] of A becomes row k and column
+    col_perm[k] becomes column k. Columns are copied as whole segments and
+    row indices renamed; there is no conversion through COO.
+    permute_csc(A, p, p) is the symmetric permutation for an ordering p.
+
+    Parameters:
+    -----------
+    csc_data : ndarray (float64)
+        Nonzero values in CSC format
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    row_perm : ndarray (int32), optional
+        Row permutation (default: none)
+    col_perm : ndarray (int32), optional
+        Column permutation (default: none)
+
+    Returns:
+    --------
+    data : ndarray (float64)
+    indices : ndarray (int32)
+    indptr : ndarray (int32)
+        P A Q^T in CSC format, sorted row indices where A had them
+    """
+    data = ensure_float64(csc_data)
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+    n_cols = len(indptr) - 1
+    if col_perm is None:
+        q = np.arange(n_cols, dtype=np.int32)
+    else:
+        q = ensure_int32(col_perm)
+    if row_perm is None:
+        n_rows = indices.max() + 1 if len(indices) > 0 else 0
+        pinv = np.arange(n_rows, dtype=np.int32)
+    else:
+        pinv = inverse_permutation(row_perm)
+    return _permute_compressed(data, indices, indptr, q, pinv)
+
+
+@njit(nogil=True)
+def permute_csr(csr_data, csr_indices, csr_indptr, row_perm=None, col_perm=None):
+    """
+    P A Q^T for a CSR matrix; see permute_csc. Rows are copied as whole
+    segments and column indices renamed.
+
+    Parameters:
+    -----------
+    csr_data : ndarray (float64)
+        Nonzero values in CSR format
+    csr_indices : ndarray (int32)
+        Column indices in CSR format
+    csr_indptr : ndarray (int32)
+        Row pointers in CSR format
+    row_perm : ndarray (int32), optional
+        Row permutation (default: none)
+    col_perm : ndarray (int32), optional
+        Column permutation (default: none)
+
+    Returns:
+    --------
+    data : ndarray (float64)
+    indices : ndarray (int32)
+    indptr : ndarray (int32)
+        P A Q^T in CSR format
+    """
+    data = ensure_float64(csr_data)
+    indices = ensure_int32(csr_indices)
+    indptr = ensure_int32(csr_indptr)
+    n_rows = len(indptr) - 1
+    if row_perm is None:
+        p = np.arange(n_rows, dtype=np.int32)
+    else:
+        p = ensure_int32(row_perm)
+    if col_perm is None:
+        n_cols = indices.max() + 1 if len(indices) > 0 else 0
+        qinv = np.arange(n_cols, dtype=np.int32)
+    else:
+        qinv = inverse_permutation(col_perm)
+    return _permute_compressed(data, indices, indptr, p, qinv)
+
+
+@njit(nogil=True)
+def csc_profile(csc_indices, csc_indptr):
+    """
+    Bandwidth and profile of a square CSC matrix's pattern, for comparing
+    orderings.
+
+    Returns:
+    --------
+    bandwidth : int
+        max |i - j| over the stored entries
+    profile : int
+        sum over columns j of j - (smallest row index in column j), the
+        envelope size of a symmetric pattern
+    """
+    n = len(csc_indptr) - 1
+    bandwidth = 0
+    profile = 0
+    for j in range(n):
+        first = j
+        for p in range(csc_indptr[j], csc_indptr[j + 1]):
+            i = csc_indices[p]
+            bandwidth = max(bandwidth, abs(i - j))
+            first = min(first, i)
+        profile += j - first
+    return bandwidth, profile
@@ -0,0 +1,128 @@
+"""
+Tests for the block triangular form and the connected components.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_btf.py
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse import csgraph
+from sparse_numba.ordering.btf_numba import (
+    connected_components,
+    strongly_connected_components,
+    btf_decomposition,
+)
+
+
+def _make_test_matrix(n=400, density=0.004, seed=0):
+    """Random sparse matrix with a scrambled row order, as CSC."""
+    A = sp.random(n, n, density=density, random_state=seed) + sp.eye(n)
+    s = np.random.default_rng(seed).permutation(n)
+    A = sp.csc_matrix(A.tocsc()[s])
+    A.sort_indices()
+    A.indices = A.indices.astype(np.int32)
+    A.indptr = A.indptr.astype(np.int32)
+    return A
+
+
+def _block_of(ptr):
+    return np.repeat(np.arange(len(ptr) - 1), np.diff(ptr))
+
+
+def test_connected_components():
+    """Same components as scipy, grouped in order of the smallest node."""
+    print("Test: connected_components")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    perm, comp_ptr = connected_components(A.indices, A.indptr)
+    n_comp, labels = csgraph.connected_components(A, directed=False)
+    assert len(comp_ptr) == n_comp + 1
+    assert np.array_equal(np.sort(perm), np.arange(n))
+    comp = _block_of(comp_ptr)
+    for c in range(n_comp):
+        nodes = perm[comp_ptr[c]:comp_ptr[c + 1]]
+        assert np.all(np.diff(nodes) > 0)
+        assert np.all(labels[nodes] == labels[nodes[0]])
+    first = perm[comp_ptr[:-1]]
+    assert np.all(np.diff(first) > 0)
+    # No edge between two components
+    C = A.tocoo()
+    pos = np.empty(n, dtype=np.int64)
+    pos[perm] = np.arange(n)
+    assert np.all(comp[pos[C.row]] == comp[pos[C.col]])
+    print("  PASSED")
+
+
+def test_strongly_connected_components():
+    """Same components as scipy; the symmetric permutation is block upper triangular."""
+    print("Test: strongly_connected_components")
+    A = _make_test_matrix(seed=1)
+    n = A.shape[0]
+    perm, block_ptr = strongly_connected_components(A.indices, A.indptr)
+    n_scc, labels = csgraph.connected_components(A, directed=True, connection='strong')
+    assert len(block_ptr) == n_scc + 1
+    assert np.array_equal(np.sort(perm), np.arange(n))
+    blk = _block_of(block_ptr)
+    for k in range(n_scc):
+        assert len(np.unique(labels[perm[block_ptr[k]:block_ptr[k + 1]]])) == 1
+    C = A[perm][:, perm].tocoo()
+    assert np.all(blk[C.row] <= blk[C.col])
+
+    # A cycle is one component; a long chain needs no recursion
+    m = 20000
+    cycle = sp.csc_matrix((np.ones(m), (np.roll(np.arange(m), 1), np.arange(m))))
+    _, block_ptr = strongly_connected_components(cycle.indices.astype(np.int32),
+                                                 cycle.indptr.astype(np.int32))
+    assert len(block_ptr) == 2
+    chain = sp.diags([np.ones(m), np.ones(m - 1)], [0, 1]).tocsc()
+    perm, block_ptr = strongly_connected_components(chain.indices.astype(np.int32),
+                                                    chain.indptr.astype(np.int32))
+    assert len(block_ptr) == m + 1
+    assert np.array_equal(perm, np.arange(m))
+    print("  PASSED")
+
+
+def test_btf_decomposition():
+    """Block upper triangular with a zero-free diagonal, also from a bad row order."""
+    print("Test: btf_decomposition")
+    A = _make_test_matrix(seed=2)
+    n = A.shape[0]
+    row_perm, col_perm, block_ptr, info = btf_decomposition(A.indices, A.indptr)
+    assert info == 0
+    assert np.array_equal(np.sort(row_perm), np.arange(n))
+    assert np.array_equal(np.sort(col_perm), np.arange(n))
+    C = A[row_perm][:, col_perm].tocsr()
+    assert np.all(C.diagonal() != 0)
+    blk = _block_of(block_ptr)
+    C = C.tocoo()
+    assert np.all(blk[C.row] <= blk[C.col])
+    assert len(block_ptr) > 10
+
+    # Structurally singular: the form is still returned
+    S = sp.csc_matrix(np.array([[1.0, 1.0, 1.0], [0.0, 0.0, 1.0], [0.0, 0.0, 1.0]]))
+    row_perm, col_perm, block_ptr, info = btf_decomposition(S.indices.astype(np.int32),
+                                                            S.indptr.astype(np.int32))
+    assert info > 0
+    assert np.array_equal(np.sort(row_perm), np.arange(3))
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Block Triangular Form Tests")
+    print("=" * 60)
+    test_connected_components()
+    test_strongly_connected_components()
+    test_btf_decomposition()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,99 @@
+"""
+Tests for maximum matching, structural rank and zero-free diagonals.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_matching.py
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import structural_rank as scipy_structural_rank
+from sparse_numba.gplu.gplu_numba import gplu_factorize_csc
+from sparse_numba.ordering.matching_numba import (
+    mc21_matching,
+    hopcroft_karp_matching,
+    structural_rank,
+    zero_free_diagonal,
+    permute_rows_csc,
+)
+
+
+def _make_test_matrix(m, n, density, seed):
+    """Random pattern, as CSC with int32 indices."""
+    A = sp.random(m, n, density=density, random_state=seed, format='csc')
+    A.indices = A.indices.astype(np.int32)
+    A.indptr = A.indptr.astype(np.int32)
+    return A
+
+
+def _check_matching(A, row_of_col, n_matched):
+    assert np.count_nonzero(row_of_col >= 0) == n_matched
+    rows = row_of_col[row_of_col >= 0]
+    assert len(np.unique(rows)) == n_matched
+    for j in np.flatnonzero(row_of_col >= 0):
+        assert row_of_col[j] in A.indices[A.indptr[j]:A.indptr[j + 1]]
+
+
+def test_matching():
+    """Both algorithms find a maximum matching, square or rectangular."""
+    print("Test: mc21_matching + hopcroft_karp_matching + structural_rank")
+    rng = np.random.default_rng(0)
+    for seed in range(100):
+        m = int(rng.integers(1, 50))
+        n = int(rng.integers(1, 50))
+        A = _make_test_matrix(m, n, rng.uniform(0.01, 0.2), seed)
+        rank = scipy_structural_rank(A)
+        for matching in (mc21_matching, hopcroft_karp_matching):
+            row_of_col, n_matched = matching(A.indices, A.indptr, m)
+            assert n_matched == rank
+            _check_matching(A, row_of_col, n_matched)
+        assert structural_rank(A.indices, A.indptr, m) == rank
+    print("  PASSED")
+
+
+def test_zero_free_diagonal():
+    """P A has a zero-free diagonal and factorizes; singular patterns are reported."""
+    print("Test: zero_free_diagonal + permute_rows_csc")
+    n = 200
+    A = _make_test_matrix(n, n, 0.01, 1) + sp.eye(n, format='csc')
+    perm_in = np.random.default_rng(1).permutation(n)
+    A = sp.csc_matrix(A[perm_in, :])
+    assert np.count_nonzero(A.diagonal()) < n
+    perm, info = zero_free_diagonal(A.indices.astype(np.int32), A.indptr.astype(np.int32))
+    assert info == 0
+    data, indices, indptr = permute_rows_csc(A.data, A.indices, A.indptr, perm)
+    PA = sp.csc_matrix((data, indices, indptr), shape=(n, n))
+    assert PA.has_sorted_indices
+    assert abs(PA - A[perm, :]).max() == 0.0
+    assert np.all(PA.diagonal() != 0.0)
+    factors, info = gplu_factorize_csc(data, indices, indptr)
+    assert info == 0
+
+    # Two columns with the same single row
+    B = sp.lil_matrix(sp.eye(6))
+    B[:, 2] = 0.0
+    B[4, 2] = 1.0
+    B = sp.csc_matrix(B)
+    perm, info = zero_free_diagonal(B.indices.astype(np.int32), B.indptr.astype(np.int32))
+    assert info in (3, 5)
+    assert sorted(perm) == list(range(6))
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Structural Analysis Tests")
+    print("=" * 60)
+    test_matching()
+    test_zero_free_diagonal()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,127 @@
+"""
+Tests for the RCM and AMD orderings and the permutation helpers.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_ordering.py
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+from sparse_numba.gplu.gplu_numba import gplu_factorize_csc
+from sparse_numba.ordering.ordering_numba import (
+    rcm_ordering,
+    amd_ordering,
+    inverse_permutation,
+    permute_csc,
+    permute_csr,
+    csc_profile,
+)
+
+
+def _make_test_matrix(m=40, seed=0):
+    """2D grid Laplacian with a random numbering, as CSC."""
+    T = sp.diags([-np.ones(m - 1), 2.0 * np.ones(m), -np.ones(m - 1)], [-1, 0, 1])
+    A = sp.kronsum(T, T).tocsc() + 0.01 * sp.eye(m * m)
+    s = np.random.default_rng(seed).permutation(m * m)
+    A = sp.csc_matrix(A.tocsc()[s][:, s])
+    A.sort_indices()
+    A.indices = A.indices.astype(np.int32)
+    A.indptr = A.indptr.astype(np.int32)
+    return A
+
+
+def _is_perm(p, n):
+    return len(p) == n and np.array_equal(np.sort(p), np.arange(n))
+
+
+def _fill(A, p):
+    data, indices, indptr = permute_csc(A.data, A.indices, A.indptr, p, p)
+    factors, info = gplu_factorize_csc(data, indices, indptr, None, 0.0)
+    assert info == 0
+    return len(factors.Li) + len(factors.Ui)
+
+
+def test_rcm_amd():
+    """RCM shrinks the bandwidth like scipy's; AMD has the least fill."""
+    print("Test: rcm_ordering + amd_ordering")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    p_rcm = rcm_ordering(A.indices, A.indptr)
+    p_amd = amd_ordering(A.indices, A.indptr)
+    assert _is_perm(p_rcm, n) and _is_perm(p_amd, n)
+
+    B = sp.csc_matrix(A[p_rcm][:, p_rcm])
+    bw_rcm, profile_rcm = csc_profile(B.indices, B.indptr)
+    p_ref = reverse_cuthill_mckee(A, symmetric_mode=True)
+    B = sp.csc_matrix(A[p_ref][:, p_ref])
+    bw_ref, profile_ref = csc_profile(B.indices, B.indptr)
+    assert bw_rcm <= 1.1 * bw_ref and profile_rcm <= 1.1 * profile_ref
+    assert bw_rcm < csc_profile(A.indices, A.indptr)[0] // 10
+
+    natural = np.arange(n, dtype=np.int32)
+    fill_nat = _fill(A, natural)
+    fill_rcm = _fill(A, p_rcm)
+    fill_amd = _fill(A, p_amd)
+    assert fill_amd < fill_rcm < fill_nat
+
+    # Unsymmetric, disconnected and empty patterns
+    rng = np.random.default_rng(1)
+    for seed in range(30):
+        m = int(rng.integers(1, 60))
+        C = sp.random(m, m, density=rng.uniform(0.0, 0.1), random_state=seed, format='csc')
+        for ordering in (rcm_ordering, amd_ordering):
+            assert _is_perm(ordering(C.indices.astype(np.int32), C.indptr.astype(np.int32)), m)
+
+    # A dense row and column are ordered last
+    D = sp.lil_matrix(sp.eye(200))
+    D[0, :] = 1.0
+    D[:, 0] = 1.0
+    D = sp.csc_matrix(D)
+    p = amd_ordering(D.indices.astype(np.int32), D.indptr.astype(np.int32))
+    assert p[-1] == 0
+    print("  PASSED")
+
+
+def test_permute():
+    """P A Q^T in CSC and CSR matches scipy indexing, with sorted indices."""
+    print("Test: permute_csc + permute_csr")
+    A = sp.random(30, 20, density=0.2, random_state=3, format='csc')
+    rng = np.random.default_rng(2)
+    p = rng.permutation(30).astype(np.int32)
+    q = rng.permutation(20).astype(np.int32)
+    ref = A.toarray()[p][:, q]
+    d, i, ptr = permute_csc(A.data, A.indices, A.indptr, p, q)
+    B = sp.csc_matrix((d, i, ptr), shape=(30, 20))
+    assert B.has_sorted_indices and np.array_equal(B.toarray(), ref)
+    d, i, ptr = permute_csc(A.data, A.indices, A.indptr, None, q)
+    assert np.array_equal(sp.csc_matrix((d, i, ptr), shape=(30, 20)).toarray(), A.toarray()[:, q])
+
+    R = A.tocsr()
+    d, i, ptr = permute_csr(R.data, R.indices, R.indptr, p, q)
+    B = sp.csr_matrix((d, i, ptr), shape=(30, 20))
+    assert B.has_sorted_indices and np.array_equal(B.toarray(), ref)
+    d, i, ptr = permute_csr(R.data, R.indices, R.indptr, p)
+    assert np.array_equal(sp.csr_matrix((d, i, ptr), shape=(30, 20)).toarray(), A.toarray()[p])
+
+    assert np.array_equal(inverse_permutation(p)[p], np.arange(30))
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Ordering Tests")
+    print("=" * 60)
+    test_rcm_amd()
+    test_permute()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,15 @@
+from .schur_numba import (
+    schur_complement, schur_complement_sparse,
+    substructure_condense, substructure_interface_solve,
+    substructure_recover, substructure_free,
+    Substructuring,
+)
+
+__all__ = [
+    'schur_complement', 'schur_complement_sparse',
+    'substructure_condense', 'substructure_interface_solve',
+    'substructure_recover', 'substructure_free',
+    'Substructuring',
+]
+
+__author__ = 'Tianqi Hong'
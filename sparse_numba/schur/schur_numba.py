@@ -0,0 +1,480 @@
+"""
+Schur complements S = D - C A^{-1} B from an existing factorization of A,
+and static condensation for substructured models: the interiors of all
+subdomains are factorized in parallel and eliminated, leaving a system for
+the interface unknowns only.
+    schur_complement
+    schur_complement_sparse
+    substructure_condense
+    substructure_interface_solve
+    substructure_recover
+    substructure_free
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: schur_numba.py
+
+import numpy as np
+from numba import njit, prange, int32, int64, float64, types
+from numba.experimental import jitclass
+from numba.typed import List
+
+from sparse_numba.conversion.sparse_matrix_numba import CSCMatrix
+from sparse_numba.dense.dense_lu_numba import _lu_factor_inplace, _lu_solve_factored_inplace
+from sparse_numba.handle_solve import (
+    handle_factorize_csc, handle_free, handle_solve_into, concurrent_solves_safe,
+    BACKEND_SUPERLU,
+)
+
+
+@njit(nogil=True)
+def _schur_plan(B, C):
+    """
+    Choose the side to solve on. With few nonempty rows of C it is cheaper
+    to solve A^T W = C^T than A X = B.
+    Returns (trans, sel, others): the columns of B (or rows of C) to solve
+    for, and the nonempty rows of C (or columns of B) to multiply with.
+    """
+    m = B.n_cols
+    p = C.n_rows
+    n_b = 0
+    for j in range(m):
+        if B.indptr[j + 1] > B.indptr[j]:
+            n_b += 1
+    n_c = 0
+    for i in range(p):
+        if C.indptr[i + 1] > C.indptr[i]:
+            n_c += 1
+    trans = n_c < n_b
+    if trans:
+        sel = np.empty(n_c, dtype=np.int64)
+        others = np.empty(n_b, dtype=np.int64)
+    else:
+        sel = np.empty(n_b, dtype=np.int64)
+        others = np.empty(n_c, dtype=np.int64)
+    kb = 0
+    for j in range(m):
+        if B.indptr[j + 1] > B.indptr[j]:
+            if trans:
+                others[kb] = j
+            else:
+                sel[kb] = j
+            kb += 1
+    kc = 0
+    for i in range(p):
+        if C.indptr[i + 1] > C.indptr[i]:
+            if trans:
+                sel[kc] = i
+            else:
+                others[kc] = i
+            kc += 1
+    return trans, sel, others
+
+
+@njit(nogil=True)
+def _schur_block(handle, B, C, S, trans, sel, others, b0, b1, backend):
+    """
+    S -= C A^{-1} B for the columns sel[b0:b1] of B (or rows of C when
+    trans), with one multi-RHS solve built from their nonzeros only.
+    """
+    n = B.n_rows
+    nb = b1 - b0
+    if trans:
+        r_data, r_indices, r_indptr = C.data, C.indices, C.indptr
+        o_data, o_indices, o_indptr = B.data, B.indices, B.indptr
+    else:
+        r_data, r_indices, r_indptr = B.data, B.indices, B.indptr
+        o_data, o_indices, o_indptr = C.data, C.indices, C.indptr
+    rhs = np.zeros((nb, n), dtype=np.float64)
+    sol = np.zeros((nb, n), dtype=np.float64)
+    for t in range(nb):
+        v = sel[b0 + t]
+        for q in range(r_indptr[v], r_indptr[v + 1]):
+            rhs[t, r_indices[q]] += r_data[q]
+    info = handle_solve_into(handle, rhs, sol, nb, trans, backend)
+    if info != 0:
+        return info
+    for t in range(nb):
+        v = sel[b0 + t]
+        for u in others:
+            acc = 0.0
+            for q in range(o_indptr[u], o_indptr[u + 1]):
+                acc += o_data[q] * sol[t, o_indices[q]]
+            if trans:
+                S[v, u] -= acc
+            else:
+                S[u, v] -= acc
+    return 0
+
+
+@njit(nogil=True)
+def _schur_subtract(handle, B, C, S, block_size, backend):
+    """S -= C A^{-1} B, one block after another."""
+    trans, sel, others = _schur_plan(B, C)
+    for b0 in range(0, len(sel), block_size):
+        b1 = min(b0 + block_size, len(sel))
+        info = _schur_block(handle, B, C, S, trans, sel, others, b0, b1, backend)
+        if info != 0:
+            return info
+    return 0
+
+
+@njit(nogil=True, parallel=True)
+def _schur_subtract_parallel(handle, B, C, S, block_size, backend):
+    """S -= C A^{-1} B with the blocks solved in parallel."""
+    trans, sel, others = _schur_plan(B, C)
+    nblk = (len(sel) + block_size - 1) // block_size
+    status = np.zeros(nblk, dtype=np.int64)
+    for k in prange(nblk):
+        b0 = k * block_size
+        b1 = min(b0 + block_size, len(sel))
+        status[k] = _schur_block(handle, B, C, S, trans, sel, others, b0, b1, backend)
+    for k in range(nblk):
+        if status[k] != 0:
+            return status[k]
+    return 0
+
+
+@njit(nogil=True)
+def _schur_dense(A_handle, B, C, block_size, backend):
+    """Dense C A^{-1} B subtracted from zero, with the shape checks."""
+    S = np.zeros((C.n_rows, B.n_cols), dtype=np.float64)
+    if C.n_cols != B.n_rows or block_size < 1:
+        return S, -3
+    if concurrent_solves_safe(backend):
+        info = _schur_subtract_parallel(A_handle, B, C, S, block_size, backend)
+    else:
+        info = _schur_subtract(A_handle, B, C, S, block_size, backend)
+    return S, info
+
+
+@njit(nogil=True)
+def schur_complement(A_handle, B, C, D=None, block_size=32, backend=BACKEND_SUPERLU):
+    """
+    Schur complement S = D - C A^{-1} B as a dense matrix.
+
+    Only the nonempty columns of B are solved for, block_size of them per
+    multi-RHS solve, with the blocks in parallel. When C has fewer nonempty
+    rows than B has nonempty columns, A^T is solved with the rows of C
+    instead.
+
+    Parameters:
+    -----------
+    A_handle : int64
+        Factors of A (n x n) from superlu_/umfpack_/klu_factorize_*()
+    B : CSCMatrix
+        Shape (n, m)
+    C : CSRMatrix
+        Shape (p, n)
+    D : ndarray (float64), optional
+        Shape (p, m); zero if None
+    block_size : int
+        Right-hand sides per solve
+    backend : int
+        BACKEND_SUPERLU, BACKEND_UMFPACK or BACKEND_KLU (from handle_solve)
+
+    Returns:
+    --------
+    S : ndarray (float64)
+        Shape (p, m)
+    info : int
+        Status code (0 for success, -3 for mismatched shapes, otherwise
+        the status of the solve)
+    """
+    S, info = _schur_dense(A_handle, B, C, block_size, backend)
+    if D is not None:
+        if D.shape[0] != S.shape[0] or D.shape[1] != S.shape[1]:
+            return S, -3
+        S += D
+    return S, info
+
+
+@njit(nogil=True)
+def schur_complement_sparse(A_handle, B, C, D=None, drop_tol=0.0, block_size=32,
+                            backend=BACKEND_SUPERLU):
+    """
+    Schur complement S = D - C A^{-1} B as a CSC matrix. Computed as in
+    schur_complement; entries with |s_ij| <= drop_tol are left out.
+
+    Parameters:
+    -----------
+    A_handle : int64
+        Factors of A (n x n) from superlu_/umfpack_/klu_factorize_*()
+    B : CSCMatrix
+        Shape (n, m)
+    C : CSRMatrix
+        Shape (p, n)
+    D : CSCMatrix, optional
+        Shape (p, m); zero if None
+    drop_tol : float
+        Drop tolerance for the entries of S
+    block_size : int
+        Right-hand sides per solve
+    backend : int
+        BACKEND_SUPERLU, BACKEND_UMFPACK or BACKEND_KLU
+
+    Returns:
+    --------
+    S : CSCMatrix
+        Shape (p, m), sorted row indices
+    info : int
+        Status code (0 for success, -3 for mismatched shapes, otherwise
+        the status of the solve)
+    """
+    Sd, info = _schur_dense(A_handle, B, C, block_size, backend)
+    p, m = Sd.shape
+    if D is not None:
+        if D.n_rows != p or D.n_cols != m:
+            info = -3
+        else:
+            for j in range(m):
+                for q in range(D.indptr[j], D.indptr[j + 1]):
+                    Sd[D.indices[q], j] += D.data[q]
+
+    indptr = np.zeros(m + 1, dtype=np.int32)
+    for j in range(m):
+        cnt = 0
+        for i in range(p):
+            if abs(Sd[i, j]) > drop_tol:
+                cnt += 1
+        indptr[j + 1] = indptr[j] + cnt
+    nnz = indptr[m]
+    data = np.empty(nnz, dtype=np.float64)
+    indices = np.empty(nnz, dtype=np.int32)
+    pos = 0
+    for j in range(m):
+        for i in range(p):
+            v = Sd[i, j]
+            if abs(v) > drop_tol:
+                data[pos] = v
+                indices[pos] = i
+                pos += 1
+    return CSCMatrix(data, indices, indptr, p, m), info
+
+
+_substructure_spec = [
+    ('backend', int64),
+    ('n_interface', int64),
+    ('handles', int64[::1]),
+    ('S', float64[:, ::1]),
+    ('g', float64[::1]),
+    ('b_maps', types.ListType(int32[::1])),
+]
+
+
+@jitclass(_substructure_spec)
+class Substructuring:
+    """
+    Condensed interface system S x_b = g of a substructured model, with the
+    factors of every subdomain interior (handles) kept for the recovery.
+    """
+
+    def __init__(self, backend, n_interface, handles, S, g, b_maps):
+        self.backend = backend
+        self.n_interface = n_interface
+        self.handles = handles
+        self.S = S
+        self.g = g
+        self.b_maps = b_maps
+
+    @property
+    def n_subdomains(self):
+        return len(self.handles)
+
+
+@njit(nogil=True)
+def _condense_one(A_ii, A_ib, A_bi, A_bb, f_i, f_b, block_size, backend):
+    """Factorize one interior; return (handle, S_s, g_s, info)."""
+    m = A_ib.n_cols
+    n = A_ii.n_cols
+    S = np.zeros((m, m), dtype=np.float64)
+    g = np.zeros(m, dtype=np.float64)
+    if (A_ii.n_rows != n or A_ib.n_rows != n or A_bi.n_cols != n or A_bi.n_rows != m
+            or A_bb.shape[0] != m or A_bb.shape[1] != m or len(f_i) != n or len(f_b) != m):
+        return np.int64(0), S, g, -3
+    handle, info = handle_factorize_csc(A_ii.data, A_ii.indices, A_ii.indptr, backend)
+    if info != 0:
+        return handle, S, g, info
+    info = _schur_subtract(handle, A_ib, A_bi, S, block_size, backend)
+    if info != 0:
+        return handle, S, g, info
+    S += A_bb
+
+    rhs = np.ascontiguousarray(f_i).astype(np.float64)
+    y = np.zeros(n, dtype=np.float64)
+    info = handle_solve_into(handle, rhs, y, 1, False, backend)
+    for i in range(m):
+        acc = f_b[i]
+        for q in range(A_bi.indptr[i], A_bi.indptr[i + 1]):
+            acc -= A_bi.data[q] * y[A_bi.indices[q]]
+        g[i] = acc
+    return handle, S, g, info
+
+
+@njit(nogil=True, parallel=True)
+def substructure_condense(A_ii, A_ib, A_bi, A_bb, f_i, f_b, b_maps, n_interface,
+                          block_size=32, backend=BACKEND_SUPERLU):
+    """
+    Static condensation of a substructured system. Subdomain s couples its
+    interior unknowns x_i to its interface unknowns x_b through
+
+        [A_ii  A_ib] [x_i]   [f_i]
+        [A_bi  A_bb] [x_b] = [f_b]
+
+    The interiors are factorized and eliminated in parallel across
+    subdomains, and the local S_s = A_bb - A_bi A_ii^{-1} A_ib and
+    g_s = f_b - A_bi A_ii^{-1} f_i are summed into the global interface
+    system S x_b = g.
+
+    Parameters:
+    -----------
+    A_ii : numba.typed.List of CSCMatrix
+        Interior blocks, (n_s x n_s)
+    A_ib : numba.typed.List of CSCMatrix
+        Interior-interface blocks, (n_s x m_s)
+    A_bi : numba.typed.List of CSRMatrix
+        Interface-interior blocks, (m_s x n_s)
+    A_bb : numba.typed.List of ndarray (float64)
+        Interface blocks of the subdomains, (m_s x m_s), dense
+    f_i, f_b : numba.typed.List of ndarray (float64)
+        Interior and interface right-hand sides
+    b_maps : numba.typed.List of ndarray (int32)
+        Global interface index of each local interface unknown, length m_s
+    n_interface : int
+        Number of global interface unknowns
+    block_size : int
+        Right-hand sides per solve in the local Schur complements
+    backend : int
+        BACKEND_SUPERLU, BACKEND_UMFPACK or BACKEND_KLU (from handle_solve)
+
+    Returns:
+    --------
+    sub : Substructuring
+        Interface system sub.S, sub.g and the interior factors
+    info : ndarray (int32)
+        Status code per subdomain (0 for success, -3 for mismatched
+        shapes, otherwise the status of the factorization or solve)
+    """
+    ns = len(A_ii)
+    handles = np.zeros(ns, dtype=np.int64)
+    info = np.zeros(ns, dtype=np.int32)
+    S_loc = List()
+    g_loc = List()
+    for s in range(ns):
+        S_loc.append(np.zeros((0, 0), dtype=np.float64))
+        g_loc.append(np.zeros(0, dtype=np.float64))
+
+    # Each subdomain has its own factors, so this is safe for every backend
+    for s in prange(ns):
+        k = np.int64(s)
+        h, Ss, gs, st = _condense_one(A_ii[k], A_ib[k], A_bi[k], A_bb[k], f_i[k], f_b[k],
+                                      block_size, backend)
+        handles[s] = h
+        S_loc[k] = Ss
+        g_loc[k] = gs
+        info[s] = st
+
+    S = np.zeros((n_interface, n_interface), dtype=np.float64)
+    g = np.zeros(n_interface, dtype=np.float64)
+    maps = List()
+    for s in range(ns):
+        bm = np.ascontiguousarray(b_maps[s]).astype(np.int32)
+        maps.append(bm)
+        if info[s] != 0:
+            continue
+        if len(bm) != len(g_loc[s]):
+            print("Error: Interface map length does not match the interface block")
+            info[s] = -3
+            continue
+        if len(bm) > 0 and (bm.min() < 0 or bm.max() >= n_interface):
+            print("Error: Interface map entry out of range")
+            info[s] = -3
+            continue
+        Ss = S_loc[s]
+        for a in range(len(bm)):
+            g[bm[a]] += g_loc[s][a]
+            for c in range(len(bm)):
+                S[bm[a], bm[c]] += Ss[a, c]
+    return Substructuring(backend, n_interface, handles, S, g, maps), info
+
+
+@njit(nogil=True)
+def substructure_interface_solve(sub):
+    """
+    Solve the condensed interface system S x_b = g with a dense LU.
+
+    Returns:
+    --------
+    x_b : ndarray (float64)
+        Interface solution
+    info : int
+        Status code (0 for success, j + 1 if S is singular at column j)
+    """
+    LU = sub.S.copy()
+    piv = np.zeros(sub.n_interface, dtype=np.int32)
+    x_b = sub.g.copy()
+    info = _lu_factor_inplace(LU, piv)
+    if info != 0:
+        return x_b, info
+    _lu_solve_factored_inplace(LU, piv, x_b)
+    return x_b, 0
+
+
+@njit(nogil=True, parallel=True)
+def substructure_recover(sub, A_ib, f_i, x_b):
+    """
+    Recover the interior unknowns x_i = A_ii^{-1} (f_i - A_ib x_b) of every
+    subdomain from the interface solution, in parallel.
+
+    Parameters:
+    -----------
+    sub : Substructuring
+        From substructure_condense
+    A_ib : numba.typed.List of CSCMatrix
+        Interior-interface blocks, as passed to substructure_condense
+    f_i : numba.typed.List of ndarray (float64)
+        Interior right-hand sides
+    x_b : ndarray (float64)
+        Global interface solution
+
+    Returns:
+    --------
+    x_i : numba.typed.List of ndarray (float64)
+        Interior solution of each subdomain
+    info : ndarray (int32)
+        Status code per subdomain (0 for success)
+    """
+    ns = sub.n_subdomains
+    info = np.zeros(ns, dtype=np.int32)
+    x_i = List()
+    for s in range(ns):
+        x_i.append(np.zeros(A_ib[s].n_rows, dtype=np.float64))
+
+    for s in prange(ns):
+        k = np.int64(s)
+        B = A_ib[k]
+        bm = sub.b_maps[k]
+        rhs = np.ascontiguousarray(f_i[k]).astype(np.float64)
+        for c in range(B.n_cols):
+            xc = x_b[bm[c]]
+            for q in range(B.indptr[c], B.indptr[c + 1]):
+                rhs[B.indices[q]] -= B.data[q] * xc
+        info[s] = handle_solve_into(sub.handles[s], rhs, x_i[k], 1, False, sub.backend)
+    return x_i, info
+
+
+@njit(nogil=True)
+def substructure_free(sub):
+    """Free the interior factors. Returns 0, or the first nonzero status."""
+    status = 0
+    for s in range(sub.n_subdomains):
+        if sub.handles[s] != 0:
+            st = handle_free(sub.handles[s], sub.backend)
+            if st != 0 and status == 0:
+                status = st
+            sub.handles[s] = 0
+    return status
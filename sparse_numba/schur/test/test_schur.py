@@ -0,0 +1,181 @@
+"""
+Tests for Schur complements and static condensation.
+The factorizations come from SuperLU.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_schur.py
+
+import numpy as np
+import scipy.sparse as sp
+from numba.typed import List
+from sparse_numba.conversion.sparse_matrix_numba import as_csc_matrix, as_csr_matrix
+from sparse_numba.sparse_superlu.superlu_numba_interface import (
+    superlu_factorize_csc,
+    superlu_free_factors,
+)
+from sparse_numba.schur.schur_numba import (
+    schur_complement,
+    schur_complement_sparse,
+    substructure_condense,
+    substructure_interface_solve,
+    substructure_recover,
+    substructure_free,
+)
+
+
+def _make_test_matrix(n=120, density=0.03, seed=42):
+    """Random unsymmetric, diagonally dominant matrix, as CSC."""
+    A = sp.random(n, n, density=density, random_state=seed)
+    A = A + sp.diags(np.abs(A).sum(axis=1).A1 + 1.0)
+    return A.tocsc()
+
+
+def _csc(M):
+    M = sp.csc_matrix(M)
+    return as_csc_matrix(M.data, M.indices, M.indptr, M.shape)
+
+
+def _csr(M):
+    M = sp.csr_matrix(M)
+    return as_csr_matrix(M.data, M.indices, M.indptr, M.shape)
+
+
+def test_schur_complement():
+    """Dense and sparse S match D - C A^{-1} B on both solve sides."""
+    print("Test: schur_complement + schur_complement_sparse")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    handle, info = superlu_factorize_csc(A.data, A.indices, A.indptr)
+    assert info == 0
+    Ainv = np.linalg.inv(A.toarray())
+
+    # B with empty columns, C with many rows: solves with A
+    B = sp.random(n, 40, density=0.02, random_state=1, format='csc')
+    C = sp.random(50, n, density=0.1, random_state=2, format='csr')
+    D = np.random.default_rng(3).standard_normal((50, 40))
+    assert np.any(np.diff(B.indptr) == 0)
+    S_ref = D - C.toarray() @ Ainv @ B.toarray()
+    for block_size in (1, 7, 64):
+        S, info = schur_complement(handle, _csc(B), _csr(C), D, block_size)
+        assert info == 0 and np.allclose(S, S_ref)
+
+    # C with few nonempty rows: solves with A^T
+    C2 = sp.random(30, n, density=0.1, random_state=4, format='lil')
+    C2[5:, :] = 0.0
+    C2 = sp.csr_matrix(C2)
+    B2 = sp.random(n, 40, density=0.2, random_state=5, format='csc')
+    S, info = schur_complement(handle, _csc(B2), _csr(C2))
+    assert info == 0 and np.allclose(S, -C2.toarray() @ Ainv @ B2.toarray())
+
+    Ds = sp.csc_matrix(D * (np.abs(D) > 1.0))
+    Ss, info = schur_complement_sparse(handle, _csc(B), _csr(C), _csc(Ds), 1e-12)
+    assert info == 0
+    Ss = sp.csc_matrix((Ss.data, Ss.indices, Ss.indptr), shape=Ss.shape)
+    assert np.allclose(Ss.toarray(), Ds.toarray() - C.toarray() @ Ainv @ B.toarray())
+    assert Ss.nnz < 50 * 40
+
+    _, info = schur_complement(handle, _csc(B), _csr(C), np.zeros((3, 3)))
+    assert info == -3
+    _, info = schur_complement(handle, _csc(B[:50, :]), _csr(C))
+    assert info == -3
+    superlu_free_factors(handle)
+    print("  PASSED")
+
+
+def _laplacian_strips(m, n_sub):
+    """
+    5-point Laplacian on an m x (n_sub * w + n_sub - 1) grid, cut into
+    vertical strips by single grid columns that form the interface.
+    """
+    w = 6
+    nx = n_sub * w + n_sub - 1
+    T = sp.diags([-np.ones(nx - 1), 4.0 * np.ones(nx), -np.ones(nx - 1)], [-1, 0, 1])
+    Ty = sp.diags([-np.ones(m - 1), np.zeros(m), -np.ones(m - 1)], [-1, 0, 1])
+    A = (sp.kron(sp.eye(m), T) + sp.kron(Ty, sp.eye(nx))).tocsr()
+    col = np.tile(np.arange(nx), m)
+    is_iface = (col % (w + 1)) == w
+    iface = np.flatnonzero(is_iface)
+    g_index = -np.ones(A.shape[0], dtype=np.int64)
+    g_index[iface] = np.arange(len(iface))
+    parts = []
+    for s in range(n_sub):
+        interior = np.flatnonzero((col // (w + 1) == s) & ~is_iface)
+        coupled = np.flatnonzero(abs(A[interior, :]).sum(axis=0).A1 > 0)
+        boundary = np.intersect1d(coupled, iface)
+        parts.append((interior, boundary))
+    return A, iface, g_index, parts
+
+
+def test_substructuring():
+    """Condense, interface solve and recover match a direct solve."""
+    print("Test: substructure_condense + substructure_recover")
+    A, iface, g_index, parts = _laplacian_strips(10, 4)
+    N = A.shape[0]
+    f = np.random.default_rng(0).standard_normal(N)
+    x_ref = np.linalg.solve(A.toarray(), f)
+
+    # Split the interface-interface block evenly between the subdomains
+    count = np.zeros(N)
+    for interior, boundary in parts:
+        count[boundary] += 1
+    A_ii, A_ib, A_bi, A_bb, f_i, f_b, b_maps = (List() for _ in range(7))
+    for interior, boundary in parts:
+        A_ii.append(_csc(A[interior][:, interior]))
+        A_ib.append(_csc(A[interior][:, boundary]))
+        A_bi.append(_csr(A[boundary][:, interior]))
+        W = sp.diags(1.0 / count[boundary])
+        Abb = A[boundary][:, boundary].toarray()
+        A_bb.append(np.ascontiguousarray(0.5 * (W @ Abb + Abb @ W)))
+        f_i.append(f[interior].copy())
+        f_b.append(f[boundary] / count[boundary])
+        b_maps.append(g_index[boundary].astype(np.int32))
+
+    sub, info = substructure_condense(A_ii, A_ib, A_bi, A_bb, f_i, f_b, b_maps, len(iface))
+    assert np.all(info == 0) and sub.n_subdomains == 4
+    x_b, info = substructure_interface_solve(sub)
+    assert info == 0
+    assert np.allclose(x_b, x_ref[iface])
+    x_i, info = substructure_recover(sub, A_ib, f_i, x_b)
+    assert np.all(info == 0)
+    for s, (interior, _) in enumerate(parts):
+        assert np.allclose(x_i[s], x_ref[interior])
+    assert substructure_free(sub) == 0
+
+    # A singular interior is reported for its subdomain only
+    A_ii[2] = _csc(sp.csc_matrix(A_ii[2].shape))
+    sub, info = substructure_condense(A_ii, A_ib, A_bi, A_bb, f_i, f_b, b_maps, len(iface))
+    assert info[2] != 0 and info[0] == 0 and info[1] == 0 and info[3] == 0
+    substructure_free(sub)
+
+    # An interface map entry outside 0:n_interface is rejected, not scattered
+    A_ii[2] = _csc(A[parts[2][0]][:, parts[2][0]])
+    b_maps[1] = b_maps[1].copy()
+    b_maps[1][0] = len(iface)
+    sub, info = substructure_condense(A_ii, A_ib, A_bi, A_bb, f_i, f_b, b_maps, len(iface))
+    assert info[1] == -3 and info[0] == 0 and info[2] == 0 and info[3] == 0
+    substructure_free(sub)
+    b_maps[1][0] = -1
+    sub, info = substructure_condense(A_ii, A_ib, A_bi, A_bb, f_i, f_b, b_maps, len(iface))
+    assert info[1] == -3
+    substructure_free(sub)
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Schur Complement Tests")
+    print("=" * 60)
+    test_schur_complement()
+    test_substructuring()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,13 @@
+from .selinv_numba import (
+    selinv, selinv_diag,
+    selinv_gplu, selinv_diag_gplu,
+    hutchinson_diag,
+)
+
+__all__ = [
+    'selinv', 'selinv_diag',
+    'selinv_gplu', 'selinv_diag_gplu',
+    'hutchinson_diag',
+]
+
+__author__ = 'Tianqi Hong'
@@ -0,0 +1,535 @@
+"""
+Selected inversion: entries of A^{-1} from the LU factors of A with the
+Takahashi recurrences, on the (chordal) pattern of L + U, in about the
+cost of one factorization. A Hutchinson estimator of diag(A^{-1}) from
+solves only is the fallback for handles whose factors cannot be read.
+    selinv
+    selinv_diag
+    selinv_gplu
+    selinv_diag_gplu
+    hutchinson_diag
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: selinv_numba.py
+
+import numpy as np
+from numba import njit
+
+from sparse_numba.conversion.matrix_conversion_numba import convert_csr_to_csc, convert_coo_to_csc
+from sparse_numba.conversion.sparse_matrix_numba import CSCMatrix
+from sparse_numba.gplu.gplu_numba import _grow
+from sparse_numba.handle_solve import (
+    handle_solve_into, BACKEND_SUPERLU, BACKEND_UMFPACK,
+)
+
+try:
+    from sparse_numba.sparse_superlu.superlu_numba_interface import (
+        c_get_factor_sizes as _c_superlu_factor_sizes,
+        c_get_factors as _c_superlu_factors,
+    )
+    _HAS_SUPERLU = True
+except ImportError:
+    _HAS_SUPERLU = False
+
+try:
+    from sparse_numba.sparse_umfpack.umfpack_numba_interface import (
+        c_get_factor_sizes as _c_umfpack_factor_sizes,
+        c_get_factors as _c_umfpack_factors,
+    )
+    _HAS_UMFPACK = True
+except ImportError:
+    _HAS_UMFPACK = False
+
+
+# Raw factor arrays of a handle; the layout depends on the backend (see the
+# get_factors comments in superlu_wrapper.h / umfpack_wrapper.h)
+if _HAS_SUPERLU:
+    @njit(nogil=True)
+    def _superlu_raw_factors(handle):
+        sizes = np.zeros(4, dtype=np.int32)
+        info = _c_superlu_factor_sizes(handle, sizes.ctypes.data)
+        n, nl, nu = sizes[0], sizes[1], sizes[2]
+        lp = np.zeros(n + 1, dtype=np.int32)
+        li = np.zeros(nl, dtype=np.int32)
+        lx = np.zeros(nl, dtype=np.float64)
+        up = np.zeros(n + 1, dtype=np.int32)
+        ui = np.zeros(nu, dtype=np.int32)
+        ux = np.zeros(nu, dtype=np.float64)
+        pr = np.zeros(n, dtype=np.int32)
+        pc = np.zeros(n, dtype=np.int32)
+        rs = np.ones(n, dtype=np.float64)
+        if info == 0:
+            info = _c_superlu_factors(handle, lp.ctypes.data, li.ctypes.data, lx.ctypes.data,
+                                      up.ctypes.data, ui.ctypes.data, ux.ctypes.data,
+                                      pr.ctypes.data, pc.ctypes.data, rs.ctypes.data)
+        return lp, li, lx, up, ui, ux, pr, pc, rs, sizes[3] != 0, info
+else:
+    @njit(nogil=True)
+    def _superlu_raw_factors(handle):
+        print("Error: SuperLU is not available")
+        e = np.zeros(1, dtype=np.int32)
+        f = np.zeros(0, dtype=np.float64)
+        return e, e, f, e, e, f, e, e, f, False, -5
+
+
+if _HAS_UMFPACK:
+    @njit(nogil=True)
+    def _umfpack_raw_factors(handle):
+        sizes = np.zeros(4, dtype=np.int32)
+        info = _c_umfpack_factor_sizes(handle, sizes.ctypes.data)
+        n, nl, nu = sizes[0], sizes[1], sizes[2]
+        lp = np.zeros(n + 1, dtype=np.int32)
+        li = np.zeros(nl, dtype=np.int32)
+        lx = np.zeros(nl, dtype=np.float64)
+        up = np.zeros(n + 1, dtype=np.int32)
+        ui = np.zeros(nu, dtype=np.int32)
+        ux = np.zeros(nu, dtype=np.float64)
+        pr = np.zeros(n, dtype=np.int32)
+        pc = np.zeros(n, dtype=np.int32)
+        rs = np.ones(n, dtype=np.float64)
+        if info == 0:
+            info = _c_umfpack_factors(handle, lp.ctypes.data, li.ctypes.data, lx.ctypes.data,
+                                      up.ctypes.data, ui.ctypes.data, ux.ctypes.data,
+                                      pr.ctypes.data, pc.ctypes.data, rs.ctypes.data)
+        return lp, li, lx, up, ui, ux, pr, pc, rs, sizes[3] != 0, info
+else:
+    @njit(nogil=True)
+    def _umfpack_raw_factors(handle):
+        print("Error: UMFPACK is not available")
+        e = np.zeros(1, dtype=np.int32)
+        f = np.zeros(0, dtype=np.float64)
+        return e, e, f, e, e, f, e, e, f, False, -5
+
+
+@njit(nogil=True)
+def _inverse_perm(p):
+    out = np.empty(len(p), dtype=np.int32)
+    for k in range(len(p)):
+        out[p[k]] = k
+    return out
+
+
+@njit(nogil=True)
+def _handle_factors(handle, backend):
+    """
+    Factors behind a handle in one layout: L and U as sorted CSC in pivot
+    order, prow[k] / pcol[k] the row / column of A at pivot k, and row
+    scaling rs, so that L U = (diag(rs) A)[prow][:, pcol]. transposed is
+    True if these are the factors of A^T.
+    """
+    if backend == BACKEND_SUPERLU:
+        lp, li, lx, up, ui, ux, pr, pc, rs, transposed, info = _superlu_raw_factors(handle)
+    elif backend == BACKEND_UMFPACK:
+        lp, li, lx, up, ui, ux, pr, pc, rs, transposed, info = _umfpack_raw_factors(handle)
+    else:
+        print("Error: Factors of this backend cannot be read")
+        lp, li, lx, up, ui, ux, pr, pc, rs, transposed, info = _superlu_raw_factors(handle)
+        info = -5
+    n = len(pr)
+    if info != 0:
+        return lp, li, lx, up, ui, ux, pr, pc, rs, transposed, info
+
+    if backend == BACKEND_SUPERLU:
+        # perm_r / perm_c give the pivot position of each row / column
+        prow = _inverse_perm(pr)
+        pcol = _inverse_perm(pc)
+        # Sort the row indices (transpose twice)
+        tx, ti, tp = convert_csr_to_csc(lx, li, lp, (n, n))
+        lx, li, lp = convert_csr_to_csc(tx, ti, tp, (n, n))
+    else:
+        prow = pr
+        pcol = pc
+        # L comes in row form; its CSR arrays are the CSC arrays of L^T
+        lx, li, lp = convert_csr_to_csc(lx, li, lp, (n, n))
+    tx, ti, tp = convert_csr_to_csc(ux, ui, up, (n, n))
+    ux, ui, up = convert_csr_to_csc(tx, ti, tp, (n, n))
+    return lp, li, lx, up, ui, ux, prow, pcol, rs, transposed, 0
+
+
+@njit(nogil=True)
+def _gplu_layout(factors):
+    """GPLUFactors in the layout of _handle_factors."""
+    n = factors.n
+    prow = _inverse_perm(factors.pinv)
+    pcol = factors.q.copy()
+    tx, ti, tp = convert_csr_to_csc(factors.Lx, factors.Li, factors.Lp, (n, n))
+    lx, li, lp = convert_csr_to_csc(tx, ti, tp, (n, n))
+    tx, ti, tp = convert_csr_to_csc(factors.Ux, factors.Ui, factors.Up, (n, n))
+    ux, ui, up = convert_csr_to_csc(tx, ti, tp, (n, n))
+    return lp, li, lx, up, ui, ux, prow, pcol, np.ones(n, dtype=np.float64)
+
+
+@njit(nogil=True)
+def _chordal_pattern(n, lp, li, up, ui, extra_a, extra_b):
+    """
+    Pattern F of the selected inverse: for each t the sorted indices k > t
+    with (k, t) or (t, k) in L + U, plus the pairs {extra_a[s], extra_b[s]},
+    closed under elimination (symbolic Cholesky of the symmetrized pattern)
+    so that the Takahashi recurrences only reference entries of F.
+    """
+    cap = 2 * (lp[n] + up[n]) + n
+    fp = np.zeros(n + 1, dtype=np.int64)
+    fi = np.empty(cap, dtype=np.int32)
+    # Lower-triangle adjacency of the symmetrized pattern
+    cnt = np.zeros(n, dtype=np.int64)
+    for t in range(n):
+        for q in range(lp[t], lp[t + 1]):
+            if li[q] > t:
+                cnt[t] += 1
+        for q in range(up[t], up[t + 1]):
+            if ui[q] < t:
+                cnt[ui[q]] += 1
+    for s in range(len(extra_a)):
+        a, b = extra_a[s], extra_b[s]
+        if a != b:
+            cnt[min(a, b)] += 1
+    gp = np.zeros(n + 1, dtype=np.int64)
+    for t in range(n):
+        gp[t + 1] = gp[t] + cnt[t]
+    gi = np.empty(gp[n], dtype=np.int32)
+    pos = gp[:n].copy()
+    for t in range(n):
+        for q in range(lp[t], lp[t + 1]):
+            if li[q] > t:
+                gi[pos[t]] = li[q]
+                pos[t] += 1
+        for q in range(up[t], up[t + 1]):
+            r = ui[q]
+            if r < t:
+                gi[pos[r]] = t
+                pos[r] += 1
+    for s in range(len(extra_a)):
+        a, b = extra_a[s], extra_b[s]
+        if a != b:
+            lo = min(a, b)
+            gi[pos[lo]] = max(a, b)
+            pos[lo] += 1
+
+    # Children of each column in the elimination tree, as linked lists
+    head = np.full(n, -1, dtype=np.int64)
+    nxt = np.full(n, -1, dtype=np.int64)
+    mark = np.full(n, -1, dtype=np.int64)
+    nnz = 0
+    for t in range(n):
+        mark[t] = t
+        start = nnz
+        for q in range(gp[t], gp[t + 1]):
+            k = gi[q]
+            if mark[k] != t:
+                mark[k] = t
+                if nnz >= len(fi):
+                    fi = _grow(fi, 2 * len(fi) + n)
+                fi[nnz] = k
+                nnz += 1
+        c = head[t]
+        while c >= 0:
+            for q in range(fp[c], fp[c + 1]):
+                k = fi[q]
+                if mark[k] != t:
+                    mark[k] = t
+                    if nnz >= len(fi):
+                        fi = _grow(fi, 2 * len(fi) + n)
+                    fi[nnz] = k
+                    nnz += 1
+            c = nxt[c]
+        fi[start:nnz] = np.sort(fi[start:nnz])
+        fp[t + 1] = nnz
+        if nnz > start:
+            parent = fi[start]
+            nxt[t] = head[parent]
+            head[parent] = t
+    return fp, fi[:nnz]
+
+
+@njit(nogil=True)
+def _find(fi, lo, hi, k):
+    """Position of k in the sorted fi[lo:hi] (k must be present)."""
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if fi[mid] < k:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+@njit(nogil=True)
+def _zget(fp, fi, zl, zu, zd, i, k):
+    """Z[i, k] for an entry of the pattern F."""
+    if i == k:
+        return zd[i]
+    if i > k:
+        return zl[_find(fi, fp[k], fp[k + 1], i)]
+    return zu[_find(fi, fp[i], fp[i + 1], k)]
+
+
+@njit(nogil=True)
+def _takahashi(n, lp, li, lx, up, ui, ux, fp, fi):
+    """
+    Z = (L U)^{-1} on the pattern F, from t = n-1 down to 0, with
+    U = D W (W unit upper):
+        Z[i, t] = -sum_k Z[i, k] L[k, t]          (i > t)
+        Z[t, j] = -sum_k W[t, k] Z[k, j]          (j > t)
+        Z[t, t] = 1 / d_t - sum_k W[t, k] Z[k, t]
+    Returns (zl, zu, zd, info); zl / zu hold Z[i, t] / Z[t, i] for i in
+    F_t. info is t + 1 if the pivot of column t is zero.
+    """
+    zl = np.zeros(len(fi), dtype=np.float64)
+    zu = np.zeros(len(fi), dtype=np.float64)
+    zd = np.zeros(n, dtype=np.float64)
+
+    # U by rows, strictly upper part scaled by the pivots
+    d = np.zeros(n, dtype=np.float64)
+    for t in range(n):
+        for q in range(up[t], up[t + 1]):
+            if ui[q] == t:
+                d[t] = ux[q]
+    for t in range(n):
+        if d[t] == 0.0:
+            return zl, zu, zd, t + 1
+    wx, wi, wp = convert_csr_to_csc(ux, ui, up, (n, n))
+
+    for t in range(n - 1, -1, -1):
+        f0, f1 = fp[t], fp[t + 1]
+        # Column t below the diagonal
+        for q in range(f0, f1):
+            i = fi[q]
+            acc = 0.0
+            for r in range(lp[t], lp[t + 1]):
+                k = li[r]
+                if k > t:
+                    acc += _zget(fp, fi, zl, zu, zd, i, k) * lx[r]
+            zl[q] = -acc
+        # Row t right of the diagonal
+        inv_d = 1.0 / d[t]
+        for q in range(f0, f1):
+            j = fi[q]
+            acc = 0.0
+            for r in range(wp[t], wp[t + 1]):
+                k = wi[r]
+                if k > t:
+                    acc += wx[r] * _zget(fp, fi, zl, zu, zd, k, j)
+            zu[q] = -acc * inv_d
+        acc = 0.0
+        for r in range(wp[t], wp[t + 1]):
+            k = wi[r]
+            if k > t:
+                acc += wx[r] * zl[_find(fi, f0, f1, k)]
+        zd[t] = (1.0 - acc) * inv_d
+    return zl, zu, zd, 0
+
+
+@njit(nogil=True)
+def _selinv_layout(lp, li, lx, up, ui, ux, prow, pcol, rs, transposed, diag_only):
+    """
+    Selected inverse from factors in the _handle_factors layout.
+    Returns (diag, rows, cols, vals, info) with the entries of A^{-1} as COO
+    (empty when diag_only).
+    """
+    n = len(prow)
+    # diag(A^{-1}) needs Z[pcol^{-1}[i], prow^{-1}[i]]
+    prow_inv = _inverse_perm(prow)
+    pcol_inv = _inverse_perm(pcol)
+    fp, fi = _chordal_pattern(n, lp, li, up, ui, pcol_inv, prow_inv)
+    zl, zu, zd, info = _takahashi(n, lp, li, lx, up, ui, ux, fp, fi)
+
+    diag = np.zeros(n, dtype=np.float64)
+    nnz = 0 if diag_only else n + 2 * len(fi)
+    rows = np.empty(nnz, dtype=np.int32)
+    cols = np.empty(nnz, dtype=np.int32)
+    vals = np.empty(nnz, dtype=np.float64)
+    if info != 0:
+        return diag, rows[:0], cols[:0], vals[:0], info
+
+    # (A^{-1})[pcol[a], prow[b]] = Z[a, b] * rs[prow[b]], transposed if the
+    # factors are those of A^T
+    for i in range(n):
+        diag[i] = _zget(fp, fi, zl, zu, zd, pcol_inv[i], prow_inv[i]) * rs[i]
+    if diag_only:
+        return diag, rows, cols, vals, 0
+    pos = 0
+    for t in range(n):
+        rows[pos] = pcol[t]
+        cols[pos] = prow[t]
+        vals[pos] = zd[t] * rs[prow[t]]
+        pos += 1
+        for q in range(fp[t], fp[t + 1]):
+            k = fi[q]
+            rows[pos] = pcol[k]
+            cols[pos] = prow[t]
+            vals[pos] = zl[q] * rs[prow[t]]
+            pos += 1
+            rows[pos] = pcol[t]
+            cols[pos] = prow[k]
+            vals[pos] = zu[q] * rs[prow[k]]
+            pos += 1
+    if transposed:
+        return diag, cols, rows, vals, 0
+    return diag, rows, cols, vals, 0
+
+
+@njit(nogil=True)
+def _as_csc(n, rows, cols, vals):
+    data, indices, indptr = convert_coo_to_csc(rows, cols, vals, n, n)
+    return CSCMatrix(data, indices, indptr, n, n)
+
+
+@njit(nogil=True)
+def selinv(handle, backend=BACKEND_SUPERLU):
+    """
+    Entries of A^{-1} on the pattern of the LU factors, computed from the
+    SuperLU or UMFPACK factors behind a handle with the Takahashi
+    recurrences. The pattern is that of L + U + (L + U)^T, plus the fill
+    needed to close the recurrences, mapped back to the rows and columns of
+    A; it contains the pattern of A^T and the diagonal.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from superlu_factorize_*() or umfpack_factorize_*()
+    backend : int
+        BACKEND_SUPERLU or BACKEND_UMFPACK (from handle_solve)
+
+    Returns:
+    --------
+    Z : CSCMatrix
+        Selected entries of A^{-1}, sorted row indices
+    info : int
+        Status code (0 for success, k + 1 if pivot k of the factors is
+        zero, -5 if the factors of the backend cannot be read)
+    """
+    lp, li, lx, up, ui, ux, prow, pcol, rs, transposed, info = _handle_factors(handle, backend)
+    n = len(prow)
+    if info != 0:
+        e = np.zeros(0, dtype=np.int32)
+        return _as_csc(n, e, e, np.zeros(0, dtype=np.float64)), info
+    _, rows, cols, vals, info = _selinv_layout(lp, li, lx, up, ui, ux, prow, pcol, rs,
+                                               transposed, False)
+    return _as_csc(n, rows, cols, vals), info
+
+
+@njit(nogil=True)
+def selinv_diag(handle, backend=BACKEND_SUPERLU):
+    """
+    diag(A^{-1}) from the SuperLU or UMFPACK factors behind a handle, with
+    the Takahashi recurrences (see selinv).
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from superlu_factorize_*() or umfpack_factorize_*()
+    backend : int
+        BACKEND_SUPERLU or BACKEND_UMFPACK
+
+    Returns:
+    --------
+    d : ndarray (float64)
+        Diagonal of A^{-1}
+    info : int
+        Status code (0 for success, k + 1 if pivot k of the factors is
+        zero, -5 if the factors of the backend cannot be read)
+    """
+    lp, li, lx, up, ui, ux, prow, pcol, rs, transposed, info = _handle_factors(handle, backend)
+    if info != 0:
+        return np.zeros(len(prow), dtype=np.float64), info
+    d, _, _, _, info = _selinv_layout(lp, li, lx, up, ui, ux, prow, pcol, rs, transposed, True)
+    return d, info
+
+
+@njit(nogil=True)
+def selinv_gplu(factors):
+    """
+    Entries of A^{-1} on the pattern of the factors from gplu_factorize_csc;
+    see selinv.
+
+    Returns:
+    --------
+    Z : CSCMatrix
+        Selected entries of A^{-1}
+    info : int
+        Status code (0 for success, k + 1 if pivot k is zero)
+    """
+    lp, li, lx, up, ui, ux, prow, pcol, rs = _gplu_layout(factors)
+    _, rows, cols, vals, info = _selinv_layout(lp, li, lx, up, ui, ux, prow, pcol, rs,
+                                               False, False)
+    return _as_csc(factors.n, rows, cols, vals), info
+
+
+@njit(nogil=True)
+def selinv_diag_gplu(factors):
+    """
+    diag(A^{-1}) from the factors of gplu_factorize_csc.
+
+    Returns:
+    --------
+    d : ndarray (float64)
+        Diagonal of A^{-1}
+    info : int
+        Status code (0 for success, k + 1 if pivot k is zero)
+    """
+    lp, li, lx, up, ui, ux, prow, pcol, rs = _gplu_layout(factors)
+    d, _, _, _, info = _selinv_layout(lp, li, lx, up, ui, ux, prow, pcol, rs, False, True)
+    return d, info
+
+
+@njit(nogil=True)
+def hutchinson_diag(handle, n, n_samples=64, seed=0, block_size=16, backend=BACKEND_SUPERLU):
+    """
+    Stochastic estimate of diag(A^{-1}) from solves only:
+    d ~ sum_s v_s * (A^{-1} v_s) / sum_s v_s * v_s with Rademacher vectors
+    v_s, solved block_size at a time. Works with every backend, including
+    KLU; the error decays like 1 / sqrt(n_samples) and is small when A^{-1}
+    is strongly diagonal.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from superlu_/umfpack_/klu_factorize_*()
+    n : int
+        Dimension of A
+    n_samples : int
+        Number of probe vectors
+    seed : int
+        Seed of the probe vectors
+    block_size : int
+        Probe vectors per solve
+    backend : int
+        BACKEND_SUPERLU, BACKEND_UMFPACK or BACKEND_KLU
+
+    Returns:
+    --------
+    d : ndarray (float64)
+        Estimate of diag(A^{-1})
+    info : int
+        Status code (0 for success, -3 for invalid sizes, otherwise the
+        status of the solve)
+    """
+    d = np.zeros(n, dtype=np.float64)
+    if n_samples < 1 or block_size < 1:
+        return d, -3
+    np.random.seed(seed)
+    den = np.zeros(n, dtype=np.float64)
+    done = 0
+    while done < n_samples:
+        nb = min(block_size, n_samples - done)
+        V = np.empty((nb, n), dtype=np.float64)
+        for s in range(nb):
+            for i in range(n):
+                V[s, i] = 1.0 if np.random.random() < 0.5 else -1.0
+        X = np.zeros((nb, n), dtype=np.float64)
+        info = handle_solve_into(handle, V, X, nb, False, backend)
+        if info != 0:
+            return d, info
+        for s in range(nb):
+            for i in range(n):
+                d[i] += V[s, i] * X[s, i]
+                den[i] += V[s, i] * V[s, i]
+        done += nb
+    for i in range(n):
+        d[i] /= den[i]
+    return d, 0
@@ -0,0 +1,110 @@
+"""
+Tests for selected inversion and the Hutchinson diagonal estimator.
+The factorizations come from the Gilbert-Peierls LU and from SuperLU.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_selinv.py
+
+import numpy as np
+import scipy.sparse as sp
+from sparse_numba.gplu.gplu_numba import gplu_factorize_csc
+from sparse_numba.sparse_superlu.superlu_numba_interface import (
+    superlu_factorize_csc,
+    superlu_free_factors,
+)
+from sparse_numba.selinv.selinv_numba import (
+    selinv,
+    selinv_diag,
+    selinv_gplu,
+    selinv_diag_gplu,
+    hutchinson_diag,
+)
+
+
+def _make_test_matrix(n=300, density=0.01, seed=3):
+    """Random unsymmetric matrix with a weak diagonal, so pivoting happens."""
+    A = sp.random(n, n, density=density, random_state=seed)
+    A = A + sp.diags(np.arange(1, n + 1) * 0.01 + 1.0)
+    return A.tocsc()
+
+
+def _check_selected(Z, A, Ainv):
+    """Every stored entry is exact, and the pattern covers A^T."""
+    n = A.shape[0]
+    Z = sp.csc_matrix((Z.data, Z.indices, Z.indptr), shape=(n, n))
+    r, c = Z.nonzero()
+    assert np.allclose(np.asarray(Z[r, c]).ravel(), Ainv[r, c])
+    At = A.T.tocoo()
+    assert np.allclose(np.asarray(Z[At.row, At.col]).ravel(), Ainv[At.row, At.col])
+    assert Z.nnz < n * n
+
+
+def test_selinv_gplu():
+    """Diagonal and selected entries from Gilbert-Peierls factors."""
+    print("Test: selinv_gplu + selinv_diag_gplu")
+    A = _make_test_matrix()
+    Ainv = np.linalg.inv(A.toarray())
+    factors, info = gplu_factorize_csc(A.data, A.indices, A.indptr)
+    assert info == 0
+    d, info = selinv_diag_gplu(factors)
+    assert info == 0 and np.allclose(d, np.diag(Ainv))
+    Z, info = selinv_gplu(factors)
+    assert info == 0
+    _check_selected(Z, A, Ainv)
+    print("  PASSED")
+
+
+def test_selinv_handle():
+    """Diagonal and selected entries from SuperLU factors."""
+    print("Test: selinv + selinv_diag")
+    A = _make_test_matrix(200, seed=7)
+    Ainv = np.linalg.inv(A.toarray())
+    handle, info = superlu_factorize_csc(A.data, A.indices, A.indptr)
+    assert info == 0
+    d, info = selinv_diag(handle)
+    assert info == 0 and np.allclose(d, np.diag(Ainv))
+    Z, info = selinv(handle)
+    assert info == 0
+    _check_selected(Z, A, Ainv)
+    superlu_free_factors(handle)
+    print("  PASSED")
+
+
+def test_hutchinson():
+    """The estimate is close for a diagonally dominant matrix."""
+    print("Test: hutchinson_diag")
+    n = 150
+    A = sp.random(n, n, density=0.02, random_state=1)
+    A = (A + sp.diags(np.abs(A).sum(axis=1).A1 * 4.0 + 1.0)).tocsc()
+    dref = np.diag(np.linalg.inv(A.toarray()))
+    handle, info = superlu_factorize_csc(A.data, A.indices, A.indptr)
+    d, info = hutchinson_diag(handle, n, 256, 0, 32)
+    assert info == 0
+    assert np.max(np.abs(d - dref)) < 0.1 * np.max(np.abs(dref))
+    d2, _ = hutchinson_diag(handle, n, 256, 0, 7)
+    assert np.allclose(d, d2)
+    _, info = hutchinson_diag(handle, n, 0)
+    assert info == -3
+    superlu_free_factors(handle)
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Selected Inversion Tests")
+    print("=" * 60)
+    test_selinv_gplu()
+    test_selinv_handle()
+    test_hutchinson()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,350 @@
+"""
+Automatic choice of solver per matrix.
+    solve
+    analyze_structure
+    select_route
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: solver_dispatch.py
+
+import numpy as np
+from numba import njit
+
+from sparse_numba.conversion.matrix_conversion_numba import ensure_float64, ensure_int32
+from sparse_numba.dense.dense_lu_numba import dense_solve_csc
+from sparse_numba.banded.banded_numba import (
+    csc_bandwidth, csc_to_band, banded_solve,
+    csc_to_tridiagonal, tridiagonal_solve,
+)
+from sparse_numba.gplu.gplu_numba import gplu_solve_csc
+from sparse_numba.ordering.matching_numba import hopcroft_karp_matching
+
+try:
+    from sparse_numba.sparse_superlu.superlu_numba_interface import (
+        superlu_solve_csc, superlu_factorize_csc_opts,
+        superlu_solve_factored, superlu_free_factors,
+        SLU_COLAMD, SLU_MMD_AT_PLUS_A,
+    )
+    _HAS_SUPERLU = True
+except ImportError:
+    _HAS_SUPERLU = False
+
+try:
+    from sparse_numba.sparse_umfpack.umfpack_numba_interface import umfpack_solve_csc
+    _HAS_UMFPACK = True
+except ImportError:
+    _HAS_UMFPACK = False
+
+try:
+    from sparse_numba.sparse_klu.klu_numba_interface import klu_solve_csc
+    _HAS_KLU = True
+except ImportError:
+    _HAS_KLU = False
+
+__all__ = [
+    'solve', 'analyze_structure', 'select_route',
+    'ROUTE_AUTO', 'ROUTE_DENSE', 'ROUTE_BANDED', 'ROUTE_SUPERLU',
+    'ROUTE_SUPERLU_COLAMD', 'ROUTE_SUPERLU_SYMMETRIC', 'ROUTE_UMFPACK',
+    'ROUTE_TRIDIAGONAL', 'ROUTE_KLU', 'ROUTE_GPLU', 'ROUTE_NAMES',
+]
+
+# Routes returned by select_route / solve, and accepted as overrides by solve
+ROUTE_AUTO = 0
+ROUTE_DENSE = 1               # dense partial-pivot LU
+ROUTE_BANDED = 2              # banded partial-pivot LU (gbsv)
+ROUTE_SUPERLU = 3             # SuperLU, natural ordering (superlu_solve_csc)
+ROUTE_SUPERLU_COLAMD = 4      # SuperLU, COLAMD ordering
+ROUTE_SUPERLU_SYMMETRIC = 5   # SuperLU, A^T+A ordering, diagonal pivots preferred
+ROUTE_UMFPACK = 6             # UMFPACK (chooses its own ordering)
+ROUTE_TRIDIAGONAL = 7         # Thomas algorithm, no pivoting
+ROUTE_KLU = 8                 # KLU (block triangular form + AMD)
+ROUTE_GPLU = 9                # Numba Gilbert-Peierls LU, natural ordering
+
+ROUTE_NAMES = ('auto', 'dense', 'banded', 'superlu', 'superlu_colamd',
+               'superlu_symmetric', 'umfpack', 'tridiagonal', 'klu', 'gplu')
+
+# Selection thresholds
+DENSE_MAX_N = 32              # always dense up to this size
+DENSE_MAX_N_FILLED = 128      # dense up to this size if density >= DENSE_MIN_DENSITY
+DENSE_MIN_DENSITY = 0.1
+BANDED_MAX_WIDTH = 64         # kl + ku
+BANDED_MAX_FILL = 8.0         # band storage n*(kl+ku+1) at most this times nnz
+SYMMETRIC_PIVOT_THRESH = 0.001
+KLU_MAX_AVG_NNZ = 8.0         # KLU if nnz is at most this times n (circuit-like)
+
+
+@njit(nogil=True)
+def analyze_structure(csc_data, csc_indices, csc_indptr):
+    """
+    Cheap structural scan of a square CSC matrix, O(nnz + n).
+
+    Parameters:
+    -----------
+    csc_data : ndarray
+        Nonzero values in CSC format
+    csc_indices : ndarray
+        Row indices in CSC format
+    csc_indptr : ndarray
+        Column pointers in CSC format
+
+    Returns:
+    --------
+    n : int
+        Matrix size
+    nnz : int
+        Number of stored entries
+    kl : int
+        Lower bandwidth
+    ku : int
+        Upper bandwidth
+    symmetric : bool
+        True if the pattern is structurally symmetric
+    diag_dominant : bool
+        True if |a_ii| >= sum of |a_ij|, j != i, in every row, with a
+        nonzero diagonal
+    """
+    n = len(csc_indptr) - 1
+    nnz = csc_indptr[n]
+
+    kl = 0
+    ku = 0
+    diag = np.zeros(n, dtype=np.float64)
+    off = np.zeros(n, dtype=np.float64)
+    row_count = np.zeros(n + 1, dtype=np.int32)
+    for j in range(n):
+        for k in range(csc_indptr[j], csc_indptr[j + 1]):
+            i = csc_indices[k]
+            d = i - j
+            if d > kl:
+                kl = d
+            elif -d > ku:
+                ku = -d
+            if i == j:
+                diag[i] += csc_data[k]
+            else:
+                off[i] += abs(csc_data[k])
+            row_count[i + 1] += 1
+
+    diag_dominant = True
+    for i in range(n):
+        if diag[i] == 0.0 or abs(diag[i]) < off[i]:
+            diag_dominant = False
+            break
+
+    # Column j of A.T lists the columns of row j of A; compare its set of
+    # indices with column j of A using two stamps per column
+    symmetric = kl == ku
+    if symmetric:
+        for i in range(n):
+            row_count[i + 1] += row_count[i]
+        pos = row_count[:n].copy()
+        t_indices = np.empty(nnz, dtype=np.int32)
+        for j in range(n):
+            for k in range(csc_indptr[j], csc_indptr[j + 1]):
+                i = csc_indices[k]
+                t_indices[pos[i]] = j
+                pos[i] += 1
+
+        mark = np.full(n, -1, dtype=np.int64)
+        for j in range(n):
+            distinct = 0
+            for k in range(csc_indptr[j], csc_indptr[j + 1]):
+                i = csc_indices[k]
+                if mark[i] != 2 * j:
+                    mark[i] = 2 * j
+                    distinct += 1
+            for k in range(row_count[j], row_count[j + 1]):
+                i = t_indices[k]
+                if mark[i] == 2 * j:
+                    mark[i] = 2 * j + 1
+                    distinct -= 1
+                elif mark[i] != 2 * j + 1:
+                    symmetric = False
+                    break
+            if not symmetric or distinct != 0:
+                symmetric = False
+                break
+
+    return n, nnz, kl, ku, symmetric, diag_dominant
+
+
+@njit(nogil=True)
+def select_route(n, nnz, kl, ku, symmetric, diag_dominant):
+    """
+    Pick a solver route from the result of analyze_structure.
+
+    Small or fairly dense matrices go to dense LU, diagonally dominant
+    tridiagonal matrices to the Thomas algorithm, narrow bands to the
+    banded solver, structurally symmetric diagonally dominant matrices to
+    SuperLU with an A^T+A ordering and diagonal pivoting, very sparse
+    matrices (circuit-like, few entries per column) to KLU, and the rest
+    to UMFPACK (SuperLU with COLAMD if UMFPACK is not available, and the
+    Numba sparse LU if no C backend is).
+
+    Returns:
+    --------
+    route : int
+        One of the ROUTE_* constants
+    """
+    if n <= DENSE_MAX_N:
+        return ROUTE_DENSE
+    if n <= DENSE_MAX_N_FILLED and nnz >= DENSE_MIN_DENSITY * n * n:
+        return ROUTE_DENSE
+    if kl <= 1 and ku <= 1 and diag_dominant:
+        return ROUTE_TRIDIAGONAL
+    if kl + ku <= BANDED_MAX_WIDTH and n * (kl + ku + 1) <= BANDED_MAX_FILL * nnz:
+        return ROUTE_BANDED
+    if symmetric and diag_dominant and _HAS_SUPERLU:
+        return ROUTE_SUPERLU_SYMMETRIC
+    if _HAS_KLU and nnz <= KLU_MAX_AVG_NNZ * n:
+        return ROUTE_KLU
+    if _HAS_UMFPACK:
+        return ROUTE_UMFPACK
+    if _HAS_SUPERLU:
+        return ROUTE_SUPERLU_COLAMD
+    return ROUTE_GPLU
+
+
+if _HAS_SUPERLU:
+    @njit(nogil=True)
+    def _superlu_route(data, indices, indptr, b, route):
+        if route == ROUTE_SUPERLU:
+            return superlu_solve_csc(data, indices, indptr, b)
+        if route == ROUTE_SUPERLU_SYMMETRIC:
+            handle, info = superlu_factorize_csc_opts(data, indices, indptr,
+                                                      SLU_MMD_AT_PLUS_A, SYMMETRIC_PIVOT_THRESH)
+        else:
+            handle, info = superlu_factorize_csc_opts(data, indices, indptr, SLU_COLAMD, 1.0)
+        if info != 0:
+            if handle != 0:
+                superlu_free_factors(handle)
+            return np.zeros(len(b), dtype=np.float64), info
+        x, info = superlu_solve_factored(handle, b)
+        superlu_free_factors(handle)
+        return x, info
+else:
+    @njit(nogil=True)
+    def _superlu_route(data, indices, indptr, b, route):
+        print("Error: SuperLU backend is not available")
+        return np.zeros(len(b), dtype=np.float64), -4
+
+if _HAS_UMFPACK:
+    @njit(nogil=True)
+    def _umfpack_route(data, indices, indptr, b):
+        return umfpack_solve_csc(data, indices, indptr, b)
+else:
+    @njit(nogil=True)
+    def _umfpack_route(data, indices, indptr, b):
+        print("Error: UMFPACK backend is not available")
+        return np.zeros(len(b), dtype=np.float64), -4
+
+if _HAS_KLU:
+    @njit(nogil=True)
+    def _klu_route(data, indices, indptr, b):
+        return klu_solve_csc(data, indices, indptr, b)
+else:
+    @njit(nogil=True)
+    def _klu_route(data, indices, indptr, b):
+        print("Error: KLU backend is not available")
+        return np.zeros(len(b), dtype=np.float64), -4
+
+
+@njit(nogil=True)
+def solve(csc_data, csc_indices, csc_indptr, b, route=ROUTE_AUTO):
+    """
+    Solve a sparse linear system Ax = b, choosing the solver from the
+    structure of A. Matrix A is in CSC format.
+
+    Parameters:
+    -----------
+    csc_data : ndarray
+        Nonzero values in CSC format
+    csc_indices : ndarray
+        Row indices in CSC format
+    csc_indptr : ndarray
+        Column pointers in CSC format
+    b : ndarray
+        Right-hand side vector
+    route : int, optional
+        ROUTE_AUTO (default) to choose automatically, or one of the other
+        ROUTE_* constants to force a solver
+
+    Returns:
+    --------
+    x : ndarray
+        Solution vector
+    info : int
+        Status code (0 for success, -1/-2 for invalid CSC input, -3 if A
+        is not square or does not match the length of b, or is not
+        tridiagonal on a forced ROUTE_TRIDIAGONAL, -4 if the forced
+        backend is not available, -5 for an unknown route, k + 1 if A is
+        structurally singular and column k has no matching row)
+    route : int
+        The route that was used (see ROUTE_NAMES)
+    """
+    data = ensure_float64(csc_data)
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+    rhs = ensure_float64(b)
+    n = len(indptr) - 1
+
+    # Validate CSC format
+    if indptr[0] != 0:
+        print("Error: First element of indptr must be 0")
+        return np.zeros(len(rhs), dtype=np.float64), -1, route
+    if indptr[n] != len(data):
+        print("Error: Last element of indptr must equal nnz")
+        return np.zeros(len(rhs), dtype=np.float64), -2, route
+    if len(rhs) != n or (len(indices) > 0 and (indices.min() < 0 or indices.max() >= n)):
+        print("Error: Matrix must be square and match the length of b")
+        return np.zeros(len(rhs), dtype=np.float64), -3, route
+    if route < 0 or route >= len(ROUTE_NAMES):
+        print("Error: Unknown route")
+        return np.zeros(len(rhs), dtype=np.float64), -5, route
+
+    kl = -1
+    ku = -1
+    if route == ROUTE_AUTO:
+        n, nnz, kl, ku, symmetric, diag_dominant = analyze_structure(data, indices, indptr)
+        route = select_route(n, nnz, kl, ku, symmetric, diag_dominant)
+
+    # Sparse LU: reject structurally singular matrices before factorizing
+    if route >= ROUTE_SUPERLU and route != ROUTE_TRIDIAGONAL:
+        row_of_col, n_matched = hopcroft_karp_matching(indices, indptr, n)
+        if n_matched < n:
+            print("Error: Matrix is structurally singular")
+            k = 0
+            while row_of_col[k] >= 0:
+                k += 1
+            return np.zeros(n, dtype=np.float64), k + 1, route
+
+    if route == ROUTE_DENSE:
+        x, info = dense_solve_csc(data, indices, indptr, rhs)
+    elif route == ROUTE_BANDED:
+        if kl < 0:
+            kl, ku = csc_bandwidth(indices, indptr)
+        ab = csc_to_band(data, indices, indptr, kl, ku)
+        x, info = banded_solve(ab, kl, ku, rhs)
+    elif route == ROUTE_TRIDIAGONAL:
+        if kl < 0:
+            kl, ku = csc_bandwidth(indices, indptr)
+        if kl > 1 or ku > 1:
+            # csc_to_tridiagonal would drop the entries outside the band
+            print("Error: Matrix is not tridiagonal")
+            return np.zeros(n, dtype=np.float64), -3, route
+        dl, d, du = csc_to_tridiagonal(data, indices, indptr)
+        x, info = tridiagonal_solve(dl, d, du, rhs)
+    elif route == ROUTE_UMFPACK:
+        x, info = _umfpack_route(data, indices, indptr, rhs)
+    elif route == ROUTE_KLU:
+        x, info = _klu_route(data, indices, indptr, rhs)
+    elif route == ROUTE_GPLU:
+        x, info = gplu_solve_csc(data, indices, indptr, rhs)
+    else:
+        x, info = _superlu_route(data, indices, indptr, rhs, route)
+    return x, info, route
@@ -0,0 +1,505 @@
+"""
+Python Interface with CHOLMOD sparse Cholesky solver
+"""
+
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: cholmod_numba_interface.py
+
+import numpy as np
+from numba import njit
+from numba.extending import get_cython_function_address
+import ctypes
+
+from sparse_numba.conversion.matrix_conversion_numba import (
+    convert_coo_to_csc, ensure_float64, ensure_int32,
+)
+
+# Load the CHOLMOD wrapper function
+addr = get_cython_function_address("sparse_numba.sparse_cholmod.cy_cholmod_wrapper",
+                                   "cy_solve_sparse_system")
+functype = ctypes.CFUNCTYPE(
+    ctypes.c_int,  # Return type: status code
+    ctypes.c_void_p,  # values array
+    ctypes.c_void_p,  # rowind array
+    ctypes.c_void_p,  # colptr array
+    ctypes.c_int,  # Number of rows
+    ctypes.c_int,  # Number of columns
+    ctypes.c_int,  # Number of non-zeros
+    ctypes.c_void_p,  # RHS array
+    ctypes.c_void_p  # Solution array (output)
+)
+c_solve_sparse_system = functype(addr)
+
+__all__ = [
+    'cholmod_solve_csc', 'cholmod_solve_coo',
+    'cholmod_analyze_csc', 'cholmod_factorize_numeric',
+    'cholmod_factorize_csc', 'cholmod_factorize_coo',
+    'cholmod_solve_factored', 'cholmod_solve_factored_multi',
+    'cholmod_updown', 'cholmod_free_factors',
+]
+
+
+@njit(nogil=True)
+def cholmod_solve_csc(csc_data, csc_indices, csc_indptr, b):
+    """
+    Solve a symmetric positive definite system Ax = b using CHOLMOD.
+    Matrix A is in CSC format.
+
+    Only the lower triangle of A is read, so either the full symmetric
+    matrix or just its lower triangle can be passed. Entries above the
+    diagonal are ignored.
+
+    Parameters:
+    -----------
+    csc_data : ndarray
+        Nonzero values in CSC format
+    csc_indices : ndarray
+        Row indices in CSC format
+    csc_indptr : ndarray
+        Column pointers in CSC format
+    b : ndarray
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray
+        Solution vector
+    info : int
+        Status code (0 for success, 1 if A is not positive definite)
+    """
+    data = ensure_float64(csc_data)
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+    rhs = ensure_float64(b)
+
+    n_rows = len(rhs)
+    n_cols = len(indptr) - 1
+    nnz = len(data)
+
+    # Validate CSC format
+    if indptr[0] != 0:
+        print(f"Error: First element of indptr must be 0, got {indptr[0]}")
+        return np.zeros(n_rows, dtype=np.float64), -1
+
+    if indptr[n_cols] != nnz:
+        print(f"Error: Last element of indptr must be {nnz}, got {indptr[n_cols]}")
+        return np.zeros(n_rows, dtype=np.float64), -2
+
+    result = np.zeros(n_rows, dtype=np.float64)
+
+    info = c_solve_sparse_system(
+        data.ctypes.data,
+        indices.ctypes.data,
+        indptr.ctypes.data,
+        n_rows,
+        n_cols,
+        nnz,
+        rhs.ctypes.data,
+        result.ctypes.data
+    )
+
+    return result, info
+
+
+@njit(nogil=True)
+def cholmod_solve_coo(row_indices, col_indices, data, shape, b):
+    """
+    Solve a symmetric positive definite system Ax = b using CHOLMOD.
+    Matrix A is in COO format and will be converted to CSC; only its
+    lower triangle is read.
+    """
+    n_rows, n_cols = shape
+
+    if np.any(row_indices < 0) or np.any(row_indices >= n_rows):
+        print("Error: Invalid row indices")
+        return np.zeros(len(b), dtype=np.float64), -1
+
+    if np.any(col_indices < 0) or np.any(col_indices >= n_cols):
+        print("Error: Invalid column indices")
+        return np.zeros(len(b), dtype=np.float64), -2
+
+    csc_data, csc_indices, csc_indptr = convert_coo_to_csc(
+        ensure_int32(row_indices), ensure_int32(col_indices), ensure_float64(data),
+        n_rows, n_cols
+    )
+    return cholmod_solve_csc(csc_data, csc_indices, csc_indptr, b)
+
+
+# ================================================================
+# Pre-factorization API: analyze once, factorize / update / solve many times
+# ================================================================
+
+# Load the symbolic analysis function
+addr_analyze = get_cython_function_address(
+    "sparse_numba.sparse_cholmod.cy_cholmod_wrapper",
+    "cy_analyze_sparse_system")
+functype_analyze = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_void_p,    # rowind
+    ctypes.c_void_p,    # colptr
+    ctypes.c_int,       # nrows
+    ctypes.c_int,       # ncols
+    ctypes.c_int,       # nnz
+    ctypes.c_void_p,    # handle_out (pointer to int64)
+)
+c_analyze_sparse_system = functype_analyze(addr_analyze)
+
+# Load the numeric factorization function
+addr_numeric = get_cython_function_address(
+    "sparse_numba.sparse_cholmod.cy_cholmod_wrapper",
+    "cy_factorize_numeric")
+functype_numeric = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_int64,     # handle (int64)
+    ctypes.c_void_p,    # values, analyzed pattern
+    ctypes.c_int,       # nnz
+)
+c_factorize_numeric = functype_numeric(addr_numeric)
+
+# Load the factorize function
+addr_factorize = get_cython_function_address(
+    "sparse_numba.sparse_cholmod.cy_cholmod_wrapper",
+    "cy_factorize_sparse_system")
+functype_factorize = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_void_p,    # values
+    ctypes.c_void_p,    # rowind
+    ctypes.c_void_p,    # colptr
+    ctypes.c_int,       # nrows
+    ctypes.c_int,       # ncols
+    ctypes.c_int,       # nnz
+    ctypes.c_void_p,    # handle_out (pointer to int64)
+)
+c_factorize_sparse_system = functype_factorize(addr_factorize)
+
+# Load the solve-with-factors function
+addr_solve_factored = get_cython_function_address(
+    "sparse_numba.sparse_cholmod.cy_cholmod_wrapper",
+    "cy_solve_with_factors")
+functype_solve_factored = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_int64,     # handle (int64)
+    ctypes.c_void_p,    # rhs (column-major, n x nrhs)
+    ctypes.c_void_p,    # solution (column-major, n x nrhs)
+    ctypes.c_int,       # nrhs
+)
+c_solve_with_factors = functype_solve_factored(addr_solve_factored)
+
+# Load the update/downdate function
+addr_updown = get_cython_function_address(
+    "sparse_numba.sparse_cholmod.cy_cholmod_wrapper",
+    "cy_updown_sparse_factors")
+functype_updown = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_int64,     # handle (int64)
+    ctypes.c_int,       # update (1) or downdate (0)
+    ctypes.c_void_p,    # values of C
+    ctypes.c_void_p,    # rowind of C
+    ctypes.c_void_p,    # colptr of C
+    ctypes.c_int,       # number of columns of C
+    ctypes.c_int,       # nnz of C
+)
+c_updown_sparse_factors = functype_updown(addr_updown)
+
+# Load the free-factors function
+addr_free = get_cython_function_address(
+    "sparse_numba.sparse_cholmod.cy_cholmod_wrapper",
+    "cy_free_sparse_factors")
+functype_free = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_int64,     # handle
+)
+c_free_sparse_factors = functype_free(addr_free)
+
+
+@njit(nogil=True)
+def cholmod_analyze_csc(csc_indices, csc_indptr):
+    """
+    Symbolic analysis of a symmetric CSC pattern with CHOLMOD: fill-reducing
+    ordering, elimination tree, column counts and supernodes. The values
+    are supplied later with cholmod_factorize_numeric, as many times as
+    needed for matrices with this pattern.
+
+    Parameters:
+    -----------
+    csc_indices : ndarray (int32)
+        Row indices in CSC format (lower triangle is used)
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+
+    Returns:
+    --------
+    handle : int64
+        Opaque handle to the symbolic factor.
+        Must be freed with cholmod_free_factors(handle).
+    info : int
+        Status code (0 for success)
+    """
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+
+    n_cols = len(indptr) - 1
+    n_rows = n_cols  # Square matrix assumption
+    nnz = len(indices)
+
+    if indptr[0] != 0:
+        print("Error: First element of indptr must be 0")
+        return np.int64(0), -1
+    if indptr[n_cols] != nnz:
+        print("Error: Last element of indptr must equal nnz")
+        return np.int64(0), -2
+
+    handle_arr = np.zeros(1, dtype=np.int64)
+
+    info = c_analyze_sparse_system(
+        indices.ctypes.data,
+        indptr.ctypes.data,
+        n_rows,
+        n_cols,
+        nnz,
+        handle_arr.ctypes.data,
+    )
+
+    return handle_arr[0], info
+
+
+@njit(nogil=True)
+def cholmod_factorize_numeric(handle, csc_data):
+    """
+    Numeric Cholesky factorization of new values on the pattern given to
+    cholmod_analyze_csc. The ordering and supernodal structure are reused.
+
+    Parameters:
+    -----------
+    handle : int64
+        Handle from cholmod_analyze_csc() or cholmod_factorize_*()
+    csc_data : ndarray (float64)
+        Nonzero values, in the order of the analyzed CSC matrix
+
+    Returns:
+    --------
+    info : int
+        Status code (0 for success, 1 if A is not positive definite,
+        -3 if the number of values differs)
+    """
+    data = ensure_float64(csc_data)
+    info = c_factorize_numeric(handle, data.ctypes.data, len(data))
+    return info
+
+
+@njit(nogil=True)
+def cholmod_factorize_csc(csc_data, csc_indices, csc_indptr):
+    """
+    Pre-factorize a symmetric positive definite matrix in CSC format using
+    CHOLMOD (analysis and numeric factorization in one call). CHOLMOD uses
+    a supernodal factorization when the matrix is dense enough to profit
+    from it, and a simplicial one otherwise.
+
+    Parameters:
+    -----------
+    csc_data : ndarray (float64)
+        Nonzero values in CSC format (lower triangle is used)
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+
+    Returns:
+    --------
+    handle : int64
+        Opaque handle to the stored factors.
+        Must be freed with cholmod_free_factors(handle).
+    info : int
+        Status code (0 for success, 1 if A is not positive definite)
+    """
+    data = ensure_float64(csc_data)
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+
+    n_cols = len(indptr) - 1
+    n_rows = n_cols  # Square matrix assumption
+    nnz = len(data)
+
+    if indptr[0] != 0:
+        print("Error: First element of indptr must be 0")
+        return np.int64(0), -1
+    if indptr[n_cols] != nnz:
+        print("Error: Last element of indptr must equal nnz")
+        return np.int64(0), -2
+
+    handle_arr = np.zeros(1, dtype=np.int64)
+
+    info = c_factorize_sparse_system(
+        data.ctypes.data,
+        indices.ctypes.data,
+        indptr.ctypes.data,
+        n_rows,
+        n_cols,
+        nnz,
+        handle_arr.ctypes.data,
+    )
+
+    return handle_arr[0], info
+
+
+@njit(nogil=True)
+def cholmod_factorize_coo(row_indices, col_indices, data, shape):
+    """
+    Pre-factorize a symmetric positive definite matrix in COO format using
+    CHOLMOD. Converts to CSC internally, then factorizes; only the lower
+    triangle is read.
+    """
+    n_rows, n_cols = shape
+    csc_data, csc_indices, csc_indptr = convert_coo_to_csc(
+        ensure_int32(row_indices), ensure_int32(col_indices), ensure_float64(data),
+        n_rows, n_cols
+    )
+    return cholmod_factorize_csc(csc_data, csc_indices, csc_indptr)
+
+
+@njit(nogil=True)
+def cholmod_solve_factored(handle, b):
+    """
+    Solve A*x = b using pre-computed factors from cholmod_factorize_*().
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from cholmod_factorize_*()
+    b : ndarray (float64)
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success, -5 if the handle has no valid
+        numeric factorization)
+    """
+    rhs = ensure_float64(b)
+    n = len(rhs)
+    result = np.zeros(n, dtype=np.float64)
+
+    info = c_solve_with_factors(
+        handle,
+        rhs.ctypes.data,
+        result.ctypes.data,
+        1,
+    )
+
+    return result, info
+
+
+@njit(nogil=True)
+def cholmod_solve_factored_multi(handle, B):
+    """
+    Solve A*X = B for several right-hand sides in one call.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from cholmod_factorize_*()
+    B : ndarray (float64)
+        Right-hand sides, shape (n, nrhs)
+
+    Returns:
+    --------
+    X : ndarray (float64)
+        Solutions, shape (n, nrhs)
+    info : int
+        Status code (0 for success)
+    """
+    n = B.shape[0]
+    nrhs = B.shape[1]
+    # Row k of Bt is column k of B: the column-major layout CHOLMOD expects
+    Bt = np.ascontiguousarray(B.T).astype(np.float64)
+    Xt = np.zeros((nrhs, n), dtype=np.float64)
+    if nrhs == 0:
+        return Xt.T, 0
+
+    info = c_solve_with_factors(
+        handle,
+        Bt.ctypes.data,
+        Xt.ctypes.data,
+        nrhs,
+    )
+
+    return Xt.T, info
+
+
+@njit(nogil=True)
+def cholmod_updown(handle, c_data, c_indices, c_indptr, update=True):
+    """
+    Modify the factors in place for a rank-k change of A:
+    A + C*C^T (update) or A - C*C^T (downdate), where C is an n x k sparse
+    matrix in CSC format. Costs about as much as a solve per column of C,
+    far less than a new factorization.
+
+    The first update of a supernodal factorization converts it to a
+    simplicial LDL^T form, which solves use transparently. A downdate that
+    makes the matrix indefinite invalidates the factors (info = 1).
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from cholmod_factorize_*()
+    c_data : ndarray (float64)
+        Nonzero values of C in CSC format
+    c_indices : ndarray (int32)
+        Row indices of C in CSC format
+    c_indptr : ndarray (int32)
+        Column pointers of C (length k + 1)
+    update : bool, optional
+        True for A + C*C^T (default), False for A - C*C^T
+
+    Returns:
+    --------
+    info : int
+        Status code (0 for success, 1 if the result is not positive
+        definite, -5 if the handle has no valid numeric factorization)
+    """
+    data = ensure_float64(c_data)
+    indices = ensure_int32(c_indices)
+    indptr = ensure_int32(c_indptr)
+
+    k = len(indptr) - 1
+    nnz = len(data)
+    if indptr[k] != nnz:
+        print("Error: Last element of indptr must equal nnz")
+        return -2
+
+    info = c_updown_sparse_factors(
+        handle,
+        1 if update else 0,
+        data.ctypes.data,
+        indices.ctypes.data,
+        indptr.ctypes.data,
+        k,
+        nnz,
+    )
+    return info
+
+
+@njit(nogil=True)
+def cholmod_free_factors(handle):
+    """
+    Free memory associated with CHOLMOD factors.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from cholmod_analyze_csc() or cholmod_factorize_*()
+
+    Returns:
+    --------
+    info : int
+        Status code (0 for success)
+    """
+    info = c_free_sparse_factors(handle)
+    return info
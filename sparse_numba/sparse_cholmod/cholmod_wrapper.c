@@ -0,0 +1,324 @@
+/* cholmod_wrapper.c - A minimal wrapper for CHOLMOD to be used with Numba */
+
+// File name: cholmod_wrapper.c
+//
+#include "cholmod_wrapper.h"
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <cholmod.h>
+
+/* Describe caller-owned CSC arrays as a cholmod_sparse without copying.
+ * values == NULL gives a pattern-only matrix (enough for cholmod_analyze). */
+static void wrap_sparse(cholmod_sparse *A, int nrows, int ncols, int nnz,
+                        int *colptr, int *rowind, double *values, int stype) {
+    memset(A, 0, sizeof(cholmod_sparse));
+    A->nrow = nrows;
+    A->ncol = ncols;
+    A->nzmax = nnz;
+    A->p = colptr;
+    A->i = rowind;
+    A->x = values;
+    A->stype = stype;
+    A->itype = CHOLMOD_INT;
+    A->xtype = values ? CHOLMOD_REAL : CHOLMOD_PATTERN;
+    A->dtype = CHOLMOD_DOUBLE;
+    A->sorted = 0;  /* not assumed; CHOLMOD handles unsorted columns */
+    A->packed = 1;
+}
+
+static void wrap_dense(cholmod_dense *B, int nrows, int ncols, double *values) {
+    memset(B, 0, sizeof(cholmod_dense));
+    B->nrow = nrows;
+    B->ncol = ncols;
+    B->nzmax = (size_t)nrows * ncols;
+    B->d = nrows;
+    B->x = values;
+    B->xtype = CHOLMOD_REAL;
+    B->dtype = CHOLMOD_DOUBLE;
+}
+
+static int check_csc(int *colptr, int nrows, int ncols, int nnz) {
+    if (nrows <= 0 || nrows != ncols || nnz <= 0) {
+        printf("Error: Invalid dimensions: rows=%d, cols=%d, nnz=%d\n", nrows, ncols, nnz);
+        return -2;
+    }
+    if (colptr[0] != 0 || colptr[ncols] != nnz) {
+        printf("Error: Invalid CSC format - colptr[0]=%d, colptr[%d]=%d, nnz=%d\n",
+               colptr[0], ncols, colptr[ncols], nnz);
+        return -3;
+    }
+    return 0;
+}
+
+/* Status after cholmod_factorize / cholmod_updown: 0, 1 if the matrix is
+ * not positive definite, or the (negative) CHOLMOD error code */
+static int factor_status(cholmod_common *c) {
+    if (c->status == CHOLMOD_NOT_POSDEF) {
+        printf("CHOLMOD: matrix is not positive definite\n");
+        return 1;
+    }
+    if (c->status < CHOLMOD_OK) {
+        printf("CHOLMOD failed with status %d\n", c->status);
+        return c->status;
+    }
+    return 0;
+}
+
+
+int solve_sparse_system(double *values, int *rowind, int *colptr,
+                        int nrows, int ncols, int nnz,
+                        double *rhs, double *solution) {
+
+    if (!values || !rowind || !colptr || !rhs || !solution) {
+        printf("Error: NULL pointer passed to solve_sparse_system\n");
+        return -1;
+    }
+    int status = check_csc(colptr, nrows, ncols, nnz);
+    if (status != 0) return status;
+
+    cholmod_common c;
+    cholmod_sparse A;
+    cholmod_dense B;
+    cholmod_factor *L = NULL;
+    cholmod_dense *X = NULL;
+
+    cholmod_start(&c);
+    wrap_sparse(&A, nrows, ncols, nnz, colptr, rowind, values, -1);
+    wrap_dense(&B, nrows, 1, rhs);
+
+    L = cholmod_analyze(&A, &c);
+    if (!L) {
+        printf("CHOLMOD analysis failed with status %d\n", c.status);
+        status = c.status;
+        goto cleanup;
+    }
+
+    cholmod_factorize(&A, L, &c);
+    status = factor_status(&c);
+    if (status != 0) goto cleanup;
+
+    X = cholmod_solve(CHOLMOD_A, L, &B, &c);
+    if (!X) {
+        printf("CHOLMOD solve failed with status %d\n", c.status);
+        status = c.status;
+        goto cleanup;
+    }
+    memcpy(solution, X->x, nrows * sizeof(double));
+
+cleanup:
+    if (X) cholmod_free_dense(&X, &c);
+    if (L) cholmod_free_factor(&L, &c);
+    cholmod_finish(&c);
+
+    return status;
+}
+
+
+/* ================================================================
+ * Pre-factorization API: analyze once, factorize / update / solve many times
+ * ================================================================ */
+
+/* Struct to hold CHOLMOD factors between calls */
+typedef struct {
+    cholmod_common Common;
+    cholmod_factor *L;
+    int *colptr;  /* Pattern copy, needed by factorize_numeric */
+    int *rowind;
+    int n;
+    int nnz;
+    int has_numeric;  /* L holds a valid numeric factorization */
+} cholmod_factors_t;
+
+
+int analyze_sparse_system(int *rowind, int *colptr,
+                          int nrows, int ncols, int nnz,
+                          int64_t *handle_out) {
+
+    if (!rowind || !colptr || !handle_out) {
+        printf("Error: NULL pointer passed to analyze_sparse_system\n");
+        return -1;
+    }
+    int status = check_csc(colptr, nrows, ncols, nnz);
+    if (status != 0) return status;
+
+    *handle_out = 0;
+
+    cholmod_factors_t *factors = (cholmod_factors_t*)calloc(1, sizeof(cholmod_factors_t));
+    if (!factors) {
+        printf("Failed to allocate factors struct\n");
+        return -10;
+    }
+    cholmod_start(&factors->Common);
+    factors->n = nrows;
+    factors->nnz = nnz;
+
+    factors->colptr = (int*)malloc((ncols+1) * sizeof(int));
+    factors->rowind = (int*)malloc(nnz * sizeof(int));
+    if (!factors->colptr || !factors->rowind) {
+        printf("Failed to allocate pattern copies\n");
+        status = -12;
+        goto cleanup;
+    }
+    memcpy(factors->colptr, colptr, (ncols+1) * sizeof(int));
+    memcpy(factors->rowind, rowind, nnz * sizeof(int));
+
+    /* Fill-reducing ordering, elimination tree, column counts, supernodes */
+    cholmod_sparse A;
+    wrap_sparse(&A, nrows, ncols, nnz, factors->colptr, factors->rowind, NULL, -1);
+    factors->L = cholmod_analyze(&A, &factors->Common);
+    if (!factors->L) {
+        printf("CHOLMOD analysis failed with status %d\n", factors->Common.status);
+        status = factors->Common.status;
+        goto cleanup;
+    }
+
+    *handle_out = (int64_t)(intptr_t)factors;
+    return 0;
+
+cleanup:
+    free_sparse_factors((int64_t)(intptr_t)factors);
+    return status;
+}
+
+
+int factorize_numeric(int64_t handle, double *values, int nnz) {
+
+    if (!handle || !values) {
+        printf("Error: NULL pointer passed to factorize_numeric\n");
+        return -1;
+    }
+
+    cholmod_factors_t *factors = (cholmod_factors_t*)(intptr_t)handle;
+    if (nnz != factors->nnz) {
+        printf("Error: numeric factorization needs the analyzed pattern (nnz %d vs %d)\n",
+               nnz, factors->nnz);
+        return -3;
+    }
+
+    cholmod_sparse A;
+    wrap_sparse(&A, factors->n, factors->n, nnz, factors->colptr, factors->rowind, values, -1);
+
+    factors->has_numeric = 0;
+    cholmod_factorize(&A, factors->L, &factors->Common);
+    int status = factor_status(&factors->Common);
+    if (status == 0) factors->has_numeric = 1;
+
+    return status;
+}
+
+
+int factorize_sparse_system(double *values, int *rowind, int *colptr,
+                            int nrows, int ncols, int nnz,
+                            int64_t *handle_out) {
+
+    if (!values || !handle_out) {
+        printf("Error: NULL pointer passed to factorize_sparse_system\n");
+        return -1;
+    }
+
+    int status = analyze_sparse_system(rowind, colptr, nrows, ncols, nnz, handle_out);
+    if (status != 0) return status;
+
+    status = factorize_numeric(*handle_out, values, nnz);
+    if (status != 0) {
+        free_sparse_factors(*handle_out);
+        *handle_out = 0;
+    }
+    return status;
+}
+
+
+int solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs) {
+
+    if (!handle || !rhs || !solution) {
+        printf("Error: NULL pointer passed to solve_with_factors\n");
+        return -1;
+    }
+    if (nrhs <= 0) {
+        printf("Error: Invalid number of right-hand sides: %d\n", nrhs);
+        return -2;
+    }
+
+    cholmod_factors_t *factors = (cholmod_factors_t*)(intptr_t)handle;
+    if (!factors->has_numeric) {
+        printf("Error: factors have no valid numeric factorization\n");
+        return -5;
+    }
+
+    int n = factors->n;
+    cholmod_dense B;
+    wrap_dense(&B, n, nrhs, rhs);
+
+    /* All right-hand sides in one pass through the factors */
+    cholmod_dense *X = cholmod_solve(CHOLMOD_A, factors->L, &B, &factors->Common);
+    if (!X) {
+        printf("CHOLMOD solve failed with status %d\n", factors->Common.status);
+        return factors->Common.status != CHOLMOD_OK ? factors->Common.status : -20;
+    }
+    memcpy(solution, X->x, (size_t)n * nrhs * sizeof(double));
+    cholmod_free_dense(&X, &factors->Common);
+
+    return 0;
+}
+
+
+int updown_sparse_factors(int64_t handle, int update,
+                          double *values, int *rowind, int *colptr,
+                          int ncols, int nnz) {
+
+    if (!handle || !values || !rowind || !colptr) {
+        printf("Error: NULL pointer passed to updown_sparse_factors\n");
+        return -1;
+    }
+
+    cholmod_factors_t *factors = (cholmod_factors_t*)(intptr_t)handle;
+    if (!factors->has_numeric) {
+        printf("Error: factors have no valid numeric factorization\n");
+        return -5;
+    }
+    if (ncols <= 0 || colptr[0] != 0 || colptr[ncols] != nnz) {
+        printf("Error: Invalid CSC format for the update matrix\n");
+        return -3;
+    }
+
+    /* cholmod_updown works on the permuted matrix: C must be P*C, with P
+     * the fill-reducing ordering stored in L */
+    cholmod_sparse C;
+    wrap_sparse(&C, factors->n, ncols, nnz, colptr, rowind, values, 0);
+    cholmod_sparse *PC = cholmod_submatrix(&C, (int*)factors->L->Perm, factors->n,
+                                           NULL, -1, 1, 1, &factors->Common);
+    if (!PC) {
+        printf("CHOLMOD permutation of the update failed with status %d\n",
+               factors->Common.status);
+        return factors->Common.status;
+    }
+
+    /* A supernodal L is converted to a simplicial LDL^T here, once */
+    cholmod_updown(update, PC, factors->L, &factors->Common);
+    cholmod_free_sparse(&PC, &factors->Common);
+
+    int status = factor_status(&factors->Common);
+    if (status != 0) factors->has_numeric = 0;
+    return status;
+}
+
+
+int free_sparse_factors(int64_t handle) {
+
+    if (!handle) {
+        printf("Error: NULL handle passed to free_sparse_factors\n");
+        return -1;
+    }
+
+    cholmod_factors_t *factors = (cholmod_factors_t*)(intptr_t)handle;
+
+    if (factors->L) cholmod_free_factor(&factors->L, &factors->Common);
+    cholmod_finish(&factors->Common);
+    if (factors->colptr) free(factors->colptr);
+    if (factors->rowind) free(factors->rowind);
+
+    free(factors);
+
+    return 0;
+}
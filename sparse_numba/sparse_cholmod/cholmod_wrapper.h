@@ -0,0 +1,50 @@
+/* cholmod_wrapper.h - A minimal wrapper for CHOLMOD to be used with Numba */
+#ifndef CHOLMOD_WRAPPER_H
+#define CHOLMOD_WRAPPER_H
+
+#include <stdint.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* All matrices are symmetric and given in CSC format; only the lower
+ * triangle is read (entries above the diagonal are ignored). */
+
+/* Main solver function - Cholesky factorize A and solve Ax=b */
+int solve_sparse_system(double *values, int *rowind, int *colptr,
+                        int nrows, int ncols, int nnz,
+                        double *rhs, double *solution);
+
+/* Symbolic analysis only (fill-reducing ordering, elimination tree,
+ * supernodes); returns opaque handle. The pattern is kept for
+ * factorize_numeric. */
+int analyze_sparse_system(int *rowind, int *colptr,
+                          int nrows, int ncols, int nnz,
+                          int64_t *handle_out);
+
+/* Numeric factorization of new values on the analyzed pattern */
+int factorize_numeric(int64_t handle, double *values, int nnz);
+
+/* Symbolic analysis and numeric factorization in one call */
+int factorize_sparse_system(double *values, int *rowind, int *colptr,
+                            int nrows, int ncols, int nnz,
+                            int64_t *handle_out);
+
+/* Solve A*X = B using stored factors; rhs/solution are column-major n x nrhs */
+int solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs);
+
+/* Rank-k update (update = 1) or downdate (update = 0) of the factors:
+ * L*L^T becomes L*L^T +/- C*C^T, with C an n x k CSC matrix */
+int updown_sparse_factors(int64_t handle, int update,
+                          double *values, int *rowind, int *colptr,
+                          int ncols, int nnz);
+
+/* Free stored factors */
+int free_sparse_factors(int64_t handle);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* CHOLMOD_WRAPPER_H */
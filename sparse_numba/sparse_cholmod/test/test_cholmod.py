@@ -0,0 +1,168 @@
+"""
+Tests for the CHOLMOD backend: direct solve, symbolic / numeric
+separation, multi-RHS solves and rank-k update / downdate.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_cholmod.py
+
+import numpy as np
+import scipy.sparse as sp
+from sparse_numba.sparse_cholmod.cholmod_numba_interface import (
+    cholmod_solve_csc,
+    cholmod_solve_coo,
+    cholmod_analyze_csc,
+    cholmod_factorize_numeric,
+    cholmod_factorize_csc,
+    cholmod_solve_factored,
+    cholmod_solve_factored_multi,
+    cholmod_updown,
+    cholmod_free_factors,
+)
+
+
+def _make_test_matrix(m=15, shift=0.1):
+    """SPD 2D Laplacian on an m x m grid (plus a diagonal shift), as CSC."""
+    T = sp.diags([-np.ones(m - 1), 2.0 * np.ones(m), -np.ones(m - 1)], [-1, 0, 1])
+    A = sp.kronsum(T, T) + shift * sp.eye(m * m)
+    return A.tocsc()
+
+
+def test_direct_solve():
+    """Full and lower-triangle-only input give the same solution."""
+    print("Test: cholmod_solve_csc / coo")
+    A = _make_test_matrix()
+    x_true = np.random.default_rng(0).standard_normal(A.shape[0])
+    b = A @ x_true
+
+    x, info = cholmod_solve_csc(A.data, A.indices, A.indptr, b)
+    assert info == 0
+    assert np.linalg.norm(x - x_true) < 1e-8
+
+    L = sp.tril(A).tocsc()
+    x, info = cholmod_solve_csc(L.data, L.indices, L.indptr, b)
+    assert info == 0
+    assert np.linalg.norm(x - x_true) < 1e-8
+
+    A_coo = A.tocoo()
+    x, info = cholmod_solve_coo(A_coo.row, A_coo.col, A_coo.data, A.shape, b)
+    assert info == 0
+    assert np.linalg.norm(x - x_true) < 1e-8
+    print("  PASSED")
+
+
+def test_symbolic_numeric_separation():
+    """One analysis serves several numeric factorizations."""
+    print("Test: cholmod_analyze_csc + cholmod_factorize_numeric")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    b = np.ones(n)
+
+    handle, info = cholmod_analyze_csc(A.indices, A.indptr)
+    assert info == 0 and handle != 0
+
+    # Solving before any numeric factorization is an error
+    x, info = cholmod_solve_factored(handle, b)
+    assert info != 0
+
+    for shift in (0.1, 1.0, 10.0):
+        A_s = (A + (shift - 0.1) * sp.eye(n)).tocsc()
+        assert np.array_equal(A_s.indices, A.indices)
+        assert cholmod_factorize_numeric(handle, A_s.data) == 0
+        x, info = cholmod_solve_factored(handle, b)
+        assert info == 0
+        assert np.linalg.norm(A_s @ x - b) < 1e-8
+
+    # Different number of values is rejected
+    assert cholmod_factorize_numeric(handle, A.data[:-1]) != 0
+
+    cholmod_free_factors(handle)
+    print("  PASSED")
+
+
+def test_multi_rhs():
+    """All columns of B are solved in one call."""
+    print("Test: cholmod_solve_factored_multi")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    B = np.random.default_rng(1).standard_normal((n, 4))
+
+    handle, info = cholmod_factorize_csc(A.data, A.indices, A.indptr)
+    assert info == 0
+    X, info = cholmod_solve_factored_multi(handle, B)
+    assert info == 0 and X.shape == (n, 4)
+    assert np.linalg.norm(A @ X - B) < 1e-8
+    cholmod_free_factors(handle)
+    print("  PASSED")
+
+
+def test_update_downdate():
+    """Factors follow A + C*C^T and back to A without refactorization."""
+    print("Test: cholmod_updown")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    rng = np.random.default_rng(2)
+    b = rng.standard_normal(n)
+
+    # Rank-2 change touching a few rows
+    C = sp.random(n, 2, density=0.05, random_state=3, dtype=np.float64).tocsc()
+
+    handle, info = cholmod_factorize_csc(A.data, A.indices, A.indptr)
+    assert info == 0
+
+    assert cholmod_updown(handle, C.data, C.indices, C.indptr) == 0
+    x, info = cholmod_solve_factored(handle, b)
+    assert info == 0
+    assert np.linalg.norm((A + C @ C.T) @ x - b) < 1e-8
+
+    assert cholmod_updown(handle, C.data, C.indices, C.indptr, False) == 0
+    x, info = cholmod_solve_factored(handle, b)
+    assert info == 0
+    assert np.linalg.norm(A @ x - b) < 1e-8
+
+    cholmod_free_factors(handle)
+    print("  PASSED")
+
+
+def test_not_positive_definite():
+    """Indefinite matrices and downdates are reported."""
+    print("Test: indefinite matrices")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    M = (A - 2.0 * sp.eye(n)).tocsc()
+    x, info = cholmod_solve_csc(M.data, M.indices, M.indptr, np.ones(n))
+    assert info == 1
+    handle, info = cholmod_factorize_csc(M.data, M.indices, M.indptr)
+    assert info == 1
+
+    # Downdate that removes more than the shift from one diagonal entry
+    handle, info = cholmod_factorize_csc(A.data, A.indices, A.indptr)
+    assert info == 0
+    C = sp.csc_matrix((np.array([3.0]), np.array([0]), np.array([0, 1])), shape=(n, 1))
+    assert cholmod_updown(handle, C.data, C.indices, C.indptr, False) == 1
+    x, info = cholmod_solve_factored(handle, np.ones(n))
+    assert info != 0
+    cholmod_free_factors(handle)
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("CHOLMOD Backend Tests")
+    print("=" * 60)
+    test_direct_solve()
+    test_symbolic_numeric_separation()
+    test_multi_rhs()
+    test_update_downdate()
+    test_not_positive_definite()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,479 @@
+"""
+Python Interface with KLU sparse linear solver
+"""
+
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: klu_numba_interface.py
+
+import numpy as np
+from numba import njit
+from numba.extending import get_cython_function_address
+import ctypes
+
+from sparse_numba.conversion.matrix_conversion_numba import (
+    convert_coo_to_csc, convert_csr_to_csc,
+    ensure_float64, ensure_int32,
+)
+
+# Load the KLU wrapper function
+addr = get_cython_function_address("sparse_numba.sparse_klu.cy_klu_wrapper",
+                                   "cy_solve_sparse_system")
+functype = ctypes.CFUNCTYPE(
+    ctypes.c_int,  # Return type: status code
+    ctypes.c_void_p,  # values array
+    ctypes.c_void_p,  # rowind array
+    ctypes.c_void_p,  # colptr array
+    ctypes.c_int,  # Number of rows
+    ctypes.c_int,  # Number of columns
+    ctypes.c_int,  # Number of non-zeros
+    ctypes.c_void_p,  # RHS array
+    ctypes.c_void_p  # Solution array (output)
+)
+c_solve_sparse_system = functype(addr)
+
+__all__ = [
+    'klu_solve_csc', 'klu_solve_coo', 'klu_solve_csr',
+    'klu_factorize_csc', 'klu_factorize_coo', 'klu_factorize_csr',
+    'klu_refactor',
+    'klu_solve_factored', 'klu_solve_factored_transpose',
+    'klu_solve_factored_multi',
+    'klu_rcond', 'klu_free_factors',
+]
+
+
+@njit(nogil=True)
+def klu_solve_csc(csc_data, csc_indices, csc_indptr, b):
+    """
+    Solve a sparse linear system Ax = b using KLU.
+    Matrix A is in CSC format.
+
+    KLU permutes A to block triangular form and factorizes only the
+    diagonal blocks, which makes it fast for very sparse, nearly block
+    triangular matrices such as circuit and power-network Jacobians.
+
+    Parameters:
+    -----------
+    csc_data : ndarray
+        Nonzero values in CSC format
+    csc_indices : ndarray
+        Row indices in CSC format
+    csc_indptr : ndarray
+        Column pointers in CSC format
+    b : ndarray
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray
+        Solution vector
+    info : int
+        Status code (0 for success, 1 if A is singular)
+    """
+    data = ensure_float64(csc_data)
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+    rhs = ensure_float64(b)
+
+    n_rows = len(rhs)
+    n_cols = len(indptr) - 1
+    nnz = len(data)
+
+    # Validate CSC format
+    if indptr[0] != 0:
+        print(f"Error: First element of indptr must be 0, got {indptr[0]}")
+        return np.zeros(n_rows, dtype=np.float64), -1
+
+    if indptr[n_cols] != nnz:
+        print(f"Error: Last element of indptr must be {nnz}, got {indptr[n_cols]}")
+        return np.zeros(n_rows, dtype=np.float64), -2
+
+    result = np.zeros(n_rows, dtype=np.float64)
+
+    info = c_solve_sparse_system(
+        data.ctypes.data,
+        indices.ctypes.data,
+        indptr.ctypes.data,
+        n_rows,
+        n_cols,
+        nnz,
+        rhs.ctypes.data,
+        result.ctypes.data
+    )
+
+    return result, info
+
+
+@njit(nogil=True)
+def klu_solve_coo(row_indices, col_indices, data, shape, b):
+    """
+    Solve a sparse linear system Ax = b using KLU.
+    Matrix A is in COO format and will be converted to CSC.
+    """
+    n_rows, n_cols = shape
+
+    if np.any(row_indices < 0) or np.any(row_indices >= n_rows):
+        print("Error: Invalid row indices")
+        return np.zeros(len(b), dtype=np.float64), -1
+
+    if np.any(col_indices < 0) or np.any(col_indices >= n_cols):
+        print("Error: Invalid column indices")
+        return np.zeros(len(b), dtype=np.float64), -2
+
+    csc_data, csc_indices, csc_indptr = convert_coo_to_csc(
+        ensure_int32(row_indices), ensure_int32(col_indices), ensure_float64(data),
+        n_rows, n_cols
+    )
+    return klu_solve_csc(csc_data, csc_indices, csc_indptr, b)
+
+
+@njit(nogil=True)
+def klu_solve_csr(csr_data, csr_indices, csr_indptr, b):
+    """
+    Solve a sparse linear system Ax = b using KLU.
+    Matrix A is in CSR format and will be converted to CSC.
+    """
+    n_rows = len(csr_indptr) - 1
+    csc_data, csc_indices, csc_indptr = convert_csr_to_csc(
+        ensure_float64(csr_data), ensure_int32(csr_indices), ensure_int32(csr_indptr),
+        (n_rows, n_rows)
+    )
+    return klu_solve_csc(csc_data, csc_indices, csc_indptr, b)
+
+
+# ================================================================
+# Pre-factorization API: factorize once, refactor / solve many times
+# ================================================================
+
+# Load the factorize function
+addr_factorize = get_cython_function_address(
+    "sparse_numba.sparse_klu.cy_klu_wrapper",
+    "cy_factorize_sparse_system")
+functype_factorize = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_void_p,    # values
+    ctypes.c_void_p,    # rowind
+    ctypes.c_void_p,    # colptr
+    ctypes.c_int,       # nrows
+    ctypes.c_int,       # ncols
+    ctypes.c_int,       # nnz
+    ctypes.c_void_p,    # handle_out (pointer to int64)
+)
+c_factorize_sparse_system = functype_factorize(addr_factorize)
+
+# Load the refactor function
+addr_refactor = get_cython_function_address(
+    "sparse_numba.sparse_klu.cy_klu_wrapper",
+    "cy_refactor_sparse_system")
+functype_refactor = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_int64,     # handle (int64)
+    ctypes.c_void_p,    # new values, same pattern
+    ctypes.c_int,       # nnz
+)
+c_refactor_sparse_system = functype_refactor(addr_refactor)
+
+# Load the solve-with-factors function with transpose option
+addr_solve_factored_trans = get_cython_function_address(
+    "sparse_numba.sparse_klu.cy_klu_wrapper",
+    "cy_solve_with_factors_trans")
+functype_solve_factored_trans = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_int64,     # handle (int64)
+    ctypes.c_void_p,    # rhs (column-major, n x nrhs)
+    ctypes.c_void_p,    # solution (column-major, n x nrhs)
+    ctypes.c_int,       # nrhs
+    ctypes.c_int,       # trans (0: A*x = b, 1: A^T*x = b)
+)
+c_solve_with_factors_trans = functype_solve_factored_trans(addr_solve_factored_trans)
+
+# Load the condition estimate function
+addr_rcond = get_cython_function_address(
+    "sparse_numba.sparse_klu.cy_klu_wrapper",
+    "cy_rcond_sparse_factors")
+functype_rcond = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_int64,     # handle (int64)
+    ctypes.c_void_p,    # rcond_out (pointer to double)
+)
+c_rcond_sparse_factors = functype_rcond(addr_rcond)
+
+# Load the free-factors function
+addr_free = get_cython_function_address(
+    "sparse_numba.sparse_klu.cy_klu_wrapper",
+    "cy_free_sparse_factors")
+functype_free = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_int64,     # handle
+)
+c_free_sparse_factors = functype_free(addr_free)
+
+
+@njit(nogil=True)
+def klu_factorize_csc(csc_data, csc_indices, csc_indptr):
+    """
+    Pre-factorize a sparse matrix in CSC format using KLU.
+    The sparsity pattern is kept with the factors so that matrices with
+    the same pattern can be refactorized with klu_refactor.
+
+    Parameters:
+    -----------
+    csc_data : ndarray (float64)
+        Nonzero values in CSC format
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+
+    Returns:
+    --------
+    handle : int64
+        Opaque handle to the stored factors.
+        Must be freed with klu_free_factors(handle).
+    info : int
+        Status code (0 for success, 1 if A is singular)
+    """
+    data = ensure_float64(csc_data)
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+
+    n_cols = len(indptr) - 1
+    n_rows = n_cols  # Square matrix assumption
+    nnz = len(data)
+
+    if indptr[0] != 0:
+        print("Error: First element of indptr must be 0")
+        return np.int64(0), -1
+    if indptr[n_cols] != nnz:
+        print("Error: Last element of indptr must equal nnz")
+        return np.int64(0), -2
+
+    handle_arr = np.zeros(1, dtype=np.int64)
+
+    info = c_factorize_sparse_system(
+        data.ctypes.data,
+        indices.ctypes.data,
+        indptr.ctypes.data,
+        n_rows,
+        n_cols,
+        nnz,
+        handle_arr.ctypes.data,
+    )
+
+    return handle_arr[0], info
+
+
+@njit(nogil=True)
+def klu_factorize_coo(row_indices, col_indices, data, shape):
+    """
+    Pre-factorize a sparse matrix in COO format using KLU.
+    Converts to CSC internally, then factorizes. klu_refactor expects the
+    values in the order of the converted CSC matrix.
+    """
+    n_rows, n_cols = shape
+    csc_data, csc_indices, csc_indptr = convert_coo_to_csc(
+        ensure_int32(row_indices), ensure_int32(col_indices), ensure_float64(data),
+        n_rows, n_cols
+    )
+    return klu_factorize_csc(csc_data, csc_indices, csc_indptr)
+
+
+@njit(nogil=True)
+def klu_factorize_csr(csr_data, csr_indices, csr_indptr):
+    """
+    Pre-factorize a sparse matrix in CSR format using KLU.
+    Converts to CSC internally, then factorizes. klu_refactor expects the
+    values in the order of the converted CSC matrix.
+    """
+    n_rows = len(csr_indptr) - 1
+    csc_data, csc_indices, csc_indptr = convert_csr_to_csc(
+        ensure_float64(csr_data), ensure_int32(csr_indices), ensure_int32(csr_indptr),
+        (n_rows, n_rows)
+    )
+    return klu_factorize_csc(csc_data, csc_indices, csc_indptr)
+
+
+@njit(nogil=True)
+def klu_refactor(handle, csc_data):
+    """
+    Refactorize in place for new values on the pattern given to
+    klu_factorize_csc. The pivot order of the first factorization is
+    reused, so no symbolic analysis or pivot search is repeated; this is
+    the fast path for Newton iterations and time stepping.
+
+    If the new values make a reused pivot tiny, the factors stay valid
+    but inaccurate: check klu_rcond and factorize again if it drops.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from klu_factorize_*()
+    csc_data : ndarray (float64)
+        New nonzero values, in the order of the factorized CSC matrix
+
+    Returns:
+    --------
+    info : int
+        Status code (0 for success, -3 if the number of values differs)
+    """
+    data = ensure_float64(csc_data)
+    info = c_refactor_sparse_system(handle, data.ctypes.data, len(data))
+    return info
+
+
+@njit(nogil=True)
+def klu_solve_factored(handle, b):
+    """
+    Solve A*x = b using pre-computed factors from klu_factorize_*().
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from klu_factorize_*()
+    b : ndarray (float64)
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success)
+    """
+    rhs = ensure_float64(b)
+    n = len(rhs)
+    result = np.zeros(n, dtype=np.float64)
+
+    info = c_solve_with_factors_trans(
+        handle,
+        rhs.ctypes.data,
+        result.ctypes.data,
+        1,
+        0,  # trans
+    )
+
+    return result, info
+
+
+@njit(nogil=True)
+def klu_solve_factored_transpose(handle, b):
+    """
+    Solve A^T*x = b using pre-computed factors from klu_factorize_*().
+    Reuses the factors of A; no refactorization of A^T is needed.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from klu_factorize_*()
+    b : ndarray (float64)
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success)
+    """
+    rhs = ensure_float64(b)
+    n = len(rhs)
+    result = np.zeros(n, dtype=np.float64)
+
+    info = c_solve_with_factors_trans(
+        handle,
+        rhs.ctypes.data,
+        result.ctypes.data,
+        1,
+        1,  # trans
+    )
+
+    return result, info
+
+
+@njit(nogil=True)
+def klu_solve_factored_multi(handle, B, trans=False):
+    """
+    Solve A*X = B (or A^T*X = B) for several right-hand sides in one call.
+    All columns go through the factors together, which is cheaper than
+    one klu_solve_factored call per column.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from klu_factorize_*()
+    B : ndarray (float64)
+        Right-hand sides, shape (n, nrhs)
+    trans : bool, optional
+        Solve with A^T instead of A (default False)
+
+    Returns:
+    --------
+    X : ndarray (float64)
+        Solutions, shape (n, nrhs)
+    info : int
+        Status code (0 for success)
+    """
+    n = B.shape[0]
+    nrhs = B.shape[1]
+    # Row k of Bt is column k of B: the column-major layout KLU expects
+    Bt = np.ascontiguousarray(B.T).astype(np.float64)
+    Xt = np.zeros((nrhs, n), dtype=np.float64)
+    if nrhs == 0:
+        return Xt.T, 0
+
+    info = c_solve_with_factors_trans(
+        handle,
+        Bt.ctypes.data,
+        Xt.ctypes.data,
+        nrhs,
+        1 if trans else 0,
+    )
+
+    return Xt.T, info
+
+
+@njit(nogil=True)
+def klu_rcond(handle):
+    """
+    Cheap estimate of the reciprocal condition number of the factored
+    matrix: min |u_ii| / max |u_ii| over the diagonal of U. Useful to
+    decide when klu_refactor is no longer good enough.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from klu_factorize_*()
+
+    Returns:
+    --------
+    rcond : float
+        Reciprocal condition estimate (0.0 for a singular matrix)
+    info : int
+        Status code (0 for success)
+    """
+    rcond_arr = np.zeros(1, dtype=np.float64)
+    info = c_rcond_sparse_factors(handle, rcond_arr.ctypes.data)
+    return rcond_arr[0], info
+
+
+@njit(nogil=True)
+def klu_free_factors(handle):
+    """
+    Free memory associated with KLU factors.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from klu_factorize_*()
+
+    Returns:
+    --------
+    info : int
+        Status code (0 for success)
+    """
+    info = c_free_sparse_factors(handle)
+    return info
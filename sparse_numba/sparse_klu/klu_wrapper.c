@@ -0,0 +1,248 @@
+/* klu_wrapper.c - A minimal wrapper for KLU to be used with Numba */
+
+// File name: klu_wrapper.c
+//
+#include "klu_wrapper.h"
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <klu.h>
+
+/* KLU does not modify or keep the input arrays, so unlike the SuperLU and
+ * UMFPACK wrappers nothing is copied for a one-shot solve. */
+int solve_sparse_system(double *values, int *rowind, int *colptr,
+                        int nrows, int ncols, int nnz,
+                        double *rhs, double *solution) {
+
+    if (!values || !rowind || !colptr || !rhs || !solution) {
+        printf("Error: NULL pointer passed to solve_sparse_system\n");
+        return -1;
+    }
+    if (nrows <= 0 || nrows != ncols || nnz <= 0) {
+        printf("Error: Invalid dimensions: rows=%d, cols=%d, nnz=%d\n", nrows, ncols, nnz);
+        return -2;
+    }
+    if (colptr[0] != 0 || colptr[ncols] != nnz) {
+        printf("Error: Invalid CSC format - colptr[0]=%d, colptr[%d]=%d, nnz=%d\n",
+               colptr[0], ncols, colptr[ncols], nnz);
+        return -3;
+    }
+
+    klu_common Common;
+    klu_symbolic *Symbolic = NULL;
+    klu_numeric *Numeric = NULL;
+    int status = -1;
+
+    klu_defaults(&Common);
+
+    Symbolic = klu_analyze(nrows, colptr, rowind, &Common);
+    if (!Symbolic) {
+        printf("KLU analysis failed with status %d\n", Common.status);
+        status = Common.status;
+        goto cleanup;
+    }
+
+    Numeric = klu_factor(colptr, rowind, values, Symbolic, &Common);
+    if (!Numeric) {
+        printf("KLU factorization failed with status %d\n", Common.status);
+        status = Common.status;
+        goto cleanup;
+    }
+
+    /* klu_solve works in place */
+    memcpy(solution, rhs, nrows * sizeof(double));
+    if (!klu_solve(Symbolic, Numeric, nrows, 1, solution, &Common)) {
+        printf("KLU solve failed with status %d\n", Common.status);
+        status = Common.status;
+        goto cleanup;
+    }
+    status = 0;
+
+cleanup:
+    if (Numeric) klu_free_numeric(&Numeric, &Common);
+    if (Symbolic) klu_free_symbolic(&Symbolic, &Common);
+
+    return status;
+}
+
+
+/* ================================================================
+ * Pre-factorization API: factorize once, refactor / solve many times
+ * ================================================================ */
+
+/* Struct to hold KLU factors between calls */
+typedef struct {
+    klu_symbolic *Symbolic;
+    klu_numeric *Numeric;
+    klu_common Common;
+    int *colptr;  /* Pattern copy, needed by klu_refactor */
+    int *rowind;
+    int n;
+    int nnz;
+} klu_factors_t;
+
+
+int factorize_sparse_system(double *values, int *rowind, int *colptr,
+                            int nrows, int ncols, int nnz,
+                            int64_t *handle_out) {
+
+    if (!values || !rowind || !colptr || !handle_out) {
+        printf("Error: NULL pointer passed to factorize_sparse_system\n");
+        return -1;
+    }
+    if (nrows <= 0 || nrows != ncols || nnz <= 0) {
+        printf("Error: Invalid dimensions: rows=%d, cols=%d, nnz=%d\n", nrows, ncols, nnz);
+        return -2;
+    }
+    if (colptr[0] != 0 || colptr[ncols] != nnz) {
+        printf("Error: Invalid CSC format - colptr[0]=%d, colptr[%d]=%d, nnz=%d\n",
+               colptr[0], ncols, colptr[ncols], nnz);
+        return -3;
+    }
+
+    *handle_out = 0;
+
+    klu_factors_t *factors = (klu_factors_t*)calloc(1, sizeof(klu_factors_t));
+    if (!factors) {
+        printf("Failed to allocate factors struct\n");
+        return -10;
+    }
+    int status = -1;
+
+    klu_defaults(&factors->Common);
+    factors->n = nrows;
+    factors->nnz = nnz;
+
+    factors->colptr = (int*)malloc((ncols+1) * sizeof(int));
+    factors->rowind = (int*)malloc(nnz * sizeof(int));
+    if (!factors->colptr || !factors->rowind) {
+        printf("Failed to allocate pattern copies\n");
+        status = -12;
+        goto cleanup;
+    }
+    memcpy(factors->colptr, colptr, (ncols+1) * sizeof(int));
+    memcpy(factors->rowind, rowind, nnz * sizeof(int));
+
+    /* Symbolic analysis: BTF, then AMD on each diagonal block */
+    factors->Symbolic = klu_analyze(nrows, factors->colptr, factors->rowind, &factors->Common);
+    if (!factors->Symbolic) {
+        printf("KLU analysis failed with status %d\n", factors->Common.status);
+        status = factors->Common.status;
+        goto cleanup;
+    }
+
+    /* Numeric factorization */
+    factors->Numeric = klu_factor(factors->colptr, factors->rowind, values,
+                                  factors->Symbolic, &factors->Common);
+    if (!factors->Numeric) {
+        printf("KLU factorization failed with status %d\n", factors->Common.status);
+        status = factors->Common.status;
+        goto cleanup;
+    }
+
+    *handle_out = (int64_t)(intptr_t)factors;
+    return 0;
+
+cleanup:
+    free_sparse_factors((int64_t)(intptr_t)factors);
+    return status;
+}
+
+
+int refactor_sparse_system(int64_t handle, double *values, int nnz) {
+
+    if (!handle || !values) {
+        printf("Error: NULL pointer passed to refactor_sparse_system\n");
+        return -1;
+    }
+
+    klu_factors_t *factors = (klu_factors_t*)(intptr_t)handle;
+    if (nnz != factors->nnz) {
+        printf("Error: refactor needs the same pattern (nnz %d vs %d)\n", nnz, factors->nnz);
+        return -3;
+    }
+
+    if (!klu_refactor(factors->colptr, factors->rowind, values,
+                      factors->Symbolic, factors->Numeric, &factors->Common)) {
+        printf("KLU refactor failed with status %d\n", factors->Common.status);
+        return factors->Common.status != KLU_OK ? factors->Common.status : -20;
+    }
+
+    return 0;
+}
+
+
+int solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs) {
+    return solve_with_factors_trans(handle, rhs, solution, nrhs, 0);
+}
+
+
+int solve_with_factors_trans(int64_t handle, double *rhs, double *solution,
+                             int nrhs, int trans) {
+
+    if (!handle || !rhs || !solution) {
+        printf("Error: NULL pointer passed to solve_with_factors\n");
+        return -1;
+    }
+    if (nrhs <= 0) {
+        printf("Error: Invalid number of right-hand sides: %d\n", nrhs);
+        return -2;
+    }
+
+    klu_factors_t *factors = (klu_factors_t*)(intptr_t)handle;
+    int n = factors->n;
+    int ok;
+
+    /* klu_solve / klu_tsolve work in place on all right-hand sides at once */
+    memcpy(solution, rhs, (size_t)n * nrhs * sizeof(double));
+    if (trans) {
+        ok = klu_tsolve(factors->Symbolic, factors->Numeric, n, nrhs, solution, &factors->Common);
+    } else {
+        ok = klu_solve(factors->Symbolic, factors->Numeric, n, nrhs, solution, &factors->Common);
+    }
+    if (!ok) {
+        printf("KLU solve failed with status %d\n", factors->Common.status);
+        return factors->Common.status != KLU_OK ? factors->Common.status : -20;
+    }
+
+    return 0;
+}
+
+
+int rcond_sparse_factors(int64_t handle, double *rcond_out) {
+
+    if (!handle || !rcond_out) {
+        printf("Error: NULL pointer passed to rcond_sparse_factors\n");
+        return -1;
+    }
+
+    klu_factors_t *factors = (klu_factors_t*)(intptr_t)handle;
+
+    if (!klu_rcond(factors->Symbolic, factors->Numeric, &factors->Common)) {
+        printf("KLU rcond failed with status %d\n", factors->Common.status);
+        return factors->Common.status != KLU_OK ? factors->Common.status : -20;
+    }
+    *rcond_out = factors->Common.rcond;
+
+    return 0;
+}
+
+
+int free_sparse_factors(int64_t handle) {
+
+    if (!handle) {
+        printf("Error: NULL handle passed to free_sparse_factors\n");
+        return -1;
+    }
+
+    klu_factors_t *factors = (klu_factors_t*)(intptr_t)handle;
+
+    if (factors->Numeric) klu_free_numeric(&factors->Numeric, &factors->Common);
+    if (factors->Symbolic) klu_free_symbolic(&factors->Symbolic, &factors->Common);
+    if (factors->colptr) free(factors->colptr);
+    if (factors->rowind) free(factors->rowind);
+
+    free(factors);
+
+    return 0;
+}
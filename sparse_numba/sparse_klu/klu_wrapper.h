@@ -0,0 +1,43 @@
+/* klu_wrapper.h - A minimal wrapper for KLU to be used with Numba */
+#ifndef KLU_WRAPPER_H
+#define KLU_WRAPPER_H
+
+#include <stdint.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Main solver function - taking CSC format matrix and solving Ax=b */
+int solve_sparse_system(double *values, int *rowind, int *colptr,
+                        int nrows, int ncols, int nnz,
+                        double *rhs, double *solution);
+
+/* Pre-factorize a sparse matrix (BTF + AMD analysis and numeric LU),
+ * returns opaque handle. The pattern is kept for refactor_sparse_system. */
+int factorize_sparse_system(double *values, int *rowind, int *colptr,
+                            int nrows, int ncols, int nnz,
+                            int64_t *handle_out);
+
+/* Recompute the numeric factors for new values on the same pattern
+ * (klu_refactor: same pivot order, no symbolic work) */
+int refactor_sparse_system(int64_t handle, double *values, int nnz);
+
+/* Solve A*X = B using stored factors; rhs/solution are column-major n x nrhs */
+int solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs);
+
+/* Solve A*X = B (trans = 0) or A^T*X = B (trans = 1) using stored factors */
+int solve_with_factors_trans(int64_t handle, double *rhs, double *solution,
+                             int nrhs, int trans);
+
+/* Cheap reciprocal condition number estimate of the factors (klu_rcond) */
+int rcond_sparse_factors(int64_t handle, double *rcond_out);
+
+/* Free stored factors */
+int free_sparse_factors(int64_t handle);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* KLU_WRAPPER_H */
@@ -0,0 +1,170 @@
+"""
+Tests for the KLU backend: direct solve, factorize / refactor / solve,
+transpose and multi-RHS solves, and the condition estimate.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_klu.py
+
+import numpy as np
+import scipy.sparse as sp
+from sparse_numba.sparse_klu.klu_numba_interface import (
+    klu_solve_csc,
+    klu_solve_coo,
+    klu_solve_csr,
+    klu_factorize_csc,
+    klu_factorize_csr,
+    klu_refactor,
+    klu_solve_factored,
+    klu_solve_factored_transpose,
+    klu_solve_factored_multi,
+    klu_rcond,
+    klu_free_factors,
+)
+
+
+def _make_test_matrix(n=200, density=0.01, seed=42):
+    """Very sparse unsymmetric matrix with a strong diagonal, as a CSC matrix."""
+    A = sp.random(n, n, density=density, dtype=np.float64, random_state=seed)
+    A = A + sp.eye(n) * 4.0
+    return A.tocsc()
+
+
+def test_direct_solve():
+    """One-shot solves from CSC, COO and CSR agree with the true solution."""
+    print("Test: klu_solve_csc / coo / csr")
+    A = _make_test_matrix()
+    x_true = np.random.default_rng(0).standard_normal(A.shape[0])
+    b = A @ x_true
+
+    x, info = klu_solve_csc(A.data, A.indices, A.indptr, b)
+    assert info == 0
+    assert np.linalg.norm(x - x_true) < 1e-10
+
+    A_coo = A.tocoo()
+    x, info = klu_solve_coo(A_coo.row, A_coo.col, A_coo.data, A.shape, b)
+    assert info == 0
+    assert np.linalg.norm(x - x_true) < 1e-10
+
+    A_csr = A.tocsr()
+    x, info = klu_solve_csr(A_csr.data, A_csr.indices, A_csr.indptr, b)
+    assert info == 0
+    assert np.linalg.norm(x - x_true) < 1e-10
+    print("  PASSED")
+
+
+def test_factorize_and_solve():
+    """Factorize once; solve with A, A^T and several right-hand sides."""
+    print("Test: klu_factorize_csc + solves")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    rng = np.random.default_rng(1)
+
+    handle, info = klu_factorize_csc(A.data, A.indices, A.indptr)
+    assert info == 0 and handle != 0
+
+    b = rng.standard_normal(n)
+    x, info = klu_solve_factored(handle, b)
+    assert info == 0
+    assert np.linalg.norm(A @ x - b) < 1e-10
+
+    x, info = klu_solve_factored_transpose(handle, b)
+    assert info == 0
+    assert np.linalg.norm(A.T @ x - b) < 1e-10
+
+    B = rng.standard_normal((n, 5))
+    X, info = klu_solve_factored_multi(handle, B)
+    assert info == 0 and X.shape == (n, 5)
+    assert np.linalg.norm(A @ X - B) < 1e-10
+
+    X, info = klu_solve_factored_multi(handle, B, True)
+    assert info == 0
+    assert np.linalg.norm(A.T @ X - B) < 1e-10
+
+    assert klu_free_factors(handle) == 0
+    print("  PASSED")
+
+
+def test_refactor():
+    """klu_refactor reuses the pattern and pivot order for new values."""
+    print("Test: klu_refactor")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    b = np.ones(n)
+
+    handle, info = klu_factorize_csc(A.data, A.indices, A.indptr)
+    assert info == 0
+
+    for step in range(1, 4):
+        A_new = A.copy()
+        A_new.data = A.data * (1.0 + 0.1 * step)
+        assert klu_refactor(handle, A_new.data) == 0
+        x, info = klu_solve_factored(handle, b)
+        assert info == 0
+        assert np.linalg.norm(A_new @ x - b) < 1e-10
+
+    # Different number of values is rejected
+    assert klu_refactor(handle, A.data[:-1]) != 0
+
+    klu_free_factors(handle)
+    print("  PASSED")
+
+
+def test_factorize_csr():
+    """CSR input is converted and factorized as A, not A^T."""
+    print("Test: klu_factorize_csr")
+    A = _make_test_matrix()
+    A_csr = A.tocsr()
+    b = np.arange(A.shape[0], dtype=np.float64)
+
+    handle, info = klu_factorize_csr(A_csr.data, A_csr.indices, A_csr.indptr)
+    assert info == 0
+    x, info = klu_solve_factored(handle, b)
+    assert info == 0
+    assert np.linalg.norm(A @ x - b) < 1e-8
+    klu_free_factors(handle)
+    print("  PASSED")
+
+
+def test_rcond_and_singular():
+    """rcond is in (0, 1] for a regular matrix; a singular one is reported."""
+    print("Test: klu_rcond and singular matrices")
+    A = _make_test_matrix()
+    handle, info = klu_factorize_csc(A.data, A.indices, A.indptr)
+    assert info == 0
+    rcond, info = klu_rcond(handle)
+    assert info == 0
+    assert 0.0 < rcond <= 1.0
+    print(f"  rcond = {rcond:.3e}")
+    klu_free_factors(handle)
+
+    # Zero column
+    S = A.tolil()
+    S[:, 3] = 0.0
+    S = S.tocsc()
+    S.eliminate_zeros()
+    x, info = klu_solve_csc(S.data, S.indices, S.indptr, np.ones(A.shape[0]))
+    assert info != 0
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("KLU Backend Tests")
+    print("=" * 60)
+    test_direct_solve()
+    test_factorize_and_solve()
+    test_refactor()
+    test_factorize_csr()
+    test_rcond_and_singular()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -1883,8 +1883,15 @@ static int __Pyx_State_RemoveModule(void*);
 
 /* Module declarations from "sparse_numba.sparse_superlu.cy_superlu_wrapper" */
 static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_sparse_system(double *, int *, int *, int, int, int, double *, double *); /*proto*/
+static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_sparse_system_csr(double *, int *, int *, int, int, int, double *, double *); /*proto*/
 static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system(double *, int *, int *, int, int, int, int64_t *); /*proto*/
+static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_opts(double *, int *, int *, int, int, int, int, double, int64_t *); /*proto*/
+static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_csr(double *, int *, int *, int, int, int, int64_t *); /*proto*/
+static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_perm(double *, int *, int *, int, int, int, int *, double, int64_t *); /*proto*/
 static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_with_factors(int64_t, double *, double *, int); /*proto*/
+static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_with_factors_trans(int64_t, double *, double *, int, int); /*proto*/
+static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_get_factor_sizes(int64_t, int *); /*proto*/
+static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_get_factors(int64_t, int *, int *, double *, int *, int *, double *, int *, int *, double *); /*proto*/
 static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_free_sparse_factors(int64_t); /*proto*/
 /* #### Code section: typeinfo ### */
 /* #### Code section: before_global_var ### */
@@ -1995,7 +2002,7 @@ return 0;
 #endif
 /* #### Code section: module_code ### */
 
-/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":16
+/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":37
  * 
  * 
  * cdef api int cy_solve_sparse_system(double *values, int *rowind, int *colptr,             # <<<<<<<<<<<<<<
@@ -2006,7 +2013,7 @@ return 0;
 static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_sparse_system(double *__pyx_v_values, int *__pyx_v_rowind, int *__pyx_v_colptr, int __pyx_v_nrows, int __pyx_v_ncols, int __pyx_v_nnz, double *__pyx_v_rhs, double *__pyx_v_solution) {
   int __pyx_r;
 
-  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":19
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":40
  *                                  int nrows, int ncols, int nnz,
  *                                  double *rhs, double *solution):
  *     return solve_sparse_system(values, rowind, colptr, nrows, ncols, nnz, rhs, solution)             # <<<<<<<<<<<<<<
@@ -2016,7 +2023,7 @@ static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve
   __pyx_r = solve_sparse_system(__pyx_v_values, __pyx_v_rowind, __pyx_v_colptr, __pyx_v_nrows, __pyx_v_ncols, __pyx_v_nnz, __pyx_v_rhs, __pyx_v_solution);
   goto __pyx_L0;
 
-  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":16
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":37
  * 
  * 
  * cdef api int cy_solve_sparse_system(double *values, int *rowind, int *colptr,             # <<<<<<<<<<<<<<
@@ -2029,7 +2036,41 @@ static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve
   return __pyx_r;
 }
 
-/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":22
+/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":43
+ * 
+ * 
+ * cdef api int cy_solve_sparse_system_csr(double *values, int *colind, int *rowptr,             # <<<<<<<<<<<<<<
+ *                                         int nrows, int ncols, int nnz,
+ *                                         double *rhs, double *solution):
+*/
+
+static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_sparse_system_csr(double *__pyx_v_values, int *__pyx_v_colind, int *__pyx_v_rowptr, int __pyx_v_nrows, int __pyx_v_ncols, int __pyx_v_nnz, double *__pyx_v_rhs, double *__pyx_v_solution) {
+  int __pyx_r;
+
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":46
+ *                                         int nrows, int ncols, int nnz,
+ *                                         double *rhs, double *solution):
+ *     return solve_sparse_system_csr(values, colind, rowptr, nrows, ncols, nnz, rhs, solution)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = solve_sparse_system_csr(__pyx_v_values, __pyx_v_colind, __pyx_v_rowptr, __pyx_v_nrows, __pyx_v_ncols, __pyx_v_nnz, __pyx_v_rhs, __pyx_v_solution);
+  goto __pyx_L0;
+
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":43
+ * 
+ * 
+ * cdef api int cy_solve_sparse_system_csr(double *values, int *colind, int *rowptr,             # <<<<<<<<<<<<<<
+ *                                         int nrows, int ncols, int nnz,
+ *                                         double *rhs, double *solution):
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":49
  * 
  * 
  * cdef api int cy_factorize_sparse_system(double *values, int *rowind, int *colptr,             # <<<<<<<<<<<<<<
@@ -2040,7 +2081,7 @@ static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve
 static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system(double *__pyx_v_values, int *__pyx_v_rowind, int *__pyx_v_colptr, int __pyx_v_nrows, int __pyx_v_ncols, int __pyx_v_nnz, int64_t *__pyx_v_handle_out) {
   int __pyx_r;
 
-  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":25
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":52
  *                                         int nrows, int ncols, int nnz,
  *                                         int64_t *handle_out):
  *     return factorize_sparse_system(values, rowind, colptr, nrows, ncols, nnz, handle_out)             # <<<<<<<<<<<<<<
@@ -2050,7 +2091,7 @@ static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_facto
   __pyx_r = factorize_sparse_system(__pyx_v_values, __pyx_v_rowind, __pyx_v_colptr, __pyx_v_nrows, __pyx_v_ncols, __pyx_v_nnz, __pyx_v_handle_out);
   goto __pyx_L0;
 
-  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":22
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":49
  * 
  * 
  * cdef api int cy_factorize_sparse_system(double *values, int *rowind, int *colptr,             # <<<<<<<<<<<<<<
@@ -2063,7 +2104,109 @@ static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_facto
   return __pyx_r;
 }
 
-/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":28
+/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":55
+ * 
+ * 
+ * cdef api int cy_factorize_sparse_system_opts(double *values, int *rowind, int *colptr,             # <<<<<<<<<<<<<<
+ *                                              int nrows, int ncols, int nnz,
+ *                                              int col_perm, double diag_pivot_thresh,
+*/
+
+static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_opts(double *__pyx_v_values, int *__pyx_v_rowind, int *__pyx_v_colptr, int __pyx_v_nrows, int __pyx_v_ncols, int __pyx_v_nnz, int __pyx_v_col_perm, double __pyx_v_diag_pivot_thresh, int64_t *__pyx_v_handle_out) {
+  int __pyx_r;
+
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":59
+ *                                              int col_perm, double diag_pivot_thresh,
+ *                                              int64_t *handle_out):
+ *     return factorize_sparse_system_opts(values, rowind, colptr, nrows, ncols, nnz,             # <<<<<<<<<<<<<<
+ *                                         col_perm, diag_pivot_thresh, handle_out)
+ * 
+*/
+  __pyx_r = factorize_sparse_system_opts(__pyx_v_values, __pyx_v_rowind, __pyx_v_colptr, __pyx_v_nrows, __pyx_v_ncols, __pyx_v_nnz, __pyx_v_col_perm, __pyx_v_diag_pivot_thresh, __pyx_v_handle_out);
+  goto __pyx_L0;
+
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":55
+ * 
+ * 
+ * cdef api int cy_factorize_sparse_system_opts(double *values, int *rowind, int *colptr,             # <<<<<<<<<<<<<<
+ *                                              int nrows, int ncols, int nnz,
+ *                                              int col_perm, double diag_pivot_thresh,
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":63
+ * 
+ * 
+ * cdef api int cy_factorize_sparse_system_csr(double *values, int *colind, int *rowptr,             # <<<<<<<<<<<<<<
+ *                                             int nrows, int ncols, int nnz,
+ *                                             int64_t *handle_out):
+*/
+
+static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_csr(double *__pyx_v_values, int *__pyx_v_colind, int *__pyx_v_rowptr, int __pyx_v_nrows, int __pyx_v_ncols, int __pyx_v_nnz, int64_t *__pyx_v_handle_out) {
+  int __pyx_r;
+
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":66
+ *                                             int nrows, int ncols, int nnz,
+ *                                             int64_t *handle_out):
+ *     return factorize_sparse_system_csr(values, colind, rowptr, nrows, ncols, nnz, handle_out)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = factorize_sparse_system_csr(__pyx_v_values, __pyx_v_colind, __pyx_v_rowptr, __pyx_v_nrows, __pyx_v_ncols, __pyx_v_nnz, __pyx_v_handle_out);
+  goto __pyx_L0;
+
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":63
+ * 
+ * 
+ * cdef api int cy_factorize_sparse_system_csr(double *values, int *colind, int *rowptr,             # <<<<<<<<<<<<<<
+ *                                             int nrows, int ncols, int nnz,
+ *                                             int64_t *handle_out):
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":69
+ * 
+ * 
+ * cdef api int cy_factorize_sparse_system_perm(double *values, int *rowind, int *colptr,             # <<<<<<<<<<<<<<
+ *                                              int nrows, int ncols, int nnz,
+ *                                              int *col_order, double diag_pivot_thresh,
+*/
+
+static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_perm(double *__pyx_v_values, int *__pyx_v_rowind, int *__pyx_v_colptr, int __pyx_v_nrows, int __pyx_v_ncols, int __pyx_v_nnz, int *__pyx_v_col_order, double __pyx_v_diag_pivot_thresh, int64_t *__pyx_v_handle_out) {
+  int __pyx_r;
+
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":73
+ *                                              int *col_order, double diag_pivot_thresh,
+ *                                              int64_t *handle_out):
+ *     return factorize_sparse_system_perm(values, rowind, colptr, nrows, ncols, nnz,             # <<<<<<<<<<<<<<
+ *                                         col_order, diag_pivot_thresh, handle_out)
+ * 
+*/
+  __pyx_r = factorize_sparse_system_perm(__pyx_v_values, __pyx_v_rowind, __pyx_v_colptr, __pyx_v_nrows, __pyx_v_ncols, __pyx_v_nnz, __pyx_v_col_order, __pyx_v_diag_pivot_thresh, __pyx_v_handle_out);
+  goto __pyx_L0;
+
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":69
+ * 
+ * 
+ * cdef api int cy_factorize_sparse_system_perm(double *values, int *rowind, int *colptr,             # <<<<<<<<<<<<<<
+ *                                              int nrows, int ncols, int nnz,
+ *                                              int *col_order, double diag_pivot_thresh,
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":77
  * 
  * 
  * cdef api int cy_solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs):             # <<<<<<<<<<<<<<
@@ -2074,7 +2217,7 @@ static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_facto
 static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_with_factors(int64_t __pyx_v_handle, double *__pyx_v_rhs, double *__pyx_v_solution, int __pyx_v_nrhs) {
   int __pyx_r;
 
-  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":29
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":78
  * 
  * cdef api int cy_solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs):
  *     return solve_with_factors(handle, rhs, solution, nrhs)             # <<<<<<<<<<<<<<
@@ -2084,7 +2227,7 @@ static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve
   __pyx_r = solve_with_factors(__pyx_v_handle, __pyx_v_rhs, __pyx_v_solution, __pyx_v_nrhs);
   goto __pyx_L0;
 
-  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":28
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":77
  * 
  * 
  * cdef api int cy_solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs):             # <<<<<<<<<<<<<<
@@ -2097,7 +2240,109 @@ static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve
   return __pyx_r;
 }
 
-/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":32
+/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":81
+ * 
+ * 
+ * cdef api int cy_solve_with_factors_trans(int64_t handle, double *rhs, double *solution,             # <<<<<<<<<<<<<<
+ *                                          int nrhs, int trans):
+ *     return solve_with_factors_trans(handle, rhs, solution, nrhs, trans)
+*/
+
+static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_with_factors_trans(int64_t __pyx_v_handle, double *__pyx_v_rhs, double *__pyx_v_solution, int __pyx_v_nrhs, int __pyx_v_trans) {
+  int __pyx_r;
+
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":83
+ * cdef api int cy_solve_with_factors_trans(int64_t handle, double *rhs, double *solution,
+ *                                          int nrhs, int trans):
+ *     return solve_with_factors_trans(handle, rhs, solution, nrhs, trans)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = solve_with_factors_trans(__pyx_v_handle, __pyx_v_rhs, __pyx_v_solution, __pyx_v_nrhs, __pyx_v_trans);
+  goto __pyx_L0;
+
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":81
+ * 
+ * 
+ * cdef api int cy_solve_with_factors_trans(int64_t handle, double *rhs, double *solution,             # <<<<<<<<<<<<<<
+ *                                          int nrhs, int trans):
+ *     return solve_with_factors_trans(handle, rhs, solution, nrhs, trans)
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":86
+ * 
+ * 
+ * cdef api int cy_get_factor_sizes(int64_t handle, int *sizes):             # <<<<<<<<<<<<<<
+ *     return get_factor_sizes(handle, sizes)
+ * 
+*/
+
+static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_get_factor_sizes(int64_t __pyx_v_handle, int *__pyx_v_sizes) {
+  int __pyx_r;
+
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":87
+ * 
+ * cdef api int cy_get_factor_sizes(int64_t handle, int *sizes):
+ *     return get_factor_sizes(handle, sizes)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = get_factor_sizes(__pyx_v_handle, __pyx_v_sizes);
+  goto __pyx_L0;
+
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":86
+ * 
+ * 
+ * cdef api int cy_get_factor_sizes(int64_t handle, int *sizes):             # <<<<<<<<<<<<<<
+ *     return get_factor_sizes(handle, sizes)
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":90
+ * 
+ * 
+ * cdef api int cy_get_factors(int64_t handle,             # <<<<<<<<<<<<<<
+ *                             int *l_colptr, int *l_rowind, double *l_values,
+ *                             int *u_colptr, int *u_rowind, double *u_values,
+*/
+
+static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_get_factors(int64_t __pyx_v_handle, int *__pyx_v_l_colptr, int *__pyx_v_l_rowind, double *__pyx_v_l_values, int *__pyx_v_u_colptr, int *__pyx_v_u_rowind, double *__pyx_v_u_values, int *__pyx_v_perm_r, int *__pyx_v_perm_c, double *__pyx_v_rs) {
+  int __pyx_r;
+
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":94
+ *                             int *u_colptr, int *u_rowind, double *u_values,
+ *                             int *perm_r, int *perm_c, double *rs):
+ *     return get_factors(handle, l_colptr, l_rowind, l_values,             # <<<<<<<<<<<<<<
+ *                        u_colptr, u_rowind, u_values, perm_r, perm_c, rs)
+ * 
+*/
+  __pyx_r = get_factors(__pyx_v_handle, __pyx_v_l_colptr, __pyx_v_l_rowind, __pyx_v_l_values, __pyx_v_u_colptr, __pyx_v_u_rowind, __pyx_v_u_values, __pyx_v_perm_r, __pyx_v_perm_c, __pyx_v_rs);
+  goto __pyx_L0;
+
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":90
+ * 
+ * 
+ * cdef api int cy_get_factors(int64_t handle,             # <<<<<<<<<<<<<<
+ *                             int *l_colptr, int *l_rowind, double *l_values,
+ *                             int *u_colptr, int *u_rowind, double *u_values,
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":98
  * 
  * 
  * cdef api int cy_free_sparse_factors(int64_t handle):             # <<<<<<<<<<<<<<
@@ -2107,7 +2352,7 @@ static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve
 static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_free_sparse_factors(int64_t __pyx_v_handle) {
   int __pyx_r;
 
-  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":33
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":99
  * 
  * cdef api int cy_free_sparse_factors(int64_t handle):
  *     return free_sparse_factors(handle)             # <<<<<<<<<<<<<<
@@ -2115,7 +2360,7 @@ static int __pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_free_
   __pyx_r = free_sparse_factors(__pyx_v_handle);
   goto __pyx_L0;
 
-  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":32
+  /* "sparse_numba/sparse_superlu/cy_superlu_wrapper.pyx":98
  * 
  * 
  * cdef api int cy_free_sparse_factors(int64_t handle):             # <<<<<<<<<<<<<<
@@ -2180,8 +2425,8 @@ static int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate) {
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (unlikely(!__pyx_export_signature)) __PYX_ERR(0, 1, __pyx_L1_error)
     #endif
-    const char * __pyx_export_name = __pyx_export_signature + 172;
-    void (*const __pyx_export_pointers[])(void) = {(void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_sparse_system, (void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system, (void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_free_sparse_factors, (void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_with_factors, (void (*)(void)) NULL};
+    const char * __pyx_export_name = __pyx_export_signature + 463;
+    void (*const __pyx_export_pointers[])(void) = {(void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_sparse_system, (void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_sparse_system_csr, (void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_perm, (void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_opts, (void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system, (void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_csr, (void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_free_sparse_factors, (void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_with_factors, (void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_with_factors_trans, (void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_get_factor_sizes, (void (*)(void))&__pyx_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_get_factors, (void (*)(void)) NULL};
     void (*const *__pyx_export_pointer)(void) = __pyx_export_pointers;
     const char *__pyx_export_current_signature = __pyx_export_signature;
     while (*__pyx_export_pointer) {
@@ -2565,25 +2810,25 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
 static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   {
-    const struct { const unsigned int length: 9; } index[] = {{1},{18},{8},{10},{8},{12},{12},{10},{8},{266}};
-    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (205 bytes) */
-const char* const cstring = "BZh91AY&SYP\331\321t\000\000)\333\200@\000@t\005\000\200\000\277o\377\3600\000\333l\303%4\000\321\265\032\006\2314\006T\362\232=A\240\r\032\032\000\221*zM6A=FM\006\203L\311yj\201\350*\3301\262`\034\202&8H\210\030\230\306\2553\026\244\003\263\r]\005O=]\321\030\240B2+R\312\0219\367@\214\213\231\300\335\001\004=\000\274\030\004\224\211\314r\346\317\352E\032>m5)\265\030\365cQK\200\252o~\035\205\244N31)\"\233\017\010H4\251U\320P\255\264\226\264RY\"\202\277\301\006\240\332\033l\t\343d\022\307\232\215\350,\257\270\262\226\205\304+\374]\311\024\341BACgE\320";
-    PyObject *data = __Pyx_DecompressString(cstring, 205, 2);
+    const struct { const unsigned int length: 10; } index[] = {{1},{18},{8},{10},{8},{12},{12},{10},{8},{742}};
+    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (276 bytes) */
+const char* const cstring = "BZh91AY&SY\203i!P\000\000p[\200@\000@t\005\000\200\000\277\357\377\3600\0018\000\306LM0\232b`&\230\014d\304\323\t\246&\002i\200D\241\t\202'\2242mCCJ\237=O\222\205kB\325$\r\003\351\r\344\214\214 A\201\010\031\212\230\241\232U\224\000!F$#!\"\020$d\214lj\005\000\307\000{\334v\273\342\264\375\346S\370-\305eZ\342\\M\254\026G\324\013g\245\213\372\367C\037\314\013\273\370[\371^\256\\\034P\242\035\324\333\262\360\020<x\000\3647\333_?\304l47\365\374\324}\260\247\351\313t2\215\213\367\2579\270\033(\033\247\223\230g\323\262\275i\235=\303\246\0214\270\323\354\234\351X\200\365\320/\331\017ej\265\277<K\024\274\370\240g\002\365\267kj\246(\364+\300\324nB0\002F\022I\0242\351sA\267C\004({\371\325_Ny\005\346\234\224\310q\311?\305\334\221N\024$ \332HT\000";
+    PyObject *data = __Pyx_DecompressString(cstring, 276, 2);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (155 bytes) */
-const char* const cstring = "x\332\225MK\022\2020\014\345(,\305q\351\270\365(\231P\302\330\261\037lR\005Oo\013\0022\303\306,\336/y\355U\031\355\010\264\003\t\250\250Fu\007\260\230|\032\353\233h(+\207v\344n\350Aa\247\263~D4S\316$\r\265\030\215\000\010qB\355\244<4>\326\206\312\343\251\314vC\277\260\236\315\252*\376\351'\270\234A\226\332\327o\335\3367c\265*\324\000\354\315\223\200;\014\234h`!\233\343\026\225\370\240\337{\253@K:\235\361\372\320K\313mN?\272\246|\232";
-    PyObject *data = __Pyx_DecompressString(cstring, 155, 1);
+    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (224 bytes) */
+const char* const cstring = "x\332\255\223\333N\3030\014\206\373(\275\\\321.'ny\024\313K=\210\310i\261;(OO\222\266\214\225\322m\322z\021\333\337\377\3339H}QF;\002\355@\"*\332\243z\007\260\230\352\364Y\337v\206r\346\320\226\030\372OP\030t\316\217\035\232\2013IK\007\354\214\000\010qZ\265\223z\323\372no\250~\332\326\271\274\010\277\227\263m\312\232\252\272g\300H\007w)\237w y\314\235S\0361cj\033\372F\320\\TKW.\2757\332\026\275\345@\213p\366@\177/q\2157\225\352\201\2759\021p\300\310)\364,d\377\301\2408f\351\200J|\324_s9P\264k\272\017\302+\372Z\353\264s\244\037e\260\362\371\254\037Z\336\326i\376\025\\\321^IF\010\234v\2331\376\006-v\035.";
+    PyObject *data = __Pyx_DecompressString(cstring, 224, 1);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #else /* compression: none (353 bytes) */
-const char* const bytes = "?cline_in_traceback__main____module____name____pyx_capi____qualname__setdefault__test__int (double *, int *, int *, int, int, int, double *, double *)\000int (double *, int *, int *, int, int, int, int64_t *)\000int (int64_t)\000int (int64_t, double *, double *, int)\000cy_solve_sparse_system\000cy_factorize_sparse_system\000cy_free_sparse_factors\000cy_solve_with_factors";
+    #else /* compression: none (829 bytes) */
+const char* const bytes = "?cline_in_traceback__main____module____name____pyx_capi____qualname__setdefault__test__int (double *, int *, int *, int, int, int, double *, double *)\000\000int (double *, int *, int *, int, int, int, int *, double, int64_t *)\000int (double *, int *, int *, int, int, int, int, double, int64_t *)\000int (double *, int *, int *, int, int, int, int64_t *)\000\000int (int64_t)\000int (int64_t, double *, double *, int)\000int (int64_t, double *, double *, int, int)\000int (int64_t, int *)\000int (int64_t, int *, int *, double *, int *, int *, double *, int *, int *, double *)\000cy_solve_sparse_system\000cy_solve_sparse_system_csr\000cy_factorize_sparse_system_perm\000cy_factorize_sparse_system_opts\000cy_factorize_sparse_system\000cy_factorize_sparse_system_csr\000cy_free_sparse_factors\000cy_solve_with_factors\000cy_solve_with_factors_trans\000cy_get_factor_sizes\000cy_get_factors";
     PyObject *data = NULL;
     CYTHON_UNUSED_VAR(__Pyx_DecompressString);
     #endif
@@ -6,10 +6,31 @@ cdef extern from "superlu_wrapper.h":
     int solve_sparse_system(double *values, int *rowind, int *colptr,
                               int nrows, int ncols, int nnz,
                               double *rhs, double *solution)
+    int solve_sparse_system_csr(double *values, int *colind, int *rowptr,
+                                int nrows, int ncols, int nnz,
+                                double *rhs, double *solution)
     int factorize_sparse_system(double *values, int *rowind, int *colptr,
                                 int nrows, int ncols, int nnz,
                                 int64_t *handle_out)
+    int factorize_sparse_system_opts(double *values, int *rowind, int *colptr,
+                                     int nrows, int ncols, int nnz,
+                                     int col_perm, double diag_pivot_thresh,
+                                     int64_t *handle_out)
+    int factorize_sparse_system_csr(double *values, int *colind, int *rowptr,
+                                    int nrows, int ncols, int nnz,
+                                    int64_t *handle_out)
+    int factorize_sparse_system_perm(double *values, int *rowind, int *colptr,
+                                     int nrows, int ncols, int nnz,
+                                     int *col_order, double diag_pivot_thresh,
+                                     int64_t *handle_out)
     int solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs)
+    int solve_with_factors_trans(int64_t handle, double *rhs, double *solution,
+                                 int nrhs, int trans)
+    int get_factor_sizes(int64_t handle, int *sizes)
+    int get_factors(int64_t handle,
+                    int *l_colptr, int *l_rowind, double *l_values,
+                    int *u_colptr, int *u_rowind, double *u_values,
+                    int *perm_r, int *perm_c, double *rs)
     int free_sparse_factors(int64_t handle)
 
 
@@ -19,15 +40,60 @@ cdef api int cy_solve_sparse_system(double *values, int *rowind, int *colptr,
     return solve_sparse_system(values, rowind, colptr, nrows, ncols, nnz, rhs, solution)
 
 
+cdef api int cy_solve_sparse_system_csr(double *values, int *colind, int *rowptr,
+                                        int nrows, int ncols, int nnz,
+                                        double *rhs, double *solution):
+    return solve_sparse_system_csr(values, colind, rowptr, nrows, ncols, nnz, rhs, solution)
+
+
 cdef api int cy_factorize_sparse_system(double *values, int *rowind, int *colptr,
                                         int nrows, int ncols, int nnz,
                                         int64_t *handle_out):
     return factorize_sparse_system(values, rowind, colptr, nrows, ncols, nnz, handle_out)
 
 
+cdef api int cy_factorize_sparse_system_opts(double *values, int *rowind, int *colptr,
+                                             int nrows, int ncols, int nnz,
+                                             int col_perm, double diag_pivot_thresh,
+                                             int64_t *handle_out):
+    return factorize_sparse_system_opts(values, rowind, colptr, nrows, ncols, nnz,
+                                        col_perm, diag_pivot_thresh, handle_out)
+
+
+cdef api int cy_factorize_sparse_system_csr(double *values, int *colind, int *rowptr,
+                                            int nrows, int ncols, int nnz,
+                                            int64_t *handle_out):
+    return factorize_sparse_system_csr(values, colind, rowptr, nrows, ncols, nnz, handle_out)
+
+
+cdef api int cy_factorize_sparse_system_perm(double *values, int *rowind, int *colptr,
+                                             int nrows, int ncols, int nnz,
+                                             int *col_order, double diag_pivot_thresh,
+                                             int64_t *handle_out):
+    return factorize_sparse_system_perm(values, rowind, colptr, nrows, ncols, nnz,
+                                        col_order, diag_pivot_thresh, handle_out)
+
+
 cdef api int cy_solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs):
     return solve_with_factors(handle, rhs, solution, nrhs)
 
 
+cdef api int cy_solve_with_factors_trans(int64_t handle, double *rhs, double *solution,
+                                         int nrhs, int trans):
+    return solve_with_factors_trans(handle, rhs, solution, nrhs, trans)
+
+
+cdef api int cy_get_factor_sizes(int64_t handle, int *sizes):
+    return get_factor_sizes(handle, sizes)
+
+
+cdef api int cy_get_factors(int64_t handle,
+                            int *l_colptr, int *l_rowind, double *l_values,
+                            int *u_colptr, int *u_rowind, double *u_values,
+                            int *perm_r, int *perm_c, double *rs):
+    return get_factors(handle, l_colptr, l_rowind, l_values,
+                       u_colptr, u_rowind, u_values, perm_r, perm_c, rs)
+
+
 cdef api int cy_free_sparse_factors(int64_t handle):
     return free_sparse_factors(handle)
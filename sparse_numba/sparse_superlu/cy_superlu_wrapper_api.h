@@ -9,10 +9,24 @@
 
 static int (*__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_sparse_system)(double *, int *, int *, int, int, int, double *, double *) = 0;
 #define cy_solve_sparse_system __pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_sparse_system
+static int (*__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_sparse_system_csr)(double *, int *, int *, int, int, int, double *, double *) = 0;
+#define cy_solve_sparse_system_csr __pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_sparse_system_csr
 static int (*__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system)(double *, int *, int *, int, int, int, int64_t *) = 0;
 #define cy_factorize_sparse_system __pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system
+static int (*__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_opts)(double *, int *, int *, int, int, int, int, double, int64_t *) = 0;
+#define cy_factorize_sparse_system_opts __pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_opts
+static int (*__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_csr)(double *, int *, int *, int, int, int, int64_t *) = 0;
+#define cy_factorize_sparse_system_csr __pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_csr
+static int (*__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_perm)(double *, int *, int *, int, int, int, int *, double, int64_t *) = 0;
+#define cy_factorize_sparse_system_perm __pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_perm
 static int (*__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_with_factors)(int64_t, double *, double *, int) = 0;
 #define cy_solve_with_factors __pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_with_factors
+static int (*__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_with_factors_trans)(int64_t, double *, double *, int, int) = 0;
+#define cy_solve_with_factors_trans __pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_with_factors_trans
+static int (*__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_get_factor_sizes)(int64_t, int *) = 0;
+#define cy_get_factor_sizes __pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_get_factor_sizes
+static int (*__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_get_factors)(int64_t, int *, int *, double *, int *, int *, double *, int *, int *, double *) = 0;
+#define cy_get_factors __pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_get_factors
 static int (*__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_free_sparse_factors)(int64_t) = 0;
 #define cy_free_sparse_factors __pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_free_sparse_factors
 static int __Pyx_ImportFunction_3_2_4(PyObject *module, const char *funcname, void (**f)(void), const char *sig);
@@ -77,8 +91,15 @@ static int import_sparse_numba__sparse_superlu__cy_superlu_wrapper(void) {
   module = PyImport_ImportModule("sparse_numba.sparse_superlu.cy_superlu_wrapper");
   if (!module) goto bad;
   if (__Pyx_ImportFunction_3_2_4(module, "cy_solve_sparse_system", (void (**)(void))&__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_sparse_system, "int (double *, int *, int *, int, int, int, double *, double *)") < 0) goto bad;
+  if (__Pyx_ImportFunction_3_2_4(module, "cy_solve_sparse_system_csr", (void (**)(void))&__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_sparse_system_csr, "int (double *, int *, int *, int, int, int, double *, double *)") < 0) goto bad;
   if (__Pyx_ImportFunction_3_2_4(module, "cy_factorize_sparse_system", (void (**)(void))&__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system, "int (double *, int *, int *, int, int, int, int64_t *)") < 0) goto bad;
+  if (__Pyx_ImportFunction_3_2_4(module, "cy_factorize_sparse_system_opts", (void (**)(void))&__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_opts, "int (double *, int *, int *, int, int, int, int, double, int64_t *)") < 0) goto bad;
+  if (__Pyx_ImportFunction_3_2_4(module, "cy_factorize_sparse_system_csr", (void (**)(void))&__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_csr, "int (double *, int *, int *, int, int, int, int64_t *)") < 0) goto bad;
+  if (__Pyx_ImportFunction_3_2_4(module, "cy_factorize_sparse_system_perm", (void (**)(void))&__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_factorize_sparse_system_perm, "int (double *, int *, int *, int, int, int, int *, double, int64_t *)") < 0) goto bad;
   if (__Pyx_ImportFunction_3_2_4(module, "cy_solve_with_factors", (void (**)(void))&__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_with_factors, "int (int64_t, double *, double *, int)") < 0) goto bad;
+  if (__Pyx_ImportFunction_3_2_4(module, "cy_solve_with_factors_trans", (void (**)(void))&__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_solve_with_factors_trans, "int (int64_t, double *, double *, int, int)") < 0) goto bad;
+  if (__Pyx_ImportFunction_3_2_4(module, "cy_get_factor_sizes", (void (**)(void))&__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_get_factor_sizes, "int (int64_t, int *)") < 0) goto bad;
+  if (__Pyx_ImportFunction_3_2_4(module, "cy_get_factors", (void (**)(void))&__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_get_factors, "int (int64_t, int *, int *, double *, int *, int *, double *, int *, int *, double *)") < 0) goto bad;
   if (__Pyx_ImportFunction_3_2_4(module, "cy_free_sparse_factors", (void (**)(void))&__pyx_api_f_12sparse_numba_14sparse_superlu_18cy_superlu_wrapper_cy_free_sparse_factors, "int (int64_t)") < 0) goto bad;
   Py_DECREF(module); module = 0;
   return 0;
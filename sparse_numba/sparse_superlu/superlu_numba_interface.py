@@ -12,7 +12,7 @@ Python Interface with SuperLU sparse linear solver
 
 import numpy as np
 from numba import njit, types
-from numba.extending import get_cython_function_address
+from numba.extending import get_cython_function_address, overload
 import ctypes
 
 # Load the SuperLU wrapper function
@@ -31,10 +31,20 @@ functype = ctypes.CFUNCTYPE(
 )
 c_solve_sparse_system = functype(addr)
 
+# Load the CSR-native solve (same signature; arrays are values/colind/rowptr)
+addr_solve_csr = get_cython_function_address("sparse_numba.sparse_superlu.cy_superlu_wrapper",
+                                             "cy_solve_sparse_system_csr")
+c_solve_sparse_system_csr = functype(addr_solve_csr)
+
 __all__ = [
     'superlu_solve_csc', 'superlu_solve_coo', 'superlu_solve_csr',
     'superlu_factorize_csc', 'superlu_factorize_coo', 'superlu_factorize_csr',
-    'superlu_solve_factored', 'superlu_free_factors',
+    'superlu_factorize_csc_opts', 'superlu_factorize_csc_perm',
+    'SLU_NATURAL', 'SLU_MMD_ATA', 'SLU_MMD_AT_PLUS_A', 'SLU_COLAMD',
+    'superlu_solve_factored', 'superlu_solve_factored_transpose',
+    'superlu_free_factors',
+    'superlu_solve', 'superlu_factorize',
+    'solve_block_diagonal_batch',
 ]
 
 @njit(nogil=True)
@@ -116,7 +126,10 @@ def superlu_solve_csc(csc_data, csc_indices, csc_indptr, b):
 
 # Import conversion functions
 # from . import convert_coo_to_csc, convert_csr_to_csc
-from sparse_numba.conversion.matrix_conversion_numba import convert_coo_to_csc, convert_csr_to_csc
+from sparse_numba.conversion.matrix_conversion_numba import (
+    convert_coo_to_csc, convert_csr_to_csc,
+    ensure_float64, ensure_int32, has_canonical_format,
+)
 
 @njit(nogil=True)
 def superlu_solve_coo(row_indices, col_indices, data, shape, b):
@@ -189,27 +202,74 @@ def superlu_solve_coo(row_indices, col_indices, data, shape, b):
     return superlu_solve_csc(csc_data, csc_indices, csc_indptr, b_f64)
 
 
-@njit
+@njit(nogil=True)
 def superlu_solve_csr(csr_data, csr_indices, csr_indptr, b):
     """
-    Numba-compatible version that first sorts the CSR indices,
-    then passes to the existing superlu_solve_csr function.
+    Solve a sparse linear system Ax = b using SuperLU.
+    Matrix A is in CSR format.
+
+    Canonical CSR input (sorted column indices, no duplicates) is handed to
+    SuperLU as is: the CSR arrays of A are the CSC arrays of A^T, so SuperLU
+    factors A^T and solves the transposed system, with no conversion. Other
+    input is converted to CSC first (duplicates summed). Arrays that already
+    are float64/int32 and contiguous are not copied.
+
+    Parameters:
+    -----------
+    csr_data : ndarray
+        Nonzero values in CSR format
+    csr_indices : ndarray
+        Column indices in CSR format
+    csr_indptr : ndarray
+        Row pointers in CSR format
+    b : ndarray
+        Right-hand side vector
 
-    Parameters are the same as superlu_solve_csc.
+    Returns:
+    --------
+    x : ndarray
+        Solution vector
+    info : int
+        Status code (0 for success)
     """
+    data = ensure_float64(csr_data)
+    indices = ensure_int32(csr_indices)
+    indptr = ensure_int32(csr_indptr)
+    rhs = ensure_float64(b)
 
-    # Ensure correct data types
-    csr_data_f64 = csr_data.astype(np.float64)
-    csr_indices_i32 = csr_indices.astype(np.int32)
-    csr_indptr_i32 = csr_indptr.astype(np.int32)
-    b_f64 = b.astype(np.float64)
-
-    # Convert CSR to CSC directly
-    csc_data, csc_indices, csc_indptr = convert_csr_to_csc(
-        csr_data_f64, csr_indices_i32, csr_indptr_i32
+    n_rows = len(indptr) - 1
+    n_cols = n_rows  # Square matrix assumption for linear solvers
+    nnz = len(data)
+
+    if not has_canonical_format(indices, indptr):
+        csc_data, csc_indices, csc_indptr = convert_csr_to_csc(
+            data, indices, indptr, (n_rows, n_cols)
+        )
+        return superlu_solve_csc(csc_data, csc_indices, csc_indptr, rhs)
+
+    # Validate CSR format
+    if indptr[0] != 0:
+        print(f"Error: First element of indptr must be 0, got {indptr[0]}")
+        return np.zeros(len(rhs), dtype=np.float64), -1
+
+    if indptr[n_rows] != nnz:
+        print(f"Error: Last element of indptr must be {nnz}, got {indptr[n_rows]}")
+        return np.zeros(len(rhs), dtype=np.float64), -2
+
+    result = np.zeros(n_rows, dtype=np.float64)
+
+    info = c_solve_sparse_system_csr(
+        data.ctypes.data,
+        indices.ctypes.data,
+        indptr.ctypes.data,
+        n_rows,
+        n_cols,
+        nnz,
+        rhs.ctypes.data,
+        result.ctypes.data
     )
 
-    return superlu_solve_csc(csc_data, csc_indices, csc_indptr, b_f64)
+    return result, info
 
 
 # ================================================================
@@ -245,6 +305,68 @@ functype_solve_factored = ctypes.CFUNCTYPE(
 )
 c_solve_with_factors = functype_solve_factored(addr_solve_factored)
 
+# Load the CSR-native factorize function (same signature as factorize)
+addr_factorize_csr = get_cython_function_address(
+    "sparse_numba.sparse_superlu.cy_superlu_wrapper",
+    "cy_factorize_sparse_system_csr")
+c_factorize_sparse_system_csr = functype_factorize(addr_factorize_csr)
+
+# Load the factorize function with ordering / pivoting options
+addr_factorize_opts = get_cython_function_address(
+    "sparse_numba.sparse_superlu.cy_superlu_wrapper",
+    "cy_factorize_sparse_system_opts")
+functype_factorize_opts = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_void_p,    # values
+    ctypes.c_void_p,    # rowind
+    ctypes.c_void_p,    # colptr
+    ctypes.c_int,       # nrows
+    ctypes.c_int,       # ncols
+    ctypes.c_int,       # nnz
+    ctypes.c_int,       # col_perm
+    ctypes.c_double,    # diag_pivot_thresh
+    ctypes.c_void_p,    # handle_out (pointer to int64)
+)
+c_factorize_sparse_system_opts = functype_factorize_opts(addr_factorize_opts)
+
+# Load the factorize function with a user column ordering
+addr_factorize_perm = get_cython_function_address(
+    "sparse_numba.sparse_superlu.cy_superlu_wrapper",
+    "cy_factorize_sparse_system_perm")
+functype_factorize_perm = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_void_p,    # values
+    ctypes.c_void_p,    # rowind
+    ctypes.c_void_p,    # colptr
+    ctypes.c_int,       # nrows
+    ctypes.c_int,       # ncols
+    ctypes.c_int,       # nnz
+    ctypes.c_void_p,    # col_order (column col_order[k] becomes column k)
+    ctypes.c_double,    # diag_pivot_thresh
+    ctypes.c_void_p,    # handle_out (pointer to int64)
+)
+c_factorize_sparse_system_perm = functype_factorize_perm(addr_factorize_perm)
+
+# Column orderings for superlu_factorize_csc_opts (SuperLU colperm_t values)
+SLU_NATURAL = 0
+SLU_MMD_ATA = 1
+SLU_MMD_AT_PLUS_A = 2
+SLU_COLAMD = 3
+
+# Load the solve-with-factors function with transpose option
+addr_solve_factored_trans = get_cython_function_address(
+    "sparse_numba.sparse_superlu.cy_superlu_wrapper",
+    "cy_solve_with_factors_trans")
+functype_solve_factored_trans = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_int64,     # handle (int64)
+    ctypes.c_void_p,    # rhs
+    ctypes.c_void_p,    # solution
+    ctypes.c_int,       # nrhs
+    ctypes.c_int,       # trans (0: A*x = b, 1: A^T*x = b)
+)
+c_solve_with_factors_trans = functype_solve_factored_trans(addr_solve_factored_trans)
+
 # Load the free-factors function
 addr_free = get_cython_function_address(
     "sparse_numba.sparse_superlu.cy_superlu_wrapper",
@@ -255,6 +377,35 @@ functype_free = ctypes.CFUNCTYPE(
 )
 c_free_sparse_factors = functype_free(addr_free)
 
+# Load the factor extraction functions (used by sparse_numba.selinv)
+addr_get_factor_sizes = get_cython_function_address(
+    "sparse_numba.sparse_superlu.cy_superlu_wrapper",
+    "cy_get_factor_sizes")
+functype_get_factor_sizes = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_int64,     # handle
+    ctypes.c_void_p,    # sizes (4 ints: n, nnz_L, nnz_U, transposed)
+)
+c_get_factor_sizes = functype_get_factor_sizes(addr_get_factor_sizes)
+
+addr_get_factors = get_cython_function_address(
+    "sparse_numba.sparse_superlu.cy_superlu_wrapper",
+    "cy_get_factors")
+functype_get_factors = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_int64,     # handle
+    ctypes.c_void_p,    # L pointers
+    ctypes.c_void_p,    # L indices
+    ctypes.c_void_p,    # L values
+    ctypes.c_void_p,    # U column pointers
+    ctypes.c_void_p,    # U row indices
+    ctypes.c_void_p,    # U values
+    ctypes.c_void_p,    # row permutation
+    ctypes.c_void_p,    # column permutation
+    ctypes.c_void_p,    # row scale factors
+)
+c_get_factors = functype_get_factors(addr_get_factors)
+
 
 @njit(nogil=True)
 def superlu_factorize_csc(csc_data, csc_indices, csc_indptr):
@@ -310,6 +461,142 @@ def superlu_factorize_csc(csc_data, csc_indices, csc_indptr):
     return handle_arr[0], info
 
 
+@njit(nogil=True)
+def superlu_factorize_csc_opts(csc_data, csc_indices, csc_indptr,
+                               col_perm=SLU_COLAMD, diag_pivot_thresh=1.0):
+    """
+    Pre-factorize a sparse matrix in CSC format using SuperLU, with a chosen
+    fill-reducing column ordering.
+
+    superlu_factorize_csc always uses the natural ordering. For matrices
+    with a symmetric pattern, SLU_MMD_AT_PLUS_A together with a small
+    diag_pivot_thresh (e.g. 0.001) keeps the diagonal pivots and usually
+    gives the least fill; COLAMD is the general-purpose choice.
+
+    Parameters:
+    -----------
+    csc_data : ndarray (float64)
+        Nonzero values in CSC format
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    col_perm : int, optional
+        SLU_NATURAL, SLU_MMD_ATA, SLU_MMD_AT_PLUS_A or SLU_COLAMD
+    diag_pivot_thresh : float, optional
+        Diagonal pivoting threshold in [0, 1]; 1.0 is partial pivoting
+
+    Returns:
+    --------
+    handle : int64
+        Opaque handle to the stored LU factors.
+        Must be freed with superlu_free_factors(handle).
+    info : int
+        Status code (0 for success, -4 for invalid options)
+    """
+    data = ensure_float64(csc_data)
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+
+    n_cols = len(indptr) - 1
+    n_rows = n_cols  # Square matrix assumption for linear solvers
+    nnz = len(data)
+
+    # Validate CSC format
+    if indptr[0] != 0:
+        print("Error: First element of indptr must be 0")
+        return np.int64(0), -1
+    if indptr[n_cols] != nnz:
+        print("Error: Last element of indptr must equal nnz")
+        return np.int64(0), -2
+
+    handle_arr = np.zeros(1, dtype=np.int64)
+
+    info = c_factorize_sparse_system_opts(
+        data.ctypes.data,
+        indices.ctypes.data,
+        indptr.ctypes.data,
+        n_rows,
+        n_cols,
+        nnz,
+        col_perm,
+        diag_pivot_thresh,
+        handle_arr.ctypes.data,
+    )
+
+    return handle_arr[0], info
+
+
+@njit(nogil=True)
+def superlu_factorize_csc_perm(csc_data, csc_indices, csc_indptr, col_order,
+                               diag_pivot_thresh=1.0):
+    """
+    Pre-factorize a sparse matrix in CSC format using SuperLU, with a column
+    ordering computed outside SuperLU (its MY_PERMC option), e.g. from
+    sparse_numba.ordering.nested_dissection.
+
+    As with SLU_MMD_AT_PLUS_A, a symmetric ordering together with a small
+    diag_pivot_thresh (e.g. 0.001) keeps the diagonal pivots it was
+    computed for.
+
+    Parameters:
+    -----------
+    csc_data : ndarray (float64)
+        Nonzero values in CSC format
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    col_order : ndarray (int32)
+        Column ordering: column col_order[k] of A becomes column k
+    diag_pivot_thresh : float, optional
+        Diagonal pivoting threshold in [0, 1]; 1.0 is partial pivoting
+
+    Returns:
+    --------
+    handle : int64
+        Opaque handle to the stored LU factors.
+        Must be freed with superlu_free_factors(handle).
+    info : int
+        Status code (0 for success, -4 for an invalid ordering or threshold)
+    """
+    data = ensure_float64(csc_data)
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+    order = ensure_int32(col_order)
+
+    n_cols = len(indptr) - 1
+    n_rows = n_cols  # Square matrix assumption for linear solvers
+    nnz = len(data)
+
+    # Validate CSC format
+    if indptr[0] != 0:
+        print("Error: First element of indptr must be 0")
+        return np.int64(0), -1
+    if indptr[n_cols] != nnz:
+        print("Error: Last element of indptr must equal nnz")
+        return np.int64(0), -2
+    if len(order) != n_cols:
+        print("Error: Column ordering length must equal the number of columns")
+        return np.int64(0), -4
+
+    handle_arr = np.zeros(1, dtype=np.int64)
+
+    info = c_factorize_sparse_system_perm(
+        data.ctypes.data,
+        indices.ctypes.data,
+        indptr.ctypes.data,
+        n_rows,
+        n_cols,
+        nnz,
+        order.ctypes.data,
+        diag_pivot_thresh,
+        handle_arr.ctypes.data,
+    )
+
+    return handle_arr[0], info
+
+
 @njit(nogil=True)
 def superlu_solve_factored(handle, b):
     """
@@ -343,6 +630,41 @@ def superlu_solve_factored(handle, b):
     return result, info
 
 
+@njit(nogil=True)
+def superlu_solve_factored_transpose(handle, b):
+    """
+    Solve A^T*x = b using pre-computed LU factors from superlu_factorize_*().
+    Reuses the factors of A; no refactorization of A^T is needed.
+
+    Parameters:
+    -----------
+    handle : int64
+        LU factors handle from superlu_factorize_*()
+    b : ndarray (float64)
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success)
+    """
+    rhs = ensure_float64(b)
+    n = len(rhs)
+    result = np.zeros(n, dtype=np.float64)
+
+    info = c_solve_with_factors_trans(
+        handle,
+        rhs.ctypes.data,
+        result.ctypes.data,
+        1,  # nrhs = 1
+        1,  # trans
+    )
+
+    return result, info
+
+
 @njit(nogil=True)
 def superlu_free_factors(handle):
     """
@@ -406,7 +728,11 @@ def superlu_factorize_coo(row_indices, col_indices, data, shape):
 def superlu_factorize_csr(csr_data, csr_indices, csr_indptr):
     """
     Pre-factorize a sparse matrix in CSR format using SuperLU.
-    Converts to CSC internally, then factorizes.
+
+    Canonical CSR input (sorted column indices, no duplicates) is factorized
+    without conversion, as the CSC matrix A^T; the handle remembers this and
+    superlu_solve_factored / superlu_solve_factored_transpose still solve
+    with A / A^T. Other input is converted to CSC first.
 
     Parameters:
     -----------
@@ -424,13 +750,276 @@ def superlu_factorize_csr(csr_data, csr_indices, csr_indptr):
     info : int
         Status code (0 for success)
     """
-    csr_data_f64 = csr_data.astype(np.float64)
-    csr_indices_i32 = csr_indices.astype(np.int32)
-    csr_indptr_i32 = csr_indptr.astype(np.int32)
+    data = ensure_float64(csr_data)
+    indices = ensure_int32(csr_indices)
+    indptr = ensure_int32(csr_indptr)
+
+    n_rows = len(indptr) - 1
+    n_cols = n_rows  # Square matrix assumption for linear solvers
+    nnz = len(data)
+
+    if not has_canonical_format(indices, indptr):
+        csc_data, csc_indices, csc_indptr = convert_csr_to_csc(
+            data, indices, indptr, (n_rows, n_cols)
+        )
+        return superlu_factorize_csc(csc_data, csc_indices, csc_indptr)
+
+    # Validate CSR format
+    if indptr[0] != 0:
+        print("Error: First element of indptr must be 0")
+        return np.int64(0), -1
+    if indptr[n_rows] != nnz:
+        print("Error: Last element of indptr must equal nnz")
+        return np.int64(0), -2
+
+    handle_arr = np.zeros(1, dtype=np.int64)
 
-    # Convert CSR to CSC
-    csc_data, csc_indices, csc_indptr = convert_csr_to_csc(
-        csr_data_f64, csr_indices_i32, csr_indptr_i32
+    info = c_factorize_sparse_system_csr(
+        data.ctypes.data,
+        indices.ctypes.data,
+        indptr.ctypes.data,
+        n_rows,
+        n_cols,
+        nnz,
+        handle_arr.ctypes.data,
     )
 
-    return superlu_factorize_csc(csc_data, csc_indices, csc_indptr)
+    return handle_arr[0], info
+
+
+# ================================================================
+# Matrix container API: CSCMatrix / CSRMatrix / COOMatrix
+# ================================================================
+
+from sparse_numba.conversion.sparse_matrix_numba import (
+    CSCMatrixType, CSRMatrixType, COOMatrixType,
+)
+
+
+def _superlu_solve_matrix(A, b):
+    pass
+
+
+@overload(_superlu_solve_matrix)
+def _ol_superlu_solve_matrix(A, b):
+    # Canonical matrices go straight to the C layer: the format, shape and
+    # flags are known, so no validation or conversion is repeated.
+    if A == CSCMatrixType:
+        def impl(A, b):
+            A.sum_duplicates()
+            rhs = ensure_float64(b)
+            result = np.zeros(A.n_cols, dtype=np.float64)
+            info = c_solve_sparse_system(
+                A.data.ctypes.data, A.indices.ctypes.data, A.indptr.ctypes.data,
+                A.n_rows, A.n_cols, A.nnz, rhs.ctypes.data, result.ctypes.data
+            )
+            return result, info
+        return impl
+    if A == CSRMatrixType:
+        def impl(A, b):
+            A.sum_duplicates()
+            rhs = ensure_float64(b)
+            result = np.zeros(A.n_cols, dtype=np.float64)
+            info = c_solve_sparse_system_csr(
+                A.data.ctypes.data, A.indices.ctypes.data, A.indptr.ctypes.data,
+                A.n_rows, A.n_cols, A.nnz, rhs.ctypes.data, result.ctypes.data
+            )
+            return result, info
+        return impl
+    if A == COOMatrixType:
+        def impl(A, b):
+            data, indices, indptr = A.csc_arrays()
+            rhs = ensure_float64(b)
+            result = np.zeros(A.n_cols, dtype=np.float64)
+            info = c_solve_sparse_system(
+                data.ctypes.data, indices.ctypes.data, indptr.ctypes.data,
+                A.n_rows, A.n_cols, len(data), rhs.ctypes.data, result.ctypes.data
+            )
+            return result, info
+        return impl
+
+
+def _superlu_factorize_matrix(A):
+    pass
+
+
+@overload(_superlu_factorize_matrix)
+def _ol_superlu_factorize_matrix(A):
+    if A == CSCMatrixType:
+        def impl(A):
+            A.sum_duplicates()
+            handle_arr = np.zeros(1, dtype=np.int64)
+            info = c_factorize_sparse_system(
+                A.data.ctypes.data, A.indices.ctypes.data, A.indptr.ctypes.data,
+                A.n_rows, A.n_cols, A.nnz, handle_arr.ctypes.data
+            )
+            return handle_arr[0], info
+        return impl
+    if A == CSRMatrixType:
+        def impl(A):
+            A.sum_duplicates()
+            handle_arr = np.zeros(1, dtype=np.int64)
+            info = c_factorize_sparse_system_csr(
+                A.data.ctypes.data, A.indices.ctypes.data, A.indptr.ctypes.data,
+                A.n_rows, A.n_cols, A.nnz, handle_arr.ctypes.data
+            )
+            return handle_arr[0], info
+        return impl
+    if A == COOMatrixType:
+        def impl(A):
+            data, indices, indptr = A.csc_arrays()
+            handle_arr = np.zeros(1, dtype=np.int64)
+            info = c_factorize_sparse_system(
+                data.ctypes.data, indices.ctypes.data, indptr.ctypes.data,
+                A.n_rows, A.n_cols, len(data), handle_arr.ctypes.data
+            )
+            return handle_arr[0], info
+        return impl
+
+
+@njit(nogil=True)
+def superlu_solve(A, b):
+    """
+    Solve a sparse linear system Ax = b using SuperLU.
+    A is a CSCMatrix, CSRMatrix or COOMatrix.
+
+    Canonical CSC/CSR matrices are passed to SuperLU without validation or
+    conversion (CSR as the transpose of a CSC matrix). Non-canonical ones are
+    made canonical in place once; COO matrices use their cached CSC form.
+
+    Parameters:
+    -----------
+    A : CSCMatrix, CSRMatrix or COOMatrix
+        Square system matrix
+    b : ndarray
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray
+        Solution vector
+    info : int
+        Status code (0 for success, -3 for a shape mismatch)
+    """
+    if A.n_rows != A.n_cols or len(b) != A.n_rows:
+        print("Error: Matrix must be square and match the length of b")
+        return np.zeros(len(b), dtype=np.float64), -3
+    return _superlu_solve_matrix(A, b)
+
+
+@njit(nogil=True)
+def superlu_factorize(A):
+    """
+    Pre-factorize a sparse matrix using SuperLU.
+    A is a CSCMatrix, CSRMatrix or COOMatrix; see superlu_solve.
+
+    Parameters:
+    -----------
+    A : CSCMatrix, CSRMatrix or COOMatrix
+        Square matrix to factorize
+
+    Returns:
+    --------
+    handle : int64
+        Opaque handle to the stored factors.
+        Must be freed with superlu_free_factors(handle).
+    info : int
+        Status code (0 for success, -3 for a non-square matrix)
+    """
+    if A.n_rows != A.n_cols:
+        print("Error: Matrix must be square")
+        return np.int64(0), -3
+    return _superlu_factorize_matrix(A)
+
+
+# ================================================================
+# Batched solve of many small systems via block-diagonal stacking
+# ================================================================
+
+from numba import prange, get_num_threads
+from numba.typed import List
+from sparse_numba.conversion.matrix_conversion_numba import (
+    _chunk_bounds, _stack_block_diagonal,
+)
+
+
+@njit(nogil=True, parallel=True)
+def solve_block_diagonal_batch(data_list, indices_list, indptr_list, b_list, n_groups=0):
+    """
+    Solve K independent small systems A_k x_k = b_k with SuperLU.
+
+    The systems are split into n_groups groups. The matrices of each group
+    are stacked into one block-diagonal CSC matrix, which is factorized and
+    solved in a single SuperLU call, and the groups run in parallel. This
+    pays the fixed per-call cost (setup, allocations, ctypes transition)
+    once per group instead of once per system.
+
+    n_groups = 1 gives one factorization for the whole batch;
+    n_groups = K is the same as a prange loop over superlu_solve_csc.
+    See benchmark_block_diagonal for where the crossover lies.
+
+    If a group fails (e.g. one matrix is singular), its systems are solved
+    one by one so that each gets its own status code.
+
+    Parameters:
+    -----------
+    data_list : numba.typed.List of ndarray (float64)
+        Nonzero values of each CSC matrix
+    indices_list : numba.typed.List of ndarray
+        Row indices of each CSC matrix
+    indptr_list : numba.typed.List of ndarray
+        Column pointers of each CSC matrix
+    b_list : numba.typed.List of ndarray (float64)
+        Right-hand side of each system
+    n_groups : int, optional
+        Number of block-diagonal groups (default 0: one per Numba thread)
+
+    Returns:
+    --------
+    x_list : numba.typed.List of ndarray (float64)
+        Solution of each system
+    info : ndarray (int32)
+        Status code of each system (0 for success)
+    """
+    n_systems = len(b_list)
+    x_list = List.empty_list(types.float64[::1])
+    for k in range(n_systems):
+        x_list.append(np.zeros(len(b_list[k]), dtype=np.float64))
+    info = np.zeros(n_systems, dtype=np.int32)
+
+    if n_groups <= 0:
+        n_groups = get_num_threads()
+    n_groups = max(1, min(n_groups, n_systems))
+    bounds = _chunk_bounds(n_systems, n_groups)
+
+    for g in prange(n_groups):
+        first = bounds[g]
+        last = bounds[g + 1]
+        data, indices, indptr = _stack_block_diagonal(
+            data_list, indices_list, indptr_list, first, last
+        )
+        rhs = np.empty(len(indptr) - 1, dtype=np.float64)
+        offset = 0
+        for k in range(first, last):
+            b = b_list[k]
+            rhs[offset:offset + len(b)] = b
+            offset += len(b)
+
+        x, group_info = superlu_solve_csc(data, indices, indptr, rhs)
+
+        if group_info == 0:
+            offset = 0
+            for k in range(first, last):
+                n_k = len(x_list[k])
+                x_list[k][:] = x[offset:offset + n_k]
+                offset += n_k
+        else:
+            for k in range(first, last):
+                x_k, info_k = superlu_solve_csc(
+                    ensure_float64(data_list[k]), ensure_int32(indices_list[k]),
+                    ensure_int32(indptr_list[k]), ensure_float64(b_list[k])
+                )
+                x_list[k][:] = x_k
+                info[k] = info_k
+
+    return x_list, info
@@ -12,10 +12,15 @@
 
 #define DEBUG_PRINT(fmt, ...) printf("[SuperLU Debug] " fmt "\n", ##__VA_ARGS__)
 
-int solve_sparse_system(double *values, int *rowind, int *colptr,
-                        int nrows, int ncols, int nnz,
-                        double *rhs, double *solution) {
+/* Shared body of solve_sparse_system / solve_sparse_system_csr.
+ * With row_major = 0 the arrays are CSC (rowind, colptr); with row_major = 1
+ * they are CSR (colind, rowptr) and are handed to dgssv as an SLU_NR matrix,
+ * which factors A^T and solves the transposed system without a conversion. */
+static int solve_impl(double *values, int *rowind, int *colptr,
+                      int nrows, int ncols, int nnz,
+                      double *rhs, double *solution, int row_major) {
 //    DEBUG_PRINT("Starting solve_sparse_system with matrix %dx%d, NNZ: %d", nrows, ncols, nnz);
+    int nptr = row_major ? nrows : ncols;  /* Length of the pointer array minus one */
 
     /* Input validation */
     if (!values || !rowind || !colptr || !rhs || !solution) {
@@ -28,9 +33,9 @@ int solve_sparse_system(double *values, int *rowind, int *colptr,
         return -2;
     }
 
-    if (colptr[0] != 0 || colptr[ncols] != nnz) {
-        DEBUG_PRINT("Error: Invalid CSC format - colptr[0]=%d, colptr[%d]=%d, nnz=%d",
-                    colptr[0], ncols, colptr[ncols], nnz);
+    if (colptr[0] != 0 || colptr[nptr] != nnz) {
+        DEBUG_PRINT("Error: Invalid %s format - ptr[0]=%d, ptr[%d]=%d, nnz=%d",
+                    row_major ? "CSR" : "CSC", colptr[0], nptr, colptr[nptr], nnz);
         return -3;
     }
 
@@ -84,7 +89,7 @@ int solve_sparse_system(double *values, int *rowind, int *colptr,
     /* Copy the arrays */
     values_copy = (double*)malloc(nnz * sizeof(double));
     rowind_copy = (int*)malloc(nnz * sizeof(int));
-    colptr_copy = (int*)malloc((ncols+1) * sizeof(int));
+    colptr_copy = (int*)malloc((nptr+1) * sizeof(int));
     rhs_copy = (double*)malloc(nrows * sizeof(double));
 
     if (!values_copy || !rowind_copy || !colptr_copy || !rhs_copy) {
@@ -96,7 +101,7 @@ int solve_sparse_system(double *values, int *rowind, int *colptr,
     /* Copy the data */
     memcpy(values_copy, values, nnz * sizeof(double));
     memcpy(rowind_copy, rowind, nnz * sizeof(int));
-    memcpy(colptr_copy, colptr, (ncols+1) * sizeof(int));
+    memcpy(colptr_copy, colptr, (nptr+1) * sizeof(int));
     memcpy(rhs_copy, rhs, nrows * sizeof(double));
 
     /* Initialize solution to zeros */
@@ -109,24 +114,41 @@ int solve_sparse_system(double *values, int *rowind, int *colptr,
     /* Initialize SuperLU structures manually */
 
     /* Create A matrix */
-    NCformat *Astore = (NCformat*)malloc(sizeof(NCformat));
-    if (!Astore) {
-        DEBUG_PRINT("Failed to allocate A.Store");
-        status = -20;
-        goto cleanup;
-    }
+    if (row_major) {
+        NRformat *Astore = (NRformat*)malloc(sizeof(NRformat));
+        if (!Astore) {
+            DEBUG_PRINT("Failed to allocate A.Store");
+            status = -20;
+            goto cleanup;
+        }
+
+        A->Stype = SLU_NR;
+        A->Store = Astore;
+
+        Astore->nnz = nnz;
+        Astore->nzval = values_copy;
+        Astore->colind = rowind_copy;
+        Astore->rowptr = colptr_copy;
+    } else {
+        NCformat *Astore = (NCformat*)malloc(sizeof(NCformat));
+        if (!Astore) {
+            DEBUG_PRINT("Failed to allocate A.Store");
+            status = -20;
+            goto cleanup;
+        }
+
+        A->Stype = SLU_NC;
+        A->Store = Astore;
 
-    A->Stype = SLU_NC;
+        Astore->nnz = nnz;
+        Astore->nzval = values_copy;
+        Astore->rowind = rowind_copy;
+        Astore->colptr = colptr_copy;
+    }
     A->Dtype = SLU_D;
     A->Mtype = SLU_GE;
     A->nrow = nrows;
     A->ncol = ncols;
-    A->Store = Astore;
-
-    Astore->nnz = nnz;
-    Astore->nzval = values_copy;
-    Astore->rowind = rowind_copy;
-    Astore->colptr = colptr_copy;
 
 //    DEBUG_PRINT("A matrix initialized manually");
 
@@ -229,10 +251,7 @@ cleanup:
 
     /* Free A matrix - careful not to free our arrays until later */
     if (A && A->Store) {
-        NCformat *Astore = (NCformat*)A->Store;
-        Astore->nzval = NULL;   /* Don't let SuperLU free our arrays */
-        Astore->rowind = NULL;
-        Astore->colptr = NULL;
+        /* Only the Store struct is freed here; our arrays are freed below */
         free(A->Store);
 //        DEBUG_PRINT("Freed A.Store");
     }
@@ -280,6 +299,20 @@ cleanup:
 }
 
 
+int solve_sparse_system(double *values, int *rowind, int *colptr,
+                        int nrows, int ncols, int nnz,
+                        double *rhs, double *solution) {
+    return solve_impl(values, rowind, colptr, nrows, ncols, nnz, rhs, solution, 0);
+}
+
+
+int solve_sparse_system_csr(double *values, int *colind, int *rowptr,
+                            int nrows, int ncols, int nnz,
+                            double *rhs, double *solution) {
+    return solve_impl(values, colind, rowptr, nrows, ncols, nnz, rhs, solution, 1);
+}
+
+
 /* ================================================================
  * Pre-factorization API: factorize once, solve many times
  * ================================================================ */
@@ -292,12 +325,21 @@ typedef struct {
     int *perm_c;
     int nrows;
     int ncols;
+    int transposed;  /* 1 if L*U factors A^T (built from CSR arrays) */
 } superlu_factors_t;
 
 
-int factorize_sparse_system(double *values, int *rowind, int *colptr,
-                            int nrows, int ncols, int nnz,
-                            int64_t *handle_out) {
+/* Shared body of the factorize_sparse_system* functions.
+ * The arrays are always read as CSC; transposed = 1 records that they are
+ * really the CSR arrays of A, i.e. the CSC arrays of A^T.
+ * col_perm is a SuperLU colperm_t value (NATURAL, MMD_ATA, MMD_AT_PLUS_A,
+ * COLAMD); diag_pivot_thresh is in [0, 1], 1 meaning plain partial pivoting.
+ * A non-NULL col_order is a user column ordering (column col_order[k] of A
+ * becomes column k) and replaces col_perm (SuperLU's MY_PERMC). */
+static int factorize_impl(double *values, int *rowind, int *colptr,
+                          int nrows, int ncols, int nnz, int transposed,
+                          int col_perm, double diag_pivot_thresh,
+                          const int *col_order, int64_t *handle_out) {
 
     /* Input validation */
     if (!values || !rowind || !colptr || !handle_out) {
@@ -313,6 +355,31 @@ int factorize_sparse_system(double *values, int *rowind, int *colptr,
                     colptr[0], ncols, colptr[ncols], nnz);
         return -3;
     }
+    if (col_perm < NATURAL || col_perm > COLAMD
+            || diag_pivot_thresh < 0.0 || diag_pivot_thresh > 1.0) {
+        DEBUG_PRINT("Error: Invalid options - col_perm=%d, diag_pivot_thresh=%g",
+                    col_perm, diag_pivot_thresh);
+        return -4;
+    }
+    if (col_order) {
+        /* Must be a permutation of 0..ncols-1 */
+        char *seen = (char*)calloc(ncols, 1);
+        if (!seen) {
+            DEBUG_PRINT("Failed to allocate permutation check");
+            return -11;
+        }
+        for (int k = 0; k < ncols; k++) {
+            int j = col_order[k];
+            if (j < 0 || j >= ncols || seen[j]) {
+                DEBUG_PRINT("Error: Invalid column ordering at position %d", k);
+                free(seen);
+                return -4;
+            }
+            seen[j] = 1;
+        }
+        free(seen);
+        col_perm = MY_PERMC;
+    }
 
     *handle_out = 0;
 
@@ -401,7 +468,12 @@ int factorize_sparse_system(double *values, int *rowind, int *colptr,
 
     /* Set options */
     set_default_options(options);
-    options->ColPerm = NATURAL;
+    options->ColPerm = (colperm_t)col_perm;
+    options->DiagPivotThresh = diag_pivot_thresh;
+    /* A small threshold with an A^T+A (or user) ordering keeps the diagonal
+     * pivots the ordering was computed for (SuperLU's symmetric mode) */
+    options->SymmetricMode = ((col_perm == MMD_AT_PLUS_A || col_perm == MY_PERMC)
+                              && diag_pivot_thresh < 1.0) ? YES : NO;
     options->PrintStat = NO;
 
     /* Initialize stat */
@@ -411,8 +483,12 @@ int factorize_sparse_system(double *values, int *rowind, int *colptr,
     for (int i = 0; i < nrows; i++) perm_r[i] = i;
     for (int i = 0; i < ncols; i++) perm_c[i] = i;
 
-    /* Step 1: Column permutation */
-    get_perm_c(options->ColPerm, A, perm_c);
+    /* Step 1: Column permutation (SuperLU's perm_c maps old to new columns) */
+    if (col_order) {
+        for (int k = 0; k < ncols; k++) perm_c[col_order[k]] = k;
+    } else {
+        get_perm_c(options->ColPerm, A, perm_c);
+    }
 
     /* Step 2: Pre-order the matrix */
     sp_preorder(options, A, perm_c, etree, AC);
@@ -455,6 +531,7 @@ int factorize_sparse_system(double *values, int *rowind, int *colptr,
     factors->perm_c = perm_c;
     factors->nrows = nrows;
     factors->ncols = ncols;
+    factors->transposed = transposed;
 
     /* Transfer ownership: set to NULL so cleanup doesn't free them */
     L = NULL;
@@ -515,7 +592,52 @@ cleanup:
 }
 
 
+int factorize_sparse_system(double *values, int *rowind, int *colptr,
+                            int nrows, int ncols, int nnz,
+                            int64_t *handle_out) {
+    return factorize_impl(values, rowind, colptr, nrows, ncols, nnz, 0,
+                          NATURAL, 1.0, NULL, handle_out);
+}
+
+
+int factorize_sparse_system_opts(double *values, int *rowind, int *colptr,
+                                 int nrows, int ncols, int nnz,
+                                 int col_perm, double diag_pivot_thresh,
+                                 int64_t *handle_out) {
+    return factorize_impl(values, rowind, colptr, nrows, ncols, nnz, 0,
+                          col_perm, diag_pivot_thresh, NULL, handle_out);
+}
+
+
+int factorize_sparse_system_perm(double *values, int *rowind, int *colptr,
+                                 int nrows, int ncols, int nnz,
+                                 int *col_order, double diag_pivot_thresh,
+                                 int64_t *handle_out) {
+    if (!col_order) {
+        DEBUG_PRINT("Error: NULL column ordering passed to factorize_sparse_system_perm");
+        return -1;
+    }
+    return factorize_impl(values, rowind, colptr, nrows, ncols, nnz, 0,
+                          NATURAL, diag_pivot_thresh, col_order, handle_out);
+}
+
+
+int factorize_sparse_system_csr(double *values, int *colind, int *rowptr,
+                                int nrows, int ncols, int nnz,
+                                int64_t *handle_out) {
+    /* CSR arrays of A are the CSC arrays of A^T (ncols x nrows) */
+    return factorize_impl(values, colind, rowptr, ncols, nrows, nnz, 1,
+                          NATURAL, 1.0, NULL, handle_out);
+}
+
+
 int solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs) {
+    return solve_with_factors_trans(handle, rhs, solution, nrhs, 0);
+}
+
+
+int solve_with_factors_trans(int64_t handle, double *rhs, double *solution,
+                             int nrhs, int trans) {
 
     if (!handle || !rhs || !solution) {
         DEBUG_PRINT("Error: NULL pointer passed to solve_with_factors");
@@ -524,6 +646,8 @@ int solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs)
 
     superlu_factors_t *factors = (superlu_factors_t*)(intptr_t)handle;
     int nrows = factors->nrows;
+    /* Factors of A^T solve A x = b with TRANS, and vice versa */
+    trans_t slu_trans = ((trans != 0) != (factors->transposed != 0)) ? TRANS : NOTRANS;
 
     SuperMatrix *B = NULL;
     SuperLUStat_t *stat = NULL;
@@ -573,7 +697,7 @@ int solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs)
     StatInit(stat);
 
     /* Triangular solve using pre-computed L, U factors */
-    dgstrs(NOTRANS, factors->L, factors->U,
+    dgstrs(slu_trans, factors->L, factors->U,
            factors->perm_c, factors->perm_r,
            B, stat, &info);
 
@@ -608,6 +732,110 @@ cleanup:
 }
 
 
+/* Walk the supernodal L and the U of the factors column by column. The
+ * rows of a supernode at or above the diagonal belong to U, with the pivot
+ * on the diagonal; L gets an explicit unit diagonal. With NULL output
+ * arrays only the counts are taken. */
+static void walk_factors(superlu_factors_t *factors,
+                         int *l_colptr, int *l_rowind, double *l_values,
+                         int *u_colptr, int *u_rowind, double *u_values,
+                         int *nnz_l, int *nnz_u) {
+    SCformat *Lstore = (SCformat*)factors->L->Store;
+    NCformat *Ustore = (NCformat*)factors->U->Store;
+    double *Lval = (double*)Lstore->nzval;
+    double *Uval = (double*)Ustore->nzval;
+    int nl = 0;
+    int nu = 0;
+
+    if (l_colptr) l_colptr[0] = 0;
+    if (u_colptr) u_colptr[0] = 0;
+    for (int isup = 0; isup <= Lstore->nsuper; ++isup) {
+        int fsupc = Lstore->sup_to_col[isup];
+        int istart = Lstore->rowind_colptr[fsupc];
+        int nsupr = Lstore->rowind_colptr[fsupc + 1] - istart;
+
+        for (int j = fsupc; j < Lstore->sup_to_col[isup + 1]; ++j) {
+            for (int p = Ustore->colptr[j]; p < Ustore->colptr[j + 1]; ++p) {
+                if (u_rowind) {
+                    u_rowind[nu] = Ustore->rowind[p];
+                    u_values[nu] = Uval[p];
+                }
+                nu++;
+            }
+            int vstart = Lstore->nzval_colptr[j];
+            for (int k = 0; k < nsupr; ++k) {
+                int i = Lstore->rowind[istart + k];
+                double v = Lval[vstart + k];
+                if (i <= j) {
+                    if (u_rowind) {
+                        u_rowind[nu] = i;
+                        u_values[nu] = v;
+                    }
+                    nu++;
+                }
+                if (i >= j) {
+                    if (l_rowind) {
+                        l_rowind[nl] = i;
+                        l_values[nl] = (i == j) ? 1.0 : v;
+                    }
+                    nl++;
+                }
+            }
+            if (l_colptr) l_colptr[j + 1] = nl;
+            if (u_colptr) u_colptr[j + 1] = nu;
+        }
+    }
+    *nnz_l = nl;
+    *nnz_u = nu;
+}
+
+
+int get_factor_sizes(int64_t handle, int *sizes) {
+
+    if (!handle || !sizes) {
+        DEBUG_PRINT("Error: NULL pointer passed to get_factor_sizes");
+        return -1;
+    }
+
+    superlu_factors_t *factors = (superlu_factors_t*)(intptr_t)handle;
+    int nnz_l = 0;
+    int nnz_u = 0;
+    walk_factors(factors, NULL, NULL, NULL, NULL, NULL, NULL, &nnz_l, &nnz_u);
+
+    sizes[0] = factors->ncols;
+    sizes[1] = nnz_l;
+    sizes[2] = nnz_u;
+    sizes[3] = factors->transposed;
+    return 0;
+}
+
+
+int get_factors(int64_t handle,
+                int *l_colptr, int *l_rowind, double *l_values,
+                int *u_colptr, int *u_rowind, double *u_values,
+                int *perm_r, int *perm_c, double *rs) {
+
+    if (!handle || !l_colptr || !l_rowind || !l_values || !u_colptr || !u_rowind
+            || !u_values || !perm_r || !perm_c || !rs) {
+        DEBUG_PRINT("Error: NULL pointer passed to get_factors");
+        return -1;
+    }
+
+    superlu_factors_t *factors = (superlu_factors_t*)(intptr_t)handle;
+    int nnz_l = 0;
+    int nnz_u = 0;
+    walk_factors(factors, l_colptr, l_rowind, l_values, u_colptr, u_rowind, u_values,
+                 &nnz_l, &nnz_u);
+
+    for (int i = 0; i < factors->ncols; i++) {
+        perm_r[i] = factors->perm_r[i];
+        perm_c[i] = factors->perm_c[i];
+        rs[i] = 1.0;
+    }
+    return 0;
+}
+
+
 int free_sparse_factors(int64_t handle) {
 
     if (!handle) {
@@ -25,6 +25,25 @@ int solve_sparse_system(double *values, int *rowind, int *colptr,
                               int nrows, int ncols, int nnz,
                               double *rhs, double *solution);
 
+/**
+ * Solve a sparse linear system given in CSR format, without converting it.
+ * The CSR arrays of A are the CSC arrays of A^T: SuperLU factors A^T and
+ * solves the transposed system.
+ *
+ * @param values    Array of non-zero values in CSR format (size nnz)
+ * @param colind    Array of column indices (size nnz)
+ * @param rowptr    Array of row pointers (size nrows+1)
+ * @param nrows     Number of rows in the matrix
+ * @param ncols     Number of columns in the matrix
+ * @param nnz       Number of non-zero elements
+ * @param rhs       Right-hand side vector (size nrows)
+ * @param solution  Output: Solution vector (size nrows)
+ * @return          0 on success, non-zero error code on failure
+ */
+int solve_sparse_system_csr(double *values, int *colind, int *rowptr,
+                            int nrows, int ncols, int nnz,
+                            double *rhs, double *solution);
+
 /**
  * Pre-factorize a sparse matrix (LU decomposition only, no solve)
  *
@@ -41,6 +60,70 @@ int factorize_sparse_system(double *values, int *rowind, int *colptr,
                             int nrows, int ncols, int nnz,
                             int64_t *handle_out);
 
+/**
+ * Pre-factorize a sparse matrix in CSC format with a chosen column ordering
+ * and diagonal pivoting threshold
+ *
+ * @param values            Array of non-zero values in CSC format (size nnz)
+ * @param rowind            Array of row indices (size nnz)
+ * @param colptr            Array of column pointers (size ncols+1)
+ * @param nrows             Number of rows in the matrix
+ * @param ncols             Number of columns in the matrix
+ * @param nnz               Number of non-zero elements
+ * @param col_perm          Column ordering: 0 NATURAL, 1 MMD_ATA,
+ *                          2 MMD_AT_PLUS_A, 3 COLAMD
+ * @param diag_pivot_thresh Diagonal pivoting threshold in [0, 1]
+ *                          (1 = partial pivoting; with MMD_AT_PLUS_A and a
+ *                          value below 1, SuperLU's symmetric mode is used)
+ * @param handle_out        Output: opaque handle to LU factors (int64)
+ * @return                  0 on success, non-zero error code on failure
+ */
+int factorize_sparse_system_opts(double *values, int *rowind, int *colptr,
+                                 int nrows, int ncols, int nnz,
+                                 int col_perm, double diag_pivot_thresh,
+                                 int64_t *handle_out);
+
+/**
+ * Pre-factorize a sparse matrix in CSC format with a user column ordering
+ * (e.g. nested dissection computed outside SuperLU)
+ *
+ * @param values            Array of non-zero values in CSC format (size nnz)
+ * @param rowind            Array of row indices (size nnz)
+ * @param colptr            Array of column pointers (size ncols+1)
+ * @param nrows             Number of rows in the matrix
+ * @param ncols             Number of columns in the matrix
+ * @param nnz               Number of non-zero elements
+ * @param col_order         Column ordering (size ncols): column col_order[k]
+ *                          of A becomes column k
+ * @param diag_pivot_thresh Diagonal pivoting threshold in [0, 1]
+ *                          (below 1, SuperLU's symmetric mode is used)
+ * @param handle_out        Output: opaque handle to LU factors (int64)
+ * @return                  0 on success, -4 if col_order is not a
+ *                          permutation, other non-zero codes on failure
+ */
+int factorize_sparse_system_perm(double *values, int *rowind, int *colptr,
+                                 int nrows, int ncols, int nnz,
+                                 int *col_order, double diag_pivot_thresh,
+                                 int64_t *handle_out);
+
+/**
+ * Pre-factorize a sparse matrix given in CSR format, without converting it.
+ * The factors are those of A^T; the handle remembers this, so
+ * solve_with_factors still solves A*x = b.
+ *
+ * @param values     Array of non-zero values in CSR format (size nnz)
+ * @param colind     Array of column indices (size nnz)
+ * @param rowptr     Array of row pointers (size nrows+1)
+ * @param nrows      Number of rows in the matrix
+ * @param ncols      Number of columns in the matrix
+ * @param nnz        Number of non-zero elements
+ * @param handle_out Output: opaque handle to LU factors (int64)
+ * @return           0 on success, non-zero error code on failure
+ */
+int factorize_sparse_system_csr(double *values, int *colind, int *rowptr,
+                                int nrows, int ncols, int nnz,
+                                int64_t *handle_out);
+
 /**
  * Solve using pre-computed LU factors from factorize_sparse_system
  *
@@ -52,6 +135,48 @@ int factorize_sparse_system(double *values, int *rowind, int *colptr,
  */
 int solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs);
 
+/**
+ * Solve A*x = b (trans = 0) or A^T*x = b (trans = 1) using pre-computed
+ * LU factors from factorize_sparse_system or factorize_sparse_system_csr
+ *
+ * @param handle    Opaque handle from factorize_sparse_system*
+ * @param rhs       Right-hand side vectors, column-major (size nrows*nrhs)
+ * @param solution  Output: Solution vectors, column-major (size nrows*nrhs)
+ * @param nrhs      Number of right-hand sides
+ * @param trans     0 to solve with A, 1 to solve with A^T
+ * @return          0 on success, non-zero error code on failure
+ */
+int solve_with_factors_trans(int64_t handle, double *rhs, double *solution,
+                             int nrhs, int trans);
+
+/**
+ * Sizes of the factors behind a handle, for get_factors
+ *
+ * @param handle    Opaque handle from factorize_sparse_system*
+ * @param sizes     Output (4 ints): n, nnz of L, nnz of U, transposed
+ *                  (1 if the factors are those of A^T)
+ * @return          0 on success, non-zero error code on failure
+ */
+int get_factor_sizes(int64_t handle, int *sizes);
+
+/**
+ * Copy the factors Pr*A*Pc = L*U out of a handle, as CSC matrices in pivot
+ * order (row indices not sorted). L has its unit diagonal stored; the
+ * diagonal of U holds the pivots. Row i of A is pivot row perm_r[i] and
+ * column j of A is column perm_c[j] of A*Pc. rs is set to ones (SuperLU
+ * factors are not scaled).
+ *
+ * @param handle    Opaque handle from factorize_sparse_system*
+ * @param l_colptr, l_rowind, l_values   Output: L (n+1, nnz_L, nnz_L)
+ * @param u_colptr, u_rowind, u_values   Output: U (n+1, nnz_U, nnz_U)
+ * @param perm_r, perm_c, rs             Output: size n each
+ * @return          0 on success, non-zero error code on failure
+ */
+int get_factors(int64_t handle,
+                int *l_colptr, int *l_rowind, double *l_values,
+                int *u_colptr, int *u_rowind, double *u_values,
+                int *perm_r, int *perm_c, double *rs);
+
 /**
  * Free memory associated with LU factors
  *
@@ -0,0 +1,78 @@
+"""
+Tests for the SuperLU block-diagonal batch solver.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_block_diagonal_slu.py
+
+import numpy as np
+import scipy.sparse as sp
+from numba.typed import List
+from sparse_numba.sparse_superlu.superlu_numba_interface import solve_block_diagonal_batch
+
+
+def _make_batch(sizes, density=0.3, seed=42):
+    """Random diagonally dominant systems with known solutions."""
+    rng = np.random.default_rng(seed)
+    data_list, indices_list, indptr_list, b_list = List(), List(), List(), List()
+    x_true = []
+    for k, n in enumerate(sizes):
+        A = sp.random(n, n, density=density, random_state=seed + k) + sp.eye(n) * (n + 1.0)
+        A = A.tocsc()
+        x = rng.standard_normal(n)
+        data_list.append(A.data)
+        indices_list.append(A.indices.astype(np.int32))
+        indptr_list.append(A.indptr.astype(np.int32))
+        b_list.append(A @ x)
+        x_true.append(x)
+    return data_list, indices_list, indptr_list, b_list, x_true
+
+
+def test_batch_all_group_counts():
+    """Every choice of n_groups gives the same, correct solutions."""
+    print("Test: solve_block_diagonal_batch, n_groups = 1, 3, K, default")
+    sizes = [10, 20, 5, 30, 15, 12, 8]
+    data_list, indices_list, indptr_list, b_list, x_true = _make_batch(sizes)
+    for n_groups in (1, 3, len(sizes), 0):
+        x_list, info = solve_block_diagonal_batch(
+            data_list, indices_list, indptr_list, b_list, n_groups
+        )
+        assert np.all(info == 0)
+        for x, xt in zip(x_list, x_true):
+            assert np.linalg.norm(x - xt) < 1e-10
+    print("  PASSED")
+
+
+def test_batch_singular_member():
+    """A singular system is reported without spoiling the others."""
+    print("Test: solve_block_diagonal_batch with a singular system")
+    sizes = [6, 6, 6, 6]
+    data_list, indices_list, indptr_list, b_list, x_true = _make_batch(sizes)
+    data_list[2] = np.zeros_like(data_list[2])
+    x_list, info = solve_block_diagonal_batch(
+        data_list, indices_list, indptr_list, b_list, 1
+    )
+    assert info[2] != 0
+    for k in (0, 1, 3):
+        assert info[k] == 0
+        assert np.linalg.norm(x_list[k] - x_true[k]) < 1e-10
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("SuperLU Block-Diagonal Batch Tests")
+    print("=" * 60)
+    test_batch_all_group_counts()
+    test_batch_singular_member()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -10,8 +10,19 @@ from sparse_numba.sparse_superlu.superlu_numba_interface import (
     superlu_factorize_csc,
     superlu_factorize_coo,
     superlu_factorize_csr,
+    superlu_solve_csr,
     superlu_solve_factored,
+    superlu_solve_factored_transpose,
     superlu_free_factors,
+    superlu_solve,
+    superlu_factorize,
+    superlu_factorize_csc_perm,
+)
+from sparse_numba.ordering.nested_dissection_numba import nested_dissection
+from sparse_numba.conversion.sparse_matrix_numba import (
+    as_csc_matrix,
+    as_csr_matrix,
+    as_coo_matrix,
 )
 from sparse_numba.conversion.matrix_conversion_numba import (
     convert_coo_to_csr,
@@ -255,6 +266,142 @@ def test_comparison_with_direct_solve():
     print("  PASSED")
 
 
+def test_solve_factored_transpose():
+    """Test A^T x = b with the factors of A, for CSC and CSR-native handles."""
+    print("Test: transpose solve with factors")
+    A_coo = _make_test_matrix()
+    A_csc = A_coo.tocsc()
+    A_csr = A_coo.tocsr()
+    n = A_csc.shape[0]
+
+    np.random.seed(7)
+    x_true = np.random.randn(n)
+    b = A_csc @ x_true
+    bt = A_csc.T @ x_true
+
+    handle_csc, info = superlu_factorize_csc(A_csc.data, A_csc.indices, A_csc.indptr)
+    assert info == 0
+    handle_csr, info = superlu_factorize_csr(
+        A_csr.data, A_csr.indices.astype(np.int32), A_csr.indptr.astype(np.int32)
+    )
+    assert info == 0
+
+    for handle in (handle_csc, handle_csr):
+        x, info = superlu_solve_factored(handle, b)
+        assert info == 0
+        err = np.linalg.norm(x - x_true) / np.linalg.norm(x_true)
+        assert err < 1e-10, f"A x = b error: {err}"
+
+        x, info = superlu_solve_factored_transpose(handle, bt)
+        assert info == 0
+        err = np.linalg.norm(x - x_true) / np.linalg.norm(x_true)
+        print(f"  A^T x = b relative error: {err:.2e}")
+        assert err < 1e-10, f"A^T x = b error: {err}"
+
+        superlu_free_factors(handle)
+    print("  PASSED")
+
+
+def test_solve_csr_native_and_fallback():
+    """Test CSR solve for canonical input and for unsorted input with duplicates."""
+    print("Test: CSR solve, canonical and non-canonical input")
+    A_coo = _make_test_matrix()
+    A_csr = A_coo.tocsr()
+    n = A_csr.shape[0]
+    x_true = np.ones(n)
+    b = A_csr @ x_true
+
+    # Canonical input: solved without conversion
+    x, info = superlu_solve_csr(A_csr.data, A_csr.indices, A_csr.indptr, b)
+    assert info == 0
+    assert np.linalg.norm(x - x_true) < 1e-8
+
+    # Split every diagonal entry into two duplicates at the end of its row
+    rows = np.repeat(np.arange(n), np.diff(A_csr.indptr))
+    diag = rows == A_csr.indices
+    data = A_csr.data.copy()
+    data[diag] *= 0.5
+    dup = sp.coo_matrix(
+        (np.concatenate([data, data[diag]]),
+         (np.concatenate([rows, rows[diag]]),
+          np.concatenate([A_csr.indices, A_csr.indices[diag]]))),
+        shape=A_csr.shape,
+    )
+    order = np.argsort(dup.row, kind='stable')
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(dup.row, minlength=n))])
+    x, info = superlu_solve_csr(
+        dup.data[order], dup.col[order].astype(np.int32), indptr.astype(np.int32), b
+    )
+    assert info == 0
+    err = np.linalg.norm(x - x_true)
+    print(f"  Error: {err:.2e}")
+    assert err < 1e-8
+    print("  PASSED")
+
+
+def test_matrix_containers():
+    """Test solve / factorize with CSCMatrix, CSRMatrix and COOMatrix."""
+    print("Test: solve and factorize with matrix containers")
+    A_coo = _make_test_matrix()
+    A_csc = A_coo.tocsc()
+    A_csr = A_coo.tocsr()
+    n = A_csc.shape[0]
+    x_true = np.ones(n)
+    b = A_csc @ x_true
+
+    matrices = (
+        as_csc_matrix(A_csc.data, A_csc.indices, A_csc.indptr, A_csc.shape),
+        as_csr_matrix(A_csr.data, A_csr.indices, A_csr.indptr, A_csr.shape),
+        # COO input contains duplicate diagonal entries
+        as_coo_matrix(A_coo.row, A_coo.col, A_coo.data, A_coo.shape),
+    )
+    for M in matrices:
+        x, info = superlu_solve(M, b)
+        assert info == 0
+        assert np.linalg.norm(x - x_true) < 1e-8
+
+        handle, info = superlu_factorize(M)
+        assert info == 0
+        x, info = superlu_solve_factored(handle, b)
+        assert info == 0
+        assert np.linalg.norm(x - x_true) < 1e-8
+        superlu_free_factors(handle)
+
+    x, info = superlu_solve(matrices[0], b[:10])
+    assert info == -3
+    print("  PASSED")
+
+
+def test_factorize_csc_perm():
+    """Test factorize with a user column ordering (nested dissection)."""
+    print("Test: factorize with nested dissection ordering")
+    A_coo = _make_test_matrix(n=400, density=0.01)
+    A_csc = A_coo.tocsc()
+    A_csc.sum_duplicates()
+    n = A_csc.shape[0]
+    x_true = np.ones(n)
+    b = A_csc @ x_true
+
+    perm, tree = nested_dissection(A_csc.indices, A_csc.indptr, 32)
+    handle, info = superlu_factorize_csc_perm(A_csc.data, A_csc.indices, A_csc.indptr, perm, 0.001)
+    assert info == 0, f"Factorize failed: info={info}"
+    x, info = superlu_solve_factored(handle, b)
+    assert info == 0
+    err = np.linalg.norm(x - x_true)
+    print(f"  Error: {err:.2e}")
+    assert err < 1e-8
+    superlu_free_factors(handle)
+
+    # Not a permutation, wrong length
+    bad = perm.copy()
+    bad[0] = bad[1]
+    handle, info = superlu_factorize_csc_perm(A_csc.data, A_csc.indices, A_csc.indptr, bad)
+    assert info == -4
+    handle, info = superlu_factorize_csc_perm(A_csc.data, A_csc.indices, A_csc.indptr, perm[:-1])
+    assert info == -4
+    print("  PASSED")
+
+
 def run_all_tests():
     print("=" * 60)
     print("SuperLU Pre-Factorization Tests")
@@ -267,6 +414,10 @@ def run_all_tests():
     test_sparse_matvec_csr()
     test_convert_coo_to_csr()
     test_comparison_with_direct_solve()
+    test_solve_factored_transpose()
+    test_solve_csr_native_and_fallback()
+    test_matrix_containers()
+    test_factorize_csc_perm()
     print("=" * 60)
     print("ALL TESTS PASSED")
     print("=" * 60)
@@ -1853,8 +1853,14 @@ static int __Pyx_State_RemoveModule(void*);
 
 /* Module declarations from "cy_umfpack_wrapper" */
 static int __pyx_f_18cy_umfpack_wrapper_cy_solve_sparse_system(double *, int *, int *, int, int, int, double *, double *); /*proto*/
+static int __pyx_f_18cy_umfpack_wrapper_cy_solve_sparse_system_csr(double *, int *, int *, int, int, int, double *, double *); /*proto*/
 static int __pyx_f_18cy_umfpack_wrapper_cy_factorize_sparse_system(double *, int *, int *, int, int, int, int64_t *); /*proto*/
+static int __pyx_f_18cy_umfpack_wrapper_cy_factorize_sparse_system_csr(double *, int *, int *, int, int, int, int64_t *); /*proto*/
+static int __pyx_f_18cy_umfpack_wrapper_cy_factorize_sparse_system_perm(double *, int *, int *, int, int, int, int *, int64_t *); /*proto*/
 static int __pyx_f_18cy_umfpack_wrapper_cy_solve_with_factors(int64_t, double *, double *, int); /*proto*/
+static int __pyx_f_18cy_umfpack_wrapper_cy_solve_with_factors_trans(int64_t, double *, double *, int, int); /*proto*/
+static int __pyx_f_18cy_umfpack_wrapper_cy_get_factor_sizes(int64_t, int *); /*proto*/
+static int __pyx_f_18cy_umfpack_wrapper_cy_get_factors(int64_t, int *, int *, double *, int *, int *, double *, int *, int *, double *); /*proto*/
 static int __pyx_f_18cy_umfpack_wrapper_cy_free_sparse_factors(int64_t); /*proto*/
 /* #### Code section: typeinfo ### */
 /* #### Code section: before_global_var ### */
@@ -1965,7 +1971,7 @@ return 0;
 #endif
 /* #### Code section: module_code ### */
 
-/* "cy_umfpack_wrapper.pyx":16
+/* "cy_umfpack_wrapper.pyx":32
  * 
  * 
  * cdef api int cy_solve_sparse_system(double *values, int *rowind, int *colptr,             # <<<<<<<<<<<<<<
@@ -1976,7 +1982,7 @@ return 0;
 static int __pyx_f_18cy_umfpack_wrapper_cy_solve_sparse_system(double *__pyx_v_values, int *__pyx_v_rowind, int *__pyx_v_colptr, int __pyx_v_nrows, int __pyx_v_ncols, int __pyx_v_nnz, double *__pyx_v_rhs, double *__pyx_v_solution) {
   int __pyx_r;
 
-  /* "cy_umfpack_wrapper.pyx":19
+  /* "cy_umfpack_wrapper.pyx":35
  *                                   int nrows, int ncols, int nnz,
  *                                   double *rhs, double *solution):
  *     return solve_sparse_system(values, rowind, colptr, nrows, ncols, nnz, rhs, solution)             # <<<<<<<<<<<<<<
@@ -1986,7 +1992,7 @@ static int __pyx_f_18cy_umfpack_wrapper_cy_solve_sparse_system(double *__pyx_v_v
   __pyx_r = solve_sparse_system(__pyx_v_values, __pyx_v_rowind, __pyx_v_colptr, __pyx_v_nrows, __pyx_v_ncols, __pyx_v_nnz, __pyx_v_rhs, __pyx_v_solution);
   goto __pyx_L0;
 
-  /* "cy_umfpack_wrapper.pyx":16
+  /* "cy_umfpack_wrapper.pyx":32
  * 
  * 
  * cdef api int cy_solve_sparse_system(double *values, int *rowind, int *colptr,             # <<<<<<<<<<<<<<
@@ -1999,7 +2005,41 @@ static int __pyx_f_18cy_umfpack_wrapper_cy_solve_sparse_system(double *__pyx_v_v
   return __pyx_r;
 }
 
-/* "cy_umfpack_wrapper.pyx":22
+/* "cy_umfpack_wrapper.pyx":38
+ * 
+ * 
+ * cdef api int cy_solve_sparse_system_csr(double *values, int *colind, int *rowptr,             # <<<<<<<<<<<<<<
+ *                                         int nrows, int ncols, int nnz,
+ *                                         double *rhs, double *solution):
+*/
+
+static int __pyx_f_18cy_umfpack_wrapper_cy_solve_sparse_system_csr(double *__pyx_v_values, int *__pyx_v_colind, int *__pyx_v_rowptr, int __pyx_v_nrows, int __pyx_v_ncols, int __pyx_v_nnz, double *__pyx_v_rhs, double *__pyx_v_solution) {
+  int __pyx_r;
+
+  /* "cy_umfpack_wrapper.pyx":41
+ *                                         int nrows, int ncols, int nnz,
+ *                                         double *rhs, double *solution):
+ *     return solve_sparse_system_csr(values, colind, rowptr, nrows, ncols, nnz, rhs, solution)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = solve_sparse_system_csr(__pyx_v_values, __pyx_v_colind, __pyx_v_rowptr, __pyx_v_nrows, __pyx_v_ncols, __pyx_v_nnz, __pyx_v_rhs, __pyx_v_solution);
+  goto __pyx_L0;
+
+  /* "cy_umfpack_wrapper.pyx":38
+ * 
+ * 
+ * cdef api int cy_solve_sparse_system_csr(double *values, int *colind, int *rowptr,             # <<<<<<<<<<<<<<
+ *                                         int nrows, int ncols, int nnz,
+ *                                         double *rhs, double *solution):
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "cy_umfpack_wrapper.pyx":44
  * 
  * 
  * cdef api int cy_factorize_sparse_system(double *values, int *rowind, int *colptr,             # <<<<<<<<<<<<<<
@@ -2010,7 +2050,7 @@ static int __pyx_f_18cy_umfpack_wrapper_cy_solve_sparse_system(double *__pyx_v_v
 static int __pyx_f_18cy_umfpack_wrapper_cy_factorize_sparse_system(double *__pyx_v_values, int *__pyx_v_rowind, int *__pyx_v_colptr, int __pyx_v_nrows, int __pyx_v_ncols, int __pyx_v_nnz, int64_t *__pyx_v_handle_out) {
   int __pyx_r;
 
-  /* "cy_umfpack_wrapper.pyx":25
+  /* "cy_umfpack_wrapper.pyx":47
  *                                         int nrows, int ncols, int nnz,
  *                                         int64_t *handle_out):
  *     return factorize_sparse_system(values, rowind, colptr, nrows, ncols, nnz, handle_out)             # <<<<<<<<<<<<<<
@@ -2020,7 +2060,7 @@ static int __pyx_f_18cy_umfpack_wrapper_cy_factorize_sparse_system(double *__pyx
   __pyx_r = factorize_sparse_system(__pyx_v_values, __pyx_v_rowind, __pyx_v_colptr, __pyx_v_nrows, __pyx_v_ncols, __pyx_v_nnz, __pyx_v_handle_out);
   goto __pyx_L0;
 
-  /* "cy_umfpack_wrapper.pyx":22
+  /* "cy_umfpack_wrapper.pyx":44
  * 
  * 
  * cdef api int cy_factorize_sparse_system(double *values, int *rowind, int *colptr,             # <<<<<<<<<<<<<<
@@ -2033,7 +2073,75 @@ static int __pyx_f_18cy_umfpack_wrapper_cy_factorize_sparse_system(double *__pyx
   return __pyx_r;
 }
 
-/* "cy_umfpack_wrapper.pyx":28
+/* "cy_umfpack_wrapper.pyx":50
+ * 
+ * 
+ * cdef api int cy_factorize_sparse_system_csr(double *values, int *colind, int *rowptr,             # <<<<<<<<<<<<<<
+ *                                             int nrows, int ncols, int nnz,
+ *                                             int64_t *handle_out):
+*/
+
+static int __pyx_f_18cy_umfpack_wrapper_cy_factorize_sparse_system_csr(double *__pyx_v_values, int *__pyx_v_colind, int *__pyx_v_rowptr, int __pyx_v_nrows, int __pyx_v_ncols, int __pyx_v_nnz, int64_t *__pyx_v_handle_out) {
+  int __pyx_r;
+
+  /* "cy_umfpack_wrapper.pyx":53
+ *                                             int nrows, int ncols, int nnz,
+ *                                             int64_t *handle_out):
+ *     return factorize_sparse_system_csr(values, colind, rowptr, nrows, ncols, nnz, handle_out)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = factorize_sparse_system_csr(__pyx_v_values, __pyx_v_colind, __pyx_v_rowptr, __pyx_v_nrows, __pyx_v_ncols, __pyx_v_nnz, __pyx_v_handle_out);
+  goto __pyx_L0;
+
+  /* "cy_umfpack_wrapper.pyx":50
+ * 
+ * 
+ * cdef api int cy_factorize_sparse_system_csr(double *values, int *colind, int *rowptr,             # <<<<<<<<<<<<<<
+ *                                             int nrows, int ncols, int nnz,
+ *                                             int64_t *handle_out):
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "cy_umfpack_wrapper.pyx":56
+ * 
+ * 
+ * cdef api int cy_factorize_sparse_system_perm(double *values, int *rowind, int *colptr,             # <<<<<<<<<<<<<<
+ *                                              int nrows, int ncols, int nnz,
+ *                                              int *qinit, int64_t *handle_out):
+*/
+
+static int __pyx_f_18cy_umfpack_wrapper_cy_factorize_sparse_system_perm(double *__pyx_v_values, int *__pyx_v_rowind, int *__pyx_v_colptr, int __pyx_v_nrows, int __pyx_v_ncols, int __pyx_v_nnz, int *__pyx_v_qinit, int64_t *__pyx_v_handle_out) {
+  int __pyx_r;
+
+  /* "cy_umfpack_wrapper.pyx":59
+ *                                              int nrows, int ncols, int nnz,
+ *                                              int *qinit, int64_t *handle_out):
+ *     return factorize_sparse_system_perm(values, rowind, colptr, nrows, ncols, nnz,             # <<<<<<<<<<<<<<
+ *                                         qinit, handle_out)
+ * 
+*/
+  __pyx_r = factorize_sparse_system_perm(__pyx_v_values, __pyx_v_rowind, __pyx_v_colptr, __pyx_v_nrows, __pyx_v_ncols, __pyx_v_nnz, __pyx_v_qinit, __pyx_v_handle_out);
+  goto __pyx_L0;
+
+  /* "cy_umfpack_wrapper.pyx":56
+ * 
+ * 
+ * cdef api int cy_factorize_sparse_system_perm(double *values, int *rowind, int *colptr,             # <<<<<<<<<<<<<<
+ *                                              int nrows, int ncols, int nnz,
+ *                                              int *qinit, int64_t *handle_out):
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "cy_umfpack_wrapper.pyx":63
  * 
  * 
  * cdef api int cy_solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs):             # <<<<<<<<<<<<<<
@@ -2044,7 +2152,7 @@ static int __pyx_f_18cy_umfpack_wrapper_cy_factorize_sparse_system(double *__pyx
 static int __pyx_f_18cy_umfpack_wrapper_cy_solve_with_factors(int64_t __pyx_v_handle, double *__pyx_v_rhs, double *__pyx_v_solution, int __pyx_v_nrhs) {
   int __pyx_r;
 
-  /* "cy_umfpack_wrapper.pyx":29
+  /* "cy_umfpack_wrapper.pyx":64
  * 
  * cdef api int cy_solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs):
  *     return solve_with_factors(handle, rhs, solution, nrhs)             # <<<<<<<<<<<<<<
@@ -2054,7 +2162,7 @@ static int __pyx_f_18cy_umfpack_wrapper_cy_solve_with_factors(int64_t __pyx_v_ha
   __pyx_r = solve_with_factors(__pyx_v_handle, __pyx_v_rhs, __pyx_v_solution, __pyx_v_nrhs);
   goto __pyx_L0;
 
-  /* "cy_umfpack_wrapper.pyx":28
+  /* "cy_umfpack_wrapper.pyx":63
  * 
  * 
  * cdef api int cy_solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs):             # <<<<<<<<<<<<<<
@@ -2067,7 +2175,109 @@ static int __pyx_f_18cy_umfpack_wrapper_cy_solve_with_factors(int64_t __pyx_v_ha
   return __pyx_r;
 }
 
-/* "cy_umfpack_wrapper.pyx":32
+/* "cy_umfpack_wrapper.pyx":67
+ * 
+ * 
+ * cdef api int cy_solve_with_factors_trans(int64_t handle, double *rhs, double *solution,             # <<<<<<<<<<<<<<
+ *                                          int nrhs, int trans):
+ *     return solve_with_factors_trans(handle, rhs, solution, nrhs, trans)
+*/
+
+static int __pyx_f_18cy_umfpack_wrapper_cy_solve_with_factors_trans(int64_t __pyx_v_handle, double *__pyx_v_rhs, double *__pyx_v_solution, int __pyx_v_nrhs, int __pyx_v_trans) {
+  int __pyx_r;
+
+  /* "cy_umfpack_wrapper.pyx":69
+ * cdef api int cy_solve_with_factors_trans(int64_t handle, double *rhs, double *solution,
+ *                                          int nrhs, int trans):
+ *     return solve_with_factors_trans(handle, rhs, solution, nrhs, trans)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = solve_with_factors_trans(__pyx_v_handle, __pyx_v_rhs, __pyx_v_solution, __pyx_v_nrhs, __pyx_v_trans);
+  goto __pyx_L0;
+
+  /* "cy_umfpack_wrapper.pyx":67
+ * 
+ * 
+ * cdef api int cy_solve_with_factors_trans(int64_t handle, double *rhs, double *solution,             # <<<<<<<<<<<<<<
+ *                                          int nrhs, int trans):
+ *     return solve_with_factors_trans(handle, rhs, solution, nrhs, trans)
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "cy_umfpack_wrapper.pyx":72
+ * 
+ * 
+ * cdef api int cy_get_factor_sizes(int64_t handle, int *sizes):             # <<<<<<<<<<<<<<
+ *     return get_factor_sizes(handle, sizes)
+ * 
+*/
+
+static int __pyx_f_18cy_umfpack_wrapper_cy_get_factor_sizes(int64_t __pyx_v_handle, int *__pyx_v_sizes) {
+  int __pyx_r;
+
+  /* "cy_umfpack_wrapper.pyx":73
+ * 
+ * cdef api int cy_get_factor_sizes(int64_t handle, int *sizes):
+ *     return get_factor_sizes(handle, sizes)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = get_factor_sizes(__pyx_v_handle, __pyx_v_sizes);
+  goto __pyx_L0;
+
+  /* "cy_umfpack_wrapper.pyx":72
+ * 
+ * 
+ * cdef api int cy_get_factor_sizes(int64_t handle, int *sizes):             # <<<<<<<<<<<<<<
+ *     return get_factor_sizes(handle, sizes)
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "cy_umfpack_wrapper.pyx":76
+ * 
+ * 
+ * cdef api int cy_get_factors(int64_t handle,             # <<<<<<<<<<<<<<
+ *                             int *l_rowptr, int *l_colind, double *l_values,
+ *                             int *u_colptr, int *u_rowind, double *u_values,
+*/
+
+static int __pyx_f_18cy_umfpack_wrapper_cy_get_factors(int64_t __pyx_v_handle, int *__pyx_v_l_rowptr, int *__pyx_v_l_colind, double *__pyx_v_l_values, int *__pyx_v_u_colptr, int *__pyx_v_u_rowind, double *__pyx_v_u_values, int *__pyx_v_P, int *__pyx_v_Q, double *__pyx_v_rs) {
+  int __pyx_r;
+
+  /* "cy_umfpack_wrapper.pyx":80
+ *                             int *u_colptr, int *u_rowind, double *u_values,
+ *                             int *P, int *Q, double *rs):
+ *     return get_factors(handle, l_rowptr, l_colind, l_values,             # <<<<<<<<<<<<<<
+ *                        u_colptr, u_rowind, u_values, P, Q, rs)
+ * 
+*/
+  __pyx_r = get_factors(__pyx_v_handle, __pyx_v_l_rowptr, __pyx_v_l_colind, __pyx_v_l_values, __pyx_v_u_colptr, __pyx_v_u_rowind, __pyx_v_u_values, __pyx_v_P, __pyx_v_Q, __pyx_v_rs);
+  goto __pyx_L0;
+
+  /* "cy_umfpack_wrapper.pyx":76
+ * 
+ * 
+ * cdef api int cy_get_factors(int64_t handle,             # <<<<<<<<<<<<<<
+ *                             int *l_rowptr, int *l_colind, double *l_values,
+ *                             int *u_colptr, int *u_rowind, double *u_values,
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "cy_umfpack_wrapper.pyx":84
  * 
  * 
  * cdef api int cy_free_sparse_factors(int64_t handle):             # <<<<<<<<<<<<<<
@@ -2077,7 +2287,7 @@ static int __pyx_f_18cy_umfpack_wrapper_cy_solve_with_factors(int64_t __pyx_v_ha
 static int __pyx_f_18cy_umfpack_wrapper_cy_free_sparse_factors(int64_t __pyx_v_handle) {
   int __pyx_r;
 
-  /* "cy_umfpack_wrapper.pyx":33
+  /* "cy_umfpack_wrapper.pyx":85
  * 
  * cdef api int cy_free_sparse_factors(int64_t handle):
  *     return free_sparse_factors(handle)             # <<<<<<<<<<<<<<
@@ -2085,7 +2295,7 @@ static int __pyx_f_18cy_umfpack_wrapper_cy_free_sparse_factors(int64_t __pyx_v_h
   __pyx_r = free_sparse_factors(__pyx_v_handle);
   goto __pyx_L0;
 
-  /* "cy_umfpack_wrapper.pyx":32
+  /* "cy_umfpack_wrapper.pyx":84
  * 
  * 
  * cdef api int cy_free_sparse_factors(int64_t handle):             # <<<<<<<<<<<<<<
@@ -2150,8 +2360,8 @@ static int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate) {
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (unlikely(!__pyx_export_signature)) __PYX_ERR(0, 1, __pyx_L1_error)
     #endif
-    const char * __pyx_export_name = __pyx_export_signature + 172;
-    void (*const __pyx_export_pointers[])(void) = {(void (*)(void))&__pyx_f_18cy_umfpack_wrapper_cy_solve_sparse_system, (void (*)(void))&__pyx_f_18cy_umfpack_wrapper_cy_factorize_sparse_system, (void (*)(void))&__pyx_f_18cy_umfpack_wrapper_cy_free_sparse_factors, (void (*)(void))&__pyx_f_18cy_umfpack_wrapper_cy_solve_with_factors, (void (*)(void)) NULL};
+    const char * __pyx_export_name = __pyx_export_signature + 387;
+    void (*const __pyx_export_pointers[])(void) = {(void (*)(void))&__pyx_f_18cy_umfpack_wrapper_cy_solve_sparse_system, (void (*)(void))&__pyx_f_18cy_umfpack_wrapper_cy_solve_sparse_system_csr, (void (*)(void))&__pyx_f_18cy_umfpack_wrapper_cy_factorize_sparse_system_perm, (void (*)(void))&__pyx_f_18cy_umfpack_wrapper_cy_factorize_sparse_system, (void (*)(void))&__pyx_f_18cy_umfpack_wrapper_cy_factorize_sparse_system_csr, (void (*)(void))&__pyx_f_18cy_umfpack_wrapper_cy_free_sparse_factors, (void (*)(void))&__pyx_f_18cy_umfpack_wrapper_cy_solve_with_factors, (void (*)(void))&__pyx_f_18cy_umfpack_wrapper_cy_solve_with_factors_trans, (void (*)(void))&__pyx_f_18cy_umfpack_wrapper_cy_get_factor_sizes, (void (*)(void))&__pyx_f_18cy_umfpack_wrapper_cy_get_factors, (void (*)(void)) NULL};
     void (*const *__pyx_export_pointer)(void) = __pyx_export_pointers;
     const char *__pyx_export_current_signature = __pyx_export_signature;
     while (*__pyx_export_pointer) {
@@ -2535,25 +2745,25 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
 static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   {
-    const struct { const unsigned int length: 9; } index[] = {{1},{18},{8},{10},{8},{12},{12},{10},{8},{266}};
-    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (205 bytes) */
-const char* const cstring = "BZh91AY&SYP\331\321t\000\000)\333\200@\000@t\005\000\200\000\277o\377\3600\000\333l\303%4\000\321\265\032\006\2314\006T\362\232=A\240\r\032\032\000\221*zM6A=FM\006\203L\311yj\201\350*\3301\262`\034\202&8H\210\030\230\306\2553\026\244\003\263\r]\005O=]\321\030\240B2+R\312\0219\367@\214\213\231\300\335\001\004=\000\274\030\004\224\211\314r\346\317\352E\032>m5)\265\030\365cQK\200\252o~\035\205\244N31)\"\233\017\010H4\251U\320P\255\264\226\264RY\"\202\277\301\006\240\332\033l\t\343d\022\307\232\215\350,\257\270\262\226\205\304+\374]\311\024\341BACgE\320";
-    PyObject *data = __Pyx_DecompressString(cstring, 205, 2);
+    const struct { const unsigned int length: 10; } index[] = {{1},{18},{8},{10},{8},{12},{12},{10},{8},{634}};
+    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (263 bytes) */
+const char* const cstring = "BZh91AY&SY7\202\002\303\000\000_\333\200@\000@t\005\000\200\000\277\357\377\3600\001\031@2\214\220\320\000d\320\000c&&\230M10\023L\002D\221\240\320S\332\246e6\243i\032H\356r}\222\224\026I\260\310?\000\253lm1\246\206\230\302\210A\200\024\t'\000\223!0m\r\211\266\233\032i\346\224\"\371\3002\240E\332\243|\2647\322\273#\020\243\303\231\202\200\244\214\211Z\253Q4$\006\036\256-\361\320\247|\301c\311\314\020\007\201\033p\227)\235t\205\360Wl\375\377\014\261\020W\347\326h\355t~\227\324\014Z\260\235e\243\252[\002UG\263EMx\005\274R;\204\365FV\231y\036\221&\201\033\344\033\001\330\024\n\371\336H\244\317\250Ta1q,\304`\013R\\\242H\264\0061&\323\006\001\216\266\250E\232\227\001\007\272\002\327,\002\322\227\010\301\033\342\037\342\356H\247\n\022\006\360@X`";
+    PyObject *data = __Pyx_DecompressString(cstring, 263, 2);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (155 bytes) */
-const char* const cstring = "x\332\225MK\022\2020\014\345(,\305q\351\270\365(\231P\302\330\261\037lR\005Oo\013\0022\303\306,\336/y\355U\031\355\010\264\003\t\250\250Fu\007\260\230|\032\353\233h(+\207v\344n\350Aa\247\263~D4S\316$\r\265\030\215\000\010qB\355\244<4>\326\206\312\343\251\314vC\277\260\236\315\252*\376\351'\270\234A\226\332\327o\335\3367c\265*\324\000\354\315\223\200;\014\234h`!\233\343\026\225\370\240\337{\253@K:\235\361\372\320K\313mN?\272\246|\232";
-    PyObject *data = __Pyx_DecompressString(cstring, 155, 1);
+    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (208 bytes) */
+const char* const cstring = "x\332\225\222\301\016\2020\014\206y\024\216b<\032\257>JSG\325\305m\340ZT|z7\020Q\002\250;\254\355\367\367\337\272d[e\264#\320\016\304\243\242\035\252\023\200\305P\207e\213\2742\0243\207\266\211e}\003\205\245\216\371\271B\323r&\311i\217\225\021\000!\016\273v\222.\362\242\332\031J\227\2534\226\037\341}\353\333\272,K\222\177\016\350\351f\r\022\355\177\272;[\353{\202\354\243\032\033\263\361\376\3306\332\333\0144\n_a\352\021\337x\226\250\032\2700\027\002.\321s\0105\013\331\t\014\212}\224\366\250\244\360\372>\224K\362vF\237\263v'{z)m+\367\263\\\265\034\347i\374\236\256\321\016$O\010\034n\0330~\000\001j\370\274";
+    PyObject *data = __Pyx_DecompressString(cstring, 208, 1);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #else /* compression: none (353 bytes) */
-const char* const bytes = "?cline_in_traceback__main____module____name____pyx_capi____qualname__setdefault__test__int (double *, int *, int *, int, int, int, double *, double *)\000int (double *, int *, int *, int, int, int, int64_t *)\000int (int64_t)\000int (int64_t, double *, double *, int)\000cy_solve_sparse_system\000cy_factorize_sparse_system\000cy_free_sparse_factors\000cy_solve_with_factors";
+    #else /* compression: none (721 bytes) */
+const char* const bytes = "?cline_in_traceback__main____module____name____pyx_capi____qualname__setdefault__test__int (double *, int *, int *, int, int, int, double *, double *)\000\000int (double *, int *, int *, int, int, int, int *, int64_t *)\000int (double *, int *, int *, int, int, int, int64_t *)\000\000int (int64_t)\000int (int64_t, double *, double *, int)\000int (int64_t, double *, double *, int, int)\000int (int64_t, int *)\000int (int64_t, int *, int *, double *, int *, int *, double *, int *, int *, double *)\000cy_solve_sparse_system\000cy_solve_sparse_system_csr\000cy_factorize_sparse_system_perm\000cy_factorize_sparse_system\000cy_factorize_sparse_system_csr\000cy_free_sparse_factors\000cy_solve_with_factors\000cy_solve_with_factors_trans\000cy_get_factor_sizes\000cy_get_factors";
     PyObject *data = NULL;
     CYTHON_UNUSED_VAR(__Pyx_DecompressString);
     #endif
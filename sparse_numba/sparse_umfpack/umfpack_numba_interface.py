@@ -12,7 +12,7 @@ Python Interface with UMFPACK sparse linear solver
 
 import numpy as np
 from numba import njit, types
-from numba.extending import get_cython_function_address
+from numba.extending import get_cython_function_address, overload
 import ctypes
 
 # Load the UMFPACK wrapper function
@@ -33,10 +33,19 @@ functype = ctypes.CFUNCTYPE(
 )
 c_solve_sparse_system = functype(addr)
 
+# Load the CSR-native solve (same signature; arrays are values/colind/rowptr)
+addr_solve_csr = get_cython_function_address("sparse_numba.sparse_umfpack.cy_umfpack_wrapper",
+                                             "cy_solve_sparse_system_csr")
+c_solve_sparse_system_csr = functype(addr_solve_csr)
+
 __all__ = [
     'umfpack_solve_csc', 'umfpack_solve_coo', 'umfpack_solve_csr',
     'umfpack_factorize_csc', 'umfpack_factorize_coo', 'umfpack_factorize_csr',
-    'umfpack_solve_factored', 'umfpack_free_factors',
+    'umfpack_factorize_csc_perm',
+    'umfpack_solve_factored', 'umfpack_solve_factored_transpose',
+    'umfpack_free_factors',
+    'umfpack_solve', 'umfpack_factorize',
+    'solve_block_diagonal_batch',
 ]
 
 
@@ -99,7 +108,10 @@ def umfpack_solve_csc(csc_data, csc_indices, csc_indptr, b):
     return result, info
 
 # Import conversion functions
-from sparse_numba.conversion.matrix_conversion_numba import convert_coo_to_csc, convert_csr_to_csc
+from sparse_numba.conversion.matrix_conversion_numba import (
+    convert_coo_to_csc, convert_csr_to_csc,
+    ensure_float64, ensure_int32, has_canonical_format,
+)
 # from . import convert_coo_to_csc, convert_csr_to_csc
 
 @njit(nogil=True)
@@ -157,20 +169,50 @@ def umfpack_solve_coo(row_indices, col_indices, data, shape, b):
 def umfpack_solve_csr(csr_data, csr_indices, csr_indptr, b):
     """
     Solve a sparse linear system Ax = b using UMFPACK.
-    Matrix A is in CSR format and will be converted to CSC.
+    Matrix A is in CSR format.
+
+    Canonical CSR input (sorted column indices, no duplicates) is read by
+    UMFPACK as the CSC matrix A^T and solved with the transposed system, with
+    no conversion. Other input is converted to CSC first (duplicates summed).
     """
-    # Ensure correct data types
-    csr_data_f64 = csr_data.astype(np.float64)
-    csr_indices_i32 = csr_indices.astype(np.int32)
-    csr_indptr_i32 = csr_indptr.astype(np.int32)
-    b_f64 = b.astype(np.float64)
-
-    # Convert CSR to CSC directly
-    csc_data, csc_indices, csc_indptr = convert_csr_to_csc(
-        csr_data_f64, csr_indices_i32, csr_indptr_i32
+    data = ensure_float64(csr_data)
+    indices = ensure_int32(csr_indices)
+    indptr = ensure_int32(csr_indptr)
+    rhs = ensure_float64(b)
+
+    n_rows = len(indptr) - 1
+    n_cols = n_rows  # Square matrix assumption
+    nnz = len(data)
+
+    if not has_canonical_format(indices, indptr):
+        csc_data, csc_indices, csc_indptr = convert_csr_to_csc(
+            data, indices, indptr, (n_rows, n_cols)
+        )
+        return umfpack_solve_csc(csc_data, csc_indices, csc_indptr, rhs)
+
+    # Validate CSR format
+    if indptr[0] != 0:
+        print(f"Error: First element of indptr must be 0, got {indptr[0]}")
+        return np.zeros(len(rhs), dtype=np.float64), -1
+
+    if indptr[n_rows] != nnz:
+        print(f"Error: Last element of indptr must be {nnz}, got {indptr[n_rows]}")
+        return np.zeros(len(rhs), dtype=np.float64), -2
+
+    result = np.zeros(n_rows, dtype=np.float64)
+
+    info = c_solve_sparse_system_csr(
+        data.ctypes.data,
+        indices.ctypes.data,
+        indptr.ctypes.data,
+        n_rows,
+        n_cols,
+        nnz,
+        rhs.ctypes.data,
+        result.ctypes.data
     )
 
-    return umfpack_solve_csc(csc_data, csc_indices, csc_indptr, b_f64)
+    return result, info
 
 
 # ================================================================
@@ -206,6 +248,43 @@ functype_solve_factored = ctypes.CFUNCTYPE(
 )
 c_solve_with_factors = functype_solve_factored(addr_solve_factored)
 
+# Load the CSR-native factorize function (same signature as factorize)
+addr_factorize_csr = get_cython_function_address(
+    "sparse_numba.sparse_umfpack.cy_umfpack_wrapper",
+    "cy_factorize_sparse_system_csr")
+c_factorize_sparse_system_csr = functype_factorize(addr_factorize_csr)
+
+# Load the factorize function with a user column ordering (umfpack_di_qsymbolic)
+addr_factorize_perm = get_cython_function_address(
+    "sparse_numba.sparse_umfpack.cy_umfpack_wrapper",
+    "cy_factorize_sparse_system_perm")
+functype_factorize_perm = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_void_p,    # values
+    ctypes.c_void_p,    # rowind
+    ctypes.c_void_p,    # colptr
+    ctypes.c_int,       # nrows
+    ctypes.c_int,       # ncols
+    ctypes.c_int,       # nnz
+    ctypes.c_void_p,    # qinit (column qinit[k] is the k-th pivot column)
+    ctypes.c_void_p,    # handle_out (pointer to int64)
+)
+c_factorize_sparse_system_perm = functype_factorize_perm(addr_factorize_perm)
+
+# Load the solve-with-factors function with transpose option
+addr_solve_factored_trans = get_cython_function_address(
+    "sparse_numba.sparse_umfpack.cy_umfpack_wrapper",
+    "cy_solve_with_factors_trans")
+functype_solve_factored_trans = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_int64,     # handle (int64)
+    ctypes.c_void_p,    # rhs
+    ctypes.c_void_p,    # solution
+    ctypes.c_int,       # nrhs
+    ctypes.c_int,       # trans (0: A*x = b, 1: A^T*x = b)
+)
+c_solve_with_factors_trans = functype_solve_factored_trans(addr_solve_factored_trans)
+
 # Load the free-factors function
 addr_free = get_cython_function_address(
     "sparse_numba.sparse_umfpack.cy_umfpack_wrapper",
@@ -216,6 +295,35 @@ functype_free = ctypes.CFUNCTYPE(
 )
 c_free_sparse_factors = functype_free(addr_free)
 
+# Load the factor extraction functions (used by sparse_numba.selinv)
+addr_get_factor_sizes = get_cython_function_address(
+    "sparse_numba.sparse_umfpack.cy_umfpack_wrapper",
+    "cy_get_factor_sizes")
+functype_get_factor_sizes = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_int64,     # handle
+    ctypes.c_void_p,    # sizes (4 ints: n, nnz_L, nnz_U, transposed)
+)
+c_get_factor_sizes = functype_get_factor_sizes(addr_get_factor_sizes)
+
+addr_get_factors = get_cython_function_address(
+    "sparse_numba.sparse_umfpack.cy_umfpack_wrapper",
+    "cy_get_factors")
+functype_get_factors = ctypes.CFUNCTYPE(
+    ctypes.c_int,       # return: status
+    ctypes.c_int64,     # handle
+    ctypes.c_void_p,    # L pointers
+    ctypes.c_void_p,    # L indices
+    ctypes.c_void_p,    # L values
+    ctypes.c_void_p,    # U column pointers
+    ctypes.c_void_p,    # U row indices
+    ctypes.c_void_p,    # U values
+    ctypes.c_void_p,    # row permutation
+    ctypes.c_void_p,    # column permutation
+    ctypes.c_void_p,    # row scale factors
+)
+c_get_factors = functype_get_factors(addr_get_factors)
+
 
 @njit(nogil=True)
 def umfpack_factorize_csc(csc_data, csc_indices, csc_indptr):
@@ -269,6 +377,68 @@ def umfpack_factorize_csc(csc_data, csc_indices, csc_indptr):
     return handle_arr[0], info
 
 
+@njit(nogil=True)
+def umfpack_factorize_csc_perm(csc_data, csc_indices, csc_indptr, col_order):
+    """
+    Pre-factorize a sparse matrix in CSC format using UMFPACK, with a user
+    column ordering in place of UMFPACK's AMD/COLAMD (umfpack_di_qsymbolic),
+    e.g. from sparse_numba.ordering.nested_dissection.
+
+    Parameters:
+    -----------
+    csc_data : ndarray (float64)
+        Nonzero values in CSC format
+    csc_indices : ndarray (int32)
+        Row indices in CSC format
+    csc_indptr : ndarray (int32)
+        Column pointers in CSC format
+    col_order : ndarray (int32)
+        Column ordering: column col_order[k] of A is the k-th pivot column
+
+    Returns:
+    --------
+    handle : int64
+        Opaque handle to the stored factors.
+        Must be freed with umfpack_free_factors(handle).
+    info : int
+        Status code (0 for success, -4 for an ordering of the wrong length,
+        UMFPACK's status otherwise, e.g. -15 for an invalid permutation)
+    """
+    data = ensure_float64(csc_data)
+    indices = ensure_int32(csc_indices)
+    indptr = ensure_int32(csc_indptr)
+    order = ensure_int32(col_order)
+
+    n_cols = len(indptr) - 1
+    n_rows = n_cols  # Square matrix assumption
+    nnz = len(data)
+
+    if indptr[0] != 0:
+        print("Error: First element of indptr must be 0")
+        return np.int64(0), -1
+    if indptr[n_cols] != nnz:
+        print("Error: Last element of indptr must equal nnz")
+        return np.int64(0), -2
+    if len(order) != n_cols:
+        print("Error: Column ordering length must equal the number of columns")
+        return np.int64(0), -4
+
+    handle_arr = np.zeros(1, dtype=np.int64)
+
+    info = c_factorize_sparse_system_perm(
+        data.ctypes.data,
+        indices.ctypes.data,
+        indptr.ctypes.data,
+        n_rows,
+        n_cols,
+        nnz,
+        order.ctypes.data,
+        handle_arr.ctypes.data,
+    )
+
+    return handle_arr[0], info
+
+
 @njit(nogil=True)
 def umfpack_solve_factored(handle, b):
     """
@@ -302,6 +472,41 @@ def umfpack_solve_factored(handle, b):
     return result, info
 
 
+@njit(nogil=True)
+def umfpack_solve_factored_transpose(handle, b):
+    """
+    Solve A^T*x = b using pre-computed factors from umfpack_factorize_*().
+    Reuses the factors of A; no refactorization of A^T is needed.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from umfpack_factorize_*()
+    b : ndarray (float64)
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success)
+    """
+    rhs = ensure_float64(b)
+    n = len(rhs)
+    result = np.zeros(n, dtype=np.float64)
+
+    info = c_solve_with_factors_trans(
+        handle,
+        rhs.ctypes.data,
+        result.ctypes.data,
+        1,
+        1,  # trans
+    )
+
+    return result, info
+
+
 @njit(nogil=True)
 def umfpack_free_factors(handle):
     """
@@ -356,7 +561,10 @@ def umfpack_factorize_coo(row_indices, col_indices, data, shape):
 def umfpack_factorize_csr(csr_data, csr_indices, csr_indptr):
     """
     Pre-factorize a sparse matrix in CSR format using UMFPACK.
-    Converts to CSC internally, then factorizes.
+    Canonical CSR input (sorted column indices, no duplicates) is factorized
+    without conversion, as the CSC matrix A^T; the handle remembers this, so
+    umfpack_solve_factored still solves with A. Other input is converted to
+    CSC first.
 
     Parameters:
     -----------
@@ -369,12 +577,275 @@ def umfpack_factorize_csr(csr_data, csr_indices, csr_indptr):
     handle : int64
     info : int
     """
-    csr_data_f64 = csr_data.astype(np.float64)
-    csr_indices_i32 = csr_indices.astype(np.int32)
-    csr_indptr_i32 = csr_indptr.astype(np.int32)
+    data = ensure_float64(csr_data)
+    indices = ensure_int32(csr_indices)
+    indptr = ensure_int32(csr_indptr)
+
+    n_rows = len(indptr) - 1
+    n_cols = n_rows  # Square matrix assumption
+    nnz = len(data)
+
+    if not has_canonical_format(indices, indptr):
+        csc_data, csc_indices, csc_indptr = convert_csr_to_csc(
+            data, indices, indptr, (n_rows, n_cols)
+        )
+        return umfpack_factorize_csc(csc_data, csc_indices, csc_indptr)
 
-    csc_data, csc_indices, csc_indptr = convert_csr_to_csc(
-        csr_data_f64, csr_indices_i32, csr_indptr_i32
+    if indptr[0] != 0:
+        print("Error: First element of indptr must be 0")
+        return np.int64(0), -1
+    if indptr[n_rows] != nnz:
+        print("Error: Last element of indptr must equal nnz")
+        return np.int64(0), -2
+
+    handle_arr = np.zeros(1, dtype=np.int64)
+
+    info = c_factorize_sparse_system_csr(
+        data.ctypes.data,
+        indices.ctypes.data,
+        indptr.ctypes.data,
+        n_rows,
+        n_cols,
+        nnz,
+        handle_arr.ctypes.data,
     )
 
-    return umfpack_factorize_csc(csc_data, csc_indices, csc_indptr)
+    return handle_arr[0], info
+
+
+# ================================================================
+# Matrix container API: CSCMatrix / CSRMatrix / COOMatrix
+# ================================================================
+
+from sparse_numba.conversion.sparse_matrix_numba import (
+    CSCMatrixType, CSRMatrixType, COOMatrixType,
+)
+
+
+def _umfpack_solve_matrix(A, b):
+    pass
+
+
+@overload(_umfpack_solve_matrix)
+def _ol_umfpack_solve_matrix(A, b):
+    # Canonical matrices go straight to the C layer: the format, shape and
+    # flags are known, so no validation or conversion is repeated.
+    if A == CSCMatrixType:
+        def impl(A, b):
+            A.sum_duplicates()
+            rhs = ensure_float64(b)
+            result = np.zeros(A.n_cols, dtype=np.float64)
+            info = c_solve_sparse_system(
+                A.data.ctypes.data, A.indices.ctypes.data, A.indptr.ctypes.data,
+                A.n_rows, A.n_cols, A.nnz, rhs.ctypes.data, result.ctypes.data
+            )
+            return result, info
+        return impl
+    if A == CSRMatrixType:
+        def impl(A, b):
+            A.sum_duplicates()
+            rhs = ensure_float64(b)
+            result = np.zeros(A.n_cols, dtype=np.float64)
+            info = c_solve_sparse_system_csr(
+                A.data.ctypes.data, A.indices.ctypes.data, A.indptr.ctypes.data,
+                A.n_rows, A.n_cols, A.nnz, rhs.ctypes.data, result.ctypes.data
+            )
+            return result, info
+        return impl
+    if A == COOMatrixType:
+        def impl(A, b):
+            data, indices, indptr = A.csc_arrays()
+            rhs = ensure_float64(b)
+            result = np.zeros(A.n_cols, dtype=np.float64)
+            info = c_solve_sparse_system(
+                data.ctypes.data, indices.ctypes.data, indptr.ctypes.data,
+                A.n_rows, A.n_cols, len(data), rhs.ctypes.data, result.ctypes.data
+            )
+            return result, info
+        return impl
+
+
+def _umfpack_factorize_matrix(A):
+    pass
+
+
+@overload(_umfpack_factorize_matrix)
+def _ol_umfpack_factorize_matrix(A):
+    if A == CSCMatrixType:
+        def impl(A):
+            A.sum_duplicates()
+            handle_arr = np.zeros(1, dtype=np.int64)
+            info = c_factorize_sparse_system(
+                A.data.ctypes.data, A.indices.ctypes.data, A.indptr.ctypes.data,
+                A.n_rows, A.n_cols, A.nnz, handle_arr.ctypes.data
+            )
+            return handle_arr[0], info
+        return impl
+    if A == CSRMatrixType:
+        def impl(A):
+            A.sum_duplicates()
+            handle_arr = np.zeros(1, dtype=np.int64)
+            info = c_factorize_sparse_system_csr(
+                A.data.ctypes.data, A.indices.ctypes.data, A.indptr.ctypes.data,
+                A.n_rows, A.n_cols, A.nnz, handle_arr.ctypes.data
+            )
+            return handle_arr[0], info
+        return impl
+    if A == COOMatrixType:
+        def impl(A):
+            data, indices, indptr = A.csc_arrays()
+            handle_arr = np.zeros(1, dtype=np.int64)
+            info = c_factorize_sparse_system(
+                data.ctypes.data, indices.ctypes.data, indptr.ctypes.data,
+                A.n_rows, A.n_cols, len(data), handle_arr.ctypes.data
+            )
+            return handle_arr[0], info
+        return impl
+
+
+@njit(nogil=True)
+def umfpack_solve(A, b):
+    """
+    Solve a sparse linear system Ax = b using UMFPACK.
+    A is a CSCMatrix, CSRMatrix or COOMatrix.
+
+    Canonical CSC/CSR matrices are passed to UMFPACK without validation or
+    conversion (CSR as the transpose of a CSC matrix). Non-canonical ones are
+    made canonical in place once; COO matrices use their cached CSC form.
+
+    Parameters:
+    -----------
+    A : CSCMatrix, CSRMatrix or COOMatrix
+        Square system matrix
+    b : ndarray
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray
+        Solution vector
+    info : int
+        Status code (0 for success, -3 for a shape mismatch)
+    """
+    if A.n_rows != A.n_cols or len(b) != A.n_rows:
+        print("Error: Matrix must be square and match the length of b")
+        return np.zeros(len(b), dtype=np.float64), -3
+    return _umfpack_solve_matrix(A, b)
+
+
+@njit(nogil=True)
+def umfpack_factorize(A):
+    """
+    Pre-factorize a sparse matrix using UMFPACK.
+    A is a CSCMatrix, CSRMatrix or COOMatrix; see umfpack_solve.
+
+    Parameters:
+    -----------
+    A : CSCMatrix, CSRMatrix or COOMatrix
+        Square matrix to factorize
+
+    Returns:
+    --------
+    handle : int64
+        Opaque handle to the stored factors.
+        Must be freed with umfpack_free_factors(handle).
+    info : int
+        Status code (0 for success, -3 for a non-square matrix)
+    """
+    if A.n_rows != A.n_cols:
+        print("Error: Matrix must be square")
+        return np.int64(0), -3
+    return _umfpack_factorize_matrix(A)
+
+
+# ================================================================
+# Batched solve of many small systems via block-diagonal stacking
+# ================================================================
+
+from numba import prange, get_num_threads
+from numba.typed import List
+from sparse_numba.conversion.matrix_conversion_numba import (
+    _chunk_bounds, _stack_block_diagonal,
+)
+
+
+@njit(nogil=True, parallel=True)
+def solve_block_diagonal_batch(data_list, indices_list, indptr_list, b_list, n_groups=0):
+    """
+    Solve K independent small systems A_k x_k = b_k with UMFPACK.
+
+    The systems are split into n_groups groups. The matrices of each group
+    are stacked into one block-diagonal CSC matrix, which is factorized and
+    solved in a single UMFPACK call, and the groups run in parallel. This
+    pays the fixed per-call cost (setup, allocations, ctypes transition)
+    once per group instead of once per system.
+
+    n_groups = 1 gives one factorization for the whole batch;
+    n_groups = K is the same as a prange loop over umfpack_solve_csc.
+    See benchmark_block_diagonal for where the crossover lies.
+
+    If a group fails (e.g. one matrix is singular), its systems are solved
+    one by one so that each gets its own status code.
+
+    Parameters:
+    -----------
+    data_list : numba.typed.List of ndarray (float64)
+        Nonzero values of each CSC matrix
+    indices_list : numba.typed.List of ndarray
+        Row indices of each CSC matrix
+    indptr_list : numba.typed.List of ndarray
+        Column pointers of each CSC matrix
+    b_list : numba.typed.List of ndarray (float64)
+        Right-hand side of each system
+    n_groups : int, optional
+        Number of block-diagonal groups (default 0: one per Numba thread)
+
+    Returns:
+    --------
+    x_list : numba.typed.List of ndarray (float64)
+        Solution of each system
+    info : ndarray (int32)
+        Status code of each system (0 for success)
+    """
+    n_systems = len(b_list)
+    x_list = List.empty_list(types.float64[::1])
+    for k in range(n_systems):
+        x_list.append(np.zeros(len(b_list[k]), dtype=np.float64))
+    info = np.zeros(n_systems, dtype=np.int32)
+
+    if n_groups <= 0:
+        n_groups = get_num_threads()
+    n_groups = max(1, min(n_groups, n_systems))
+    bounds = _chunk_bounds(n_systems, n_groups)
+
+    for g in prange(n_groups):
+        first = bounds[g]
+        last = bounds[g + 1]
+        data, indices, indptr = _stack_block_diagonal(
+            data_list, indices_list, indptr_list, first, last
+        )
+        rhs = np.empty(len(indptr) - 1, dtype=np.float64)
+        offset = 0
+        for k in range(first, last):
+            b = b_list[k]
+            rhs[offset:offset + len(b)] = b
+            offset += len(b)
+
+        x, group_info = umfpack_solve_csc(data, indices, indptr, rhs)
+
+        if group_info == 0:
+            offset = 0
+            for k in range(first, last):
+                n_k = len(x_list[k])
+                x_list[k][:] = x[offset:offset + n_k]
+                offset += n_k
+        else:
+            for k in range(first, last):
+                x_k, info_k = umfpack_solve_csc(
+                    ensure_float64(data_list[k]), ensure_int32(indices_list[k]),
+                    ensure_int32(indptr_list[k]), ensure_float64(b_list[k])
+                )
+                x_list[k][:] = x_k
+                info[k] = info_k
+
+    return x_list, info
@@ -10,10 +10,14 @@
 #include <float.h>  /* For DBL_MAX */
 #include <umfpack.h>
 
-int solve_sparse_system(double *values, int *rowind, int *colptr,
+/* Shared body of solve_sparse_system / solve_sparse_system_csr.
+ * With transposed = 1 the arrays are the CSR arrays of A, i.e. the CSC arrays
+ * of A^T: UMFPACK factors A^T and solves A x = b with UMFPACK_At. */
+static int solve_impl(double *values, int *rowind, int *colptr,
                       int nrows, int ncols, int nnz,
-                      double *rhs, double *solution) {
+                      double *rhs, double *solution, int transposed) {
     /* Initialize variables */
+    int nptr = transposed ? nrows : ncols;  /* Length of the pointer array minus one */
     void *Symbolic = NULL;
     void *Numeric = NULL;
     double *rhs_copy = NULL;
@@ -48,7 +52,7 @@ int solve_sparse_system(double *values, int *rowind, int *colptr,
         goto cleanup;
     }
 
-    colptr_copy = (int *) malloc((ncols+1) * sizeof(int));
+    colptr_copy = (int *) malloc((nptr+1) * sizeof(int));
     if (!colptr_copy) {
         printf("Failed to allocate memory for colptr_copy\n");
         goto cleanup;
@@ -63,7 +67,7 @@ int solve_sparse_system(double *values, int *rowind, int *colptr,
     /* Copy data */
     memcpy(values_copy, values, nnz * sizeof(double));
     memcpy(rowind_copy, rowind, nnz * sizeof(int));
-    memcpy(colptr_copy, colptr, (ncols+1) * sizeof(int));
+    memcpy(colptr_copy, colptr, (nptr+1) * sizeof(int));
     memcpy(rhs_copy, rhs, nrows * sizeof(double));
 
     /* Validate matrix format */
@@ -72,15 +76,16 @@ int solve_sparse_system(double *values, int *rowind, int *colptr,
         goto cleanup;
     }
 
-    if (colptr_copy[ncols] != nnz) {
+    if (colptr_copy[nptr] != nnz) {
         printf("Error: Last column pointer must equal nnz, got %d vs %d\n",
-               colptr_copy[ncols], nnz);
+               colptr_copy[nptr], nnz);
         goto cleanup;
     }
 
     /* Symbolic analysis phase */
 //    printf("Performing symbolic analysis...\n");
-    status = umfpack_di_symbolic(nrows, ncols, colptr_copy, rowind_copy, values_copy,
+    status = umfpack_di_symbolic(transposed ? ncols : nrows, transposed ? nrows : ncols,
+                              colptr_copy, rowind_copy, values_copy,
                               &Symbolic, Control, Info);
 
     if (status != UMFPACK_OK) {
@@ -100,7 +105,8 @@ int solve_sparse_system(double *values, int *rowind, int *colptr,
 
     /* Solve the system */
 //    printf("Solving the system...\n");
-    status = umfpack_di_solve(UMFPACK_A, colptr_copy, rowind_copy, values_copy,
+    status = umfpack_di_solve(transposed ? UMFPACK_At : UMFPACK_A,
+                           colptr_copy, rowind_copy, values_copy,
                            solution, rhs_copy, Numeric, Control, Info);
 
     if (status != UMFPACK_OK) {
@@ -121,6 +127,20 @@ cleanup:
 }
 
 
+int solve_sparse_system(double *values, int *rowind, int *colptr,
+                      int nrows, int ncols, int nnz,
+                      double *rhs, double *solution) {
+    return solve_impl(values, rowind, colptr, nrows, ncols, nnz, rhs, solution, 0);
+}
+
+
+int solve_sparse_system_csr(double *values, int *colind, int *rowptr,
+                            int nrows, int ncols, int nnz,
+                            double *rhs, double *solution) {
+    return solve_impl(values, colind, rowptr, nrows, ncols, nnz, rhs, solution, 1);
+}
+
+
 /* ================================================================
  * Pre-factorization API: factorize once, solve many times
  * ================================================================ */
@@ -137,12 +157,18 @@ typedef struct {
     int nrows;
     int ncols;
     int nnz;
+    int transposed;  /* 1 if the stored arrays (and factors) are those of A^T */
 } umfpack_factors_t;
 
 
-int factorize_sparse_system(double *values, int *rowind, int *colptr,
-                            int nrows, int ncols, int nnz,
-                            int64_t *handle_out) {
+/* Shared body of the factorize_sparse_system* functions.
+ * The arrays are always read as CSC; transposed = 1 records that they are
+ * really the CSR arrays of A, i.e. the CSC arrays of A^T. A non-NULL qinit
+ * is a user column ordering (column qinit[k] of A is the k-th pivot column)
+ * used instead of UMFPACK's AMD/COLAMD. */
+static int factorize_impl(double *values, int *rowind, int *colptr,
+                          int nrows, int ncols, int nnz, int transposed,
+                          int *qinit, int64_t *handle_out) {
 
     if (!values || !rowind || !colptr || !handle_out) {
         printf("Error: NULL pointer passed to factorize_sparse_system\n");
@@ -184,8 +210,13 @@ int factorize_sparse_system(double *values, int *rowind, int *colptr,
     memcpy(colptr_copy, colptr, (ncols+1) * sizeof(int));
 
     /* Symbolic analysis */
-    status = umfpack_di_symbolic(nrows, ncols, colptr_copy, rowind_copy, values_copy,
-                                &Symbolic, Control, Info);
+    if (qinit) {
+        status = umfpack_di_qsymbolic(nrows, ncols, colptr_copy, rowind_copy, values_copy,
+                                      qinit, &Symbolic, Control, Info);
+    } else {
+        status = umfpack_di_symbolic(nrows, ncols, colptr_copy, rowind_copy, values_copy,
+                                    &Symbolic, Control, Info);
+    }
     if (status != UMFPACK_OK) {
         printf("UMFPACK symbolic analysis failed with status %d\n", status);
         goto cleanup;
@@ -215,6 +246,7 @@ int factorize_sparse_system(double *values, int *rowind, int *colptr,
     factors->nrows = nrows;
     factors->ncols = ncols;
     factors->nnz = nnz;
+    factors->transposed = transposed;
 
     /* Transfer ownership */
     Symbolic = NULL;
@@ -237,7 +269,39 @@ cleanup:
 }
 
 
+int factorize_sparse_system(double *values, int *rowind, int *colptr,
+                            int nrows, int ncols, int nnz,
+                            int64_t *handle_out) {
+    return factorize_impl(values, rowind, colptr, nrows, ncols, nnz, 0, NULL, handle_out);
+}
+
+
+int factorize_sparse_system_perm(double *values, int *rowind, int *colptr,
+                                 int nrows, int ncols, int nnz,
+                                 int *qinit, int64_t *handle_out) {
+    if (!qinit) {
+        printf("Error: NULL column ordering passed to factorize_sparse_system_perm\n");
+        return -1;
+    }
+    return factorize_impl(values, rowind, colptr, nrows, ncols, nnz, 0, qinit, handle_out);
+}
+
+
+int factorize_sparse_system_csr(double *values, int *colind, int *rowptr,
+                                int nrows, int ncols, int nnz,
+                                int64_t *handle_out) {
+    /* CSR arrays of A are the CSC arrays of A^T (ncols x nrows) */
+    return factorize_impl(values, colind, rowptr, ncols, nrows, nnz, 1, NULL, handle_out);
+}
+
+
 int solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs) {
+    return solve_with_factors_trans(handle, rhs, solution, nrhs, 0);
+}
+
+
+int solve_with_factors_trans(int64_t handle, double *rhs, double *solution,
+                             int nrhs, int trans) {
 
     if (!handle || !rhs || !solution) {
         printf("Error: NULL pointer passed to solve_with_factors\n");
@@ -251,10 +315,13 @@ int solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs)
 
     umfpack_di_defaults(Control);
 
-    /* Solve: A*x = b using stored factors and CSC arrays */
+    /* Factors of A^T solve A x = b with UMFPACK_At, and vice versa */
+    int sys = ((trans != 0) != (factors->transposed != 0)) ? UMFPACK_At : UMFPACK_A;
+
+    /* Solve using stored factors and CSC arrays */
     /* Note: umfpack_di_solve handles one RHS at a time */
     for (int k = 0; k < nrhs; k++) {
-        status = umfpack_di_solve(UMFPACK_A,
+        status = umfpack_di_solve(sys,
                                   factors->colptr, factors->rowind, factors->values,
                                   solution + k * factors->nrows,
                                   rhs + k * factors->nrows,
@@ -269,6 +336,69 @@ int solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs)
 }
 
 
+int get_factor_sizes(int64_t handle, int *sizes) {
+
+    if (!handle || !sizes) {
+        printf("Error: NULL pointer passed to get_factor_sizes\n");
+        return -1;
+    }
+
+    umfpack_factors_t *factors = (umfpack_factors_t*)(intptr_t)handle;
+    int lnz, unz, n_row, n_col, nz_udiag;
+    int status = umfpack_di_get_lunz(&lnz, &unz, &n_row, &n_col, &nz_udiag,
+                                     factors->Numeric);
+    if (status != UMFPACK_OK) {
+        printf("UMFPACK get_lunz failed with status %d\n", status);
+        return status;
+    }
+
+    sizes[0] = n_col;
+    sizes[1] = lnz;
+    sizes[2] = unz;
+    sizes[3] = factors->transposed;
+    return 0;
+}
+
+
+int get_factors(int64_t handle,
+                int *l_rowptr, int *l_colind, double *l_values,
+                int *u_colptr, int *u_rowind, double *u_values,
+                int *P, int *Q, double *rs) {
+
+    if (!handle || !l_rowptr || !l_colind || !l_values || !u_colptr || !u_rowind
+            || !u_values || !P || !Q || !rs) {
+        printf("Error: NULL pointer passed to get_factors\n");
+        return -1;
+    }
+
+    umfpack_factors_t *factors = (umfpack_factors_t*)(intptr_t)handle;
+    int n = factors->ncols;
+    int do_recip = 0;
+    double *Rs = (double*)malloc(n * sizeof(double));
+    if (!Rs) {
+        printf("Failed to allocate Rs\n");
+        return -10;
+    }
+
+    int status = umfpack_di_get_numeric(l_rowptr, l_colind, l_values,
+                                        u_colptr, u_rowind, u_values,
+                                        P, Q, NULL, &do_recip, Rs,
+                                        factors->Numeric);
+    if (status != UMFPACK_OK) {
+        printf("UMFPACK get_numeric failed with status %d\n", status);
+        free(Rs);
+        return status;
+    }
+
+    /* UMFPACK multiplies row i by Rs[i] if do_recip, else divides by it */
+    for (int i = 0; i < n; i++) {
+        rs[i] = do_recip ? Rs[i] : 1.0 / Rs[i];
+    }
+    free(Rs);
+    return 0;
+}
+
+
 int free_sparse_factors(int64_t handle) {
 
     if (!handle) {
@@ -13,14 +13,49 @@ int solve_sparse_system(double *values, int *rowind, int *colptr,
                         int nrows, int ncols, int nnz,
                         double *rhs, double *solution);
 
+/* Same as solve_sparse_system for a CSR matrix: factors A^T, no conversion */
+int solve_sparse_system_csr(double *values, int *colind, int *rowptr,
+                            int nrows, int ncols, int nnz,
+                            double *rhs, double *solution);
+
 /* Pre-factorize a sparse matrix (symbolic + numeric), returns opaque handle */
 int factorize_sparse_system(double *values, int *rowind, int *colptr,
                             int nrows, int ncols, int nnz,
                             int64_t *handle_out);
 
+/* Pre-factorize with a user column ordering (column qinit[k] of A is the k-th
+ * pivot column, as in umfpack_di_qsymbolic); UMFPACK's own ordering is skipped */
+int factorize_sparse_system_perm(double *values, int *rowind, int *colptr,
+                                 int nrows, int ncols, int nnz,
+                                 int *qinit, int64_t *handle_out);
+
+/* Pre-factorize a CSR matrix without converting it (the factors are those of
+ * A^T; the handle remembers this, so solve_with_factors still solves A*x = b) */
+int factorize_sparse_system_csr(double *values, int *colind, int *rowptr,
+                                int nrows, int ncols, int nnz,
+                                int64_t *handle_out);
+
 /* Solve using pre-computed factors */
 int solve_with_factors(int64_t handle, double *rhs, double *solution, int nrhs);
 
+/* Solve A*x = b (trans = 0) or A^T*x = b (trans = 1) using pre-computed factors */
+int solve_with_factors_trans(int64_t handle, double *rhs, double *solution,
+                             int nrhs, int trans);
+
+/* Sizes of the factors behind a handle: sizes = {n, nnz of L, nnz of U,
+ * transposed}, transposed = 1 if the factors are those of A^T */
+int get_factor_sizes(int64_t handle, int *sizes);
+
+/* Copy the factors P*R*A*Q = L*U out of a handle (umfpack_di_get_numeric).
+ * L is in compressed row form (l_rowptr, l_colind) with its unit diagonal
+ * stored; U is in compressed column form with the pivots on its diagonal.
+ * Pivot row k is row P[k] of A and pivot column k is column Q[k]. Row i of
+ * A is multiplied by rs[i] (R = diag(rs)). */
+int get_factors(int64_t handle,
+                int *l_rowptr, int *l_colind, double *l_values,
+                int *u_colptr, int *u_rowind, double *u_values,
+                int *P, int *Q, double *rs);
+
 /* Free memory associated with factors */
 int free_sparse_factors(int64_t handle);
 
@@ -0,0 +1,101 @@
+"""
+Tests for the 1-norm condition estimator.
+The factorizations come from SuperLU and UMFPACK.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_condest.py
+
+import numpy as np
+import scipy.sparse as sp
+from sparse_numba.conversion.sparse_matrix_numba import as_csc_matrix
+from sparse_numba.conversion.matrix_conversion_numba import check_matrix_properties
+from sparse_numba.sparse_superlu.superlu_numba_interface import (
+    superlu_factorize_csc,
+    superlu_factorize_csr,
+    superlu_free_factors,
+)
+from sparse_numba.sparse_umfpack.umfpack_numba_interface import (
+    umfpack_factorize_csc,
+    umfpack_free_factors,
+)
+from sparse_numba.handle_solve import BACKEND_SUPERLU, BACKEND_UMFPACK
+from sparse_numba.condest import norm1_csc, inv_norm1_est, condest
+
+
+def _make_test_matrix(n=200, density=0.02, seed=42, scale=1.0):
+    """Random unsymmetric matrix; small scale gives a worse condition."""
+    A = sp.random(n, n, density=density, random_state=seed)
+    A = A + sp.diags(scale * (1.0 + np.arange(n) % 7))
+    return A.tocsc()
+
+
+def _cond1(A):
+    M = A.toarray()
+    return np.abs(M).sum(axis=0).max() * np.abs(np.linalg.inv(M)).sum(axis=0).max()
+
+
+def test_condest():
+    """Within a factor of 3 of the exact 1-norm condition, never above it."""
+    print("Test: condest + inv_norm1_est")
+    for scale in (10.0, 1.0, 1e-3):
+        A = _make_test_matrix(scale=scale)
+        n = A.shape[0]
+        exact = _cond1(A)
+        assert np.isclose(norm1_csc(A.data, A.indptr), np.abs(A).sum(axis=0).max())
+        Ac = as_csc_matrix(A.data, A.indices, A.indptr, A.shape)
+
+        handle, info = superlu_factorize_csc(A.data, A.indices, A.indptr)
+        for t in (1, 2, 4):
+            cond, info = condest(handle, Ac, t)
+            assert info == 0
+            assert exact / 3.0 <= cond <= exact * (1.0 + 1e-10)
+        superlu_free_factors(handle)
+
+        R = A.tocsr()
+        handle, info = superlu_factorize_csr(R.data, R.indices, R.indptr)
+        cond, info = condest(handle, Ac)
+        assert info == 0 and exact / 3.0 <= cond <= exact * (1.0 + 1e-10)
+        superlu_free_factors(handle)
+
+        handle, info = umfpack_factorize_csc(A.data, A.indices, A.indptr)
+        cond, info = condest(handle, Ac, 2, BACKEND_UMFPACK)
+        assert info == 0 and exact / 3.0 <= cond <= exact * (1.0 + 1e-10)
+        est, info = inv_norm1_est(handle, n, 2, 5, 0, BACKEND_UMFPACK)
+        assert np.isclose(est * norm1_csc(A.data, A.indptr), cond)
+        umfpack_free_factors(handle)
+
+    _, info = inv_norm1_est(np.int64(0), 0, 2, 5, 0, BACKEND_SUPERLU)
+    assert info == -3
+    print("  PASSED")
+
+
+def test_check_matrix_properties():
+    """The condition value is a lower bound on the 1-norm condition."""
+    print("Test: check_matrix_properties condition bound")
+    A = _make_test_matrix(scale=1e-3)
+    is_singular, bound, _ = check_matrix_properties(A.data, A.indices, A.indptr, A.shape[0])
+    assert 1.0 <= bound <= _cond1(A)
+    B = sp.diags(np.arange(1.0, 11.0)).tocsc()
+    _, bound, _ = check_matrix_properties(B.data, B.indices, B.indptr, 10)
+    assert np.isclose(bound, 10.0)
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Condition Estimation Tests")
+    print("=" * 60)
+    test_condest()
+    test_check_matrix_properties()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
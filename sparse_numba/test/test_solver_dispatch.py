@@ -0,0 +1,185 @@
+"""
+Tests for the automatic solver dispatcher.
+Only the dense and banded routes are solved here, so the tests run
+without the SuperLU / UMFPACK libraries.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_solver_dispatch.py
+
+import numpy as np
+import scipy.sparse as sp
+from numba import njit
+from sparse_numba.solver_dispatch import (
+    solve,
+    analyze_structure,
+    select_route,
+    ROUTE_DENSE, ROUTE_BANDED, ROUTE_TRIDIAGONAL,
+    ROUTE_SUPERLU_SYMMETRIC, ROUTE_UMFPACK, ROUTE_SUPERLU_COLAMD, ROUTE_KLU,
+    ROUTE_GPLU,
+    ROUTE_NAMES,
+)
+
+
+def _make_test_matrix(n=200, density=0.02, seed=42):
+    A = sp.random(n, n, density=density, random_state=seed) + sp.eye(n) * 3.0
+    A = A.tocsc()
+    A.indices = A.indices.astype(np.int32)
+    A.indptr = A.indptr.astype(np.int32)
+    return A
+
+
+def _laplacian_2d(m):
+    T = sp.diags([-np.ones(m - 1), 4.0 * np.ones(m), -np.ones(m - 1)], [-1, 0, 1])
+    A = sp.kronsum(T, T).tocsc()
+    A.indices = A.indices.astype(np.int32)
+    A.indptr = A.indptr.astype(np.int32)
+    return A
+
+
+def test_analyze_structure():
+    """Bandwidth, structural symmetry and diagonal dominance."""
+    print("Test: analyze_structure")
+    A = _laplacian_2d(10)
+    n, nnz, kl, ku, symmetric, diag_dominant = analyze_structure(A.data, A.indices, A.indptr)
+    assert (n, nnz, kl, ku) == (100, A.nnz, 10, 10)
+    assert symmetric and diag_dominant
+
+    # Symmetric pattern with unsymmetric values and a weak diagonal
+    B = A.copy()
+    B.data = np.arange(1.0, B.nnz + 1.0)
+    _, _, _, _, symmetric, diag_dominant = analyze_structure(B.data, B.indices, B.indptr)
+    assert symmetric and not diag_dominant
+
+    # Equal bandwidths but an unsymmetric pattern
+    C = sp.csc_matrix(np.array([[1.0, 0.0, 1.0], [0.0, 1.0, 0.0], [1.0, 1.0, 1.0]]))
+    _, _, kl, ku, symmetric, _ = analyze_structure(C.data, C.indices, C.indptr)
+    assert kl == ku == 2 and not symmetric
+
+    # Unsorted indices and a duplicate entry do not break the symmetry test
+    data = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    indices = np.array([1, 0, 0, 1, 0, 1], dtype=np.int32)
+    indptr = np.array([0, 3, 6], dtype=np.int32)
+    assert analyze_structure(data, indices, indptr)[4]
+    indices[4] = 1  # column 1 = {1, 1}: (1, 0) has no mirror
+    assert not analyze_structure(data, indices, indptr)[4]
+    print("  PASSED")
+
+
+def test_select_route():
+    """Routing rules for the main matrix classes."""
+    print("Test: select_route")
+    assert select_route(20, 60, 19, 19, False, False) == ROUTE_DENSE
+    assert select_route(100, 2000, 99, 99, False, False) == ROUTE_DENSE
+    assert select_route(10000, 29998, 1, 1, True, True) == ROUTE_TRIDIAGONAL
+    assert select_route(10000, 29998, 1, 1, True, False) == ROUTE_BANDED
+    assert select_route(10000, 69998, 3, 3, True, False) == ROUTE_BANDED
+    route = select_route(10000, 49600, 100, 100, True, True)
+    assert route in (ROUTE_SUPERLU_SYMMETRIC, ROUTE_KLU, ROUTE_UMFPACK, ROUTE_GPLU)
+    route = select_route(10000, 50000, 9000, 9000, False, False)
+    assert route in (ROUTE_KLU, ROUTE_UMFPACK, ROUTE_SUPERLU_COLAMD, ROUTE_GPLU)
+    print("  PASSED")
+
+
+def test_solve_auto_and_override():
+    """The chosen route is returned; dense, banded and GP-LU routes can be forced."""
+    print("Test: solve with automatic and forced routes")
+    n = 300
+    A = sp.diags([np.ones(n - 1), 4.0 * np.ones(n), np.ones(n - 1)], [-1, 0, 1], format='csc')
+    b = np.linspace(-1.0, 1.0, n)
+    x, info, route = solve(A.data, A.indices, A.indptr, b)
+    assert info == 0 and route == ROUTE_TRIDIAGONAL
+    assert np.abs(A @ x - b).max() < 1e-12
+    print(f"  Tridiagonal n={n}: route '{ROUTE_NAMES[route]}'")
+
+    # Same pattern, no diagonal dominance: pivoting band solver
+    A = sp.diags([np.ones(n - 1), 0.5 * np.ones(n), np.ones(n - 1)], [-1, 0, 1], format='csc')
+    x, info, route = solve(A.data, A.indices, A.indptr, b)
+    assert info == 0 and route == ROUTE_BANDED
+    assert np.abs(A @ x - b).max() < 1e-10
+
+    A = _make_test_matrix(30, density=0.3)
+    b = np.ones(30)
+    x, info, route = solve(A.data, A.indices, A.indptr, b)
+    assert info == 0 and route == ROUTE_DENSE
+    assert np.abs(A @ x - b).max() < 1e-12
+
+    x, info, route = solve(A.data, A.indices, A.indptr, b, ROUTE_BANDED)
+    assert info == 0 and route == ROUTE_BANDED
+    assert np.abs(A @ x - b).max() < 1e-12
+
+    x, info, route = solve(A.data, A.indices, A.indptr, b, ROUTE_GPLU)
+    assert info == 0 and route == ROUTE_GPLU
+    assert np.abs(A @ x - b).max() < 1e-12
+    print("  PASSED")
+
+
+def test_solve_errors():
+    """Bad input and unknown routes return negative status codes."""
+    print("Test: solve error codes")
+    A = _make_test_matrix(40)
+    _, info, _ = solve(A.data, A.indices, A.indptr, np.ones(39))
+    assert info == -3
+    _, info, _ = solve(A.data, A.indices, A.indptr, np.ones(40), 99)
+    assert info == -5
+    # Row index past the last column: rejected before any analysis
+    bad = A.indices.astype(np.int32)
+    bad[-1] = 45
+    _, info, _ = solve(A.data, bad, A.indptr, np.ones(40))
+    assert info == -3
+
+    # A forced tridiagonal route must not drop entries outside the band
+    T = sp.diags([-np.ones(5), 4.0 * np.ones(6), -np.ones(5)], [-1, 0, 1]).tolil()
+    T[0, 5] = 1.0
+    T = sp.csc_matrix(T)
+    _, info, _ = solve(T.data, T.indices, T.indptr, np.ones(6), ROUTE_TRIDIAGONAL)
+    assert info == -3
+
+    # Columns 3 and 7 only touch row 5: rejected before factorizing
+    A = sp.lil_matrix(A)
+    A[:, 3] = 0.0
+    A[:, 7] = 0.0
+    A[5, 3] = 1.0
+    A[5, 7] = 1.0
+    A = sp.csc_matrix(A)
+    _, info, route = solve(A.data, A.indices, A.indptr, np.ones(40), ROUTE_GPLU)
+    assert info in (4, 8) and route == ROUTE_GPLU
+    print("  PASSED")
+
+
+@njit(nogil=True)
+def _solve_in_numba(data, indices, indptr, b):
+    x, info, route = solve(data, indices, indptr, b)
+    return x, info
+
+
+def test_solve_inside_numba():
+    """solve can be called from jitted code."""
+    print("Test: solve inside Numba code")
+    A = _make_test_matrix(20, density=0.3)
+    b = np.arange(20.0)
+    x, info = _solve_in_numba(A.data, A.indices, A.indptr, b)
+    assert info == 0 and np.abs(A @ x - b).max() < 1e-10
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Solver Dispatch Tests")
+    print("=" * 60)
+    test_analyze_structure()
+    test_select_route()
+    test_solve_auto_and_override()
+    test_solve_errors()
+    test_solve_inside_numba()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
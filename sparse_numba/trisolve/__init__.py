@@ -0,0 +1,17 @@
+from .trisolve_numba import (
+    tri_analyze_csr, tri_analyze_csc,
+    tri_solve, tri_solve_multi,
+    lu_schedule, lu_schedule_gplu,
+    lu_solve, lu_solve_multi,
+    TriangularSchedule, LUSchedule,
+)
+
+__all__ = [
+    'tri_analyze_csr', 'tri_analyze_csc',
+    'tri_solve', 'tri_solve_multi',
+    'lu_schedule', 'lu_schedule_gplu',
+    'lu_solve', 'lu_solve_multi',
+    'TriangularSchedule', 'LUSchedule',
+]
+
+__author__ = 'Tianqi Hong'
@@ -0,0 +1,108 @@
+"""
+Tests for the level-scheduled parallel triangular solves.
+The LU factors come from the pure-Numba Gilbert-Peierls LU.
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: test_trisolve.py
+
+import numpy as np
+import scipy.sparse as sp
+from sparse_numba.gplu.gplu_numba import gplu_factorize_csc
+from sparse_numba.trisolve.trisolve_numba import (
+    tri_analyze_csr,
+    tri_analyze_csc,
+    tri_solve,
+    tri_solve_multi,
+    lu_schedule_gplu,
+    lu_solve,
+    lu_solve_multi,
+)
+
+
+def _make_test_matrix(n=400, density=0.01, seed=3):
+    """Random unsymmetric matrix with a weak diagonal, so pivoting happens."""
+    A = sp.random(n, n, density=density, random_state=seed)
+    A = A + sp.diags(np.arange(1, n + 1) * 0.01 + 1.0)
+    return A.tocsc()
+
+
+def test_triangular():
+    """Lower and upper, CSR and CSC, one and many right-hand sides."""
+    print("Test: tri_analyze_* + tri_solve / tri_solve_multi")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    rng = np.random.default_rng(0)
+    b = rng.standard_normal(n)
+    B = rng.standard_normal((n, 5))
+
+    for lower in (True, False):
+        T = sp.tril(A) if lower else sp.triu(A)
+        R = T.tocsr()
+        C = T.tocsc()
+        S, info = tri_analyze_csr(R.data, R.indices, R.indptr, lower)
+        assert info == 0 and 1 < S.n_levels < n
+        x, info = tri_solve(S, b)
+        assert info == 0 and np.allclose(T @ x, b)
+        S, info = tri_analyze_csc(C.data, C.indices, C.indptr, lower)
+        X, info = tri_solve_multi(S, B)
+        assert info == 0 and np.allclose(T @ X, B)
+
+    # Stored diagonal ignored with unit_diagonal
+    T = (sp.tril(A, -1) + 5.0 * sp.eye(n)).tocsc()
+    S, info = tri_analyze_csc(T.data, T.indices, T.indptr, True, True)
+    x, info = tri_solve(S, b)
+    assert np.allclose((sp.tril(A, -1) + sp.eye(n)) @ x, b)
+
+    R = A.tocsr()
+    _, info = tri_analyze_csr(R.data, R.indices, R.indptr, True)
+    assert info == -3
+    R = sp.tril(A, -1).tocsr()
+    _, info = tri_analyze_csr(R.data, R.indices, R.indptr, True)
+    assert info == 1
+    _, info = tri_solve(S, np.ones(n + 1))
+    assert info == -3
+    print("  PASSED")
+
+
+def test_lu_solve():
+    """Full solves with the scheduled Gilbert-Peierls factors."""
+    print("Test: lu_schedule_gplu + lu_solve / lu_solve_multi")
+    A = _make_test_matrix()
+    n = A.shape[0]
+    rng = np.random.default_rng(1)
+    b = rng.standard_normal(n)
+    B = rng.standard_normal((n, 300))
+    factors, info = gplu_factorize_csc(A.data, A.indices, A.indptr)
+    assert info == 0
+    S, info = lu_schedule_gplu(factors)
+    assert info == 0
+    n_lower, n_upper = S.n_levels
+    assert n_lower < n and n_upper < n
+    x, info = lu_solve(S, b)
+    assert info == 0 and np.allclose(A @ x, b)
+    # Wide enough for the parallel levels
+    X, info = lu_solve_multi(S, B)
+    assert info == 0 and np.allclose(A @ X, B)
+    _, info = lu_solve_multi(S, B[1:])
+    assert info == -3
+    print("  PASSED")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Level-Scheduled Triangular Solve Tests")
+    print("=" * 60)
+    test_triangular()
+    test_lu_solve()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
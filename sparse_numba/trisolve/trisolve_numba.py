@@ -0,0 +1,424 @@
+"""
+Level-scheduled parallel sparse triangular solves. The analysis of a
+triangular matrix (its level sets) is done once and kept with the matrix;
+each solve then runs the rows of a level in parallel, with one or many
+right-hand sides. For single large systems where the serial substitution
+of the C backends is the bottleneck, lu_schedule does the same for the LU
+factors behind a SuperLU / UMFPACK handle or from gplu_factorize_csc.
+    tri_analyze_csr, tri_analyze_csc
+    tri_solve, tri_solve_multi
+    lu_schedule, lu_schedule_gplu
+    lu_solve, lu_solve_multi
+"""
+
+#  [sparse_numba] (C)2025-2025 Tianqi Hong
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the BSD License.
+#
+#  File name: trisolve_numba.py
+
+import numpy as np
+from numba import njit, prange, boolean, int32, int64, float64
+from numba.experimental import jitclass
+
+from sparse_numba.conversion.matrix_conversion_numba import (
+    ensure_float64, ensure_int32, convert_csr_to_csc,
+)
+from sparse_numba.krylov.precond_numba import _level_sets
+from sparse_numba.selinv.selinv_numba import _handle_factors, _gplu_layout
+from sparse_numba.handle_solve import BACKEND_SUPERLU
+
+# Levels with fewer (rows x right-hand sides) than this are solved serially;
+# below it the fork/join of prange costs more than the work
+PARALLEL_MIN_WORK = 256
+
+
+@jitclass([
+    ('n', int64),
+    ('lower', boolean),
+    ('indptr', int32[::1]),
+    ('indices', int32[::1]),
+    ('data', float64[::1]),
+    ('diag', float64[::1]),
+    ('level_ptr', int32[::1]),
+    ('level_rows', int32[::1]),
+])
+class TriangularSchedule:
+    """
+    A triangular matrix prepared for level-scheduled solves: the strictly
+    triangular part as CSR, the diagonal, and the level sets. Rows
+    level_rows[level_ptr[l]:level_ptr[l + 1]] depend only on rows in
+    earlier levels, so they can be solved in any order.
+    """
+
+    def __init__(self, n, lower, indptr, indices, data, diag):
+        self.n = n
+        self.lower = lower
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.diag = diag
+        level_ptr, level_rows = _level_sets(n, indptr, indices, not lower)
+        self.level_ptr = level_ptr
+        self.level_rows = level_rows
+
+    @property
+    def n_levels(self):
+        """Number of sequential steps of a solve."""
+        return len(self.level_ptr) - 1
+
+
+@njit(nogil=True)
+def _strict_part(n, indptr, indices, data, lower, unit_diagonal):
+    """
+    Strictly triangular CSR part and diagonal of a triangular CSR matrix.
+    info is -3 for an entry on the wrong side of the diagonal and i + 1 for
+    a zero diagonal in row i.
+    """
+    ptr = np.zeros(n + 1, dtype=np.int32)
+    diag = np.ones(n, dtype=np.float64)
+    has_diag = np.zeros(n, dtype=np.bool_)
+    info = 0
+    for i in range(n):
+        cnt = 0
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            if j == i:
+                if not unit_diagonal:
+                    if has_diag[i]:
+                        diag[i] += data[p]
+                    else:
+                        diag[i] = data[p]
+                    has_diag[i] = True
+            elif (j < i) == lower:
+                cnt += 1
+            elif data[p] != 0.0:
+                info = -3
+        ptr[i + 1] = ptr[i] + cnt
+    strict_indices = np.empty(ptr[n], dtype=np.int32)
+    strict_data = np.empty(ptr[n], dtype=np.float64)
+    for i in range(n):
+        q = ptr[i]
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            if j != i and (j < i) == lower:
+                strict_indices[q] = j
+                strict_data[q] = data[p]
+                q += 1
+    if info == 0 and not unit_diagonal:
+        for i in range(n):
+            if not has_diag[i] or diag[i] == 0.0:
+                info = i + 1
+                break
+    return ptr, strict_indices, strict_data, diag, info
+
+
+@njit(nogil=True)
+def tri_analyze_csr(data, indices, indptr, lower, unit_diagonal=False):
+    """
+    Prepare a sparse triangular matrix in CSR format for tri_solve. Do this
+    once per matrix and reuse the schedule for every solve.
+
+    Parameters:
+    -----------
+    data : ndarray (float64)
+        Nonzero values in CSR format
+    indices : ndarray (int32)
+        Column indices in CSR format
+    indptr : ndarray (int32)
+        Row pointers in CSR format
+    lower : bool
+        True for a lower, False for an upper triangular matrix
+    unit_diagonal : bool, optional
+        Take the diagonal as all ones and ignore stored diagonal entries
+
+    Returns:
+    --------
+    schedule : TriangularSchedule
+        Pass to tri_solve / tri_solve_multi
+    info : int
+        Status code (0 for success, -3 if an entry is on the wrong side of
+        the diagonal, i + 1 if the diagonal of row i is zero or missing)
+    """
+    n = len(indptr) - 1
+    ptr, idx, val, diag, info = _strict_part(n, ensure_int32(indptr), ensure_int32(indices),
+                                             ensure_float64(data), lower, unit_diagonal)
+    return TriangularSchedule(n, lower, ptr, idx, val, diag), info
+
+
+@njit(nogil=True)
+def tri_analyze_csc(data, indices, indptr, lower, unit_diagonal=False):
+    """
+    Prepare a sparse triangular matrix in CSC format for tri_solve; see
+    tri_analyze_csr. The matrix is converted to CSR once, here.
+    """
+    n = len(indptr) - 1
+    # The CSC arrays of A are the CSR arrays of A^T
+    r_data, r_indices, r_indptr = convert_csr_to_csc(ensure_float64(data), ensure_int32(indices),
+                                                     ensure_int32(indptr), (n, n), False)
+    return tri_analyze_csr(r_data, r_indices, r_indptr, lower, unit_diagonal)
+
+
+@njit(nogil=True)
+def _solve_row(S, i, X, nrhs):
+    """X[i] = (X[i] - sum_j T[i, j] X[j]) / d[i], for all right-hand sides."""
+    for p in range(S.indptr[i], S.indptr[i + 1]):
+        a = S.data[p]
+        j = S.indices[p]
+        for r in range(nrhs):
+            X[i, r] -= a * X[j, r]
+    d = S.diag[i]
+    if d != 1.0:
+        for r in range(nrhs):
+            X[i, r] /= d
+
+
+@njit(nogil=True, parallel=True)
+def _tri_solve_inplace(S, X):
+    """Level-scheduled solve, overwriting the right-hand sides in X (n, nrhs)."""
+    nrhs = X.shape[1]
+    lp = S.level_ptr
+    lr = S.level_rows
+    for lev in range(len(lp) - 1):
+        start = lp[lev]
+        stop = lp[lev + 1]
+        if (stop - start) * nrhs >= PARALLEL_MIN_WORK:
+            for t in prange(start, stop):
+                _solve_row(S, lr[t], X, nrhs)
+        else:
+            for t in range(start, stop):
+                _solve_row(S, lr[t], X, nrhs)
+
+
+@njit(nogil=True)
+def tri_solve(schedule, b):
+    """
+    Solve T x = b with a triangular matrix prepared by tri_analyze_*.
+
+    Parameters:
+    -----------
+    schedule : TriangularSchedule
+        From tri_analyze_csr / tri_analyze_csc
+    b : ndarray (float64)
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success, -3 if b has the wrong length)
+    """
+    n = schedule.n
+    rhs = ensure_float64(b)
+    if len(rhs) != n:
+        return np.zeros(n, dtype=np.float64), -3
+    X = rhs.copy().reshape((n, 1))
+    _tri_solve_inplace(schedule, X)
+    return X.reshape(n), 0
+
+
+@njit(nogil=True)
+def tri_solve_multi(schedule, B):
+    """
+    Solve T X = B for several right-hand sides at once; each row update
+    streams over all of them.
+
+    Parameters:
+    -----------
+    schedule : TriangularSchedule
+        From tri_analyze_csr / tri_analyze_csc
+    B : ndarray (float64)
+        Right-hand sides, shape (n, nrhs)
+
+    Returns:
+    --------
+    X : ndarray (float64)
+        Solutions, shape (n, nrhs)
+    info : int
+        Status code (0 for success, -3 if B has the wrong number of rows)
+    """
+    n = schedule.n
+    if B.shape[0] != n:
+        return np.zeros((n, B.shape[1]), dtype=np.float64), -3
+    X = np.ascontiguousarray(B).astype(np.float64)
+    _tri_solve_inplace(schedule, X)
+    return X, 0
+
+
+_TriangularSchedule_type = TriangularSchedule.class_type.instance_type
+
+
+@jitclass([
+    ('n', int64),
+    ('lower', _TriangularSchedule_type),
+    ('upper', _TriangularSchedule_type),
+    ('prow', int32[::1]),
+    ('pcol', int32[::1]),
+    ('rs', float64[::1]),
+    ('transposed', boolean),
+])
+class LUSchedule:
+    """
+    Level schedules of the two triangular factors of A together with the
+    row / column permutations and row scaling of the factorization, so that
+    lu_solve is a full solve with A. For factors of A^T (SuperLU on CSR
+    input) the schedules are those of U^T and L^T.
+    """
+
+    def __init__(self, n, lower, upper, prow, pcol, rs, transposed):
+        self.n = n
+        self.lower = lower
+        self.upper = upper
+        self.prow = prow
+        self.pcol = pcol
+        self.rs = rs
+        self.transposed = transposed
+
+    @property
+    def n_levels(self):
+        """Number of sequential steps of the forward and backward solves."""
+        return self.lower.n_levels, self.upper.n_levels
+
+
+@njit(nogil=True)
+def _lu_schedule(lp, li, lx, up, ui, ux, prow, pcol, rs, transposed):
+    """LUSchedule from factors in the layout of selinv._handle_factors."""
+    n = len(prow)
+    if transposed:
+        # A = (diag(rs)^{-1} M)^T with M[prow][:, pcol] = L U: solve with
+        # U^T then L^T, whose CSR arrays are the CSC arrays of U and L
+        lo, info_l = tri_analyze_csr(ux, ui, up, True)
+        hi, info_u = tri_analyze_csr(lx, li, lp, False, True)
+    else:
+        lo, info_l = tri_analyze_csc(lx, li, lp, True, True)
+        hi, info_u = tri_analyze_csc(ux, ui, up, False)
+    info = info_l if info_l != 0 else info_u
+    return LUSchedule(n, lo, hi, prow, pcol, rs, transposed), info
+
+
+@njit(nogil=True)
+def lu_schedule(handle, backend=BACKEND_SUPERLU):
+    """
+    Read the LU factors behind a handle and prepare them for parallel
+    solves. Do this once per factorization; the schedule holds a copy of
+    the factors, so the handle may be freed afterwards.
+
+    Parameters:
+    -----------
+    handle : int64
+        Factors handle from superlu_factorize_*() or umfpack_factorize_*()
+    backend : int
+        BACKEND_SUPERLU or BACKEND_UMFPACK (from handle_solve)
+
+    Returns:
+    --------
+    schedule : LUSchedule
+        Pass to lu_solve / lu_solve_multi
+    info : int
+        Status code (0 for success, k + 1 if pivot k of the factors is
+        zero, -5 if the factors of the backend cannot be read)
+    """
+    lp, li, lx, up, ui, ux, prow, pcol, rs, transposed, info = _handle_factors(handle, backend)
+    if info != 0:
+        n = len(prow)
+        lp = np.zeros(n + 1, dtype=np.int32)
+        up = lp
+        transposed = False
+    schedule, info2 = _lu_schedule(lp, li, lx, up, ui, ux, prow, pcol, rs, transposed)
+    return schedule, info if info != 0 else info2
+
+
+@njit(nogil=True)
+def lu_schedule_gplu(factors):
+    """LUSchedule of the factors from gplu_factorize_csc; see lu_schedule."""
+    lp, li, lx, up, ui, ux, prow, pcol, rs = _gplu_layout(factors)
+    return _lu_schedule(lp, li, lx, up, ui, ux, prow, pcol, rs, False)
+
+
+@njit(nogil=True, parallel=True)
+def _lu_solve_inplace(S, B, X):
+    """X = A^{-1} B for B, X of shape (n, nrhs)."""
+    n = S.n
+    nrhs = B.shape[1]
+    W = np.empty((n, nrhs), dtype=np.float64)
+    if S.transposed:
+        for k in prange(n):
+            c = S.pcol[k]
+            for r in range(nrhs):
+                W[k, r] = B[c, r]
+    else:
+        for k in prange(n):
+            i = S.prow[k]
+            s = S.rs[i]
+            for r in range(nrhs):
+                W[k, r] = s * B[i, r]
+    _tri_solve_inplace(S.lower, W)
+    _tri_solve_inplace(S.upper, W)
+    if S.transposed:
+        for k in prange(n):
+            i = S.prow[k]
+            s = S.rs[i]
+            for r in range(nrhs):
+                X[i, r] = s * W[k, r]
+    else:
+        for k in prange(n):
+            c = S.pcol[k]
+            for r in range(nrhs):
+                X[c, r] = W[k, r]
+
+
+@njit(nogil=True)
+def lu_solve(schedule, b):
+    """
+    Solve A x = b with the level-scheduled factors of A.
+
+    Parameters:
+    -----------
+    schedule : LUSchedule
+        From lu_schedule / lu_schedule_gplu
+    b : ndarray (float64)
+        Right-hand side vector
+
+    Returns:
+    --------
+    x : ndarray (float64)
+        Solution vector
+    info : int
+        Status code (0 for success, -3 if b has the wrong length)
+    """
+    n = schedule.n
+    rhs = ensure_float64(b)
+    x = np.zeros(n, dtype=np.float64)
+    if len(rhs) != n:
+        return x, -3
+    _lu_solve_inplace(schedule, np.ascontiguousarray(rhs).reshape((n, 1)), x.reshape((n, 1)))
+    return x, 0
+
+
+@njit(nogil=True)
+def lu_solve_multi(schedule, B):
+    """
+    Solve A X = B with the level-scheduled factors of A.
+
+    Parameters:
+    -----------
+    schedule : LUSchedule
+        From lu_schedule / lu_schedule_gplu
+    B : ndarray (float64)
+        Right-hand sides, shape (n, nrhs)
+
+    Returns:
+    --------
+    X : ndarray (float64)
+        Solutions, shape (n, nrhs)
+    info : int
+        Status code (0 for success, -3 if B has the wrong number of rows)
+    """
+    n = schedule.n
+    X = np.zeros((n, B.shape[1]), dtype=np.float64)
+    if B.shape[0] != n:
+        return X, -3
+    _lu_solve_inplace(schedule, np.ascontiguousarray(B).astype(np.float64), X)
+    return X, 0